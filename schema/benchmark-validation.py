@@ -0,0 +1,96 @@
+#!/usr/bin/python3
+
+"""
+Compares the speed of the generated discovery map validator against the validator that
+fastjsonschema compiles without the optimizations, on large synthetic discovery maps.
+"""
+
+import os
+import sys
+import random
+import timeit
+import fastjsonschema
+import yaml
+
+schema_dir = os.path.abspath(sys.argv[1])
+common_dir = os.path.abspath(sys.argv[2])
+sys.path.insert(0, common_dir)
+
+from nightjar_common.validation import discovery_map  # noqa: E402
+
+
+def mk_host_port(rnd, index):
+    kind = index % 3
+    port = rnd.randrange(1, 65536)
+    if kind == 0:
+        return {'ipv4': '10.{0}.{1}.{2}'.format(
+            rnd.randrange(256), rnd.randrange(256), rnd.randrange(256),
+        ), 'port': port}
+    if kind == 1:
+        return {'ipv6': 'fd00::{0:x}:{1:x}'.format(
+            rnd.randrange(65536), rnd.randrange(65536),
+        ), 'port': port}
+    return {'hostname': 'host-{0}.example.com'.format(index), 'port': port}
+
+
+def mk_discovery_map(namespace_count, service_color_count, instance_count):
+    rnd = random.Random(namespace_count * service_color_count * instance_count)
+    return {
+        'schema-version': 'v1',
+        'document-version': 'benchmark',
+        'namespaces': [
+            {
+                'namespace': 'n{0}'.format(namespace),
+                'network-id': 'network',
+                'gateways': {
+                    'prefer-gateway': False,
+                    'protocol': 'HTTP1.1',
+                    'instances': [mk_host_port(rnd, i) for i in range(instance_count)],
+                },
+                'service-colors': [
+                    {
+                        'service': 's{0}'.format(service),
+                        'color': 'blue',
+                        'index': 1,
+                        'routes': [{
+                            'path-match': {'match-type': 'prefix', 'value': '/s{0}'.format(service)},
+                            'weight': 1,
+                            'namespace-access': [{'namespace': 'n0', 'access': True}],
+                            'default-access': True,
+                        }],
+                        'instances': [mk_host_port(rnd, i) for i in range(instance_count)],
+                        'namespace-egress': [{
+                            'namespace': 'n0',
+                            'interface': {'ipv4': '127.0.0.1', 'port': 9000},
+                        }],
+                    }
+                    for service in range(service_color_count)
+                ],
+            }
+            for namespace in range(namespace_count)
+        ],
+    }
+
+
+def best_time(validator, data, repeat=5):
+    return min(timeit.repeat(lambda: validator(data), number=1, repeat=repeat))
+
+
+with open(os.path.join(schema_dir, 'discovery-map-schema.yaml'), 'r') as f:
+    unoptimized = fastjsonschema.compile(yaml.safe_load(f))
+optimized = discovery_map.validate_discovery_map_schema_yaml
+
+print('{0:>10} {1:>10} {2:>14} {3:>14} {4:>8}'.format(
+    'namespaces', 'hosts', 'unoptimized ms', 'optimized ms', 'speedup',
+))
+for namespaces, service_colors, instances in ((1, 10, 10), (10, 50, 20), (20, 100, 50)):
+    data = mk_discovery_map(namespaces, service_colors, instances)
+    # Both must accept the same data.
+    unoptimized(data)
+    optimized(data)
+    unoptimized_time = best_time(unoptimized, data)
+    optimized_time = best_time(optimized, data)
+    print('{0:>10} {1:>10} {2:>14.1f} {3:>14.1f} {4:>7.2f}x'.format(
+        namespaces, namespaces * (service_colors + 1) * instances,
+        unoptimized_time * 1000, optimized_time * 1000, unoptimized_time / optimized_time,
+    ))
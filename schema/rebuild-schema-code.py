@@ -11,6 +11,8 @@ import yaml
 import tempfile
 import shutil
 import json
+import ast
+import re
 
 schema_dir = os.path.abspath(sys.argv[1])
 code_output_dir = sys.argv[2]
@@ -18,9 +20,120 @@ temp_dir = tempfile.mkdtemp()
 init_contents = '''
 """
 Auto-generated validation code.
+
+The generated validator modules are large, so each one is only imported on the first
+use of its validator.
 """
 
+from typing import Dict, Callable, Any
+import importlib
+
+Validator = Callable[[Dict[str, Any]], Dict[str, Any]]
+_VALIDATORS: Dict[str, Validator] = {}
+
+
+def _get_validator(code_name: str) -> Validator:
+    ret = _VALIDATORS.get(code_name)
+    if ret is None:
+        module = importlib.import_module('.' + code_name, __name__)
+        ret = getattr(module, 'validate_{0}_schema_yaml'.format(code_name))
+        _VALIDATORS[code_name] = ret
+    return ret
 '''
+init_function = '''
+
+def validate_{0}(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate the data against the {1} schema."""
+    return _get_validator('{0}')(data)
+'''
+
+# The generated integer type check; the exact type check is tried first.
+integer_check = re.compile(
+    r'if (not isinstance\((\w+), \(int\)\) and not \(isinstance\(\2, float\) and '
+    r'\2\.is_integer\(\)\) or isinstance\(\2, bool\)):'
+)
+# The generated required properties check, which loops over the properties.
+required_check = re.compile(r'all\(prop in (\w+) for prop in \[([^\]]+)\]\)')
+
+
+def optimize_code(code):
+    """
+    Optimize the generated code for valid data, which is the usual case.
+
+    * The error definitions are module constants, rather than dictionaries built for each
+      error.  Each item checked against a oneOf raises errors for the branches it doesn't
+      match, which are then thrown away.
+    * The error paths are f-strings, rather than formatted from all the local variables.
+    * The integer type checks first try the exact type.
+    * The required properties are checked as a set, rather than in a generator loop.
+    * The regular expressions are module variables, rather than looked up on each use.
+    """
+    data = code.encode('utf-8')
+    line_starts = [0]
+    for line in code.splitlines(True):
+        line_starts.append(line_starts[-1] + len(line.encode('utf-8')))
+
+    def get_span(node):
+        return (
+            line_starts[node.lineno - 1] + node.col_offset,
+            line_starts[node.end_lineno - 1] + node.end_col_offset,
+        )
+
+    replacements = []
+    definitions = {}
+    patterns = {}
+    for node in ast.walk(ast.parse(code)):
+        if (
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Name)
+                and node.func.id == 'JsonSchemaException'
+        ):
+            for keyword in node.keywords:
+                if keyword.arg == 'definition':
+                    start, end = get_span(keyword.value)
+                    text = data[start:end].decode('utf-8')
+                    if text not in definitions:
+                        definitions[text] = '_DEFINITION_{0}'.format(len(definitions))
+                    replacements.append((start, end, definitions[text]))
+        elif (
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Attribute)
+                and node.func.attr == 'format'
+                and isinstance(node.func.value, ast.Constant)
+                and not node.args
+                and len(node.keywords) == 1
+                and node.keywords[0].arg is None
+                and isinstance(node.keywords[0].value, ast.Call)
+                and isinstance(node.keywords[0].value.func, ast.Name)
+                and node.keywords[0].value.func.id == 'locals'
+        ):
+            start, end = get_span(node)
+            replacements.append((start, end, 'f' + repr(node.func.value.value)))
+        elif (
+                isinstance(node, ast.Subscript)
+                and isinstance(node.value, ast.Name)
+                and node.value.id == 'REGEX_PATTERNS'
+        ):
+            start, end = get_span(node)
+            text = data[start:end].decode('utf-8')
+            if text not in patterns:
+                patterns[text] = '_PATTERN_{0}'.format(len(patterns))
+            replacements.append((start, end, patterns[text]))
+
+    for start, end, text in sorted(replacements, reverse=True):
+        data = data[:start] + text.encode('utf-8') + data[end:]
+    code = integer_check.sub(r'if type(\2) is not int and (\1):', data.decode('utf-8'))
+    code = required_check.sub(r'\1.keys() >= {\2}', code)
+
+    constants = ''.join(
+        '{0} = {1}\n'.format(name, text)
+        for text, name in list(patterns.items()) + list(definitions.items())
+    )
+    if constants:
+        pos = code.index('\ndef ') + 1
+        code = code[:pos] + constants + '\n' + code[pos:]
+    return code
+
 
 try:
     print("Dumping into " + temp_dir)
@@ -36,7 +149,7 @@ try:
         with open(os.path.join(temp_dir, filename), 'w') as f:
             json.dump(schema, f)
 
-    for filename in os.listdir(temp_dir):
+    for filename in sorted(os.listdir(temp_dir)):
         # Remember, the filename is still ending -schema.yaml
         code_name = filename[:-12].replace('-', '_')
         print("Processing " + filename)
@@ -50,12 +163,16 @@ try:
             replace(to_replace_src_name_1, '').
             replace(to_replace_src_name_2, '').
             replace('from fastjsonschema ', 'from ..fastjsonschema_replacement ').
+            # The patterns are only compiled when first used.
+            replace('import re\n', 'import re\nfrom ..fastjsonschema_replacement import LazyPattern\n', 1).
+            replace('re.compile(', 'LazyPattern(').
             replace('(data):', '(data: Dict[str, Any]) -> Dict[str, Any]:')
         )
+        code = optimize_code(code)
         with open(os.path.join(code_output_dir, code_name + '.py'), 'w') as f:
             f.write("# DO NOT MODIFY\n# AUTO-GENERATED CODE.\n\n# pylint: ignore\n\nfrom typing import Dict, Any\n\n")
             f.write(code)
-        init_contents += 'from .{0} import validate_{0}_schema_yaml as validate_{0}\n'.format(code_name)
+        init_contents += init_function.format(code_name, filename[:-12])
 
     with open(os.path.join(code_output_dir, '__init__.py'), 'w') as f:
         f.write(init_contents)
@@ -0,0 +1,89 @@
+#!/usr/bin/python3
+
+"""
+Measures the start up time of the extension point and entry modules, with
+`python3 -X importtime`.  Each extension point runs as a new process for each action, so
+its start up time is paid on every call.
+
+Run it with the package directories to measure, or with none to measure all of them:
+
+```bash
+./src/build-support/import-time.py py-ds-aws-s3 py-dm-aws-ecs-tags
+```
+
+It fails if a module imports a module that must only be imported on use, such as
+boto3, which is only needed once the first AWS call is made.
+"""
+
+from typing import Dict, List, Tuple
+import os
+import subprocess
+import sys
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPEAT = 5
+TOP_IMPORTS = 8
+
+# package directory -> (main module, modules it must not import on start up)
+ENTRY_MODULES: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    'py-dm-aws-ecs-tags': ('nightjar_dm_aws_ecs_tags.main', ('boto3', 'botocore')),
+    'py-dm-aws-service-discovery': ('nightjar_dm_aws_service_discovery.main', ()),
+    'py-ds-aws-s3': ('nightjar_ds_aws_s3.main', ('boto3', 'botocore')),
+    'py-ds-local': ('nightjar_ds_local.main', ()),
+    'py-entry-central': ('nightjar_central.main', ()),
+    'py-entry-standalone': ('nightjar_standalone.main', ()),
+    'py-tool-template-manager': ('nightjar_template_manager.main', ()),
+}
+
+
+def measure(package_dir: str, module: str) -> Dict[str, int]:
+    """Import the module in a new process, and get the cumulative import time, in
+    microseconds, of each module it imported."""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([
+        os.path.join(SRC_DIR, package_dir), os.path.join(SRC_DIR, 'py-common'),
+    ])
+    res = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=False,
+    )
+    if res.returncode != 0:
+        print(res.stderr.decode('utf-8'))
+        raise RuntimeError('Failed to import ' + module)
+    ret: Dict[str, int] = {}
+    for line in res.stderr.decode('utf-8').splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = line.split('|')
+        if len(parts) == 3 and line.startswith('import time:') and parts[1].strip().isdigit():
+            ret[parts[2].strip()] = int(parts[1])
+    return ret
+
+
+def main(args: List[str]) -> int:
+    """Measure each package's entry module."""
+    failed = False
+    for package_dir in args or sorted(ENTRY_MODULES.keys()):
+        module, forbidden = ENTRY_MODULES[package_dir]
+        # The best of several runs, to remove some of the noise.
+        times = min(
+            (measure(package_dir, module) for _ in range(REPEAT)),
+            key=lambda t: t.get(module, 0),
+        )
+        print('{0}: {1} imported in {2:.1f} ms'.format(
+            package_dir, module, times.get(module, 0) / 1000,
+        ))
+        top = sorted(
+            ((t, name) for name, t in times.items() if '.' not in name and name != module),
+            reverse=True,
+        )[:TOP_IMPORTS]
+        for cumulative, name in top:
+            print('    {0:>8.1f} ms  {1}'.format(cumulative / 1000, name))
+        for name in forbidden:
+            if name in times:
+                print('    ERROR: {0} must not be imported on start up'.format(name))
+                failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -6,8 +6,16 @@ the construction of the expected data map easier.
 
 from typing import Dict, List, Iterable, Sequence, Literal, Optional, Any, cast
 from ..log import debug
+from ..metrics import histogram
+from ..tracing import span
 from ..validation import validate_proxy_input
 
+TRANSFORM_SECONDS = histogram(
+    'nightjar_envoy_transform_duration_seconds',
+    'Time taken to transform the discovery map into the proxy input.',
+    ('transform',),
+)
+
 
 class HeaderQueryMatcher:
     """Matches a header value."""
@@ -419,7 +427,8 @@ class EnvoyConfigContext:
             self.network_id, self.service, self.admin_port,
         )
         ret['schema-version'] = 'v1'
-        return validate_proxy_input(ret)
+        with span('proxy-input.validate'):
+            return validate_proxy_input(ret)
 
 
 def is_protocol_http2(protocol: Optional[str]) -> bool:
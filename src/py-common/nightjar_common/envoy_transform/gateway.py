@@ -17,10 +17,15 @@ from .common import (
     get_service_color_instances_host_type,
     get_service_color_instance_host_format,
     is_protocol_http2,
+    TRANSFORM_SECONDS,
 )
 from ..log import warning
+from ..metrics import timed
+from ..tracing import traced
 
 
+@timed(TRANSFORM_SECONDS, 'gateway')
+@traced('proxy-input.create')
 def create_gateway_proxy_input(
         discovery_map_data: Dict[str, Any],
         namespace: str,
@@ -19,11 +19,16 @@ from .common import (
     RoutePathMatcher,
     HeaderQueryMatcher,
     is_protocol_http2,
+    TRANSFORM_SECONDS,
     get_service_color_instances_host_type,
 )
 from ..log import warning
+from ..metrics import timed
+from ..tracing import traced
 
 
+@timed(TRANSFORM_SECONDS, 'service')
+@traced('proxy-input.create')
 def create_service_color_proxy_input(
         discovery_map_data: Dict[str, Any],
         namespace: str,
@@ -365,6 +370,25 @@ def can_local_namespace_access_remote(
     return False
 
 
+def find_required_namespaces(
+        discovery_map_data: Dict[str, Any],
+        namespace: str,
+        service: str,
+        color: str,
+) -> Set[str]:
+    """Find the names of the namespaces that `create_service_color_proxy_input` needs
+    from the discovery map for this service-color.  The discovery map data only needs to
+    include the local namespace."""
+    ret = {namespace}
+    local_service_colors = find_namespace_service_colors(namespace, discovery_map_data)
+    if local_service_colors is not None:
+        local_service_color = find_service_color(service, color, local_service_colors)
+        if local_service_color is not None:
+            for egress_obj in local_service_color['namespace-egress']:
+                ret.add(egress_obj['namespace'])
+    return ret
+
+
 def find_namespace_service_colors(
         namespace: str,
         discovery_map_data: Dict[str, Any],
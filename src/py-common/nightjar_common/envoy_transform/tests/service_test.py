@@ -647,6 +647,31 @@ class ServiceTest(unittest.TestCase):  # pylint: disable=R0904
         res = service.find_namespace_service_colors('n2', discovery_map)
         self.assertIsNone(res)
 
+    def test_find_required_namespaces__no_namespace(self) -> None:
+        """Test find_required_namespaces with no matching namespace"""
+        discovery_map = _mk_doc({'namespaces': []})
+        res = service.find_required_namespaces(discovery_map, 'n1', 's', 'c')
+        self.assertEqual({'n1'}, res)
+
+    def test_find_required_namespaces__no_service_color(self) -> None:
+        """Test find_required_namespaces with no matching service-color"""
+        discovery_map = _mk_doc({'namespaces': [_mk_namespace({'namespace': 'n1'})]})
+        res = service.find_required_namespaces(discovery_map, 'n1', 's', 'c')
+        self.assertEqual({'n1'}, res)
+
+    def test_find_required_namespaces__egress(self) -> None:
+        """Test find_required_namespaces with namespace egress"""
+        discovery_map = _mk_doc({'namespaces': [_mk_namespace({
+            'namespace': 'n1', 'service-colors': [_mk_service_color({
+                'namespace-egress': [
+                    {'namespace': 'n2', 'interface': {'ipv4': '127.0.0.1', 'port': 100}},
+                    {'namespace': 'n3', 'interface': {'ipv4': '127.0.0.1', 'port': 101}},
+                ],
+            })],
+        })]})
+        res = service.find_required_namespaces(discovery_map, 'n1', 's', 'c')
+        self.assertEqual({'n1', 'n2', 'n3'}, res)
+
     def test_find_service_color__no_match(self) -> None:
         """Test find_service_color with no match."""
         scl = [_mk_service_color({'service': 'x', 'color': 'y'})]
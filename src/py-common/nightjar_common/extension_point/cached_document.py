@@ -6,11 +6,15 @@ Runs the data store extension point.
 from typing import Dict, Optional, Callable, Any
 import os
 import json
+import time
+from .document_stream import ListDocumentFormat, load_document
 from .errors import ExtensionPointTooManyRetries, ExtensionPointRuntimeError
 from ..log import warning
+from .. import tracing
 
 
 DOCUMENT_VERSION_KEY = 'document-version'
+ItemFilter = Callable[[Any], bool]
 
 
 class CachedDocument:
@@ -19,7 +23,7 @@ class CachedDocument:
     __slots__ = (
         'last_version', 'cached_file', 'update_file',
         'validator', 'commit_file', 'document_name',
-        'extension_point_name',
+        'extension_point_name', 'doc_format',
     )
 
     def __init__(
@@ -27,8 +31,10 @@ class CachedDocument:
             cached_file: str, update_file: str, commit_file: str,
             validator: Callable[[Dict[str, Any]], Dict[str, Any]],
             clean: bool,
+            doc_format: Optional[ListDocumentFormat] = None,
     ) -> None:
         self.last_version = ''
+        self.doc_format = doc_format
         self.extension_point_name = extension_point_name
         self.document_name = document_name
         self.validator = validator
@@ -41,7 +47,9 @@ class CachedDocument:
                 if os.path.isfile(name):
                     os.unlink(name)
 
-    def after_fetch(self, result_code: int) -> Dict[str, Any]:
+    def after_fetch(
+            self, result_code: int, item_filter: Optional[ItemFilter] = None,
+    ) -> Dict[str, Any]:
         """
         On cache update calls, the call included an output file, and if the
         update call returns code 30, then the existing cached version is used.
@@ -52,7 +60,12 @@ class CachedDocument:
 
         Either the cached version is returned or the updated file.
 
+        If this document has a list document format, then the file is read incrementally,
+        and only the list items that pass the item filter are returned.  The whole file
+        is still validated, one list item at a time.
+
         @param result_code:
+        @param item_filter:
         @return:
         """
         # Do not raise exceptions on fetch errors unless there is no cache.
@@ -63,10 +76,10 @@ class CachedDocument:
                 value: Optional[Dict[str, Any]] = None
                 err: Optional[Exception] = None
                 try:
-                    with open(self.update_file, 'r') as f:
-                        ret = json.load(f)
+                    ret = self.read_file(self.update_file, item_filter, True)
                     if isinstance(ret, dict) and DOCUMENT_VERSION_KEY in ret:
-                        value = self.validator(ret)
+                        with tracing.span('document.validate', document=self.document_name):
+                            value = self.validate_document(ret)
                 except ValueError as value_error:
                     err = value_error
                 if value is None:
@@ -90,13 +103,72 @@ class CachedDocument:
         if not os.path.isfile(self.cached_file):
             self.check_run_error(result_code, 'fetch')
             raise ExtensionPointRuntimeError(self.extension_point_name, 'create file', 0)
+        return self.read_cached(item_filter)
 
+    def read_cached(self, item_filter: Optional[ItemFilter] = None) -> Dict[str, Any]:
+        """Read the cached document, which must exist.  This allows for making another
+        pass over the cached file with a different item filter."""
         # The cached file is already valid.
-        with open(self.cached_file, 'r') as f:
-            ret = json.load(f)
+        ret = self.read_file(self.cached_file, item_filter, False)
         assert isinstance(ret, dict)
         return ret
 
+    def read_valid_version(self, filename: str) -> Optional[str]:
+        """Validate the whole document file, and return its version, or None if it is not
+        valid."""
+        try:
+            data = self.read_file(filename, None, True)
+            if isinstance(data, dict) and isinstance(data.get(DOCUMENT_VERSION_KEY), str):
+                self.validate_document(data)
+                return str(data[DOCUMENT_VERSION_KEY])
+        except ValueError:
+            pass
+        return None
+
+    def validate_document(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate the document read by `read_file`.  With a list document format, the
+        list items were validated as they were read, so only the rest is checked here.
+        A list key value that isn't a list was not read as items, so it is validated as
+        it is."""
+        if self.doc_format is None:
+            return self.validator(data)
+        list_key = self.doc_format.list_key
+        self.validator({
+            key: [] if key == list_key and isinstance(value, list) else value
+            for key, value in data.items()
+        })
+        return data
+
+    def read_file(self, filename: str, item_filter: Optional[ItemFilter], validate: bool) -> Any:
+        """Read the JSON file.  With a list document format, the list items are read and
+        validated one at a time, and the item filter is used.  The time taken by the item
+        validation is recorded in the trace span's `validate_seconds`, as it's spread
+        through the parsing."""
+        with open(filename, 'r') as f, tracing.span(
+                'document.read', document=self.document_name, validate=validate,
+        ) as read_span:
+            if self.doc_format is None:
+                return json.load(f)
+            doc_format = self.doc_format
+            validator = self.validator
+
+            def validate_item(item: Any) -> Any:
+                return doc_format.validate_item(validator, item)
+
+            def trace_validate_item(item: Any) -> Any:
+                start = time.perf_counter()
+                try:
+                    return doc_format.validate_item(validator, item)
+                finally:
+                    read_span.add_time('validate_seconds', start)
+
+            item_validator: Optional[Callable[[Any], Any]] = None
+            if validate:
+                item_validator = (
+                    trace_validate_item if tracing.is_enabled() else validate_item
+                )
+            return load_document(f, doc_format, item_filter, item_validator)
+
     def before_commit(self, data: Dict[str, Any]) -> None:
         """Called before the commit happens.  The document-version must be the new version."""
         data = self.validator(data)
@@ -3,24 +3,52 @@
 Runs the data store extension point.
 """
 
-from typing import Sequence, Literal, Dict, Any, Optional, cast
+from typing import Sequence, Iterable, Literal, Dict, Set, Any, Optional, cast
 import os
+import time
 import subprocess
-from .cached_document import CachedDocument
-from .run_cmd import run_with_backoff
-from ..validation import validate_discovery_map, validate_templates
+from .cached_document import CachedDocument, ItemFilter, DOCUMENT_VERSION_KEY
+from .discovery_map_delta import (
+    get_map_version, create_delta_document, diff_discovery_maps, apply_operations,
+    find_changes_since, is_delta_too_large, MAP_VERSION_KEY,
+)
+from .document_stream import DISCOVERY_MAP_FORMAT
+from .run_cmd import run_with_backoff, record_run
+from .shared_cache import SharedDocumentCache
+from .sharded_discovery_map import (
+    get_namespace_document_name, get_namespace_version,
+    create_index_document, create_namespace_document, create_namespace_document_validator,
+    join_namespace_documents, NAMESPACE_VERSION_KEY,
+)
+from ..validation import (
+    validate_discovery_map, validate_discovery_map_index, validate_discovery_map_delta,
+    validate_templates,
+)
+from ..log import warning
+from .. import tracing
 
-Action = Literal["fetch", "commit"]
-DocumentName = Literal["templates", "discovery-map"]
+Action = Literal["fetch", "commit", "gc", "watch", "lease"]
+DocumentName = Literal[
+    "templates", "discovery-map", "discovery-map-index", "discovery-map-delta",
+]
 TEMPLATES_DOCUMENT = cast(DocumentName, 'templates')
 DISCOVERY_MAP_DOCUMENT = cast(DocumentName, 'discovery-map')
-VALID_DOCUMENT_TYPES = (TEMPLATES_DOCUMENT, DISCOVERY_MAP_DOCUMENT,)
+DISCOVERY_MAP_INDEX_DOCUMENT = cast(DocumentName, 'discovery-map-index')
+DISCOVERY_MAP_DELTA_DOCUMENT = cast(DocumentName, 'discovery-map-delta')
+VALID_DOCUMENT_TYPES = (
+    TEMPLATES_DOCUMENT, DISCOVERY_MAP_DOCUMENT,
+    DISCOVERY_MAP_INDEX_DOCUMENT, DISCOVERY_MAP_DELTA_DOCUMENT,
+)
+DEFAULT_MAX_DELTA_CHANGES = 20
 
 
-class DataStoreRunner:
+class DataStoreRunner:  # pylint: disable=R0902
     """Manages the execution of the data store."""
     __slots__ = (
-        '_cached_documents',
+        '_cached_documents', '_temp_dir',
+        '_namespace_documents', '_namespace_data', '_committed_namespace_versions',
+        '_delta_map', '_committed_delta', '_committed_delta_map', 'max_delta_changes',
+        '_committed_documents', 'can_watch', '_watch_since', 'shared_cache',
         '_executable', 'max_retry_count', 'max_retry_wait_seconds',
         'env',
     )
@@ -29,6 +57,7 @@ class DataStoreRunner:
             self, cmd: Sequence[str], temp_dir: str,
             env: Optional[Dict[str, str]] = None,
     ) -> None:
+        self._temp_dir = temp_dir
         self._cached_documents = {
             TEMPLATES_DOCUMENT: CachedDocument(
                 'data_store',
@@ -47,22 +76,57 @@ class DataStoreRunner:
                 os.path.join(temp_dir, 'discovery-map-pending.json'),
                 validate_discovery_map,
                 True,
+                DISCOVERY_MAP_FORMAT,
+            ),
+            DISCOVERY_MAP_INDEX_DOCUMENT: CachedDocument(
+                'data_store',
+                DISCOVERY_MAP_INDEX_DOCUMENT,
+                os.path.join(temp_dir, 'discovery-map-index-cached.json'),
+                os.path.join(temp_dir, 'discovery-map-index-new.json'),
+                os.path.join(temp_dir, 'discovery-map-index-pending.json'),
+                validate_discovery_map_index,
+                True,
+            ),
+            DISCOVERY_MAP_DELTA_DOCUMENT: CachedDocument(
+                'data_store',
+                DISCOVERY_MAP_DELTA_DOCUMENT,
+                os.path.join(temp_dir, 'discovery-map-delta-cached.json'),
+                os.path.join(temp_dir, 'discovery-map-delta-new.json'),
+                os.path.join(temp_dir, 'discovery-map-delta-pending.json'),
+                validate_discovery_map_delta,
+                True,
             ),
         }
+        # The sharded discovery map's per-namespace documents, by namespace name.
+        self._namespace_documents: Dict[str, CachedDocument] = {}
+        self._namespace_data: Dict[str, Dict[str, Any]] = {}
+        self._committed_namespace_versions: Dict[str, str] = {}
+        # The delta encoded discovery map, as last fetched, and as last committed.
+        self._delta_map: Optional[Dict[str, Any]] = None
+        self._committed_delta: Optional[Dict[str, Any]] = None
+        self._committed_delta_map: Optional[Dict[str, Any]] = None
+        self.max_delta_changes = DEFAULT_MAX_DELTA_CHANGES
+        # The documents committed since the last garbage collection.
+        self._committed_documents: Set[str] = set()
+        # Cleared when the data store doesn't support the watch action.
+        self.can_watch = True
+        # When the first fetch since the last watch started, so the watch reports the
+        # changes made since then, rather than only those after the watch starts.
+        self._watch_since: Optional[float] = None
+        # Optional cache of the fetched documents, shared with other processes.
+        self.shared_cache: Optional[SharedDocumentCache] = None
         self._executable = tuple(cmd)
         self.env = env or dict(os.environ)
         self.max_retry_count = 5
         self.max_retry_wait_seconds = 60.0
 
-    def fetch_document(self, name: DocumentName) -> Dict[str, Any]:
-        """Fetch the document data."""
-        result_code = self.run_data_store(
-            self._cached_documents[name].update_file,
-            'fetch',
-            name,
-            self._cached_documents[name].last_version,
-        )
-        return self._cached_documents[name].after_fetch(result_code)
+    def fetch_document(
+            self, name: DocumentName, item_filter: Optional[ItemFilter] = None,
+    ) -> Dict[str, Any]:
+        """Fetch the document data.  For the discovery map, the item filter limits the
+        namespaces loaded."""
+        cached = self._cached_documents[name]
+        return cached.after_fetch(self.run_fetch(cached), item_filter)
 
     def commit_document(self, name: DocumentName, data: Dict[str, Any]) -> None:
         """Upload the templates to the data store."""
@@ -73,30 +137,266 @@ class DataStoreRunner:
         )
         self._cached_documents[name].after_commit(result)
 
+    def fetch_sharded_discovery_map(
+            self, namespaces: Iterable[str], use_cached_index: bool = False,
+    ) -> Dict[str, Any]:
+        """Fetch the discovery map from the sharded layout, with just the requested
+        namespaces.  Only the namespace documents whose version changed since the last
+        fetch are pulled from the data store.  If `use_cached_index` is set, then the
+        index from the previous fetch is used, rather than fetching it again."""
+        if use_cached_index:
+            index = self._cached_documents[DISCOVERY_MAP_INDEX_DOCUMENT].read_cached()
+        else:
+            index = self.fetch_document(DISCOVERY_MAP_INDEX_DOCUMENT)
+        versions: Dict[str, str] = index['namespaces']
+        for name in list(self._namespace_data.keys()):
+            if name not in versions:
+                del self._namespace_data[name]
+        found: Dict[str, Dict[str, Any]] = {}
+        for name in set(namespaces):
+            if name in versions:
+                found[name] = self.fetch_namespace_document(name, versions[name])
+        return join_namespace_documents(index, found)
+
+    def fetch_namespace_document(self, namespace: str, version: str) -> Dict[str, Any]:
+        """Fetch the sharded discovery map document for the one namespace, unless the
+        already loaded document has the requested version."""
+        data = self._namespace_data.get(namespace)
+        if data is not None and data[NAMESPACE_VERSION_KEY] == version:
+            return data
+        cached = self.get_namespace_document(namespace)
+        data = cached.after_fetch(self.run_fetch(cached))
+        self._namespace_data[namespace] = data
+        return data
+
+    def commit_sharded_discovery_map(self, data: Dict[str, Any]) -> None:
+        """Commit the discovery map in the sharded layout.  Only the namespaces whose
+        contents changed since the last commit are committed, followed by the index.  The
+        index is committed last, so that readers never find a namespace version in the
+        index that is newer than its document."""
+        versions: Dict[str, str] = {}
+        for namespace_obj in data['namespaces']:
+            name = namespace_obj['namespace']
+            version = get_namespace_version(namespace_obj)
+            versions[name] = version
+            if self._committed_namespace_versions.get(name) != version:
+                cached = self.get_namespace_document(name)
+                cached.before_commit(create_namespace_document(namespace_obj, version))
+                result = self.run_data_store(
+                    cached.commit_file, 'commit', cached.document_name, '',
+                )
+                cached.after_commit(result)
+                # Only mark the namespace as committed once it is successfully stored.
+                self._committed_namespace_versions[name] = version
+        self.commit_document(DISCOVERY_MAP_INDEX_DOCUMENT, create_index_document(versions))
+        self._committed_namespace_versions = versions
+
+    def forget_commits(self) -> None:
+        """Forget what this runner committed, so the next commit stores the whole discovery
+        map: a new delta snapshot and every namespace.  Another process may have committed
+        since then, such as a different leader."""
+        self._committed_namespace_versions = {}
+        self._committed_delta = None
+        self._committed_delta_map = None
+
+    def run_fetch(self, cached: CachedDocument) -> int:
+        """Fetch the document into its update file, through the shared cache if there is
+        one."""
+        if self._watch_since is None:
+            self._watch_since = time.time()
+        if self.shared_cache is None:
+            return self.run_data_store(
+                cached.update_file, 'fetch', cached.document_name, cached.last_version,
+            )
+        return self.shared_cache.fetch(
+            cached.document_name, cached.update_file, cached.last_version,
+            lambda dest_file, last_version: self.run_data_store(
+                dest_file, 'fetch', cached.document_name, last_version,
+            ),
+            cached.read_valid_version,
+        )
+
+    def get_namespace_document(self, namespace: str) -> CachedDocument:
+        """Get the cached document for the sharded discovery map's namespace document."""
+        ret = self._namespace_documents.get(namespace)
+        if ret is None:
+            name = get_namespace_document_name(namespace)
+            ret = CachedDocument(
+                'data_store',
+                name,
+                os.path.join(self._temp_dir, name + '-cached.json'),
+                os.path.join(self._temp_dir, name + '-new.json'),
+                os.path.join(self._temp_dir, name + '-pending.json'),
+                create_namespace_document_validator(namespace),
+                True,
+            )
+            self._namespace_documents[namespace] = ret
+        return ret
+
+    def fetch_delta_discovery_map(self, use_last: bool = False) -> Dict[str, Any]:
+        """Fetch the discovery map using the delta encoding.  If the discovery map
+        already held is in the delta chain, then the changes are applied to it, otherwise
+        the snapshot is fetched and the changes are applied to that.  If `use_last` is
+        set, then the discovery map from the last fetch is returned, if there is one."""
+        if use_last and self._delta_map is not None:
+            return self._delta_map
+        delta = self.fetch_document(DISCOVERY_MAP_DELTA_DOCUMENT)
+        current = self._delta_map
+        self._delta_map = None
+        if current is not None and self.apply_delta(current, delta):
+            self._delta_map = current
+            return current
+        snapshot = self.fetch_document(DISCOVERY_MAP_DOCUMENT)
+        if not self.apply_delta(snapshot, delta):
+            # Either the snapshot is newer than the delta chain, or the changes could not
+            # be applied.  Either way, the snapshot is the best version available.
+            snapshot = self._cached_documents[DISCOVERY_MAP_DOCUMENT].read_cached()
+        self._delta_map = snapshot
+        return snapshot
+
+    @staticmethod
+    def apply_delta(data: Dict[str, Any], delta: Dict[str, Any]) -> bool:
+        """Apply the delta document's changes to the discovery map, in place.  Returns
+        False if the discovery map version is not in the delta chain, or the changes
+        don't apply to it.  In that case, the discovery map may be partially changed."""
+        changes = find_changes_since(delta, str(data.get(MAP_VERSION_KEY, '')))
+        if changes is None:
+            return False
+        try:
+            for change in changes:
+                apply_operations(data, change['operations'])
+                data[MAP_VERSION_KEY] = change['to-version']
+        except ValueError as err:
+            warning('Could not apply the discovery map delta: {err}', err=err)
+            return False
+        return True
+
+    def commit_delta_discovery_map(self, data: Dict[str, Any]) -> None:
+        """Commit the discovery map using the delta encoding.  The changes since the last
+        commit are added to the delta document, unless the delta document grows too large,
+        in which case a new snapshot is committed along with an empty delta document."""
+        version = get_map_version(data)
+        previous = self._committed_delta
+        if previous is not None and self._committed_delta_map is not None:
+            if previous[MAP_VERSION_KEY] == version:
+                return
+            operations = diff_discovery_maps(self._committed_delta_map, data)
+            if operations is not None:
+                delta = create_delta_document(
+                    previous['base-version'], version,
+                    [*previous['changes'], {
+                        'from-version': previous[MAP_VERSION_KEY],
+                        'to-version': version,
+                        'operations': operations,
+                    }],
+                )
+                if not is_delta_too_large(delta, data, self.max_delta_changes):
+                    self.commit_delta_document(delta, data)
+                    return
+
+        # Compact the changes into a new snapshot.  The snapshot is committed first, so
+        # readers of the old delta document still find their version in its chain.
+        snapshot = dict(data)
+        snapshot[DOCUMENT_VERSION_KEY] = ''
+        snapshot[MAP_VERSION_KEY] = version
+        self.commit_document(DISCOVERY_MAP_DOCUMENT, snapshot)
+        self.commit_delta_document(create_delta_document(version, version, []), data)
+
+    def commit_delta_document(self, delta: Dict[str, Any], data: Dict[str, Any]) -> None:
+        """Commit the delta document, and remember it for the next delta commit."""
+        # Clear the state first, so that a failed commit starts over with a new snapshot.
+        self._committed_delta = None
+        self._committed_delta_map = None
+        self.commit_document(DISCOVERY_MAP_DELTA_DOCUMENT, delta)
+        self._committed_delta = delta
+        self._committed_delta_map = data
+
+    def collect_garbage(self) -> None:
+        """Ask the data store to remove the old versions of the documents committed since
+        the last call.  Failures are only logged; the next call tries again with whatever
+        was committed in the meantime."""
+        documents = sorted(self._committed_documents)
+        self._committed_documents.clear()
+        for document in documents:
+            result = self.run_data_store('', 'gc', document, '')
+            if result != 0:
+                warning(
+                    'Data store garbage collection for {document} exited with {result}',
+                    document=document, result=result,
+                )
+
+    def wait_for_change(self, timeout: float) -> bool:
+        """Wait, up to the timeout, for the data store to report a changed document.
+        Returns True if one changed.  If the data store can't watch for changes, then this
+        just waits out the timeout."""
+        since = self._watch_since
+        self._watch_since = None
+        if self.can_watch:
+            args = ['--watch-timeout={0}'.format(timeout)]
+            if since is not None:
+                args.append('--watch-since={0}'.format(since))
+            result = self.run_data_store_once('', 'watch', '', '', *args)
+            if result == 0:
+                return True
+            if result == 30:
+                return False
+            if result == 6:
+                warning('Data store does not support watching; polling instead')
+                self.can_watch = False
+            else:
+                warning('Data store watch exited with {result}', result=result)
+        time.sleep(timeout)
+        return False
+
+    def acquire_lease(self, name: str, owner: str, lease_seconds: float) -> Optional[bool]:
+        """Acquire or renew the named lease for the owner.  Returns True if the owner holds
+        the lease, False if it doesn't, and None if the data store doesn't support leases.
+        A lease time of 0 releases the lease."""
+        result = self.run_data_store_once(
+            '', 'lease', name, '',
+            '--lease-owner=' + owner, '--lease-seconds={0}'.format(lease_seconds),
+        )
+        if result == 0:
+            return True
+        if result == 6:
+            return None
+        if result != 30:
+            warning('Data store lease {name} exited with {result}', name=name, result=result)
+        return False
+
     def run_data_store_once(
             self,
             dest_file: str,
-            action: Action, document: DocumentName, last_version: str,
+            action: Action, document: str, last_version: str,
+            *extra_args: str,
     ) -> int:
         """The most basic invocation of the data store."""
-        result = subprocess.run(
-            [
-                *self._executable,
-                '--document=' + document,
-                '--action=' + action,
-                '--previous-document-version=' + last_version,
-                '--action-file=' + dest_file,
-                '--api-version=1',
-            ],
-            check=False,
-            env=self.env,
-        )
+        with tracing.span(
+                'extension-point.run', extension_point='data-store', action=action,
+                document=document,
+        ) as run_span:
+            start = time.monotonic()
+            result = subprocess.run(
+                [
+                    *self._executable,
+                    '--document=' + document,
+                    '--action=' + action,
+                    '--previous-document-version=' + last_version,
+                    '--action-file=' + dest_file,
+                    '--api-version=1',
+                    *extra_args,
+                ],
+                check=False,
+                env=self.env,
+            )
+            record_run('data-store', action, result.returncode, time.monotonic() - start)
+            run_span.set_attribute('exit_code', result.returncode)
         return result.returncode
 
     def run_data_store(
             self,
             dest_file: str,
-            action: Action, document: DocumentName, last_version: str,
+            action: Action, document: str, last_version: str,
     ) -> int:
         """Run the data store process, with correct retries.  The downloaded file is
         moved over to the previous file."""
@@ -106,6 +406,10 @@ class DataStoreRunner:
                 dest_file, action, document, last_version,
             )
 
-        return run_with_backoff(
+        result = run_with_backoff(
             run_it, self.max_retry_count, self.max_retry_wait_seconds,
+            extension_point='data-store',
         )
+        if action == 'commit' and result == 0:
+            self._committed_documents.add(document)
+        return result
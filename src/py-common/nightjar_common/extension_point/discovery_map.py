@@ -3,12 +3,25 @@
 Interface for calling out to the discovery map extension point executable.
 """
 
-from typing import Dict, Sequence, Any
+from typing import Dict, Sequence, Iterable, Optional, Any
 import os
 import subprocess
-from .cached_document import CachedDocument
-from .run_cmd import run_with_backoff
+import time
+from .cached_document import CachedDocument, ItemFilter
+from .document_stream import DISCOVERY_MAP_FORMAT
+from .run_cmd import run_with_backoff, record_run
 from ..validation import validate_discovery_map
+from .. import tracing
+
+
+def namespace_filter(namespaces: Iterable[str]) -> ItemFilter:
+    """Create a discovery map item filter that only keeps the given namespaces."""
+    names = frozenset(namespaces)
+
+    def matches(namespace_obj: Any) -> bool:
+        return isinstance(namespace_obj, dict) and namespace_obj.get('namespace') in names
+
+    return matches
 
 
 class DiscoveryMapRunner:
@@ -31,33 +44,51 @@ class DiscoveryMapRunner:
             os.path.join(temp_dir, 'mesh-pending.json'),
             validate_discovery_map,
             True,
+            DISCOVERY_MAP_FORMAT,
         )
         self._executable = tuple(executable)
         self.max_retry_count = 5
         self.max_retry_wait_seconds = 60.0
 
-    def get_mesh(self) -> Dict[str, Any]:
-        """Get the mesh information from the discovery map."""
-        return self.run_discovery_map()
+    def get_mesh(self, item_filter: Optional[ItemFilter] = None) -> Dict[str, Any]:
+        """Get the mesh information from the discovery map.  If the item filter
+        (see `namespace_filter`) is given, then only the namespaces that pass it are loaded."""
+        return self.run_discovery_map(item_filter)
+
+    def get_cached_mesh(self, item_filter: Optional[ItemFilter] = None) -> Dict[str, Any]:
+        """Re-read the mesh information last returned by `get_mesh`, without running the
+        discovery map again."""
+        return self._cached.read_cached(item_filter)
 
     def run_discovery_map_once(self, output_file: str, previous_version: str) -> int:
         """Execute the executable one time."""
-        result = subprocess.run(
-            [
-                *self._executable,
-                '--action-file=' + output_file,
-                '--previous-document-version=' + previous_version,
-                '--api-version=1',
-            ],
-            check=False,
-        )
+        with tracing.span(
+                'extension-point.run', extension_point='discovery-map', action='fetch',
+        ) as run_span:
+            start = time.monotonic()
+            result = subprocess.run(
+                [
+                    *self._executable,
+                    '--action-file=' + output_file,
+                    '--previous-document-version=' + previous_version,
+                    '--api-version=1',
+                ],
+                check=False,
+            )
+            record_run('discovery-map', 'fetch', result.returncode, time.monotonic() - start)
+            run_span.set_attribute('exit_code', result.returncode)
         return result.returncode
 
-    def run_discovery_map(self) -> Dict[str, Any]:
+    def run_discovery_map(
+            self, item_filter: Optional[ItemFilter] = None,
+    ) -> Dict[str, Any]:
         """Execute the discovery map extension point.  Return the raw data structure."""
 
         def run_it() -> int:
             return self.run_discovery_map_once(self._cached.update_file, self._cached.last_version)
 
-        result = run_with_backoff(run_it, self.max_retry_count, self.max_retry_wait_seconds)
-        return self._cached.after_fetch(result)
+        result = run_with_backoff(
+            run_it, self.max_retry_count, self.max_retry_wait_seconds,
+            extension_point='discovery-map',
+        )
+        return self._cached.after_fetch(result, item_filter)
@@ -0,0 +1,209 @@
+
+"""
+Delta encoding for the discovery map in the data store.
+
+The full discovery map is committed as the "discovery-map" snapshot document only now
+and then.  Each change after that is added to the "discovery-map-delta" document, as a
+list of namespace and service-color operations.  Readers that already hold one of the
+versions in the delta chain apply the remaining operations, rather than downloading the
+whole map again.
+"""
+
+from typing import Dict, List, Tuple, Optional, Any
+import json
+from .discovery_map_fingerprint import get_fingerprint
+
+DISCOVERY_MAP_DELTA_DOCUMENT = 'discovery-map-delta'
+MAP_VERSION_KEY = 'map-version'
+SERVICE_COLORS_KEY = 'service-colors'
+
+# The delta chain is compacted into a new snapshot when it grows beyond this fraction
+# of the snapshot size.
+MAX_DELTA_SIZE_RATIO = 0.5
+
+ServiceColorKey = Tuple[str, str]
+
+
+def get_map_version(data: Dict[str, Any]) -> str:
+    """Get the version of the discovery map's contents."""
+    return get_fingerprint(data)
+
+
+def create_delta_document(
+        base_version: str, map_version: str, changes: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Create the delta document."""
+    return {
+        'schema-version': 'v1',
+        'document-version': '',
+        'base-version': base_version,
+        MAP_VERSION_KEY: map_version,
+        'changes': changes,
+    }
+
+
+def diff_discovery_maps(
+        old: Dict[str, Any], new: Dict[str, Any],
+) -> Optional[List[Dict[str, Any]]]:
+    """Find the operations that turn the old discovery map into the new one.  Returns None
+    if the maps can't be expressed as operations, because the namespace names are not
+    unique."""
+    old_namespaces = _namespaces_by_name(old)
+    new_namespaces = _namespaces_by_name(new)
+    if old_namespaces is None or new_namespaces is None:
+        return None
+    ret: List[Dict[str, Any]] = []
+    for name, namespace_obj in new_namespaces.items():
+        old_obj = old_namespaces.get(name)
+        if old_obj is None:
+            ret.append({'op': 'add', 'namespace': name, 'value': namespace_obj})
+        elif old_obj != namespace_obj:
+            ret.extend(diff_namespaces(old_obj, namespace_obj))
+    for name in old_namespaces:
+        if name not in new_namespaces:
+            ret.append({'op': 'remove', 'namespace': name})
+    return ret
+
+
+def diff_namespaces(old: Dict[str, Any], new: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Find the operations that turn the old namespace into the new one.  If anything but
+    the service-colors changed, then the whole namespace is replaced."""
+    name = new['namespace']
+    old_service_colors = _service_colors_by_key(old)
+    new_service_colors = _service_colors_by_key(new)
+    if (
+            old_service_colors is None or new_service_colors is None
+            or _without_service_colors(old) != _without_service_colors(new)
+    ):
+        return [{'op': 'replace', 'namespace': name, 'value': new}]
+    ret: List[Dict[str, Any]] = []
+    for key, service_color in new_service_colors.items():
+        old_service_color = old_service_colors.get(key)
+        if old_service_color is None:
+            ret.append(_service_color_op('add', name, key, service_color))
+        elif old_service_color != service_color:
+            ret.append(_service_color_op('replace', name, key, service_color))
+    for key in old_service_colors:
+        if key not in new_service_colors:
+            ret.append(_service_color_op('remove', name, key, None))
+    return ret
+
+
+def apply_operations(data: Dict[str, Any], operations: List[Dict[str, Any]]) -> None:
+    """Apply the operations to the discovery map, in place.  Raises a ValueError if the
+    operations don't match the discovery map."""
+    namespaces: List[Dict[str, Any]] = data['namespaces']
+    for operation in operations:
+        name = operation['namespace']
+        index = _find_index(namespaces, ('namespace',), (name,))
+        if 'service' not in operation:
+            _apply_operation(namespaces, index, operation)
+            continue
+        if index is None:
+            raise ValueError('no namespace {0} for the service-color operation'.format(name))
+        service_colors: List[Dict[str, Any]] = namespaces[index][SERVICE_COLORS_KEY]
+        _apply_operation(
+            service_colors,
+            _find_index(
+                service_colors, ('service', 'color'),
+                (operation['service'], operation.get('color')),
+            ),
+            operation,
+        )
+
+
+def find_changes_since(
+        delta: Dict[str, Any], map_version: str,
+) -> Optional[List[Dict[str, Any]]]:
+    """Find the changes in the delta document to apply to the discovery map with the given
+    map version.  Returns None if the version is not in the delta chain."""
+    if map_version == delta[MAP_VERSION_KEY]:
+        return []
+    changes: List[Dict[str, Any]] = delta['changes']
+    for index, change in enumerate(changes):
+        if change['from-version'] == map_version:
+            return changes[index:]
+    return None
+
+
+def is_delta_too_large(
+        delta: Dict[str, Any], data: Dict[str, Any], max_changes: int,
+) -> bool:
+    """Should the delta chain be compacted into a new snapshot of the discovery map?"""
+    if len(delta['changes']) > max_changes:
+        return True
+    return len(json.dumps(delta)) > len(json.dumps(data)) * MAX_DELTA_SIZE_RATIO
+
+
+def _apply_operation(
+        items: List[Dict[str, Any]], index: Optional[int], operation: Dict[str, Any],
+) -> None:
+    op_name = operation['op']
+    if op_name == 'add':
+        if index is not None:
+            raise ValueError('cannot add an existing item: {0}'.format(operation))
+        items.append(_get_operation_value(operation))
+    elif index is None:
+        raise ValueError('cannot {0} a missing item: {1}'.format(op_name, operation))
+    elif op_name == 'replace':
+        items[index] = _get_operation_value(operation)
+    else:
+        del items[index]
+
+
+def _get_operation_value(operation: Dict[str, Any]) -> Dict[str, Any]:
+    value = operation.get('value')
+    if not isinstance(value, dict):
+        raise ValueError('operation requires a value: {0}'.format(operation))
+    return value
+
+
+def _find_index(
+        items: List[Dict[str, Any]], keys: Tuple[str, ...], values: Tuple[Any, ...],
+) -> Optional[int]:
+    for index, item in enumerate(items):
+        if tuple(item[key] for key in keys) == values:
+            return index
+    return None
+
+
+def _service_color_op(
+        op_name: str, namespace: str, key: ServiceColorKey,
+        service_color: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    ret: Dict[str, Any] = {
+        'op': op_name, 'namespace': namespace, 'service': key[0], 'color': key[1],
+    }
+    if service_color is not None:
+        ret['value'] = service_color
+    return ret
+
+
+def _namespaces_by_name(data: Dict[str, Any]) -> Optional[Dict[str, Dict[str, Any]]]:
+    ret: Dict[str, Dict[str, Any]] = {}
+    for namespace_obj in data['namespaces']:
+        name = namespace_obj['namespace']
+        if name in ret:
+            return None
+        ret[name] = namespace_obj
+    return ret
+
+
+def _service_colors_by_key(
+        namespace_obj: Dict[str, Any],
+) -> Optional[Dict[ServiceColorKey, Dict[str, Any]]]:
+    ret: Dict[ServiceColorKey, Dict[str, Any]] = {}
+    for service_color in namespace_obj[SERVICE_COLORS_KEY]:
+        key = (service_color['service'], service_color['color'])
+        if key in ret:
+            return None
+        ret[key] = service_color
+    return ret
+
+
+def _without_service_colors(namespace_obj: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        key: value
+        for key, value in namespace_obj.items()
+        if key != SERVICE_COLORS_KEY
+    }
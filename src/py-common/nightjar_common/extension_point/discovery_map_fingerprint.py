@@ -0,0 +1,64 @@
+
+"""
+Canonical form and fingerprint of the discovery map.
+
+Many of the discovery map arrays are collections where the order has no meaning, such as
+the namespaces and instances.  The discovery map providers don't
+always create these in a stable order (the ECS task listing order isn't stable), so two
+maps describing the same mesh may differ only in their ordering.  The canonical form sorts
+these arrays and the object keys, so that such maps have the same fingerprint.
+
+The service-colors, routes and their namespace-access keep their order, because envoy
+matches the routes in the order they are generated.
+"""
+
+from typing import Dict, Any
+import json
+import hashlib
+
+# Array properties whose order has no meaning, per the discovery map schema.  The property
+# names are unique to those arrays within the discovery map.
+UNORDERED_ARRAY_KEYS = frozenset((
+    'namespaces',
+    'instances',
+    'namespace-egress',
+    'headers',
+    'query-parameters',
+))
+
+# Top level properties that describe the document version, not the mesh.
+VERSION_KEYS = frozenset(('document-version', 'map-version',))
+
+
+def get_canonical_json(data: Dict[str, Any]) -> str:
+    """Get the canonical JSON text of the discovery map.  The version properties are not
+    part of it."""
+    return _canonical_object({
+        key: value
+        for key, value in data.items()
+        if key not in VERSION_KEYS
+    })
+
+
+def get_fingerprint(data: Dict[str, Any]) -> str:
+    """Get the fingerprint of the discovery map contents.  Maps that differ only in the
+    order of the unordered arrays, or in their version, have the same fingerprint."""
+    return hashlib.sha256(get_canonical_json(data).encode('utf-8')).hexdigest()
+
+
+def _canonical_value(value: Any, unordered: bool) -> str:
+    if isinstance(value, dict):
+        return _canonical_object(value)
+    if isinstance(value, list):
+        items = [_canonical_value(item, False) for item in value]
+        if unordered:
+            items.sort()
+        return '[' + ','.join(items) + ']'
+    return json.dumps(value)
+
+
+def _canonical_object(value: Dict[str, Any]) -> str:
+    return '{' + ','.join(
+        json.dumps(key) + ':' + _canonical_value(value[key], key in UNORDERED_ARRAY_KEYS)
+        for key in sorted(value.keys())
+    ) + '}'
@@ -0,0 +1,161 @@
+"""
+Incremental reading of the JSON documents passed through the extension points.
+
+The large documents, such as the discovery map, are a JSON object with a few small
+header values and one large list.  Reading them incrementally means only one list
+item needs to be in memory at a time, rather than the whole document.
+"""
+
+from typing import Dict, Iterator, Tuple, Callable, TextIO, Optional, Any
+import json
+
+# Default number of characters to read from the stream at a time.
+READ_SIZE = 64 * 1024
+WHITESPACE = ' \t\n\r'
+# The characters that may follow a complete number.
+NUMBER_END = ',]}' + WHITESPACE
+DECODER = json.JSONDecoder()
+
+
+class ListDocumentFormat:
+    """Describes a document made of small header values and one list of items, and how to
+    validate a single item in that list by itself."""
+    __slots__ = ('list_key', 'shell',)
+
+    def __init__(self, list_key: str, shell: Dict[str, Any]) -> None:
+        self.list_key = list_key
+        self.shell = dict(shell)
+
+    def validate_item(
+            self, validator: Callable[[Dict[str, Any]], Dict[str, Any]], item: Any,
+    ) -> Any:
+        """Validate the single list item by validating a document that contains just it."""
+        document = dict(self.shell)
+        document[self.list_key] = [item]
+        return validator(document)[self.list_key][0]
+
+
+DISCOVERY_MAP_FORMAT = ListDocumentFormat(
+    'namespaces', {'schema-version': 'v1', 'document-version': ''},
+)
+
+
+class StreamReader:
+    """Reads JSON values out of a text stream, keeping only the unparsed text in memory."""
+    __slots__ = ('_inp', '_buffer', '_pos', '_eof', '_read_size',)
+
+    def __init__(self, inp: TextIO, read_size: int = READ_SIZE) -> None:
+        self._inp = inp
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+        self._read_size = read_size
+
+    def fill(self) -> bool:
+        """Read more text into the buffer.  Returns False if the stream is done.
+        The read size grows with the buffer, so a large value requires few re-parses."""
+        if self._eof:
+            return False
+        data = self._inp.read(max(self._read_size, len(self._buffer) - self._pos))
+        if not data:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + data
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, or '' at the end of the stream."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, allowed: str) -> str:
+        """Consume the next non-whitespace character, which must be one of the allowed
+        characters."""
+        next_char = self.peek()
+        if not next_char or next_char not in allowed:
+            raise ValueError('expected one of {0} but found {1}'.format(
+                repr(allowed), repr(next_char) if next_char else 'end of document',
+            ))
+        self._pos += 1
+        return next_char
+
+    def value(self) -> Any:
+        """Consume the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                ret, end = DECODER.raw_decode(self._buffer, self._pos)
+                # A number cut short by the end of the buffer, such as in its fraction or
+                # exponent, still parses as a shorter number, so only trust it if a
+                # character that ends a number follows it.
+                if self._eof or (end < len(self._buffer) and (
+                        isinstance(ret, bool) or not isinstance(ret, (int, float))
+                        or self._buffer[end] in NUMBER_END
+                )):
+                    self._pos = end
+                    return ret
+            except ValueError:
+                if self._eof:
+                    raise
+            self.fill()
+
+
+def iter_document(
+        inp: TextIO, list_key: str, read_size: int = READ_SIZE,
+) -> Iterator[Tuple[str, Any, bool]]:
+    """Iterate over the top-level values in the JSON object read from the stream, as
+    (key, value, is_list_item).  The `list_key` list is returned as an empty list
+    followed by each of its items as its own list item value."""
+    reader = StreamReader(inp, read_size)
+    reader.expect('{')
+    if reader.peek() == '}':
+        reader.expect('}')
+    else:
+        while True:
+            key = reader.value()
+            if not isinstance(key, str):
+                raise ValueError('document keys must be strings')
+            reader.expect(':')
+            if key == list_key and reader.peek() == '[':
+                reader.expect('[')
+                yield key, [], False
+                if reader.peek() == ']':
+                    reader.expect(']')
+                else:
+                    while True:
+                        yield key, reader.value(), True
+                        if reader.expect(',]') == ']':
+                            break
+            else:
+                yield key, reader.value(), False
+            if reader.expect(',}') == '}':
+                break
+    if reader.peek():
+        raise ValueError('extra data after the document')
+
+
+def load_document(
+        inp: TextIO,
+        doc_format: ListDocumentFormat,
+        item_filter: Optional[Callable[[Any], bool]] = None,
+        item_validator: Optional[Callable[[Any], Any]] = None,
+) -> Dict[str, Any]:
+    """Load the document from the stream, keeping only the list items that pass the
+    filter (or all of them if no filter is given).  Each item is passed through the
+    item validator, if given, before it is filtered."""
+    ret: Dict[str, Any] = {}
+    for key, value, is_item in iter_document(inp, doc_format.list_key):
+        if not is_item:
+            ret[key] = value
+            continue
+        if item_validator:
+            value = item_validator(value)
+        if item_filter is None or item_filter(value):
+            ret[key].append(value)
+    return ret
@@ -8,6 +8,23 @@ import shlex
 import shutil
 import time
 from .errors import ConfigurationError
+from .. import metrics
+
+EXTENSION_POINT_RUNS = metrics.counter(
+    'nightjar_extension_point_runs_total',
+    'Extension point runs, by exit code.',
+    ('extension_point', 'action', 'exit_code',),
+)
+EXTENSION_POINT_SECONDS = metrics.histogram(
+    'nightjar_extension_point_duration_seconds',
+    'Time taken by each extension point run.',
+    ('extension_point', 'action',),
+)
+EXTENSION_POINT_RETRIES = metrics.counter(
+    'nightjar_extension_point_retries_total',
+    'Extension point runs retried after asking for a retry.',
+    ('extension_point',),
+)
 
 
 def get_env_executable_cmd(
@@ -38,6 +55,7 @@ def run_with_backoff(
         maximum_retries: int,
         maximum_wait: float,
         sleep_func: Callable[[float], None] = time.sleep,
+        extension_point: str = '',
 ) -> int:
     """
     Runs the command, and if it requires a retry, then it retries with a wait.  However,
@@ -49,6 +67,7 @@ def run_with_backoff(
     The logic is taken from:
     https://docs.aws.amazon.com/general/latest/gr/api-retries.html
 
+    @param extension_point: name of the extension point, for the retry metric.
     @param sleep_func:
     @param maximum_wait:
     @param runner_callback:
@@ -62,8 +81,15 @@ def run_with_backoff(
         retry_count += 1
         result = runner_callback()
         if result == 31 and retry_count < maximum_retries:
+            EXTENSION_POINT_RETRIES.inc(extension_point)
             sleep_time = min((2 ** retry_count), maximum_wait)
             sleep_func(sleep_time)
         else:
             keep_running = False
     return result
+
+
+def record_run(extension_point: str, action: str, exit_code: int, seconds: float) -> None:
+    """Record the metrics for one run of the extension point."""
+    EXTENSION_POINT_RUNS.inc(extension_point, action, str(exit_code))
+    EXTENSION_POINT_SECONDS.observe(seconds, extension_point, action)
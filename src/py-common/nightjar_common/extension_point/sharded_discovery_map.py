@@ -0,0 +1,89 @@
+
+"""
+The sharded discovery map layout in the data store.
+
+Rather than storing the whole mesh in the one "discovery-map" document, each namespace
+is stored as its own document, along with a small index document that lists each
+namespace's contents version.  Readers that only need a few namespaces fetch the index,
+then just the namespace documents they need whose version changed.
+"""
+
+from typing import Dict, Callable, Any
+import json
+import hashlib
+import urllib.parse
+from ..validation import validate_discovery_map
+
+DISCOVERY_MAP_INDEX_DOCUMENT = 'discovery-map-index'
+NAMESPACE_DOCUMENT_PREFIX = 'discovery-map-namespace.'
+NAMESPACE_VERSION_KEY = 'namespace-version'
+
+
+def get_namespace_document_name(namespace: str) -> str:
+    """Get the data store document name for the namespace.  The namespace is encoded so
+    that the document name is safe to use as a file name or a path part."""
+    return NAMESPACE_DOCUMENT_PREFIX + urllib.parse.quote(namespace, safe='')
+
+
+def get_namespace_version(namespace_obj: Dict[str, Any]) -> str:
+    """Get the version of the namespace contents.  This is based only on the contents, so
+    unchanged namespaces keep the same version between commits."""
+    return hashlib.sha256(
+        json.dumps(namespace_obj, sort_keys=True, separators=(',', ':')).encode('utf-8'),
+    ).hexdigest()
+
+
+def create_index_document(namespace_versions: Dict[str, str]) -> Dict[str, Any]:
+    """Create the index document from the namespace name -> version map."""
+    return {
+        'schema-version': 'v1',
+        'document-version': '',
+        'namespaces': dict(namespace_versions),
+    }
+
+
+def create_namespace_document(namespace_obj: Dict[str, Any], version: str) -> Dict[str, Any]:
+    """Create the per-namespace document.  This is a discovery map with just the one
+    namespace."""
+    return {
+        'schema-version': 'v1',
+        'document-version': '',
+        NAMESPACE_VERSION_KEY: version,
+        'namespaces': [namespace_obj],
+    }
+
+
+def create_namespace_document_validator(
+        namespace: str,
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Create the validator for the per-namespace document of the given namespace."""
+
+    def validator(data: Dict[str, Any]) -> Dict[str, Any]:
+        ret = validate_discovery_map(data)
+        if not isinstance(ret.get(NAMESPACE_VERSION_KEY), str):
+            raise ValueError('namespace document must contain a {0}'.format(
+                NAMESPACE_VERSION_KEY,
+            ))
+        namespaces = ret['namespaces']
+        if len(namespaces) != 1 or namespaces[0]['namespace'] != namespace:
+            raise ValueError('namespace document must contain only the namespace {0}'.format(
+                namespace,
+            ))
+        return ret
+
+    return validator
+
+
+def join_namespace_documents(
+        index: Dict[str, Any], namespace_documents: Dict[str, Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Join the namespace documents into a single discovery map.  The document version is
+    the index's version."""
+    return {
+        'schema-version': 'v1',
+        'document-version': index['document-version'],
+        'namespaces': [
+            namespace_documents[name]['namespaces'][0]
+            for name in sorted(namespace_documents.keys())
+        ],
+    }
@@ -0,0 +1,161 @@
+
+"""
+A document cache shared by the nightjar containers on the same host.
+
+Each document is kept in the shared directory as `(document).json`, along with a
+`(document).state` file that records its document version and when it was last
+refreshed from the data store.  Only one process refreshes a stale document, while
+holding the document's lock file; the others wait for it, then use the new copy.
+"""
+
+from typing import Dict, Callable, Optional, Iterator, Any
+import os
+import json
+import time
+import shutil
+import tempfile
+import contextlib
+from ..log import debug, warning
+
+try:
+    import fcntl
+except ImportError:  # pragma no cover
+    fcntl = None  # type: ignore
+
+FetchCallback = Callable[[str, str], int]
+VersionReader = Callable[[str], Optional[str]]
+
+
+class SharedDocumentCache:
+    """Manages the documents in a directory shared between processes."""
+    __slots__ = ('cache_dir', 'max_age_seconds',)
+
+    def __init__(self, cache_dir: str, max_age_seconds: float) -> None:
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_age_seconds = max_age_seconds
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def fetch(
+            self, document: str, dest_file: str, last_version: str,
+            fetch_callback: FetchCallback, version_reader: VersionReader,
+    ) -> int:
+        """Fetch the document into the destination file, with the same exit codes as the
+        data store fetch action.  If the shared copy is stale, then the fetch callback
+        (called with the output file and the previous version) is used to refresh it;
+        the version reader validates the fetched file and returns its version, or None
+        if it isn't valid."""
+        with self.lock(document, False):
+            state = self.read_state(document)
+            if self.is_fresh(state):
+                return self.copy_out(document, state, dest_file, last_version)
+        with self.lock(document, True):
+            # Another process may have refreshed the document while waiting for the lock.
+            state = self.read_state(document)
+            if self.is_fresh(state):
+                return self.copy_out(document, state, dest_file, last_version)
+            return self.refresh(
+                document, state, dest_file, last_version, fetch_callback, version_reader,
+            )
+
+    def refresh(
+            self, document: str, state: Dict[str, Any], dest_file: str, last_version: str,
+            fetch_callback: FetchCallback, version_reader: VersionReader,
+    ) -> int:
+        """Refresh the shared copy from the data store.  The caller must hold the
+        exclusive lock."""
+        data_file = self.get_data_file(document)
+        shared_version = state.get('document-version', '')
+        if not os.path.isfile(data_file):
+            shared_version = ''
+        # Only the process holding the exclusive lock writes this file.
+        gen_filename = os.path.join(self.cache_dir, document + '.fetch')
+        result = fetch_callback(gen_filename, shared_version)
+        if result == 0 and os.path.isfile(gen_filename):
+            version = version_reader(gen_filename)
+            if version is None:
+                # Let the caller report the invalid document, and use its own cache.
+                shutil.move(gen_filename, dest_file)
+                return 0
+            os.replace(gen_filename, data_file)
+            state = {'document-version': version}
+        elif result != 30 or not shared_version:
+            if os.path.isfile(gen_filename):
+                os.unlink(gen_filename)
+            return result
+        debug(
+            'Refreshed shared {document} version {version}',
+            document=document, version=state['document-version'],
+        )
+        state['refreshed'] = time.time()
+        self.write_state(document, state)
+        return self.copy_out(document, state, dest_file, last_version)
+
+    def copy_out(
+            self, document: str, state: Dict[str, Any], dest_file: str, last_version: str,
+    ) -> int:
+        """Give the caller the shared copy, unless it already has that version.  The
+        shared copy is only ever replaced, never changed, so it can be hard linked."""
+        if last_version and state['document-version'] == last_version:
+            return 30
+        data_file = self.get_data_file(document)
+        if os.path.isfile(dest_file):
+            os.unlink(dest_file)
+        try:
+            os.link(data_file, dest_file)
+        except OSError:
+            # Different file system, or links are not supported.
+            shutil.copyfile(data_file, dest_file)
+        return 0
+
+    def is_fresh(self, state: Dict[str, Any]) -> bool:
+        """Is the shared copy new enough to use without asking the data store?"""
+        refreshed = state.get('refreshed')
+        return (
+            isinstance(refreshed, (int, float))
+            and isinstance(state.get('document-version'), str)
+            and 0 <= time.time() - refreshed < self.max_age_seconds
+        )
+
+    def read_state(self, document: str) -> Dict[str, Any]:
+        """Read the shared state for the document."""
+        state_file = self.get_state_file(document)
+        if os.path.isfile(state_file) and os.path.isfile(self.get_data_file(document)):
+            try:
+                with open(state_file, 'r') as f:
+                    ret = json.load(f)
+                if isinstance(ret, dict):
+                    return ret
+            except ValueError:
+                warning('Shared cache state {file} is not valid', file=state_file)
+        return {}
+
+    def write_state(self, document: str, state: Dict[str, Any]) -> None:
+        """Replace the shared state for the document."""
+        gen_fd, gen_filename = tempfile.mkstemp(
+            prefix=document, suffix='.tmp', dir=self.cache_dir,
+        )
+        os.write(gen_fd, json.dumps(state).encode('utf-8'))
+        os.close(gen_fd)
+        # mkstemp creates the file readable only by the owner.
+        os.chmod(gen_filename, 0o644)
+        os.replace(gen_filename, self.get_state_file(document))
+
+    @contextlib.contextmanager
+    def lock(self, document: str, exclusive: bool) -> Iterator[None]:
+        """Hold the document's lock file."""
+        with open(os.path.join(self.cache_dir, document + '.lock'), 'a') as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def get_data_file(self, document: str) -> str:
+        """Get the shared copy of the document."""
+        return os.path.join(self.cache_dir, document + '.json')
+
+    def get_state_file(self, document: str) -> str:
+        """Get the shared state of the document."""
+        return os.path.join(self.cache_dir, document + '.state')
@@ -9,6 +9,9 @@ import shutil
 import json
 from .. import cached_document
 from .. import errors
+from .. import document_stream
+from ... import tracing
+from ...validation import validate_discovery_map
 
 
 class CachedDocumentTest(unittest.TestCase):
@@ -77,6 +80,106 @@ class CachedDocumentTest(unittest.TestCase):
         self.assertEqual(0, len(self._validation_stack))
         self.assertFalse(os.path.isfile(self.update_file))
 
+    def test_after_fetch__list_format(self) -> None:
+        """Ensure that a document with a list format is validated per item and filtered."""
+        self.doc.doc_format = document_stream.ListDocumentFormat('items', {'v': ''})
+        expected_1 = {cached_document.DOCUMENT_VERSION_KEY: "1", "items": ["a", "b", "c"]}
+        with open(self.update_file, 'w') as f:
+            json.dump(expected_1, f)
+        res = self.doc.after_fetch(0, lambda item: item != 'b')
+        self.assertEqual(
+            {cached_document.DOCUMENT_VERSION_KEY: "1", "items": ["a", "c"]},
+            res,
+        )
+        self.assertEqual([
+            {'v': '', 'items': ['a']},
+            {'v': '', 'items': ['b']},
+            {'v': '', 'items': ['c']},
+            {cached_document.DOCUMENT_VERSION_KEY: "1", "items": []},
+        ], self._validation_stack)
+        self._validation_stack.clear()
+
+        # The cached file keeps all the items, and can be re-read with another filter.
+        self.assertEqual(expected_1, self.doc.read_cached())
+        self.assertEqual(
+            {cached_document.DOCUMENT_VERSION_KEY: "1", "items": ["b"]},
+            self.doc.read_cached(lambda item: item == 'b'),
+        )
+        self.assertEqual([], self._validation_stack)
+
+    def test_after_fetch__list_format_traced(self) -> None:
+        """Ensure that the item validation time is recorded in the read span."""
+        self.doc.doc_format = document_stream.ListDocumentFormat('items', {'v': ''})
+        with open(self.update_file, 'w') as f:
+            json.dump({cached_document.DOCUMENT_VERSION_KEY: "1", "items": ["a", "b"]}, f)
+        trace_file = os.path.join(self._temp_dir, 'trace.jsonl')
+        tracing.enable(trace_file)
+        try:
+            res = self.doc.after_fetch(0)
+        finally:
+            tracing.disable()
+        self.assertEqual(["a", "b"], res['items'])
+        with open(trace_file, 'r') as f:
+            spans = [json.loads(line) for line in f]
+        self.assertEqual(['document.read', 'document.validate'], [s['name'] for s in spans])
+        self.assertEqual(
+            ['document', 'validate', 'validate_seconds'],
+            sorted(spans[0]['attributes'].keys()),
+        )
+
+    def test_after_fetch__list_format_not_a_list(self) -> None:
+        """Ensure that a list key value that is not a list is still validated."""
+        doc = cached_document.CachedDocument(
+            'ext_1', 'discovery-map',
+            self.cached_file, self.update_file, self.commit_file,
+            validate_discovery_map, True, document_stream.DISCOVERY_MAP_FORMAT,
+        )
+        for namespaces in ('n1', {'namespace': 'n1'}):
+            with open(self.update_file, 'w') as f:
+                json.dump({
+                    'schema-version': 'v1',
+                    cached_document.DOCUMENT_VERSION_KEY: '1',
+                    'namespaces': namespaces,
+                }, f)
+            try:
+                doc.after_fetch(0)
+                self.fail('did not raise')  # pragma no cover
+            except errors.ExtensionPointRuntimeError:
+                pass
+            self.assertFalse(os.path.isfile(self.cached_file))
+            self.assertEqual('', doc.last_version)
+
+    def test_after_fetch__list_format_invalid_item(self) -> None:
+        """Ensure that an invalid list item causes the cached version to be used."""
+        expected_1 = {cached_document.DOCUMENT_VERSION_KEY: "1", "items": ["a"]}
+        with open(self.update_file, 'w') as f:
+            json.dump(expected_1, f)
+        self.doc.after_fetch(0)
+        self._validation_stack.clear()
+
+        def validator(val: Dict[str, Any]) -> Dict[str, Any]:
+            raise ValueError('bad item {0}'.format(val))
+
+        self.doc.validator = validator
+        self.doc.doc_format = document_stream.ListDocumentFormat('items', {})
+        with open(self.update_file, 'w') as f:
+            json.dump({cached_document.DOCUMENT_VERSION_KEY: "2", "items": ["bad"]}, f)
+        res = self.doc.after_fetch(0)
+        self.assertEqual(expected_1, res)
+
+    def test_read_valid_version(self) -> None:
+        """Test read_valid_version with valid and invalid files."""
+        with open(self.update_file, 'w') as f:
+            json.dump({'document-version': 'v1'}, f)
+        self.assertEqual('v1', self.doc.read_valid_version(self.update_file))
+        self.assertEqual([{'document-version': 'v1'}], self._validation_stack)
+        with open(self.update_file, 'w') as f:
+            json.dump({'document-version': 1}, f)
+        self.assertIsNone(self.doc.read_valid_version(self.update_file))
+        with open(self.update_file, 'w') as f:
+            f.write('{[')
+        self.assertIsNone(self.doc.read_valid_version(self.update_file))
+
     def test_check_run_error__success(self) -> None:
         """Ensure check_run_error does the right thing."""
         self.doc.check_run_error(0, 'foo')
@@ -3,19 +3,24 @@
 Tests the data_store module.
 """
 
+from typing import List, Dict, Any
 import unittest
 import os
 import tempfile
 import shutil
 import json
+import time
 from .invoke_runnable import RunnableInvoker
 from .. import data_store
 from ..cached_document import DOCUMENT_VERSION_KEY
+from ..sharded_discovery_map import get_namespace_version, create_namespace_document
+from ..discovery_map_delta import get_map_version, create_delta_document, MAP_VERSION_KEY
+from ..shared_cache import SharedDocumentCache
 from ..errors import ExtensionPointTooManyRetries, ExtensionPointRuntimeError
 from ...fastjsonschema_replacement import JsonSchemaException
 
 
-class DataStoreRunnerTest(unittest.TestCase):
+class DataStoreRunnerTest(unittest.TestCase):  # pylint: disable=R0904
     """Tests the DataStoreRunner class"""
 
     def setUp(self) -> None:
@@ -273,6 +278,39 @@ class DataStoreRunnerTest(unittest.TestCase):
         with open(self.template_cache_file, 'r') as f:
             self.assertEqual(expected_data, json.load(f))
 
+    def test_fetch_templates__shared_cache(self) -> None:
+        """Tests fetch_document for templates through the shared cache, which only runs
+        the data store for the first runner."""
+        expected_data = {
+            'schema-version': 'v1',
+            DOCUMENT_VERSION_KEY: '1',
+            'gateway-templates': [],
+            'service-templates': [],
+        }
+        shared_dir = os.path.join(self._tempdir, 'shared')
+        invoker = RunnableInvoker(self._tempdir)
+        cmd = invoker.prepare_runnable([0])
+        shared_cache = SharedDocumentCache(shared_dir, 60)
+        # The runnable doesn't write the action file, so put the data there up front.
+        with open(os.path.join(shared_dir, 'templates.fetch'), 'w') as f:
+            json.dump(expected_data, f)
+        for index in range(2):
+            runner = data_store.DataStoreRunner(
+                cmd, os.path.join(self._tempdir, 'runner-{0}'.format(index)),
+            )
+            runner.shared_cache = shared_cache
+            self.assertEqual(expected_data, runner.fetch_document('templates'))
+        self.assertEqual(
+            [[
+                '--document=templates',
+                '--action=fetch',
+                '--previous-document-version=',
+                '--action-file=' + os.path.join(shared_dir, 'templates.fetch'),
+                '--api-version=1',
+            ]],
+            invoker.get_invoked_arguments(),
+        )
+
     def test_fetch_templates__repeated_same_version(self) -> None:
         """Tests fetch_document for templates with same version return code."""
         expected_data = {
@@ -483,3 +521,418 @@ class DataStoreRunnerTest(unittest.TestCase):
             ],
             invoker.get_invoked_arguments(),
         )
+
+    def test_commit_sharded_discovery_map(self) -> None:
+        """Tests commit_sharded_discovery_map, which only commits the changed namespaces."""
+        invoker = RunnableInvoker(self._tempdir)
+        runner = data_store.DataStoreRunner(invoker.prepare_runnable([0] * 5), self._tempdir)
+        index_commit_file = os.path.join(self._tempdir, 'discovery-map-index-pending.json')
+        ns_1 = _mk_namespace('n1')
+        ns_2 = _mk_namespace('n/2')
+        runner.commit_sharded_discovery_map({
+            'schema-version': 'v1',
+            DOCUMENT_VERSION_KEY: '123',
+            'namespaces': [ns_1, ns_2],
+        })
+        self.assertEqual(
+            [
+                '--document=discovery-map-namespace.n1',
+                '--document=discovery-map-namespace.n%2F2',
+                '--document=discovery-map-index',
+            ],
+            [args[0] for args in invoker.get_invoked_arguments()],
+        )
+        with open(index_commit_file, 'r') as f:
+            self.assertEqual({
+                'schema-version': 'v1',
+                DOCUMENT_VERSION_KEY: '',
+                'namespaces': {
+                    'n1': get_namespace_version(ns_1),
+                    'n/2': get_namespace_version(ns_2),
+                },
+            }, json.load(f))
+        with open(os.path.join(
+                self._tempdir, 'discovery-map-namespace.n1-pending.json',
+        ), 'r') as f:
+            self.assertEqual(
+                create_namespace_document(ns_1, get_namespace_version(ns_1)),
+                json.load(f),
+            )
+
+        # Change just one namespace.
+        invoker.clear_arguments()
+        ns_2['network-id'] = 'nk2'
+        runner.commit_sharded_discovery_map({
+            'schema-version': 'v1',
+            DOCUMENT_VERSION_KEY: '124',
+            'namespaces': [ns_1, ns_2],
+        })
+        self.assertEqual(
+            [
+                '--document=discovery-map-namespace.n%2F2',
+                '--document=discovery-map-index',
+            ],
+            [args[0] for args in invoker.get_invoked_arguments()],
+        )
+
+    def test_forget_commits(self) -> None:
+        """Tests forget_commits, which makes the next commit store the whole map again."""
+        invoker = RunnableInvoker(self._tempdir)
+        runner = data_store.DataStoreRunner(invoker.prepare_runnable([0] * 10), self._tempdir)
+        dm_1 = _mk_discovery_map([_mk_namespace('n1'), _mk_namespace('n2')])
+        runner.commit_sharded_discovery_map(dm_1)
+        runner.commit_delta_discovery_map(dm_1)
+
+        invoker.clear_arguments()
+        runner.forget_commits()
+        runner.commit_sharded_discovery_map(dm_1)
+        runner.commit_delta_discovery_map(dm_1)
+        self.assertEqual(
+            [
+                '--document=discovery-map-namespace.n1',
+                '--document=discovery-map-namespace.n2',
+                '--document=discovery-map-index',
+                '--document=discovery-map',
+                '--document=discovery-map-delta',
+            ],
+            [args[0] for args in invoker.get_invoked_arguments()],
+        )
+
+    def test_fetch_sharded_discovery_map(self) -> None:
+        """Tests fetch_sharded_discovery_map, which only fetches the requested and changed
+        namespaces."""
+        invoker = RunnableInvoker(self._tempdir)
+        runner = data_store.DataStoreRunner(invoker.prepare_runnable([0] * 6), self._tempdir)
+        index_fetch_file = os.path.join(self._tempdir, 'discovery-map-index-new.json')
+        namespaces = {name: _mk_namespace(name) for name in ('n1', 'n2', 'n3')}
+        for name, namespace_obj in namespaces.items():
+            runner.get_namespace_document(name)
+            with open(os.path.join(
+                    self._tempdir, 'discovery-map-namespace.{0}-new.json'.format(name),
+            ), 'w') as f:
+                json.dump(create_namespace_document(namespace_obj, name + '-v1'), f)
+        with open(index_fetch_file, 'w') as f:
+            json.dump({
+                'schema-version': 'v1',
+                DOCUMENT_VERSION_KEY: 'i1',
+                'namespaces': {'n1': 'n1-v1', 'n2': 'n2-v1', 'n3': 'n3-v1'},
+            }, f)
+
+        res = runner.fetch_sharded_discovery_map(['n3', 'n1', 'n2', 'n4'])
+        self.assertEqual({
+            'schema-version': 'v1',
+            DOCUMENT_VERSION_KEY: 'i1',
+            'namespaces': [namespaces['n1'], namespaces['n2'], namespaces['n3']],
+        }, res)
+        self.assertEqual(
+            [
+                '--document=discovery-map-index',
+                '--document=discovery-map-namespace.n1',
+                '--document=discovery-map-namespace.n2',
+                '--document=discovery-map-namespace.n3',
+            ],
+            sorted(args[0] for args in invoker.get_invoked_arguments()),
+        )
+
+        # A new index, where n1 changed and n3 is removed.  Only n1 is fetched again,
+        # and the already loaded n2 is reused.
+        invoker.clear_arguments()
+        namespaces['n1']['network-id'] = 'nk2'
+        with open(os.path.join(self._tempdir, 'discovery-map-namespace.n1-new.json'), 'w') as f:
+            json.dump(create_namespace_document(namespaces['n1'], 'n1-v2'), f)
+        with open(index_fetch_file, 'w') as f:
+            json.dump({
+                'schema-version': 'v1',
+                DOCUMENT_VERSION_KEY: 'i2',
+                'namespaces': {'n1': 'n1-v2', 'n2': 'n2-v1'},
+            }, f)
+        res = runner.fetch_sharded_discovery_map(['n1', 'n2', 'n3'])
+        self.assertEqual({
+            'schema-version': 'v1',
+            DOCUMENT_VERSION_KEY: 'i2',
+            'namespaces': [namespaces['n1'], namespaces['n2']],
+        }, res)
+        self.assertEqual(
+            [
+                '--document=discovery-map-index',
+                '--document=discovery-map-namespace.n1',
+            ],
+            [args[0] for args in invoker.get_invoked_arguments()],
+        )
+
+        # Using the cached index does not fetch anything.
+        invoker.clear_arguments()
+        res = runner.fetch_sharded_discovery_map(['n2'], True)
+        self.assertEqual({
+            'schema-version': 'v1',
+            DOCUMENT_VERSION_KEY: 'i2',
+            'namespaces': [namespaces['n2']],
+        }, res)
+        self.assertEqual([], invoker.get_invoked_arguments())
+
+
+    def test_commit_delta_discovery_map(self) -> None:
+        """Tests commit_delta_discovery_map, which commits the snapshot only on compaction."""
+        invoker = RunnableInvoker(self._tempdir)
+        runner = data_store.DataStoreRunner(invoker.prepare_runnable([0] * 6), self._tempdir)
+        delta_commit_file = os.path.join(self._tempdir, 'discovery-map-delta-pending.json')
+        # Enough namespaces that a one namespace change is small compared to the map.
+        names = ['n{0}'.format(i) for i in range(12)]
+        dm_1 = _mk_discovery_map([_mk_namespace(name) for name in names])
+        version_1 = get_map_version(dm_1)
+
+        # The first commit always creates a snapshot.
+        runner.commit_delta_discovery_map(dm_1)
+        self.assertEqual(
+            ['--document=discovery-map', '--document=discovery-map-delta'],
+            [args[0] for args in invoker.get_invoked_arguments()],
+        )
+        with open(self.dm_commit_file, 'r') as f:
+            self.assertEqual(version_1, json.load(f)[MAP_VERSION_KEY])
+        with open(delta_commit_file, 'r') as f:
+            self.assertEqual(create_delta_document(version_1, version_1, []), json.load(f))
+
+        # The same contents commit nothing.
+        invoker.clear_arguments()
+        runner.commit_delta_discovery_map(
+            _mk_discovery_map([_mk_namespace(name) for name in names]),
+        )
+        self.assertEqual([], invoker.get_invoked_arguments())
+
+        # A change only commits the delta.
+        invoker.clear_arguments()
+        dm_2 = _mk_discovery_map([_mk_namespace(name) for name in [*names, 'x']])
+        version_2 = get_map_version(dm_2)
+        runner.commit_delta_discovery_map(dm_2)
+        self.assertEqual(
+            ['--document=discovery-map-delta'],
+            [args[0] for args in invoker.get_invoked_arguments()],
+        )
+        with open(delta_commit_file, 'r') as f:
+            self.assertEqual(create_delta_document(version_1, version_2, [{
+                'from-version': version_1,
+                'to-version': version_2,
+                'operations': [{'op': 'add', 'namespace': 'x', 'value': _mk_namespace('x')}],
+            }]), json.load(f))
+
+        # Too many changes compacts the delta into a new snapshot.
+        invoker.clear_arguments()
+        runner.max_delta_changes = 0
+        dm_3 = _mk_discovery_map([_mk_namespace('n2')])
+        version_3 = get_map_version(dm_3)
+        runner.commit_delta_discovery_map(dm_3)
+        self.assertEqual(
+            ['--document=discovery-map', '--document=discovery-map-delta'],
+            [args[0] for args in invoker.get_invoked_arguments()],
+        )
+        with open(delta_commit_file, 'r') as f:
+            self.assertEqual(create_delta_document(version_3, version_3, []), json.load(f))
+
+    def test_fetch_delta_discovery_map(self) -> None:
+        """Tests fetch_delta_discovery_map, which applies the delta to the held map."""
+        invoker = RunnableInvoker(self._tempdir)
+        runner = data_store.DataStoreRunner(invoker.prepare_runnable([0] * 6), self._tempdir)
+        delta_fetch_file = os.path.join(self._tempdir, 'discovery-map-delta-new.json')
+        ns_1 = _mk_namespace('n1')
+        ns_2 = _mk_namespace('n2')
+        snapshot = _mk_discovery_map([ns_1])
+        snapshot[MAP_VERSION_KEY] = 'm1'
+        with open(self.dm_fetch_file, 'w') as f:
+            json.dump(snapshot, f)
+        with open(delta_fetch_file, 'w') as f:
+            json.dump(create_delta_document('m1', 'm2', [{
+                'from-version': 'm1',
+                'to-version': 'm2',
+                'operations': [{'op': 'add', 'namespace': 'n2', 'value': ns_2}],
+            }]), f)
+
+        res = runner.fetch_delta_discovery_map()
+        self.assertEqual([ns_1, ns_2], res['namespaces'])
+        self.assertEqual('m2', res[MAP_VERSION_KEY])
+        self.assertEqual(
+            ['--document=discovery-map-delta', '--document=discovery-map'],
+            [args[0] for args in invoker.get_invoked_arguments()],
+        )
+
+        # Using the last fetched map does not fetch anything.
+        invoker.clear_arguments()
+        self.assertIs(res, runner.fetch_delta_discovery_map(True))
+        self.assertEqual([], invoker.get_invoked_arguments())
+
+        # A longer chain only fetches the delta, and applies the new changes.
+        invoker.clear_arguments()
+        with open(delta_fetch_file, 'w') as f:
+            json.dump(create_delta_document('m1', 'm3', [{
+                'from-version': 'm1',
+                'to-version': 'm2',
+                'operations': [{'op': 'add', 'namespace': 'n2', 'value': ns_2}],
+            }, {
+                'from-version': 'm2',
+                'to-version': 'm3',
+                'operations': [{'op': 'remove', 'namespace': 'n1'}],
+            }]), f)
+        res = runner.fetch_delta_discovery_map()
+        self.assertEqual([ns_2], res['namespaces'])
+        self.assertEqual(
+            ['--document=discovery-map-delta'],
+            [args[0] for args in invoker.get_invoked_arguments()],
+        )
+
+        # A compacted delta that does not apply to the held map or the snapshot uses
+        # the snapshot as-is.
+        invoker.clear_arguments()
+        with open(delta_fetch_file, 'w') as f:
+            json.dump(create_delta_document('m4', 'm5', [{
+                'from-version': 'm4',
+                'to-version': 'm5',
+                'operations': [{'op': 'remove', 'namespace': 'n3'}],
+            }]), f)
+        res = runner.fetch_delta_discovery_map()
+        self.assertEqual([ns_1], res['namespaces'])
+        self.assertEqual(
+            ['--document=discovery-map-delta', '--document=discovery-map'],
+            [args[0] for args in invoker.get_invoked_arguments()],
+        )
+
+    def test_collect_garbage(self) -> None:
+        """Tests collect_garbage, which only runs for the committed documents."""
+        invoker = RunnableInvoker(self._tempdir)
+        runner = data_store.DataStoreRunner(
+            invoker.prepare_runnable([0, 1, 0, 0, 6]), self._tempdir,
+        )
+        runner.max_retry_count = 1
+        templates = {
+            DOCUMENT_VERSION_KEY: '1',
+            'schema-version': 'v1',
+            'activity': 'template',
+            'gateway-templates': [],
+            'service-templates': [],
+        }
+        runner.commit_document('templates', templates)
+        with self.assertRaises(ExtensionPointRuntimeError):
+            runner.commit_document('discovery-map', _mk_discovery_map([]))
+        runner.collect_garbage()
+        runner.commit_document('templates', templates)
+        runner.collect_garbage()
+        runner.collect_garbage()
+        self.assertEqual(
+            [
+                '--document=templates --action=commit',
+                '--document=discovery-map --action=commit',
+                '--document=templates --action=gc',
+                '--document=templates --action=commit',
+                '--document=templates --action=gc',
+            ],
+            [' '.join(args[0:2]) for args in invoker.get_invoked_arguments()],
+        )
+
+    def test_wait_for_change(self) -> None:
+        """Tests wait_for_change with the different data store exit codes."""
+        invoker = RunnableInvoker(self._tempdir)
+        runner = data_store.DataStoreRunner(
+            invoker.prepare_runnable([0, 30, 1, 6]), self._tempdir,
+        )
+        self.assertTrue(runner.wait_for_change(0.01))
+        self.assertFalse(runner.wait_for_change(0.01))
+        self.assertFalse(runner.wait_for_change(0.01))
+        self.assertTrue(runner.can_watch)
+        self.assertFalse(runner.wait_for_change(0.01))
+        self.assertFalse(runner.can_watch)
+        # No longer runs the data store.
+        self.assertFalse(runner.wait_for_change(0.01))
+        args = invoker.get_invoked_arguments()
+        self.assertEqual(4, len(args))
+        self.assertEqual(
+            [
+                '--document=',
+                '--action=watch',
+                '--previous-document-version=',
+                '--action-file=',
+                '--api-version=1',
+                '--watch-timeout=0.01',
+            ],
+            args[0],
+        )
+
+    def test_wait_for_change__since(self) -> None:
+        """Tests wait_for_change after fetches, which passes the time of the first fetch
+        since the last watch."""
+        invoker = RunnableInvoker(self._tempdir)
+        runner = data_store.DataStoreRunner(
+            invoker.prepare_runnable([0, 30, 30, 0]), self._tempdir,
+        )
+        with open(os.path.join(self.template_fetch_file), 'w') as f:
+            json.dump({
+                'schema-version': 'v1',
+                DOCUMENT_VERSION_KEY: 'x1x',
+                'gateway-templates': [],
+                'service-templates': [],
+            }, f)
+        before = time.time()
+        runner.fetch_document('templates')
+        after = time.time()
+        runner.fetch_document('templates')
+        self.assertFalse(runner.wait_for_change(0.01))
+        # Nothing was fetched since the last watch.
+        self.assertTrue(runner.wait_for_change(0.01))
+        args = invoker.get_invoked_arguments()
+        self.assertEqual(4, len(args))
+        self.assertEqual('--watch-timeout=0.01', args[2][5])
+        self.assertTrue(args[2][6].startswith('--watch-since='))
+        self.assertTrue(before <= float(args[2][6][len('--watch-since='):]) <= after)
+        self.assertEqual(6, len(args[3]))
+
+    def test_acquire_lease(self) -> None:
+        """Tests acquire_lease with the different data store exit codes."""
+        invoker = RunnableInvoker(self._tempdir)
+        runner = data_store.DataStoreRunner(
+            invoker.prepare_runnable([0, 30, 1, 6]), self._tempdir,
+        )
+        self.assertTrue(runner.acquire_lease('leader', 'me', 60))
+        self.assertFalse(runner.acquire_lease('leader', 'me', 60))
+        self.assertFalse(runner.acquire_lease('leader', 'me', 60))
+        self.assertIsNone(runner.acquire_lease('leader', 'me', 0))
+        args = invoker.get_invoked_arguments()
+        self.assertEqual(4, len(args))
+        self.assertEqual(
+            [
+                '--document=leader',
+                '--action=lease',
+                '--previous-document-version=',
+                '--action-file=',
+                '--api-version=1',
+                '--lease-owner=me',
+                '--lease-seconds=60',
+            ],
+            args[0],
+        )
+
+    def test_apply_delta__bad_operation(self) -> None:
+        """Tests apply_delta with a change that does not apply to the map."""
+        data = _mk_discovery_map([])
+        data[MAP_VERSION_KEY] = 'm1'
+        self.assertFalse(data_store.DataStoreRunner.apply_delta(
+            data,
+            create_delta_document('m1', 'm2', [{
+                'from-version': 'm1',
+                'to-version': 'm2',
+                'operations': [{'op': 'remove', 'namespace': 'n1'}],
+            }]),
+        ))
+
+
+def _mk_namespace(name: str) -> Dict[str, Any]:
+    return {
+        'namespace': name,
+        'network-id': 'nk1',
+        'gateways': {'instances': [], 'prefer-gateway': False, 'protocol': 'http1.1'},
+        'service-colors': [],
+    }
+
+
+def _mk_discovery_map(namespaces: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        'schema-version': 'v1',
+        DOCUMENT_VERSION_KEY: '',
+        'namespaces': namespaces,
+    }
@@ -0,0 +1,161 @@
+
+"""
+Tests the discovery_map_delta module.
+"""
+
+from typing import List, Dict, Any
+import unittest
+import copy
+from .. import discovery_map_delta
+
+
+class DiscoveryMapDeltaTest(unittest.TestCase):
+    """Tests the discovery map delta functions."""
+
+    def test_get_map_version(self) -> None:
+        """Test get_map_version, which only depends on the namespace contents."""
+        dm_1 = _mk_discovery_map([_mk_namespace('n1', [])])
+        dm_2 = copy.deepcopy(dm_1)
+        dm_2['document-version'] = 'other'
+        self.assertEqual(
+            discovery_map_delta.get_map_version(dm_1),
+            discovery_map_delta.get_map_version(dm_2),
+        )
+        dm_2['namespaces'][0]['network-id'] = 'nk2'
+        self.assertNotEqual(
+            discovery_map_delta.get_map_version(dm_1),
+            discovery_map_delta.get_map_version(dm_2),
+        )
+
+    def test_diff_and_apply__namespaces(self) -> None:
+        """Test diffing and applying added, removed, and replaced namespaces."""
+        old = _mk_discovery_map([
+            _mk_namespace('n1', []), _mk_namespace('n2', []), _mk_namespace('n3', []),
+        ])
+        new = copy.deepcopy(old)
+        del new['namespaces'][0]
+        new['namespaces'][0]['network-id'] = 'nk2'
+        new['namespaces'].append(_mk_namespace('n4', []))
+        operations = discovery_map_delta.diff_discovery_maps(old, new)
+        self.assertEqual([
+            {'op': 'replace', 'namespace': 'n2', 'value': new['namespaces'][0]},
+            {'op': 'add', 'namespace': 'n4', 'value': new['namespaces'][2]},
+            {'op': 'remove', 'namespace': 'n1'},
+        ], operations)
+        assert operations is not None
+        discovery_map_delta.apply_operations(old, operations)
+        self.assertEqual(new, old)
+
+    def test_diff_and_apply__service_colors(self) -> None:
+        """Test diffing and applying added, removed, and replaced service-colors."""
+        old = _mk_discovery_map([_mk_namespace('n1', [
+            _mk_service_color('s1', 'c1'), _mk_service_color('s1', 'c2'),
+            _mk_service_color('s2', 'c1'),
+        ])])
+        new = copy.deepcopy(old)
+        service_colors = new['namespaces'][0]['service-colors']
+        del service_colors[0]
+        service_colors[0]['index'] = 2
+        service_colors.append(_mk_service_color('s3', 'c1'))
+        operations = discovery_map_delta.diff_discovery_maps(old, new)
+        self.assertEqual([
+            {
+                'op': 'replace', 'namespace': 'n1', 'service': 's1', 'color': 'c2',
+                'value': service_colors[0],
+            },
+            {
+                'op': 'add', 'namespace': 'n1', 'service': 's3', 'color': 'c1',
+                'value': service_colors[2],
+            },
+            {'op': 'remove', 'namespace': 'n1', 'service': 's1', 'color': 'c1'},
+        ], operations)
+        assert operations is not None
+        discovery_map_delta.apply_operations(old, operations)
+        self.assertEqual(new, old)
+
+    def test_diff__duplicates(self) -> None:
+        """Test diffs with duplicate namespaces or service-colors."""
+        self.assertIsNone(discovery_map_delta.diff_discovery_maps(
+            _mk_discovery_map([]),
+            _mk_discovery_map([_mk_namespace('n1', []), _mk_namespace('n1', [])]),
+        ))
+        new = _mk_namespace('n1', [
+            _mk_service_color('s1', 'c1'), _mk_service_color('s1', 'c1'),
+        ])
+        self.assertEqual(
+            [{'op': 'replace', 'namespace': 'n1', 'value': new}],
+            discovery_map_delta.diff_namespaces(_mk_namespace('n1', []), new),
+        )
+
+    def test_apply_operations__errors(self) -> None:
+        """Test apply_operations with operations that don't match the discovery map."""
+        for operation in (
+                {'op': 'add', 'namespace': 'n1', 'value': _mk_namespace('n1', [])},
+                {'op': 'add', 'namespace': 'n2'},
+                {'op': 'remove', 'namespace': 'n2'},
+                {'op': 'replace', 'namespace': 'n2', 'value': {}},
+                {'op': 'remove', 'namespace': 'n2', 'service': 's1', 'color': 'c1'},
+                {'op': 'remove', 'namespace': 'n1', 'service': 's1', 'color': 'c1'},
+        ):
+            with self.assertRaises(ValueError):
+                discovery_map_delta.apply_operations(
+                    _mk_discovery_map([_mk_namespace('n1', [])]), [operation],
+                )
+
+    def test_find_changes_since(self) -> None:
+        """Test find_changes_since"""
+        change_1 = {'from-version': 'm1', 'to-version': 'm2', 'operations': []}
+        change_2 = {'from-version': 'm2', 'to-version': 'm3', 'operations': []}
+        delta = discovery_map_delta.create_delta_document('m1', 'm3', [change_1, change_2])
+        self.assertEqual(
+            [change_1, change_2], discovery_map_delta.find_changes_since(delta, 'm1'),
+        )
+        self.assertEqual([change_2], discovery_map_delta.find_changes_since(delta, 'm2'))
+        self.assertEqual([], discovery_map_delta.find_changes_since(delta, 'm3'))
+        self.assertIsNone(discovery_map_delta.find_changes_since(delta, 'm0'))
+
+    def test_is_delta_too_large(self) -> None:
+        """Test is_delta_too_large"""
+        data = _mk_discovery_map([_mk_namespace('n{0}'.format(i), []) for i in range(5)])
+        change = {
+            'from-version': 'm1', 'to-version': 'm2',
+            'operations': [{'op': 'remove', 'namespace': 'n1'}],
+        }
+        small = discovery_map_delta.create_delta_document('m1', 'm2', [change])
+        self.assertFalse(discovery_map_delta.is_delta_too_large(small, data, 1))
+        self.assertTrue(discovery_map_delta.is_delta_too_large(small, data, 0))
+        large = discovery_map_delta.create_delta_document('m1', 'm2', [{
+            'from-version': 'm1', 'to-version': 'm2',
+            'operations': [
+                {'op': 'add', 'namespace': namespace_obj['namespace'], 'value': namespace_obj}
+                for namespace_obj in data['namespaces']
+            ],
+        }])
+        self.assertTrue(discovery_map_delta.is_delta_too_large(large, data, 1))
+
+
+def _mk_discovery_map(namespaces: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        'schema-version': 'v1',
+        'document-version': 'x',
+        'namespaces': namespaces,
+    }
+
+
+def _mk_namespace(name: str, service_colors: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        'namespace': name,
+        'network-id': 'nk1',
+        'gateways': {'instances': [], 'prefer-gateway': False, 'protocol': 'http1.1'},
+        'service-colors': service_colors,
+    }
+
+
+def _mk_service_color(service: str, color: str) -> Dict[str, Any]:
+    return {
+        'service': service,
+        'color': color,
+        'index': 1,
+        'instances': [],
+        'namespace-egress': [],
+    }
@@ -0,0 +1,127 @@
+"""
+Tests the discovery_map_fingerprint module.
+"""
+
+from typing import Dict, Any
+import unittest
+import copy
+from .. import discovery_map_fingerprint
+
+
+class DiscoveryMapFingerprintTest(unittest.TestCase):
+    """Tests the discovery map fingerprint functions."""
+
+    def test_get_canonical_json(self) -> None:
+        """Test get_canonical_json, which sorts the keys and unordered arrays."""
+        self.assertEqual(
+            '{"namespaces":[{"a":1,"b":[2,1]},{"a":2,"b":[1,2]}],"schema-version":"v1"}',
+            discovery_map_fingerprint.get_canonical_json({
+                'schema-version': 'v1',
+                'document-version': 'x',
+                'map-version': 'y',
+                'namespaces': [{'b': [1, 2], 'a': 2}, {'b': [2, 1], 'a': 1}],
+            }),
+        )
+
+    def test_get_fingerprint__reordered(self) -> None:
+        """Test get_fingerprint with the unordered arrays in a different order."""
+        dm_1 = _mk_discovery_map()
+        dm_2 = copy.deepcopy(dm_1)
+        dm_2['document-version'] = 'other'
+        dm_2['namespaces'].reverse()
+        service_color = dm_2['namespaces'][1]['service-colors'][0]
+        service_color['instances'].reverse()
+        service_color['namespace-egress'].reverse()
+        dm_2['namespaces'][1]['gateways']['instances'].reverse()
+        self.assertEqual(
+            discovery_map_fingerprint.get_fingerprint(dm_1),
+            discovery_map_fingerprint.get_fingerprint(dm_2),
+        )
+
+    def test_get_fingerprint__routes_reordered(self) -> None:
+        """Test get_fingerprint with the routes in a different order, which envoy matches
+        in order."""
+        dm_1 = _mk_discovery_map()
+        dm_2 = copy.deepcopy(dm_1)
+        dm_2['namespaces'][0]['service-colors'][0]['routes'].reverse()
+        self.assertNotEqual(
+            discovery_map_fingerprint.get_fingerprint(dm_1),
+            discovery_map_fingerprint.get_fingerprint(dm_2),
+        )
+        dm_3 = copy.deepcopy(dm_1)
+        dm_3['namespaces'][0]['service-colors'][0]['routes'][0]['namespace-access'].reverse()
+        self.assertNotEqual(
+            discovery_map_fingerprint.get_fingerprint(dm_1),
+            discovery_map_fingerprint.get_fingerprint(dm_3),
+        )
+
+    def test_get_fingerprint__changed(self) -> None:
+        """Test get_fingerprint with changed contents."""
+        dm_1 = _mk_discovery_map()
+        dm_2 = copy.deepcopy(dm_1)
+        dm_2['namespaces'][0]['service-colors'][0]['instances'][0]['port'] = 9
+        self.assertNotEqual(
+            discovery_map_fingerprint.get_fingerprint(dm_1),
+            discovery_map_fingerprint.get_fingerprint(dm_2),
+        )
+
+
+def _mk_discovery_map() -> Dict[str, Any]:
+    return {
+        'schema-version': 'v1',
+        'document-version': 'x',
+        'namespaces': [
+            {
+                'namespace': 'n1',
+                'network-id': 'n1',
+                'gateways': {
+                    'instances': [
+                        {'ipv4': '1.2.3.4', 'port': 1},
+                        {'ipv4': '1.2.3.5', 'port': 1},
+                    ],
+                    'prefer-gateway': False,
+                    'protocol': 'HTTP1.1',
+                },
+                'service-colors': [{
+                    'service': 's1',
+                    'color': 'c1',
+                    'index': 1,
+                    'routes': [
+                        {
+                            'path-match': {'match-type': 'prefix', 'value': '/a'},
+                            'weight': 1,
+                            'namespace-access': [
+                                {'namespace': 'n1', 'access': True},
+                                {'namespace': 'n2', 'access': False},
+                            ],
+                            'default-access': True,
+                        },
+                        {
+                            'path-match': {'match-type': 'prefix', 'value': '/b'},
+                            'weight': 1,
+                            'namespace-access': [],
+                            'default-access': True,
+                        },
+                    ],
+                    'instances': [
+                        {'ipv4': '2.3.4.5', 'port': 2},
+                        {'hostname': 'x.y', 'port': 2},
+                    ],
+                    'namespace-egress': [
+                        {'namespace': 'n1', 'interface': {'ipv4': '127.0.0.1', 'port': 3}},
+                        {'namespace': 'n2', 'interface': {'ipv4': '127.0.0.1', 'port': 4}},
+                    ],
+                }],
+            },
+            {
+                'namespace': 'n2',
+                'network-id': 'n2',
+                'gateways': {
+                    'instances': [],
+                    'prefer-gateway': False,
+                    'protocol': 'HTTP1.1',
+                },
+                'service-colors': [],
+            },
+        ],
+    }
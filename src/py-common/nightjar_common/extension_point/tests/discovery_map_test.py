@@ -209,3 +209,28 @@ class DiscoveryMapRunnerTest(unittest.TestCase):
 
         # Ensure the cached version still exists.
         self.assertTrue(os.path.isfile(os.path.join(self._tempdir, 'mesh-cache.json')))
+
+    def test_get_mesh__namespace_filter(self) -> None:
+        """Ensure the get_mesh only loads the filtered namespaces."""
+        ns_1 = {
+            'namespace': 'n1', 'network-id': 'nk1', 'service-colors': [],
+            'gateways': {'instances': [], 'prefer-gateway': False, 'protocol': 'http1.1'},
+        }
+        ns_2 = dict(ns_1)
+        ns_2['namespace'] = 'n2'
+        expected_data = {
+            'schema-version': 'v1',
+            DOCUMENT_VERSION_KEY: '1',
+            'namespaces': [ns_1, ns_2],
+        }
+        invoker = RunnableInvoker(self._tempdir)
+        runner = discovery_map.DiscoveryMapRunner(invoker.prepare_runnable([0]), self._tempdir)
+        with open(self.fetch_file, 'w') as f:
+            json.dump(expected_data, f)
+
+        res = runner.get_mesh(discovery_map.namespace_filter(['n2']))
+        self.assertEqual([ns_2], res['namespaces'])
+
+        res = runner.get_cached_mesh(discovery_map.namespace_filter(['n1', 'n3']))
+        self.assertEqual([ns_1], res['namespaces'])
+        self.assertEqual(expected_data, runner.get_cached_mesh())
@@ -0,0 +1,109 @@
+"""Tests the document_stream module."""
+
+from typing import Dict, Any
+import unittest
+import io
+import json
+from .. import document_stream
+
+
+class DocumentStreamTest(unittest.TestCase):
+    """Tests the document stream functions."""
+
+    def test_iter_document__empty_object(self) -> None:
+        """Test iter_document with an empty object."""
+        res = list(document_stream.iter_document(io.StringIO(' { } '), 'items'))
+        self.assertEqual([], res)
+
+    def test_iter_document__small_reads(self) -> None:
+        """Test iter_document with a read size much smaller than the values, so values
+        span many reads."""
+        data = {
+            'a': 12345678901234567890,
+            'items': [{'x': 'y' * 40, 'n': 1.5}, [1, 2, 3], 'abc', 1234567],
+            'b': {'c': [True, False, None]},
+        }
+        res = list(document_stream.iter_document(
+            io.StringIO(json.dumps(data, indent=2)), 'items', 3,
+        ))
+        self.assertEqual([
+            ('a', 12345678901234567890, False),
+            ('items', [], False),
+            ('items', {'x': 'y' * 40, 'n': 1.5}, True),
+            ('items', [1, 2, 3], True),
+            ('items', 'abc', True),
+            ('items', 1234567, True),
+            ('b', {'c': [True, False, None]}, False),
+        ], res)
+
+    def test_iter_document__split_numbers(self) -> None:
+        """Test iter_document with every small read size, so the numbers are cut at each
+        of their characters, including the fraction and the exponent."""
+        text = '{"x": 0.125, "items": [12e3, -7.5E-2, 10], "y": 12e3}'
+        for read_size in range(1, 12):
+            res = list(document_stream.iter_document(io.StringIO(text), 'items', read_size))
+            self.assertEqual([
+                ('x', 0.125, False),
+                ('items', [], False),
+                ('items', 12e3, True),
+                ('items', -7.5e-2, True),
+                ('items', 10, True),
+                ('y', 12e3, False),
+            ], res, 'read size {0}'.format(read_size))
+
+    def test_iter_document__empty_list(self) -> None:
+        """Test iter_document with an empty list."""
+        res = list(document_stream.iter_document(io.StringIO('{"items": [ ], "a": 1}'), 'items'))
+        self.assertEqual([('items', [], False), ('a', 1, False)], res)
+
+    def test_iter_document__list_key_not_a_list(self) -> None:
+        """Test iter_document where the list key is some other value."""
+        res = list(document_stream.iter_document(io.StringIO('{"items": 2}'), 'items'))
+        self.assertEqual([('items', 2, False)], res)
+
+    def test_iter_document__invalid(self) -> None:
+        """Test iter_document with invalid documents."""
+        for text in (
+                '', '[]', '{"a": 1', '{"a": 1,}', '{1: 2}', '{"a" 1}',
+                '{"items": [1 2]}', '{"a": tru}', '{"a": 1} x',
+        ):
+            with self.assertRaises(ValueError, msg=text):
+                list(document_stream.iter_document(io.StringIO(text), 'items', 2))
+
+    def test_load_document__filter(self) -> None:
+        """Test load_document with an item filter and validator."""
+        validated = []
+
+        def validator(item: Any) -> Any:
+            validated.append(item)
+            return item
+
+        res = document_stream.load_document(
+            io.StringIO(json.dumps({'v': 'x', 'namespaces': [
+                {'namespace': 'a'}, {'namespace': 'b'}, {'namespace': 'c'},
+            ]})),
+            document_stream.DISCOVERY_MAP_FORMAT,
+            lambda item: item['namespace'] != 'b',
+            validator,
+        )
+        self.assertEqual(
+            {'v': 'x', 'namespaces': [{'namespace': 'a'}, {'namespace': 'c'}]},
+            res,
+        )
+        self.assertEqual(3, len(validated))
+
+    def test_validate_item(self) -> None:
+        """Test the list document format's validate_item."""
+        documents = []
+
+        def validator(data: Dict[str, Any]) -> Dict[str, Any]:
+            documents.append(data)
+            return {'namespaces': [{'validated': True}]}
+
+        res = document_stream.DISCOVERY_MAP_FORMAT.validate_item(validator, {'namespace': 'a'})
+        self.assertEqual({'validated': True}, res)
+        self.assertEqual([{
+            'schema-version': 'v1',
+            'document-version': '',
+            'namespaces': [{'namespace': 'a'}],
+        }], documents)
@@ -90,6 +90,28 @@ class RunCmdTest(unittest.TestCase):
         mock.next_runner_callback()
         mock.at_end()
 
+    def test_run_with_backoff__retry_metric(self) -> None:
+        """Test run_with_backoff counts the retries."""
+        before = run_cmd.EXTENSION_POINT_RETRIES.get('test-retry')
+        mock = BackoffMock(self, [31, 0], [True, False])
+        result = run_cmd.run_with_backoff(
+            mock.runner_callback,
+            3, 1.0,
+            mock.sleep_func,
+            extension_point='test-retry',
+        )
+        self.assertEqual(0, result)
+        self.assertEqual(before + 1, run_cmd.EXTENSION_POINT_RETRIES.get('test-retry'))
+
+    def test_record_run(self) -> None:
+        """Test record_run updates the run metrics."""
+        before = run_cmd.EXTENSION_POINT_RUNS.get('test-run', 'fetch', '30')
+        run_cmd.record_run('test-run', 'fetch', 30, 0.25)
+        self.assertEqual(
+            before + 1, run_cmd.EXTENSION_POINT_RUNS.get('test-run', 'fetch', '30'),
+        )
+        self.assertEqual(1, run_cmd.EXTENSION_POINT_SECONDS.get_count('test-run', 'fetch'))
+
 
 class BackoffMock:
     """Mock class for recording callbacks."""
@@ -0,0 +1,87 @@
+
+"""
+Tests the sharded_discovery_map module.
+"""
+
+from typing import Dict, Any
+import unittest
+from .. import sharded_discovery_map
+
+
+class ShardedDiscoveryMapTest(unittest.TestCase):
+    """Tests the sharded discovery map functions."""
+
+    def test_get_namespace_document_name(self) -> None:
+        """Test get_namespace_document_name"""
+        self.assertEqual(
+            'discovery-map-namespace.a-b_c.d',
+            sharded_discovery_map.get_namespace_document_name('a-b_c.d'),
+        )
+        self.assertEqual(
+            'discovery-map-namespace.a%2F..%5Cb%20c',
+            sharded_discovery_map.get_namespace_document_name('a/..\\b c'),
+        )
+
+    def test_get_namespace_version(self) -> None:
+        """Test get_namespace_version, which must not depend on the key order."""
+        ns_1 = _mk_namespace('n1')
+        ns_2 = dict(reversed(list(ns_1.items())))
+        self.assertEqual(
+            sharded_discovery_map.get_namespace_version(ns_1),
+            sharded_discovery_map.get_namespace_version(ns_2),
+        )
+        ns_2['network-id'] = 'nk2'
+        self.assertNotEqual(
+            sharded_discovery_map.get_namespace_version(ns_1),
+            sharded_discovery_map.get_namespace_version(ns_2),
+        )
+
+    def test_namespace_document_validator__valid(self) -> None:
+        """Test the namespace document validator with a valid document."""
+        validator = sharded_discovery_map.create_namespace_document_validator('n1')
+        doc = sharded_discovery_map.create_namespace_document(_mk_namespace('n1'), 'v1')
+        self.assertEqual(doc, validator(doc))
+
+    def test_namespace_document_validator__invalid(self) -> None:
+        """Test the namespace document validator with invalid documents."""
+        validator = sharded_discovery_map.create_namespace_document_validator('n1')
+        no_version = sharded_discovery_map.create_namespace_document(_mk_namespace('n1'), 'v1')
+        del no_version[sharded_discovery_map.NAMESPACE_VERSION_KEY]
+        two_namespaces = sharded_discovery_map.create_namespace_document(
+            _mk_namespace('n1'), 'v1',
+        )
+        two_namespaces['namespaces'].append(_mk_namespace('n2'))
+        for doc in (
+                {},
+                no_version,
+                sharded_discovery_map.create_namespace_document(_mk_namespace('n2'), 'v1'),
+                two_namespaces,
+        ):
+            with self.assertRaises(ValueError):
+                validator(doc)
+
+    def test_join_namespace_documents(self) -> None:
+        """Test join_namespace_documents"""
+        ns_1 = _mk_namespace('n1')
+        ns_2 = _mk_namespace('n2')
+        res = sharded_discovery_map.join_namespace_documents(
+            {'document-version': 'x'},
+            {
+                'n2': sharded_discovery_map.create_namespace_document(ns_2, 'v2'),
+                'n1': sharded_discovery_map.create_namespace_document(ns_1, 'v1'),
+            },
+        )
+        self.assertEqual({
+            'schema-version': 'v1',
+            'document-version': 'x',
+            'namespaces': [ns_1, ns_2],
+        }, res)
+
+
+def _mk_namespace(name: str) -> Dict[str, Any]:
+    return {
+        'namespace': name,
+        'network-id': 'nk1',
+        'gateways': {'instances': [], 'prefer-gateway': False, 'protocol': 'http1.1'},
+        'service-colors': [],
+    }
@@ -0,0 +1,135 @@
+
+"""
+Tests the shared_cache module.
+"""
+
+from typing import List, Tuple, Dict, Optional, Any
+import unittest
+import os
+import json
+import time
+import tempfile
+import shutil
+from .. import shared_cache
+
+
+class SharedDocumentCacheTest(unittest.TestCase):
+    """Tests the SharedDocumentCache class."""
+
+    def setUp(self) -> None:
+        self._tempdir = tempfile.mkdtemp()
+        self.cache = shared_cache.SharedDocumentCache(
+            os.path.join(self._tempdir, 'shared'), 60,
+        )
+        self.dest_file = os.path.join(self._tempdir, 'dest.json')
+        self.fetches: List[Tuple[str, str]] = []
+        self.fetch_result = 0
+        self.fetch_contents: Optional[Dict[str, Any]] = {'document-version': 'v1'}
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self._tempdir)
+
+    def test_fetch__refresh_then_fresh(self) -> None:
+        """Test that only the first fetch asks the data store."""
+        self.assertEqual(0, self._fetch(''))
+        self.assertEqual({'document-version': 'v1'}, self._read_dest())
+        os.unlink(self.dest_file)
+        self.assertEqual(0, self._fetch(''))
+        self.assertEqual({'document-version': 'v1'}, self._read_dest())
+        self.assertEqual(30, self._fetch('v1'))
+        self.assertEqual([('templates.fetch', '')], self.fetches)
+
+    def test_fetch__stale_unchanged(self) -> None:
+        """Test a stale shared copy that the data store reports as unchanged."""
+        self.assertEqual(0, self._fetch(''))
+        self.cache.max_age_seconds = 0
+        self.fetch_result = 30
+        self.assertEqual(30, self._fetch('v1'))
+        self.assertEqual(0, self._fetch('v0'))
+        self.assertEqual({'document-version': 'v1'}, self._read_dest())
+        self.assertEqual(
+            [('templates.fetch', ''), ('templates.fetch', 'v1'), ('templates.fetch', 'v1')],
+            self.fetches,
+        )
+
+    def test_fetch__stale_changed(self) -> None:
+        """Test a stale shared copy that the data store has a new version for."""
+        self.assertEqual(0, self._fetch(''))
+        self.cache.max_age_seconds = 0
+        self.fetch_contents = {'document-version': 'v2'}
+        self.assertEqual(0, self._fetch('v1'))
+        self.assertEqual({'document-version': 'v2'}, self._read_dest())
+        self.assertEqual(
+            'v2', self.cache.read_state('templates')['document-version'],
+        )
+
+    def test_fetch__invalid(self) -> None:
+        """Test that an invalid fetched document is handed to the caller, but not
+        shared."""
+        self.fetch_contents = {'not-valid': True}
+        self.assertEqual(0, self._fetch(''))
+        self.assertEqual({'not-valid': True}, self._read_dest())
+        self.assertEqual({}, self.cache.read_state('templates'))
+
+    def test_fetch__error(self) -> None:
+        """Test that a data store error is returned to the caller."""
+        self.fetch_result = 31
+        self.assertEqual(31, self._fetch(''))
+        self.fetch_result = 30
+        self.fetch_contents = None
+        self.assertEqual(30, self._fetch(''))
+        self.assertFalse(os.path.isfile(self.dest_file))
+        self.assertFalse(os.path.isfile(os.path.join(self.cache.cache_dir, 'templates.fetch')))
+
+    def test_is_fresh(self) -> None:
+        """Test is_fresh with different states."""
+        self.assertFalse(self.cache.is_fresh({}))
+        self.assertFalse(self.cache.is_fresh({'refreshed': time.time()}))
+        self.assertTrue(self.cache.is_fresh({
+            'refreshed': time.time(), 'document-version': 'v1',
+        }))
+        self.assertFalse(self.cache.is_fresh({
+            'refreshed': time.time() - 61, 'document-version': 'v1',
+        }))
+
+    def test_read_state__invalid(self) -> None:
+        """Test read_state with an invalid state file."""
+        with open(self.cache.get_data_file('templates'), 'w') as f:
+            json.dump({}, f)
+        with open(self.cache.get_state_file('templates'), 'w') as f:
+            f.write('{[')
+        self.assertEqual({}, self.cache.read_state('templates'))
+        with open(self.cache.get_state_file('templates'), 'w') as f:
+            f.write('[]')
+        self.assertEqual({}, self.cache.read_state('templates'))
+
+    def test_copy_out__no_links(self) -> None:
+        """Test copy_out where the destination can't be hard linked."""
+        with open(self.cache.get_data_file('templates'), 'w') as f:
+            json.dump({'document-version': 'v1'}, f)
+        os.makedirs(os.path.join(self.dest_file, 'x'))
+        with self.assertRaises(OSError):
+            self.cache.copy_out('templates', {'document-version': 'v1'}, self.dest_file, '')
+
+    def _fetch(self, last_version: str) -> int:
+        return self.cache.fetch(
+            'templates', self.dest_file, last_version, self._fetch_callback, _read_version,
+        )
+
+    def _fetch_callback(self, dest_file: str, last_version: str) -> int:
+        self.fetches.append((os.path.basename(dest_file), last_version))
+        if self.fetch_contents is not None:
+            with open(dest_file, 'w') as f:
+                json.dump(self.fetch_contents, f)
+        return self.fetch_result
+
+    def _read_dest(self) -> Any:
+        with open(self.dest_file, 'r') as f:
+            return json.load(f)
+
+
+def _read_version(filename: str) -> Optional[str]:
+    with open(filename, 'r') as f:
+        data = json.load(f)
+    version = data.get('document-version')
+    return version if isinstance(version, str) else None
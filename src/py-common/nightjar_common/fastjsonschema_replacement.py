@@ -3,7 +3,8 @@
 Replaces the exception in fastjsonschema, so that it doesn't need to be required.
 """
 
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Pattern, Match, Any
+import re
 
 
 class JsonSchemaException(ValueError):
@@ -21,3 +22,27 @@ class JsonSchemaException(ValueError):
         self.name = name
         self.definition = definition
         self.rule = rule
+
+
+class LazyPattern:
+    """A regular expression that is only compiled on its first use, so that importing the
+    generated validation code doesn't compile every pattern."""
+    __slots__ = ('pattern', '_compiled',)
+
+    def __init__(self, pattern: str) -> None:
+        self.pattern = pattern
+        self._compiled: Optional[Pattern[str]] = None
+
+    def get_compiled(self) -> Pattern[str]:
+        """Get the compiled regular expression."""
+        if self._compiled is None:
+            self._compiled = re.compile(self.pattern)
+        return self._compiled
+
+    def match(self, value: str) -> Optional[Match[str]]:
+        """Match the value from its start."""
+        return self.get_compiled().match(value)
+
+    def search(self, value: str) -> Optional[Match[str]]:
+        """Search the value for the pattern."""
+        return self.get_compiled().search(value)
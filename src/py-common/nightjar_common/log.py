@@ -1,19 +1,85 @@
 
 """
 Simple logging tools.
+
+With the LOG_FORMAT environment variable set to 'json', each message is written as a
+JSON object with its level, source and arguments.  Debug messages are buffered, and
+written out with the next message of another level, when the buffer fills, or when the
+process exits, so that debug logging doesn't cost a write for each message.
 """
 
-from typing import Any
+from typing import List, Any
+import atexit
+import json
 import os
+import reprlib
 import sys
+import time
 from .consts import TRUE_VALUES
 
 
 EXECUTE_MODEL = 'nightjar-not-initialized'
 DEBUG_ON = os.environ.get('DEBUG', 'false').lower() in TRUE_VALUES
+JSON_FORMAT = os.environ.get('LOG_FORMAT', 'text').lower() == 'json'
+DEFAULT_MAX_VALUE_LENGTH = 4096
+# Buffered debug messages are written out once they reach this many characters.
+BUFFER_SIZE = 64 * 1024
+
+
+def get_max_value_length() -> int:
+    """Get the most characters of an argument value or raw message that are logged; 0 means
+    no limit."""
+    try:
+        return max(0, int(os.environ.get('LOG_MAX_VALUE_LENGTH', DEFAULT_MAX_VALUE_LENGTH)))
+    except ValueError:
+        return DEFAULT_MAX_VALUE_LENGTH
+
+
+MAX_VALUE_LENGTH = get_max_value_length()
+
+# Collections are shortened while they are turned into text, rather than after, so that
+# logging a large list doesn't build its whole text.
+SHORT_REPR = reprlib.Repr()
+SHORT_REPR.maxlevel = 4
+SHORT_REPR.maxlist = SHORT_REPR.maxtuple = SHORT_REPR.maxdict = 100
+SHORT_REPR.maxset = SHORT_REPR.maxfrozenset = 100
+SHORT_REPR.maxstring = SHORT_REPR.maxother = 1000
+
+
+class LogBuffer:
+    """Holds the debug messages until they are written out together."""
+    __slots__ = ('max_size', '_lines', '_size',)
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._lines: List[str] = []
+        self._size = 0
+
+    def add(self, line: str) -> None:
+        """Add the line, and write out the buffer if it's full."""
+        self._lines.append(line)
+        self._size += len(line)
+        if self._size >= self.max_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write out the buffered lines."""
+        if self._lines:
+            sys.stderr.write(''.join(self._lines))
+            self._lines = []
+            self._size = 0
 
 
-def debug(msg: str, **kwargs: Any) -> None:
+BUFFER = LogBuffer(BUFFER_SIZE)
+atexit.register(BUFFER.flush)
+
+
+def flush() -> None:
+    """Write out the buffered debug messages."""
+    BUFFER.flush()
+
+
+def debug(msg: str, /, **kwargs: Any) -> None:
     """Debug messages."""
     if DEBUG_ON:
         log('DEBUG', msg, **kwargs)
@@ -25,16 +91,71 @@ def debug_raw(msg: str) -> None:
         log_raw('DEBUG', msg)
 
 
-def warning(msg: str, **kwargs: Any) -> None:
+def warning(msg: str, /, **kwargs: Any) -> None:
     """Debug messages."""
     log('WARN', msg, **kwargs)
 
 
-def log(mode: str, msg: str, **kwargs: Any) -> None:
-    """Print a log message."""
-    sys.stderr.write('[{0} :: {1}] {2}\n'.format(EXECUTE_MODEL, mode, msg.format(**kwargs)))
+def log(mode: str, msg: str, /, **kwargs: Any) -> None:
+    """Print a log message.  Argument values that are callables are only called here, so
+    values that are expensive to create can be passed for messages that may not be
+    logged."""
+    args = {key: get_log_value(value) for key, value in kwargs.items()}
+    message = msg.format(**args)
+    if JSON_FORMAT:
+        write_line(mode, json.dumps({
+            'time': round(time.time(), 3),
+            'source': EXECUTE_MODEL,
+            'level': mode,
+            'message': message,
+            'args': args,
+        }))
+    else:
+        write_line(mode, '[{0} :: {1}] {2}'.format(EXECUTE_MODEL, mode, message))
 
 
 def log_raw(mode: str, msg: str) -> None:
     """Print a log message."""
-    sys.stderr.write('[{0} :: {1}] {2}\n'.format(EXECUTE_MODEL, mode, msg))
+    message = limit_length(msg)
+    if JSON_FORMAT:
+        write_line(mode, json.dumps({
+            'time': round(time.time(), 3),
+            'source': EXECUTE_MODEL,
+            'level': mode,
+            'message': message,
+        }))
+    else:
+        write_line(mode, '[{0} :: {1}] {2}'.format(EXECUTE_MODEL, mode, message))
+
+
+def write_line(mode: str, line: str) -> None:
+    """Write the log line.  Debug lines are buffered; other lines are written right away,
+    after the buffered lines."""
+    if mode == 'DEBUG':
+        BUFFER.add(line + '\n')
+    else:
+        BUFFER.flush()
+        sys.stderr.write(line + '\n')
+
+
+def get_log_value(value: Any) -> Any:
+    """Get the value logged for a message argument.  Simple values are kept, so they
+    stay numbers in the JSON format; the others are turned into text of limited length."""
+    if callable(value):
+        value = value()
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        return limit_length(value)
+    if MAX_VALUE_LENGTH > 0 and isinstance(value, (list, tuple, dict, set, frozenset)):
+        return limit_length(SHORT_REPR.repr(value))
+    return limit_length(str(value))
+
+
+def limit_length(text: str) -> str:
+    """Cut the text short if it's longer than the maximum value length."""
+    if 0 < MAX_VALUE_LENGTH < len(text):
+        return '{0}... ({1} more characters)'.format(
+            text[:MAX_VALUE_LENGTH], len(text) - MAX_VALUE_LENGTH,
+        )
+    return text
@@ -0,0 +1,348 @@
+
+"""
+Lightweight metrics, in the Prometheus text format.
+
+The process keeps its metrics in memory.  They can be read through an HTTP endpoint, or
+written to a file for the node exporter's textfile collector.
+"""
+
+from typing import (
+    Dict, List, Tuple, Sequence, Iterator, Callable, TypeVar, Optional, Any, cast,
+    TYPE_CHECKING,
+)
+import contextlib
+import functools
+import math
+import os
+import tempfile
+import threading
+import time
+from .log import warning
+
+if TYPE_CHECKING:  # pragma no cover
+    import http.server
+
+LabelValues = Tuple[str, ...]
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,)
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+FuncT = TypeVar('FuncT', bound=Callable[..., Any])
+
+
+class Metric:
+    """A named metric, with a value for each combination of its label values."""
+    __slots__ = ('name', 'help_text', 'label_names', '_lock',)
+    metric_type = 'untyped'
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str]) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def render(self) -> List[str]:
+        """Get the lines of the metric in the text format."""
+        ret = [
+            '# HELP {0} {1}'.format(self.name, escape_help(self.help_text)),
+            '# TYPE {0} {1}'.format(self.name, self.metric_type),
+        ]
+        with self._lock:
+            ret.extend(self.render_samples())
+        return ret
+
+    def render_samples(self) -> List[str]:
+        """Get the sample lines; called while holding the lock."""
+        raise NotImplementedError()  # pragma no cover
+
+    def reset(self) -> None:
+        """Remove all the values."""
+        raise NotImplementedError()  # pragma no cover
+
+    def check_labels(self, label_values: LabelValues) -> None:
+        """Check the number of label values, when the value is recorded, so that rendering
+        the metrics can't fail."""
+        if len(label_values) != len(self.label_names):
+            raise ValueError('{0} requires the labels {1}'.format(self.name, self.label_names))
+
+    def get_labels(self, label_values: LabelValues, extra: str = '') -> str:
+        """Get the label text for the label values."""
+        labels = [
+            '{0}="{1}"'.format(name, escape_label_value(value))
+            for name, value in zip(self.label_names, label_values)
+        ]
+        if extra:
+            labels.append(extra)
+        return '{' + ','.join(labels) + '}' if labels else ''
+
+
+class Counter(Metric):
+    """A value that only goes up."""
+    __slots__ = ('_values',)
+    metric_type = 'counter'
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str]) -> None:
+        super().__init__(name, help_text, label_names)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        """Increase the value for the label values."""
+        self.check_labels(label_values)
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def get(self, *label_values: str) -> float:
+        """Get the value for the label values."""
+        return self._values.get(label_values, 0.0)
+
+    def render_samples(self) -> List[str]:
+        return [
+            '{0}{1} {2}'.format(self.name, self.get_labels(labels), format_value(value))
+            for labels, value in sorted(self._values.items())
+        ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(Counter):
+    """A value that can be set to anything."""
+    __slots__ = ()
+    metric_type = 'gauge'
+
+    def set(self, value: float, *label_values: str) -> None:
+        """Set the value for the label values."""
+        self.check_labels(label_values)
+        with self._lock:
+            self._values[label_values] = value
+
+
+class Histogram(Metric):
+    """Counts the observed values in buckets, such as the time taken by an action."""
+    __slots__ = ('buckets', '_values',)
+    metric_type = 'histogram'
+
+    def __init__(
+            self, name: str, help_text: str, label_names: Sequence[str],
+            buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> (count in each bucket, then the total count and sum)
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        """Add the value to the buckets for the label values."""
+        self.check_labels(label_values)
+        with self._lock:
+            counts = self._values.get(label_values)
+            if counts is None:
+                counts = [0.0] * (len(self.buckets) + 2)
+                self._values[label_values] = counts
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+            counts[-2] += 1
+            counts[-1] += value
+
+    @contextlib.contextmanager
+    def time(self, *label_values: str) -> Iterator[None]:
+        """Observe the seconds taken by the with block."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.observe(time.monotonic() - start, *label_values)
+
+    def get_count(self, *label_values: str) -> float:
+        """Get the number of values observed for the label values."""
+        counts = self._values.get(label_values)
+        return counts[-2] if counts else 0.0
+
+    def render_samples(self) -> List[str]:
+        ret: List[str] = []
+        for labels, counts in sorted(self._values.items()):
+            for bound, count in zip(self.buckets, counts):
+                ret.append('{0}_bucket{1} {2}'.format(
+                    self.name, self.get_labels(labels, 'le="{0}"'.format(format_value(bound))),
+                    format_value(count),
+                ))
+            ret.append('{0}_bucket{1} {2}'.format(
+                self.name, self.get_labels(labels, 'le="+Inf"'), format_value(counts[-2]),
+            ))
+            ret.append('{0}_sum{1} {2}'.format(
+                self.name, self.get_labels(labels), format_value(counts[-1]),
+            ))
+            ret.append('{0}_count{1} {2}'.format(
+                self.name, self.get_labels(labels), format_value(counts[-2]),
+            ))
+        return ret
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Registry:
+    """All the metrics of the process."""
+    __slots__ = ('_metrics', '_lock',)
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> Counter:
+        """Get the counter with the name, creating it if it's new."""
+        return cast(Counter, self._add(Counter, name, lambda: Counter(
+            name, help_text, label_names,
+        )))
+
+    def gauge(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> Gauge:
+        """Get the gauge with the name, creating it if it's new."""
+        return cast(Gauge, self._add(Gauge, name, lambda: Gauge(
+            name, help_text, label_names,
+        )))
+
+    def histogram(
+            self, name: str, help_text: str, label_names: Sequence[str] = (),
+            buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get the histogram with the name, creating it if it's new."""
+        return cast(Histogram, self._add(Histogram, name, lambda: Histogram(
+            name, help_text, label_names, buckets,
+        )))
+
+    def _add(self, metric_class: type, name: str, factory: Callable[[], Metric]) -> Metric:
+        with self._lock:
+            ret = self._metrics.get(name)
+            if ret is None:
+                ret = factory()
+                self._metrics[name] = ret
+            elif type(ret) is not metric_class:  # pylint: disable=C0123
+                raise ValueError('{0} is already registered as a {1}'.format(
+                    name, ret.metric_type,
+                ))
+            return ret
+
+    def render(self) -> str:
+        """Get all the metrics in the text format."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+    def reset(self) -> None:
+        """Remove all the metric values, but keep the metrics."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+
+REGISTRY = Registry()
+
+
+def counter(name: str, help_text: str, label_names: Sequence[str] = ()) -> Counter:
+    """Get the counter from the process' registry."""
+    return REGISTRY.counter(name, help_text, label_names)
+
+
+def gauge(name: str, help_text: str, label_names: Sequence[str] = ()) -> Gauge:
+    """Get the gauge from the process' registry."""
+    return REGISTRY.gauge(name, help_text, label_names)
+
+
+def histogram(
+        name: str, help_text: str, label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+) -> Histogram:
+    """Get the histogram from the process' registry."""
+    return REGISTRY.histogram(name, help_text, label_names, buckets)
+
+
+def timed(metric: Histogram, *label_values: str) -> Callable[[FuncT], FuncT]:
+    """Decorator that observes the seconds taken by each call of the function."""
+    def decorator(func: FuncT) -> FuncT:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with metric.time(*label_values):
+                return func(*args, **kwargs)
+        return cast(FuncT, wrapper)
+    return decorator
+
+
+def write_textfile(path: str, registry: Optional[Registry] = None) -> None:
+    """Write the metrics to the file, for the node exporter's textfile collector.  The
+    file is replaced, so the collector never reads a partial file."""
+    contents = (registry or REGISTRY).render()
+    out_dir = os.path.dirname(os.path.abspath(path))
+    gen_fd, gen_filename = tempfile.mkstemp(prefix='.metrics', suffix='.tmp', dir=out_dir)
+    os.write(gen_fd, contents.encode('utf-8'))
+    os.close(gen_fd)
+    # mkstemp creates the file readable only by the owner.
+    os.chmod(gen_filename, 0o644)
+    os.replace(gen_filename, path)
+
+
+def export_textfile(path: str) -> None:
+    """Write the process' metrics to the file, if one is set.  Failures are only logged,
+    so a bad metrics file doesn't stop the proxy configuration."""
+    if not path:
+        return
+    try:
+        write_textfile(path)
+    except (OSError, ValueError) as err:
+        warning('Could not write the metrics file {path}: {err}', path=path, err=err)
+
+
+def start_http_server(
+        port: int, address: str = '', registry: Optional[Registry] = None,
+) -> 'http.server.HTTPServer':
+    """Serve the metrics over HTTP, from a daemon thread.  The HTTP server is only
+    imported here, as it adds to the start up time of every process."""
+    import http.server  # pylint: disable=C0415,W0621
+    metrics_registry = registry or REGISTRY
+
+    class MetricsHandler(http.server.BaseHTTPRequestHandler):
+        """Serves the metrics."""
+
+        def do_GET(self) -> None:  # pylint: disable=C0103
+            """Handle the GET request."""
+            if self.path.split('?', 1)[0] not in ('/', '/metrics'):
+                self.send_error(404)
+                return
+            body = metrics_registry.render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=W0622
+            """Don't log each request."""
+
+    server = http.server.ThreadingHTTPServer((address, port), MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, name='metrics', daemon=True)
+    thread.start()
+    return server
+
+
+def format_value(value: float) -> str:
+    """Format the value for the text format."""
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def escape_label_value(value: str) -> str:
+    """Escape the label value for the text format."""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def escape_help(value: str) -> str:
+    """Escape the help text for the text format."""
+    return value.replace('\\', '\\\\').replace('\n', '\\n')
@@ -16,3 +16,17 @@ class JsonSchemaExceptionTest(unittest.TestCase):
             self.assertEqual("JsonSchemaException('my message')", repr(err))
         else:
             self.fail("Did not raise the right error.")  # pragma no cover
+
+
+class LazyPatternTest(unittest.TestCase):
+    """Test the LazyPattern class"""
+
+    def test_match_search(self) -> None:
+        """Test match and search, which compile the pattern once."""
+        pattern = fastjsonschema_replacement.LazyPattern(r'b+')
+        self.assertIsNone(pattern.match('abb'))
+        compiled = pattern.get_compiled()
+        match = pattern.search('abb')
+        assert match is not None
+        self.assertEqual('bb', match.group(0))
+        self.assertIs(compiled, pattern.get_compiled())
@@ -3,10 +3,12 @@
 Test the log module.
 """
 
-from typing import Callable
+from typing import List, Callable
 import unittest
 import io
+import os
 import sys
+import json
 from .. import log
 
 
@@ -17,11 +19,22 @@ class LogTest(unittest.TestCase):
         self._orig_stderr = sys.stderr
         self._orig_model = log.EXECUTE_MODEL
         self._orig_debug = log.DEBUG_ON
+        self._orig_json = log.JSON_FORMAT
+        self._orig_max = log.MAX_VALUE_LENGTH
+        self._orig_env = dict(os.environ)
+        # The debug messages go to a buffer of their own, which is dropped after the test.
+        self._orig_buffer = log.BUFFER
+        log.BUFFER = log.LogBuffer(log.BUFFER_SIZE)
 
     def tearDown(self) -> None:
         sys.stderr = self._orig_stderr
+        log.BUFFER = self._orig_buffer
         log.EXECUTE_MODEL = self._orig_model
         log.DEBUG_ON = self._orig_debug
+        log.JSON_FORMAT = self._orig_json
+        log.MAX_VALUE_LENGTH = self._orig_max
+        os.environ.clear()
+        os.environ.update(self._orig_env)
 
     def test_log(self) -> None:
         """Test the log method."""
@@ -68,11 +81,111 @@ class LogTest(unittest.TestCase):
         res = self._with_replace(lambda: log.warning('a {b}', b="c"))
         self.assertEqual("[koi :: WARN] a c\n", res)
 
+    def test_log__lazy(self) -> None:
+        """Test the log function with a callable argument, which is only called when the
+        message is logged."""
+        log.EXECUTE_MODEL = 'tuna'
+        log.DEBUG_ON = False
+        calls: List[int] = []
+
+        def get_value() -> int:
+            calls.append(1)
+            return 12
+
+        res = self._with_replace(lambda: log.debug("y {z}", z=get_value))
+        self.assertEqual("", res)
+        self.assertEqual([], calls)
+        res = self._with_replace(lambda: log.log("x", "y {z}", z=get_value))
+        self.assertEqual("[tuna :: x] y 12\n", res)
+        self.assertEqual([1], calls)
+
+    def test_log__limited(self) -> None:
+        """Test the log function with argument values over the maximum length."""
+        log.EXECUTE_MODEL = 'tuna'
+        log.MAX_VALUE_LENGTH = 10
+        res = self._with_replace(lambda: log.log(
+            "x", "{a} {b} {c}", a='0123456789abc', b=list(range(200)), c=None,
+        ))
+        self.assertEqual(
+            "[tuna :: x] 0123456789... (3 more characters) "
+            "[0, 1, 2, ... (385 more characters) None\n",
+            res,
+        )
+
+    def test_log_raw__limited(self) -> None:
+        """Test the log_raw function with a message over the maximum length."""
+        log.EXECUTE_MODEL = 'pike'
+        log.MAX_VALUE_LENGTH = 3
+        res = self._with_replace(lambda: log.log_raw("x", "abcd"))
+        self.assertEqual("[pike :: x] abc... (1 more characters)\n", res)
+
+    def test_log__json(self) -> None:
+        """Test the log function in the JSON format."""
+        log.EXECUTE_MODEL = 'tuna'
+        log.JSON_FORMAT = True
+        res = json.loads(self._with_replace(lambda: log.log(
+            "x", "y {z} {w}", z=1, w=('a',),
+        )))
+        self.assertIsInstance(res.pop('time'), float)
+        self.assertEqual({
+            'source': 'tuna',
+            'level': 'x',
+            'message': "y 1 ('a',)",
+            'args': {'z': 1, 'w': "('a',)"},
+        }, res)
+
+    def test_log_raw__json(self) -> None:
+        """Test the log_raw function in the JSON format."""
+        log.EXECUTE_MODEL = 'pike'
+        log.JSON_FORMAT = True
+        res = json.loads(self._with_replace(lambda: log.log_raw("x", "y {z}")))
+        self.assertIsInstance(res.pop('time'), float)
+        self.assertEqual({'source': 'pike', 'level': 'x', 'message': 'y {z}'}, res)
+
+    def test_debug__buffered(self) -> None:
+        """Test that debug messages are buffered until another message is logged."""
+        log.EXECUTE_MODEL = 'marlin'
+        log.DEBUG_ON = True
+        new_err = io.StringIO()
+        sys.stderr = new_err
+        try:
+            log.debug("a")
+            self.assertEqual("", new_err.getvalue())
+            log.warning("b")
+            self.assertEqual("[marlin :: DEBUG] a\n[marlin :: WARN] b\n", new_err.getvalue())
+        finally:
+            sys.stderr = self._orig_stderr
+
+    def test_log_buffer__full(self) -> None:
+        """Test that the log buffer is written out once it's full."""
+        new_err = io.StringIO()
+        sys.stderr = new_err
+        try:
+            buffer = log.LogBuffer(4)
+            buffer.add('ab')
+            self.assertEqual("", new_err.getvalue())
+            buffer.add('cd')
+            self.assertEqual("abcd", new_err.getvalue())
+            buffer.flush()
+            self.assertEqual("abcd", new_err.getvalue())
+        finally:
+            sys.stderr = self._orig_stderr
+
+    def test_get_max_value_length(self) -> None:
+        """Test get_max_value_length with the different environment values."""
+        os.environ['LOG_MAX_VALUE_LENGTH'] = '20'
+        self.assertEqual(20, log.get_max_value_length())
+        os.environ['LOG_MAX_VALUE_LENGTH'] = '-1'
+        self.assertEqual(0, log.get_max_value_length())
+        os.environ['LOG_MAX_VALUE_LENGTH'] = 'x'
+        self.assertEqual(log.DEFAULT_MAX_VALUE_LENGTH, log.get_max_value_length())
+
     def _with_replace(self, callback: Callable[[], None]) -> str:
         new_err = io.StringIO()
         sys.stderr = new_err
         try:
             callback()
+            log.flush()
         finally:
             sys.stderr = self._orig_stderr
         return new_err.getvalue()
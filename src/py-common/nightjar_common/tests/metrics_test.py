@@ -0,0 +1,182 @@
+
+"""
+Test the metrics module.
+"""
+
+from typing import List, Callable
+import unittest
+import os
+import shutil
+import tempfile
+import urllib.error
+import urllib.request
+from .. import metrics
+
+
+class MetricsTest(unittest.TestCase):
+    """Test the metrics classes and functions."""
+
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self._temp_dir)
+
+    def test_counter(self) -> None:
+        """Test the counter values and text."""
+        registry = metrics.Registry()
+        counter = registry.counter('c_total', 'Some "help"\nlines.', ('a', 'b',))
+        counter.inc('x', 'y')
+        counter.inc('x', 'y', amount=2.5)
+        counter.inc('x', 'a"\\\nb')
+        self.assertEqual(3.5, counter.get('x', 'y'))
+        self.assertEqual(0.0, counter.get('x', 'z'))
+        self.assertEqual(
+            '# HELP c_total Some "help"\\nlines.\n'
+            '# TYPE c_total counter\n'
+            'c_total{a="x",b="a\\"\\\\\\nb"} 1\n'
+            'c_total{a="x",b="y"} 3.5\n',
+            registry.render(),
+        )
+
+    def test_wrong_labels(self) -> None:
+        """Test recording values with the wrong number of label values."""
+        registry = metrics.Registry()
+        records: List[Callable[[], None]] = [
+            registry.counter('c', 'C', ('a',)).inc,
+            lambda: registry.gauge('g', 'G', ('a',)).set(1.0),
+            lambda: registry.histogram('h', 'H', ('a',)).observe(1.0, 'x', 'y'),
+        ]
+        for record in records:
+            try:
+                record()
+                self.fail('did not raise')  # pragma no cover
+            except ValueError as err:
+                self.assertIn(" requires the labels ('a',)", str(err))
+        # Nothing was recorded, so the metrics still render.
+        self.assertEqual(
+            '# HELP c C\n# TYPE c counter\n# HELP g G\n# TYPE g gauge\n'
+            '# HELP h H\n# TYPE h histogram\n',
+            registry.render(),
+        )
+
+    def test_gauge(self) -> None:
+        """Test the gauge values and text."""
+        registry = metrics.Registry()
+        gauge = registry.gauge('g', 'G')
+        gauge.set(4.0)
+        gauge.set(-2.0)
+        self.assertEqual(-2.0, gauge.get())
+        self.assertEqual('# HELP g G\n# TYPE g gauge\ng -2\n', registry.render())
+
+    def test_histogram(self) -> None:
+        """Test the histogram values and text."""
+        registry = metrics.Registry()
+        hist = registry.histogram('h_seconds', 'H', ('a',), buckets=(1.0, 0.5,))
+        hist.observe(0.25, 'x')
+        hist.observe(0.75, 'x')
+        hist.observe(3.0, 'x')
+        with hist.time('y'):
+            pass
+        self.assertEqual(3, hist.get_count('x'))
+        self.assertEqual(1, hist.get_count('y'))
+        self.assertEqual(0, hist.get_count('z'))
+        lines = registry.render().splitlines()
+        self.assertEqual([
+            '# HELP h_seconds H',
+            '# TYPE h_seconds histogram',
+            'h_seconds_bucket{a="x",le="0.5"} 1',
+            'h_seconds_bucket{a="x",le="1"} 2',
+            'h_seconds_bucket{a="x",le="+Inf"} 3',
+            'h_seconds_sum{a="x"} 4',
+            'h_seconds_count{a="x"} 3',
+            'h_seconds_bucket{a="y",le="0.5"} 1',
+        ], lines[:8])
+
+    def test_timed(self) -> None:
+        """Test the timed decorator."""
+        hist = metrics.Registry().histogram('h', 'H')
+
+        @metrics.timed(hist)
+        def func(value: int) -> int:
+            return value + 1
+
+        self.assertEqual(3, func(2))
+        self.assertEqual(1, hist.get_count())
+
+    def test_registry__same_name(self) -> None:
+        """Test getting a metric from the registry twice."""
+        registry = metrics.Registry()
+        counter = registry.counter('c', 'C')
+        self.assertIs(counter, registry.counter('c', 'C'))
+        try:
+            registry.gauge('c', 'C')
+            self.fail('did not raise')  # pragma no cover
+        except ValueError as err:
+            self.assertEqual('c is already registered as a counter', str(err))
+
+    def test_registry__reset(self) -> None:
+        """Test resetting the registry."""
+        registry = metrics.Registry()
+        registry.counter('c', 'C').inc()
+        registry.gauge('g', 'G').set(1.0)
+        registry.histogram('h', 'H').observe(1.0)
+        registry.reset()
+        self.assertEqual(
+            '# HELP c C\n# TYPE c counter\n# HELP g G\n# TYPE g gauge\n'
+            '# HELP h H\n# TYPE h histogram\n',
+            registry.render(),
+        )
+
+    def test_module_registry(self) -> None:
+        """Test the module functions use the process registry."""
+        self.assertIs(metrics.counter('test_c', 'C'), metrics.REGISTRY.counter('test_c', 'C'))
+        self.assertIs(metrics.gauge('test_g', 'G'), metrics.REGISTRY.gauge('test_g', 'G'))
+        self.assertIs(
+            metrics.histogram('test_h', 'H'), metrics.REGISTRY.histogram('test_h', 'H'),
+        )
+
+    def test_write_textfile(self) -> None:
+        """Test writing the metrics file."""
+        registry = metrics.Registry()
+        registry.gauge('g', 'G').set(1.5)
+        filename = os.path.join(self._temp_dir, 'nightjar.prom')
+        metrics.write_textfile(filename, registry)
+        with open(filename, 'r') as f:
+            self.assertEqual('# HELP g G\n# TYPE g gauge\ng 1.5\n', f.read())
+        self.assertEqual(['nightjar.prom'], os.listdir(self._temp_dir))
+
+    def test_export_textfile(self) -> None:
+        """Test exporting the process' metrics to a file."""
+        metrics.export_textfile('')
+        filename = os.path.join(self._temp_dir, 'nightjar.prom')
+        metrics.export_textfile(filename)
+        self.assertTrue(os.path.isfile(filename))
+        # A missing directory is only logged.
+        metrics.export_textfile(os.path.join(self._temp_dir, 'missing', 'nightjar.prom'))
+
+    def test_start_http_server(self) -> None:
+        """Test reading the metrics over HTTP."""
+        metrics.gauge('test_http', 'H').set(2.0)
+        server = metrics.start_http_server(0, '127.0.0.1')
+        try:
+            url = 'http://127.0.0.1:{0}'.format(server.server_address[1])
+            with urllib.request.urlopen(url + '/metrics') as response:
+                self.assertEqual(metrics.CONTENT_TYPE, response.headers['Content-Type'])
+                self.assertIn('\ntest_http 2\n', response.read().decode('utf-8'))
+            try:
+                urllib.request.urlopen(url + '/other')  # pylint: disable=R1732
+                self.fail('did not raise')  # pragma no cover
+            except urllib.error.HTTPError as err:
+                self.assertEqual(404, err.code)
+                err.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_format_value(self) -> None:
+        """Test the format_value function."""
+        self.assertEqual('+Inf', metrics.format_value(float('inf')))
+        self.assertEqual('-Inf', metrics.format_value(float('-inf')))
+        self.assertEqual('3', metrics.format_value(3.0))
+        self.assertEqual('0.25', metrics.format_value(0.25))
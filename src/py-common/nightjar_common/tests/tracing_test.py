@@ -0,0 +1,103 @@
+
+"""
+Test the tracing module.
+"""
+
+from typing import List, Dict, Any
+import unittest
+import json
+import os
+import shutil
+import tempfile
+import time
+from .. import tracing
+
+
+class TracingTest(unittest.TestCase):
+    """Test the tracing functions."""
+
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.mkdtemp()
+        self._trace_file = os.path.join(self._temp_dir, 'trace.jsonl')
+
+    def tearDown(self) -> None:
+        tracing.disable()
+        shutil.rmtree(self._temp_dir)
+
+    def test_span__disabled(self) -> None:
+        """Test spans when tracing is not enabled."""
+        self.assertFalse(tracing.is_enabled())
+        with tracing.span('a', x=1) as span:
+            span.set_attribute('y', 2)
+            span.add_time('z', time.perf_counter())
+        self.assertIs(tracing.NOOP_SPAN, span)
+        self.assertEqual({}, span.attributes)
+
+    def test_span__nested(self) -> None:
+        """Test nested spans share the trace."""
+        tracing.enable(self._trace_file)
+        self.assertTrue(tracing.is_enabled())
+        with tracing.span('parent', x=1):
+            with tracing.span('child') as child:
+                child.set_attribute('y', 'z')
+                child.add_time('t', time.perf_counter())
+                child.add_time('t', time.perf_counter())
+        with tracing.span('other'):
+            pass
+        spans = self._read_spans()
+        self.assertEqual(['child', 'parent', 'other'], [s['name'] for s in spans])
+        child_span, parent_span, other_span = spans
+        self.assertEqual(parent_span['trace_id'], child_span['trace_id'])
+        self.assertEqual(parent_span['span_id'], child_span['parent_span_id'])
+        self.assertIsNone(parent_span['parent_span_id'])
+        self.assertNotEqual(parent_span['trace_id'], other_span['trace_id'])
+        self.assertEqual(32, len(parent_span['trace_id']))
+        self.assertEqual(16, len(parent_span['span_id']))
+        self.assertEqual({'x': 1}, parent_span['attributes'])
+        self.assertEqual(['t', 'y'], sorted(child_span['attributes'].keys()))
+        self.assertLessEqual(
+            parent_span['start_time_unix_nano'], child_span['start_time_unix_nano'],
+        )
+        self.assertLessEqual(
+            child_span['end_time_unix_nano'], parent_span['end_time_unix_nano'],
+        )
+
+    def test_span__error(self) -> None:
+        """Test a span that ends with an error."""
+        tracing.enable(self._trace_file)
+        try:
+            with tracing.span('a'):
+                raise ValueError('bad')
+        except ValueError:
+            pass
+        self.assertEqual(
+            {'error': "ValueError('bad')"}, self._read_spans()[0]['attributes'],
+        )
+
+    def test_traced(self) -> None:
+        """Test the traced decorator."""
+
+        @tracing.traced('func')
+        def func(value: int) -> int:
+            return value + 1
+
+        self.assertEqual(2, func(1))
+        tracing.enable(self._trace_file)
+        self.assertEqual(3, func(2))
+        self.assertEqual(['func'], [s['name'] for s in self._read_spans()])
+
+    def test_enable__twice(self) -> None:
+        """Test enabling tracing again appends to the new file."""
+        tracing.enable(self._trace_file)
+        with tracing.span('a'):
+            pass
+        tracing.enable(self._trace_file)
+        with tracing.span('b'):
+            pass
+        tracing.disable()
+        self.assertFalse(tracing.is_enabled())
+        self.assertEqual(['a', 'b'], [s['name'] for s in self._read_spans()])
+
+    def _read_spans(self) -> List[Dict[str, Any]]:
+        with open(self._trace_file, 'r') as f:
+            return [json.loads(line) for line in f]
@@ -0,0 +1,162 @@
+
+"""
+Opt-in tracing of the time spent in each stage of a pass.
+
+When enabled, each finished span is written to the trace file as one JSON object per line,
+with the OpenTelemetry span fields: the trace and span identifiers, the parent span, the
+start and end times in nanoseconds since the epoch, and the attributes.  A span started
+while no other span is open on the thread starts a new trace.
+
+When not enabled, a span costs a function call and a check.
+"""
+
+from typing import Dict, List, Callable, TypeVar, Optional, TextIO, Any, cast
+import functools
+import json
+import os
+import threading
+import time
+
+FuncT = TypeVar('FuncT', bound=Callable[..., Any])
+
+
+class Span:
+    """One timed stage.  Use it as a context manager, which ends the span."""
+    __slots__ = (
+        'tracer', 'name', 'trace_id', 'span_id', 'parent_id', 'attributes',
+        'start_time', '_start',
+    )
+
+    def __init__(self, tracer: Optional['Tracer'], name: str, attributes: Dict[str, Any]) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+        self.trace_id = ''
+        self.span_id = ''
+        self.parent_id = ''
+        self.start_time = 0
+        self._start = 0
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set the attribute of the span.  Only simple values should be used."""
+        if self.tracer is not None:
+            self.attributes[key] = value
+
+    def add_time(self, key: str, start: float) -> None:
+        """Add the seconds since the `time.perf_counter()` start to the attribute.  This
+        records the time of a sub-stage that runs too often to be a span of its own."""
+        if self.tracer is not None:
+            self.attributes[key] = (
+                self.attributes.get(key, 0.0) + time.perf_counter() - start
+            )
+
+    def __enter__(self) -> 'Span':
+        if self.tracer is not None:
+            self.tracer.start_span(self)
+            self.start_time = time.time_ns()
+            self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        if self.tracer is not None:
+            if exc_value is not None:
+                self.attributes['error'] = repr(exc_value)
+            self.tracer.end_span(self, self.start_time + time.perf_counter_ns() - self._start)
+
+
+# The span used when tracing is not enabled.
+NOOP_SPAN = Span(None, '', {})
+
+
+class Tracer:
+    """Writes the finished spans to the trace file."""
+    __slots__ = ('out', '_lock', '_local',)
+
+    def __init__(self, out: TextIO) -> None:
+        self.out = out
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def get_stack(self) -> List[Span]:
+        """Get the open spans of the current thread."""
+        stack: Optional[List[Span]] = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+        return stack
+
+    def start_span(self, started: Span) -> None:
+        """Start the span as a child of the thread's current span, if there is one."""
+        stack = self.get_stack()
+        if stack:
+            started.trace_id = stack[-1].trace_id
+            started.parent_id = stack[-1].span_id
+        else:
+            started.trace_id = os.urandom(16).hex()
+        started.span_id = os.urandom(8).hex()
+        stack.append(started)
+
+    def end_span(self, ended: Span, end_time: int) -> None:
+        """Write the span.  The file is flushed when a trace ends."""
+        stack = self.get_stack()
+        if ended in stack:
+            stack.remove(ended)
+        line = json.dumps({
+            'name': ended.name,
+            'trace_id': ended.trace_id,
+            'span_id': ended.span_id,
+            'parent_span_id': ended.parent_id or None,
+            'start_time_unix_nano': ended.start_time,
+            'end_time_unix_nano': end_time,
+            'attributes': ended.attributes,
+        }, default=str)
+        with self._lock:
+            self.out.write(line + '\n')
+            if not stack:
+                self.out.flush()
+
+    def close(self) -> None:
+        """Close the trace file."""
+        with self._lock:
+            self.out.close()
+
+
+TRACER: Optional[Tracer] = None
+
+
+def enable(path: str) -> None:
+    """Write the spans to the end of the file."""
+    global TRACER  # pylint: disable=W0603
+    disable()
+    TRACER = Tracer(open(path, 'a', encoding='utf-8'))  # pylint: disable=R1732
+
+
+def disable() -> None:
+    """Stop writing the spans."""
+    global TRACER  # pylint: disable=W0603
+    if TRACER is not None:
+        TRACER.close()
+        TRACER = None
+
+
+def is_enabled() -> bool:
+    """Are the spans written?"""
+    return TRACER is not None
+
+
+def span(name: str, **attributes: Any) -> Span:
+    """Create the span, which starts when used as a context manager."""
+    if TRACER is None:
+        return NOOP_SPAN
+    return Span(TRACER, name, attributes)
+
+
+def traced(name: str) -> Callable[[FuncT], FuncT]:
+    """Decorator that records each call of the function as a span."""
+    def decorator(func: FuncT) -> FuncT:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name):
+                return func(*args, **kwargs)
+        return cast(FuncT, wrapper)
+    return decorator
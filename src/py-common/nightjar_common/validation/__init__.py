@@ -1,8 +1,47 @@
 
 """
 Auto-generated validation code.
+
+The generated validator modules are large, so each one is only imported on the first
+use of its validator.
 """
 
-from .proxy_input import validate_proxy_input_schema_yaml as validate_proxy_input
-from .discovery_map import validate_discovery_map_schema_yaml as validate_discovery_map
-from .templates import validate_templates_schema_yaml as validate_templates
+from typing import Dict, Callable, Any
+import importlib
+
+Validator = Callable[[Dict[str, Any]], Dict[str, Any]]
+_VALIDATORS: Dict[str, Validator] = {}
+
+
+def _get_validator(code_name: str) -> Validator:
+    ret = _VALIDATORS.get(code_name)
+    if ret is None:
+        module = importlib.import_module('.' + code_name, __name__)
+        ret = getattr(module, 'validate_{0}_schema_yaml'.format(code_name))
+        _VALIDATORS[code_name] = ret
+    return ret
+
+
+def validate_discovery_map_delta(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate the data against the discovery-map-delta schema."""
+    return _get_validator('discovery_map_delta')(data)
+
+
+def validate_discovery_map_index(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate the data against the discovery-map-index schema."""
+    return _get_validator('discovery_map_index')(data)
+
+
+def validate_discovery_map(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate the data against the discovery-map schema."""
+    return _get_validator('discovery_map')(data)
+
+
+def validate_proxy_input(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate the data against the proxy-input schema."""
+    return _get_validator('proxy_input')(data)
+
+
+def validate_templates(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate the data against the templates schema."""
+    return _get_validator('templates')(data)
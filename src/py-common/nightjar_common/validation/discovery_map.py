@@ -7,83 +7,145 @@ from typing import Dict, Any
 
 VERSION = "2.14.4"
 import re
+from ..fastjsonschema_replacement import LazyPattern
 from ..fastjsonschema_replacement import JsonSchemaException
 
 
 REGEX_PATTERNS = {
-    "ipv4_re_pattern": re.compile(r"^((25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\Z"),
-    "ipv6_re_pattern": re.compile(r"^(?:(?:[0-9A-Fa-f]{1,4}:){6}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|::(?:[0-9A-Fa-f]{1,4}:){5}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:[0-9A-Fa-f]{1,4})?::(?:[0-9A-Fa-f]{1,4}:){4}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4})?::(?:[0-9A-Fa-f]{1,4}:){3}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:(?:[0-9A-Fa-f]{1,4}:){,2}[0-9A-Fa-f]{1,4})?::(?:[0-9A-Fa-f]{1,4}:){2}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:(?:[0-9A-Fa-f]{1,4}:){,3}[0-9A-Fa-f]{1,4})?::[0-9A-Fa-f]{1,4}:(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:(?:[0-9A-Fa-f]{1,4}:){,4}[0-9A-Fa-f]{1,4})?::(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:(?:[0-9A-Fa-f]{1,4}:){,5}[0-9A-Fa-f]{1,4})?::[0-9A-Fa-f]{1,4}|(?:(?:[0-9A-Fa-f]{1,4}:){,6}[0-9A-Fa-f]{1,4})?::)\Z")
+    "ipv4_re_pattern": LazyPattern(r"^((25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\Z"),
+    "ipv6_re_pattern": LazyPattern(r"^(?:(?:[0-9A-Fa-f]{1,4}:){6}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|::(?:[0-9A-Fa-f]{1,4}:){5}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:[0-9A-Fa-f]{1,4})?::(?:[0-9A-Fa-f]{1,4}:){4}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4})?::(?:[0-9A-Fa-f]{1,4}:){3}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:(?:[0-9A-Fa-f]{1,4}:){,2}[0-9A-Fa-f]{1,4})?::(?:[0-9A-Fa-f]{1,4}:){2}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:(?:[0-9A-Fa-f]{1,4}:){,3}[0-9A-Fa-f]{1,4})?::[0-9A-Fa-f]{1,4}:(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:(?:[0-9A-Fa-f]{1,4}:){,4}[0-9A-Fa-f]{1,4})?::(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:(?:[0-9A-Fa-f]{1,4}:){,5}[0-9A-Fa-f]{1,4})?::[0-9A-Fa-f]{1,4}|(?:(?:[0-9A-Fa-f]{1,4}:){,6}[0-9A-Fa-f]{1,4})?::)\Z")
 }
 
 NoneType = type(None)
 
+_PATTERN_0 = REGEX_PATTERNS["ipv4_re_pattern"]
+_PATTERN_1 = REGEX_PATTERNS["ipv6_re_pattern"]
+_DEFINITION_0 = {'$schema': 'https://json-schema.org/draft-07/schema', 'description': 'Data output from the discovery-map extension point.  It describes the entire mesh.', 'type': 'object', 'required': ['schema-version', 'document-version', 'namespaces'], 'properties': {'schema-version': {'description': 'Version of this document\'s schema.  The value must be the string value "v1".', 'const': 'v1'}, 'document-version': {'description': 'An opaque value indicating the version of this document.', 'type': 'string'}, 'namespaces': {'description': 'Collection of all the namespaces and their services, colors, and routes.  This will be transformed by the entry point into the correct proxy configuration.\n', 'type': 'array', 'items': {'description': 'A single namespace and its configuration properties.', 'type': 'object', 'required': ['namespace', 'network-id', 'gateways', 'service-colors'], 'properties': {'namespace': {'description': 'The namespace name.  Each must be unique.', 'type': 'string'}, 'network-id': {'description': 'The network ID.  This can be the same as the namespace name.', 'type': 'string'}, 'gateways': {'description': 'Collection of gateway proxies that send traffic into the namespace.', 'type': 'object', 'required': ['instances', 'prefer-gateway', 'protocol'], 'properties': {'prefer-gateway': {'description': 'Whether services outside this namespace should prefer to send requests to the gateway proxy (true) or use direct access (false).  Some network topologies require inter-namespace access to go through a gateway.\n', 'type': 'boolean'}, 'instances': {'description': 'Collection of host/ports that proxy requests into the namespace.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}, 'protocol': {'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}}}, 'service-colors': {'description': 'List of all the service-colors.  Each running instance for a service-color must share the routing information.  If two instances have the same service-color information but different routing or weights, then the discovery map must distinguish the color between them.\n', 'type': 'array', 'items': {'description': 'A service-color description, which has 1 or more instances associated with it.', 'type': 'object', 'required': ['service', 'color', 'index', 'routes', 'instances', 'namespace-egress'], 'properties': {'service': {'description': 'Service name.', 'type': 'string'}, 'color': {'description': 'The service "color", which indicates different deployment characteristics of the service.\n', 'type': 'string'}, 'index': {'description': 'Some services must be split out into separate groups due to routes only serving select ports.  These are then split out by the index.\n', 'type': 'integer'}, 'protocol': {'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}, 'routes': {'description': 'Collection of URL routes that the service-color serves.', 'type': 'array', 'items': {'description': 'A service route.', 'type': 'object', 'required': ['path-match', 'weight', 'namespace-access', 'default-access'], 'properties': {'path-match': {'description': 'How the route path is matched.', 'type': 'object', 'required': ['match-type', 'value'], 'properties': {'match-type': {'oneOf': [{'description': 'the starting part of the URI path part.', 'const': 'prefix'}, {'description': 'the value is a matching regular expression.', 'const': 'regex'}, {'description': 'the value must match exactly.', 'const': 'exact'}]}, 'value': {'description': 'The URI path-part that handles the route.  This must be unique within the service-color.', 'type': 'string'}, 'case-sensitive': {'description': 'Is the path case sensitive?  Defaults to True', 'type': 'boolean'}}}, 'weight': {'description': 'Weight to give the handling of this route.  A higher number means more traffic is directed to it.', 'type': 'integer', 'minimum': 1, 'maximum': 32767}, 'headers': {'description': 'Optional list of request header fields that must also be fulfilled to pass network traffic to this route.\n', 'type': 'array', 'items': {'type': 'object', 'required': ['header-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': 'string'}, 'invert': {'description': 'If true, then the match is reversed.  Defaults to false.', 'type': 'boolean'}, 'case-sensitive': {'type': 'boolean'}}}}, 'query-parameters': {'description': 'query parameter filters', 'type': 'array', 'items': {'description': 'Filter for a query parameter which is part of the routing to this cluster.', 'type': 'object', 'required': ['parameter-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': ['string', 'null']}, 'case-sensitive': {'type': 'boolean'}}}}, 'default-access': {'description': 'Default access for any namespace not specified. Also, gateways only look at this to determine whether a route is generally public or not.\n', 'type': 'boolean'}, 'namespace-access': {'description': "Collection of each namespace's allowed access. If a namespace exists that is not given here, then the default-protection is used for that namespace.\n", 'type': 'array', 'items': {'description': 'A namespace access grant.  If a namespace is not listed, then the default-access is used instead.\n', 'type': 'object', 'required': ['namespace', 'access'], 'properties': {'namespace': {'description': 'The namespace protection to grant access.', 'type': 'string'}, 'access': {'description': 'Whether the given namespace is allowed access to this route.', 'type': 'boolean'}}}}}}}, 'instances': {'description': 'Collection of IP and listening ports for handlers of this service-color routes.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}, 'namespace-egress': {'description': 'The host and port that this service-color sends requests to access each namespace.', 'type': 'array', 'items': {'description': "A host and port that describes the URI this service-color sends requests to for access to a namespace's routes.  That namespace's protections will be applied.  This should be an interface on the local, sidecar proxy.  The host part of the interface is usually ignored.\n", 'type': 'object', 'required': ['namespace', 'interface'], 'properties': {'namespace': {'description': 'The namespace that this interface servces.', 'type': 'string'}, 'interface': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}}}}}}}}}}, 'definitions': {'host-port': {'oneOf': [{'description': 'An IPv4 and listening port.', 'type': 'object', 'required': ['ipv4', 'port'], 'properties': {'ipv4': {'description': 'IPv4 address.', 'type': 'string', 'format': 'ipv4'}, 'port': {'description': 'Listening port.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}}}, {'description': "An IPv6 and listening port for a handler of this service-color's routes.", 'type': 'object', 'required': ['ipv6', 'port'], 'properties': {'ipv6': {'description': 'IPv6 address for this service-color instance.', 'type': 'string', 'format': 'ipv6'}, 'port': {'description': 'Listening port that services the routes.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}}}, {'description': "A DNS resolvable hostname and listening port for a handler of this service-color's routes.", 'type': 'object', 'required': ['hostname', 'port'], 'properties': {'hostname': {'description': 'hostname address for this service-color instance.', 'type': 'string'}, 'port': {'description': 'Listening port that services the routes.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}}}]}, 'match-type': {'oneOf': [{'description': 'exact matching of the value.', 'const': 'exact'}, {'description': 'regular expression.', 'const': 'regex'}, {'description': 'parameter value starts with this.', 'const': 'prefix'}, {'description': 'parameter value ends with this.', 'const': 'suffix'}, {'description': 'parameter needs to just be present.  The "value" is ignored.', 'const': 'present'}]}}, '$id': 'file:/tmp/tmp93fil6rp/discovery-map-schema.yaml'}
+_DEFINITION_1 = {'oneOf': [{'description': 'exact matching of the value.', 'const': 'exact'}, {'description': 'regular expression.', 'const': 'regex'}, {'description': 'parameter value starts with this.', 'const': 'prefix'}, {'description': 'parameter value ends with this.', 'const': 'suffix'}, {'description': 'parameter needs to just be present.  The "value" is ignored.', 'const': 'present'}]}
+_DEFINITION_2 = {'oneOf': [{'description': 'An IPv4 and listening port.', 'type': 'object', 'required': ['ipv4', 'port'], 'properties': {'ipv4': {'description': 'IPv4 address.', 'type': 'string', 'format': 'ipv4'}, 'port': {'description': 'Listening port.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}}}, {'description': "An IPv6 and listening port for a handler of this service-color's routes.", 'type': 'object', 'required': ['ipv6', 'port'], 'properties': {'ipv6': {'description': 'IPv6 address for this service-color instance.', 'type': 'string', 'format': 'ipv6'}, 'port': {'description': 'Listening port that services the routes.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}}}, {'description': "A DNS resolvable hostname and listening port for a handler of this service-color's routes.", 'type': 'object', 'required': ['hostname', 'port'], 'properties': {'hostname': {'description': 'hostname address for this service-color instance.', 'type': 'string'}, 'port': {'description': 'Listening port that services the routes.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}}}]}
+_DEFINITION_3 = {'description': 'Version of this document\'s schema.  The value must be the string value "v1".', 'const': 'v1'}
+_DEFINITION_4 = {'description': 'An opaque value indicating the version of this document.', 'type': 'string'}
+_DEFINITION_5 = {'description': 'Collection of all the namespaces and their services, colors, and routes.  This will be transformed by the entry point into the correct proxy configuration.\n', 'type': 'array', 'items': {'description': 'A single namespace and its configuration properties.', 'type': 'object', 'required': ['namespace', 'network-id', 'gateways', 'service-colors'], 'properties': {'namespace': {'description': 'The namespace name.  Each must be unique.', 'type': 'string'}, 'network-id': {'description': 'The network ID.  This can be the same as the namespace name.', 'type': 'string'}, 'gateways': {'description': 'Collection of gateway proxies that send traffic into the namespace.', 'type': 'object', 'required': ['instances', 'prefer-gateway', 'protocol'], 'properties': {'prefer-gateway': {'description': 'Whether services outside this namespace should prefer to send requests to the gateway proxy (true) or use direct access (false).  Some network topologies require inter-namespace access to go through a gateway.\n', 'type': 'boolean'}, 'instances': {'description': 'Collection of host/ports that proxy requests into the namespace.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}, 'protocol': {'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}}}, 'service-colors': {'description': 'List of all the service-colors.  Each running instance for a service-color must share the routing information.  If two instances have the same service-color information but different routing or weights, then the discovery map must distinguish the color between them.\n', 'type': 'array', 'items': {'description': 'A service-color description, which has 1 or more instances associated with it.', 'type': 'object', 'required': ['service', 'color', 'index', 'routes', 'instances', 'namespace-egress'], 'properties': {'service': {'description': 'Service name.', 'type': 'string'}, 'color': {'description': 'The service "color", which indicates different deployment characteristics of the service.\n', 'type': 'string'}, 'index': {'description': 'Some services must be split out into separate groups due to routes only serving select ports.  These are then split out by the index.\n', 'type': 'integer'}, 'protocol': {'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}, 'routes': {'description': 'Collection of URL routes that the service-color serves.', 'type': 'array', 'items': {'description': 'A service route.', 'type': 'object', 'required': ['path-match', 'weight', 'namespace-access', 'default-access'], 'properties': {'path-match': {'description': 'How the route path is matched.', 'type': 'object', 'required': ['match-type', 'value'], 'properties': {'match-type': {'oneOf': [{'description': 'the starting part of the URI path part.', 'const': 'prefix'}, {'description': 'the value is a matching regular expression.', 'const': 'regex'}, {'description': 'the value must match exactly.', 'const': 'exact'}]}, 'value': {'description': 'The URI path-part that handles the route.  This must be unique within the service-color.', 'type': 'string'}, 'case-sensitive': {'description': 'Is the path case sensitive?  Defaults to True', 'type': 'boolean'}}}, 'weight': {'description': 'Weight to give the handling of this route.  A higher number means more traffic is directed to it.', 'type': 'integer', 'minimum': 1, 'maximum': 32767}, 'headers': {'description': 'Optional list of request header fields that must also be fulfilled to pass network traffic to this route.\n', 'type': 'array', 'items': {'type': 'object', 'required': ['header-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': 'string'}, 'invert': {'description': 'If true, then the match is reversed.  Defaults to false.', 'type': 'boolean'}, 'case-sensitive': {'type': 'boolean'}}}}, 'query-parameters': {'description': 'query parameter filters', 'type': 'array', 'items': {'description': 'Filter for a query parameter which is part of the routing to this cluster.', 'type': 'object', 'required': ['parameter-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': ['string', 'null']}, 'case-sensitive': {'type': 'boolean'}}}}, 'default-access': {'description': 'Default access for any namespace not specified. Also, gateways only look at this to determine whether a route is generally public or not.\n', 'type': 'boolean'}, 'namespace-access': {'description': "Collection of each namespace's allowed access. If a namespace exists that is not given here, then the default-protection is used for that namespace.\n", 'type': 'array', 'items': {'description': 'A namespace access grant.  If a namespace is not listed, then the default-access is used instead.\n', 'type': 'object', 'required': ['namespace', 'access'], 'properties': {'namespace': {'description': 'The namespace protection to grant access.', 'type': 'string'}, 'access': {'description': 'Whether the given namespace is allowed access to this route.', 'type': 'boolean'}}}}}}}, 'instances': {'description': 'Collection of IP and listening ports for handlers of this service-color routes.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}, 'namespace-egress': {'description': 'The host and port that this service-color sends requests to access each namespace.', 'type': 'array', 'items': {'description': "A host and port that describes the URI this service-color sends requests to for access to a namespace's routes.  That namespace's protections will be applied.  This should be an interface on the local, sidecar proxy.  The host part of the interface is usually ignored.\n", 'type': 'object', 'required': ['namespace', 'interface'], 'properties': {'namespace': {'description': 'The namespace that this interface servces.', 'type': 'string'}, 'interface': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}}}}}}}}}
+_DEFINITION_6 = {'description': 'exact matching of the value.', 'const': 'exact'}
+_DEFINITION_7 = {'description': 'regular expression.', 'const': 'regex'}
+_DEFINITION_8 = {'description': 'parameter value starts with this.', 'const': 'prefix'}
+_DEFINITION_9 = {'description': 'parameter value ends with this.', 'const': 'suffix'}
+_DEFINITION_10 = {'description': 'parameter needs to just be present.  The "value" is ignored.', 'const': 'present'}
+_DEFINITION_11 = {'description': 'An IPv4 and listening port.', 'type': 'object', 'required': ['ipv4', 'port'], 'properties': {'ipv4': {'description': 'IPv4 address.', 'type': 'string', 'format': 'ipv4'}, 'port': {'description': 'Listening port.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}}}
+_DEFINITION_12 = {'description': "An IPv6 and listening port for a handler of this service-color's routes.", 'type': 'object', 'required': ['ipv6', 'port'], 'properties': {'ipv6': {'description': 'IPv6 address for this service-color instance.', 'type': 'string', 'format': 'ipv6'}, 'port': {'description': 'Listening port that services the routes.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}}}
+_DEFINITION_13 = {'description': "A DNS resolvable hostname and listening port for a handler of this service-color's routes.", 'type': 'object', 'required': ['hostname', 'port'], 'properties': {'hostname': {'description': 'hostname address for this service-color instance.', 'type': 'string'}, 'port': {'description': 'Listening port that services the routes.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}}}
+_DEFINITION_14 = {'description': 'A single namespace and its configuration properties.', 'type': 'object', 'required': ['namespace', 'network-id', 'gateways', 'service-colors'], 'properties': {'namespace': {'description': 'The namespace name.  Each must be unique.', 'type': 'string'}, 'network-id': {'description': 'The network ID.  This can be the same as the namespace name.', 'type': 'string'}, 'gateways': {'description': 'Collection of gateway proxies that send traffic into the namespace.', 'type': 'object', 'required': ['instances', 'prefer-gateway', 'protocol'], 'properties': {'prefer-gateway': {'description': 'Whether services outside this namespace should prefer to send requests to the gateway proxy (true) or use direct access (false).  Some network topologies require inter-namespace access to go through a gateway.\n', 'type': 'boolean'}, 'instances': {'description': 'Collection of host/ports that proxy requests into the namespace.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}, 'protocol': {'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}}}, 'service-colors': {'description': 'List of all the service-colors.  Each running instance for a service-color must share the routing information.  If two instances have the same service-color information but different routing or weights, then the discovery map must distinguish the color between them.\n', 'type': 'array', 'items': {'description': 'A service-color description, which has 1 or more instances associated with it.', 'type': 'object', 'required': ['service', 'color', 'index', 'routes', 'instances', 'namespace-egress'], 'properties': {'service': {'description': 'Service name.', 'type': 'string'}, 'color': {'description': 'The service "color", which indicates different deployment characteristics of the service.\n', 'type': 'string'}, 'index': {'description': 'Some services must be split out into separate groups due to routes only serving select ports.  These are then split out by the index.\n', 'type': 'integer'}, 'protocol': {'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}, 'routes': {'description': 'Collection of URL routes that the service-color serves.', 'type': 'array', 'items': {'description': 'A service route.', 'type': 'object', 'required': ['path-match', 'weight', 'namespace-access', 'default-access'], 'properties': {'path-match': {'description': 'How the route path is matched.', 'type': 'object', 'required': ['match-type', 'value'], 'properties': {'match-type': {'oneOf': [{'description': 'the starting part of the URI path part.', 'const': 'prefix'}, {'description': 'the value is a matching regular expression.', 'const': 'regex'}, {'description': 'the value must match exactly.', 'const': 'exact'}]}, 'value': {'description': 'The URI path-part that handles the route.  This must be unique within the service-color.', 'type': 'string'}, 'case-sensitive': {'description': 'Is the path case sensitive?  Defaults to True', 'type': 'boolean'}}}, 'weight': {'description': 'Weight to give the handling of this route.  A higher number means more traffic is directed to it.', 'type': 'integer', 'minimum': 1, 'maximum': 32767}, 'headers': {'description': 'Optional list of request header fields that must also be fulfilled to pass network traffic to this route.\n', 'type': 'array', 'items': {'type': 'object', 'required': ['header-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': 'string'}, 'invert': {'description': 'If true, then the match is reversed.  Defaults to false.', 'type': 'boolean'}, 'case-sensitive': {'type': 'boolean'}}}}, 'query-parameters': {'description': 'query parameter filters', 'type': 'array', 'items': {'description': 'Filter for a query parameter which is part of the routing to this cluster.', 'type': 'object', 'required': ['parameter-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': ['string', 'null']}, 'case-sensitive': {'type': 'boolean'}}}}, 'default-access': {'description': 'Default access for any namespace not specified. Also, gateways only look at this to determine whether a route is generally public or not.\n', 'type': 'boolean'}, 'namespace-access': {'description': "Collection of each namespace's allowed access. If a namespace exists that is not given here, then the default-protection is used for that namespace.\n", 'type': 'array', 'items': {'description': 'A namespace access grant.  If a namespace is not listed, then the default-access is used instead.\n', 'type': 'object', 'required': ['namespace', 'access'], 'properties': {'namespace': {'description': 'The namespace protection to grant access.', 'type': 'string'}, 'access': {'description': 'Whether the given namespace is allowed access to this route.', 'type': 'boolean'}}}}}}}, 'instances': {'description': 'Collection of IP and listening ports for handlers of this service-color routes.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}, 'namespace-egress': {'description': 'The host and port that this service-color sends requests to access each namespace.', 'type': 'array', 'items': {'description': "A host and port that describes the URI this service-color sends requests to for access to a namespace's routes.  That namespace's protections will be applied.  This should be an interface on the local, sidecar proxy.  The host part of the interface is usually ignored.\n", 'type': 'object', 'required': ['namespace', 'interface'], 'properties': {'namespace': {'description': 'The namespace that this interface servces.', 'type': 'string'}, 'interface': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}}}}}}}}
+_DEFINITION_15 = {'description': 'IPv4 address.', 'type': 'string', 'format': 'ipv4'}
+_DEFINITION_16 = {'description': 'Listening port.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}
+_DEFINITION_17 = {'description': 'IPv6 address for this service-color instance.', 'type': 'string', 'format': 'ipv6'}
+_DEFINITION_18 = {'description': 'Listening port that services the routes.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}
+_DEFINITION_19 = {'description': 'hostname address for this service-color instance.', 'type': 'string'}
+_DEFINITION_20 = {'description': 'The namespace name.  Each must be unique.', 'type': 'string'}
+_DEFINITION_21 = {'description': 'The network ID.  This can be the same as the namespace name.', 'type': 'string'}
+_DEFINITION_22 = {'description': 'Collection of gateway proxies that send traffic into the namespace.', 'type': 'object', 'required': ['instances', 'prefer-gateway', 'protocol'], 'properties': {'prefer-gateway': {'description': 'Whether services outside this namespace should prefer to send requests to the gateway proxy (true) or use direct access (false).  Some network topologies require inter-namespace access to go through a gateway.\n', 'type': 'boolean'}, 'instances': {'description': 'Collection of host/ports that proxy requests into the namespace.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}, 'protocol': {'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}}}
+_DEFINITION_23 = {'description': 'List of all the service-colors.  Each running instance for a service-color must share the routing information.  If two instances have the same service-color information but different routing or weights, then the discovery map must distinguish the color between them.\n', 'type': 'array', 'items': {'description': 'A service-color description, which has 1 or more instances associated with it.', 'type': 'object', 'required': ['service', 'color', 'index', 'routes', 'instances', 'namespace-egress'], 'properties': {'service': {'description': 'Service name.', 'type': 'string'}, 'color': {'description': 'The service "color", which indicates different deployment characteristics of the service.\n', 'type': 'string'}, 'index': {'description': 'Some services must be split out into separate groups due to routes only serving select ports.  These are then split out by the index.\n', 'type': 'integer'}, 'protocol': {'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}, 'routes': {'description': 'Collection of URL routes that the service-color serves.', 'type': 'array', 'items': {'description': 'A service route.', 'type': 'object', 'required': ['path-match', 'weight', 'namespace-access', 'default-access'], 'properties': {'path-match': {'description': 'How the route path is matched.', 'type': 'object', 'required': ['match-type', 'value'], 'properties': {'match-type': {'oneOf': [{'description': 'the starting part of the URI path part.', 'const': 'prefix'}, {'description': 'the value is a matching regular expression.', 'const': 'regex'}, {'description': 'the value must match exactly.', 'const': 'exact'}]}, 'value': {'description': 'The URI path-part that handles the route.  This must be unique within the service-color.', 'type': 'string'}, 'case-sensitive': {'description': 'Is the path case sensitive?  Defaults to True', 'type': 'boolean'}}}, 'weight': {'description': 'Weight to give the handling of this route.  A higher number means more traffic is directed to it.', 'type': 'integer', 'minimum': 1, 'maximum': 32767}, 'headers': {'description': 'Optional list of request header fields that must also be fulfilled to pass network traffic to this route.\n', 'type': 'array', 'items': {'type': 'object', 'required': ['header-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': 'string'}, 'invert': {'description': 'If true, then the match is reversed.  Defaults to false.', 'type': 'boolean'}, 'case-sensitive': {'type': 'boolean'}}}}, 'query-parameters': {'description': 'query parameter filters', 'type': 'array', 'items': {'description': 'Filter for a query parameter which is part of the routing to this cluster.', 'type': 'object', 'required': ['parameter-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': ['string', 'null']}, 'case-sensitive': {'type': 'boolean'}}}}, 'default-access': {'description': 'Default access for any namespace not specified. Also, gateways only look at this to determine whether a route is generally public or not.\n', 'type': 'boolean'}, 'namespace-access': {'description': "Collection of each namespace's allowed access. If a namespace exists that is not given here, then the default-protection is used for that namespace.\n", 'type': 'array', 'items': {'description': 'A namespace access grant.  If a namespace is not listed, then the default-access is used instead.\n', 'type': 'object', 'required': ['namespace', 'access'], 'properties': {'namespace': {'description': 'The namespace protection to grant access.', 'type': 'string'}, 'access': {'description': 'Whether the given namespace is allowed access to this route.', 'type': 'boolean'}}}}}}}, 'instances': {'description': 'Collection of IP and listening ports for handlers of this service-color routes.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}, 'namespace-egress': {'description': 'The host and port that this service-color sends requests to access each namespace.', 'type': 'array', 'items': {'description': "A host and port that describes the URI this service-color sends requests to for access to a namespace's routes.  That namespace's protections will be applied.  This should be an interface on the local, sidecar proxy.  The host part of the interface is usually ignored.\n", 'type': 'object', 'required': ['namespace', 'interface'], 'properties': {'namespace': {'description': 'The namespace that this interface servces.', 'type': 'string'}, 'interface': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}}}}}}
+_DEFINITION_24 = {'description': 'Whether services outside this namespace should prefer to send requests to the gateway proxy (true) or use direct access (false).  Some network topologies require inter-namespace access to go through a gateway.\n', 'type': 'boolean'}
+_DEFINITION_25 = {'description': 'Collection of host/ports that proxy requests into the namespace.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}
+_DEFINITION_26 = {'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}
+_DEFINITION_27 = {'description': 'A service-color description, which has 1 or more instances associated with it.', 'type': 'object', 'required': ['service', 'color', 'index', 'routes', 'instances', 'namespace-egress'], 'properties': {'service': {'description': 'Service name.', 'type': 'string'}, 'color': {'description': 'The service "color", which indicates different deployment characteristics of the service.\n', 'type': 'string'}, 'index': {'description': 'Some services must be split out into separate groups due to routes only serving select ports.  These are then split out by the index.\n', 'type': 'integer'}, 'protocol': {'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}, 'routes': {'description': 'Collection of URL routes that the service-color serves.', 'type': 'array', 'items': {'description': 'A service route.', 'type': 'object', 'required': ['path-match', 'weight', 'namespace-access', 'default-access'], 'properties': {'path-match': {'description': 'How the route path is matched.', 'type': 'object', 'required': ['match-type', 'value'], 'properties': {'match-type': {'oneOf': [{'description': 'the starting part of the URI path part.', 'const': 'prefix'}, {'description': 'the value is a matching regular expression.', 'const': 'regex'}, {'description': 'the value must match exactly.', 'const': 'exact'}]}, 'value': {'description': 'The URI path-part that handles the route.  This must be unique within the service-color.', 'type': 'string'}, 'case-sensitive': {'description': 'Is the path case sensitive?  Defaults to True', 'type': 'boolean'}}}, 'weight': {'description': 'Weight to give the handling of this route.  A higher number means more traffic is directed to it.', 'type': 'integer', 'minimum': 1, 'maximum': 32767}, 'headers': {'description': 'Optional list of request header fields that must also be fulfilled to pass network traffic to this route.\n', 'type': 'array', 'items': {'type': 'object', 'required': ['header-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': 'string'}, 'invert': {'description': 'If true, then the match is reversed.  Defaults to false.', 'type': 'boolean'}, 'case-sensitive': {'type': 'boolean'}}}}, 'query-parameters': {'description': 'query parameter filters', 'type': 'array', 'items': {'description': 'Filter for a query parameter which is part of the routing to this cluster.', 'type': 'object', 'required': ['parameter-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': ['string', 'null']}, 'case-sensitive': {'type': 'boolean'}}}}, 'default-access': {'description': 'Default access for any namespace not specified. Also, gateways only look at this to determine whether a route is generally public or not.\n', 'type': 'boolean'}, 'namespace-access': {'description': "Collection of each namespace's allowed access. If a namespace exists that is not given here, then the default-protection is used for that namespace.\n", 'type': 'array', 'items': {'description': 'A namespace access grant.  If a namespace is not listed, then the default-access is used instead.\n', 'type': 'object', 'required': ['namespace', 'access'], 'properties': {'namespace': {'description': 'The namespace protection to grant access.', 'type': 'string'}, 'access': {'description': 'Whether the given namespace is allowed access to this route.', 'type': 'boolean'}}}}}}}, 'instances': {'description': 'Collection of IP and listening ports for handlers of this service-color routes.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}, 'namespace-egress': {'description': 'The host and port that this service-color sends requests to access each namespace.', 'type': 'array', 'items': {'description': "A host and port that describes the URI this service-color sends requests to for access to a namespace's routes.  That namespace's protections will be applied.  This should be an interface on the local, sidecar proxy.  The host part of the interface is usually ignored.\n", 'type': 'object', 'required': ['namespace', 'interface'], 'properties': {'namespace': {'description': 'The namespace that this interface servces.', 'type': 'string'}, 'interface': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}}}}}
+_DEFINITION_28 = {'description': 'Service name.', 'type': 'string'}
+_DEFINITION_29 = {'description': 'The service "color", which indicates different deployment characteristics of the service.\n', 'type': 'string'}
+_DEFINITION_30 = {'description': 'Some services must be split out into separate groups due to routes only serving select ports.  These are then split out by the index.\n', 'type': 'integer'}
+_DEFINITION_31 = {'description': 'Collection of URL routes that the service-color serves.', 'type': 'array', 'items': {'description': 'A service route.', 'type': 'object', 'required': ['path-match', 'weight', 'namespace-access', 'default-access'], 'properties': {'path-match': {'description': 'How the route path is matched.', 'type': 'object', 'required': ['match-type', 'value'], 'properties': {'match-type': {'oneOf': [{'description': 'the starting part of the URI path part.', 'const': 'prefix'}, {'description': 'the value is a matching regular expression.', 'const': 'regex'}, {'description': 'the value must match exactly.', 'const': 'exact'}]}, 'value': {'description': 'The URI path-part that handles the route.  This must be unique within the service-color.', 'type': 'string'}, 'case-sensitive': {'description': 'Is the path case sensitive?  Defaults to True', 'type': 'boolean'}}}, 'weight': {'description': 'Weight to give the handling of this route.  A higher number means more traffic is directed to it.', 'type': 'integer', 'minimum': 1, 'maximum': 32767}, 'headers': {'description': 'Optional list of request header fields that must also be fulfilled to pass network traffic to this route.\n', 'type': 'array', 'items': {'type': 'object', 'required': ['header-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': 'string'}, 'invert': {'description': 'If true, then the match is reversed.  Defaults to false.', 'type': 'boolean'}, 'case-sensitive': {'type': 'boolean'}}}}, 'query-parameters': {'description': 'query parameter filters', 'type': 'array', 'items': {'description': 'Filter for a query parameter which is part of the routing to this cluster.', 'type': 'object', 'required': ['parameter-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': ['string', 'null']}, 'case-sensitive': {'type': 'boolean'}}}}, 'default-access': {'description': 'Default access for any namespace not specified. Also, gateways only look at this to determine whether a route is generally public or not.\n', 'type': 'boolean'}, 'namespace-access': {'description': "Collection of each namespace's allowed access. If a namespace exists that is not given here, then the default-protection is used for that namespace.\n", 'type': 'array', 'items': {'description': 'A namespace access grant.  If a namespace is not listed, then the default-access is used instead.\n', 'type': 'object', 'required': ['namespace', 'access'], 'properties': {'namespace': {'description': 'The namespace protection to grant access.', 'type': 'string'}, 'access': {'description': 'Whether the given namespace is allowed access to this route.', 'type': 'boolean'}}}}}}}
+_DEFINITION_32 = {'description': 'Collection of IP and listening ports for handlers of this service-color routes.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}
+_DEFINITION_33 = {'description': 'The host and port that this service-color sends requests to access each namespace.', 'type': 'array', 'items': {'description': "A host and port that describes the URI this service-color sends requests to for access to a namespace's routes.  That namespace's protections will be applied.  This should be an interface on the local, sidecar proxy.  The host part of the interface is usually ignored.\n", 'type': 'object', 'required': ['namespace', 'interface'], 'properties': {'namespace': {'description': 'The namespace that this interface servces.', 'type': 'string'}, 'interface': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}}}
+_DEFINITION_34 = {'description': 'A service route.', 'type': 'object', 'required': ['path-match', 'weight', 'namespace-access', 'default-access'], 'properties': {'path-match': {'description': 'How the route path is matched.', 'type': 'object', 'required': ['match-type', 'value'], 'properties': {'match-type': {'oneOf': [{'description': 'the starting part of the URI path part.', 'const': 'prefix'}, {'description': 'the value is a matching regular expression.', 'const': 'regex'}, {'description': 'the value must match exactly.', 'const': 'exact'}]}, 'value': {'description': 'The URI path-part that handles the route.  This must be unique within the service-color.', 'type': 'string'}, 'case-sensitive': {'description': 'Is the path case sensitive?  Defaults to True', 'type': 'boolean'}}}, 'weight': {'description': 'Weight to give the handling of this route.  A higher number means more traffic is directed to it.', 'type': 'integer', 'minimum': 1, 'maximum': 32767}, 'headers': {'description': 'Optional list of request header fields that must also be fulfilled to pass network traffic to this route.\n', 'type': 'array', 'items': {'type': 'object', 'required': ['header-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': 'string'}, 'invert': {'description': 'If true, then the match is reversed.  Defaults to false.', 'type': 'boolean'}, 'case-sensitive': {'type': 'boolean'}}}}, 'query-parameters': {'description': 'query parameter filters', 'type': 'array', 'items': {'description': 'Filter for a query parameter which is part of the routing to this cluster.', 'type': 'object', 'required': ['parameter-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': ['string', 'null']}, 'case-sensitive': {'type': 'boolean'}}}}, 'default-access': {'description': 'Default access for any namespace not specified. Also, gateways only look at this to determine whether a route is generally public or not.\n', 'type': 'boolean'}, 'namespace-access': {'description': "Collection of each namespace's allowed access. If a namespace exists that is not given here, then the default-protection is used for that namespace.\n", 'type': 'array', 'items': {'description': 'A namespace access grant.  If a namespace is not listed, then the default-access is used instead.\n', 'type': 'object', 'required': ['namespace', 'access'], 'properties': {'namespace': {'description': 'The namespace protection to grant access.', 'type': 'string'}, 'access': {'description': 'Whether the given namespace is allowed access to this route.', 'type': 'boolean'}}}}}}
+_DEFINITION_35 = {'description': "A host and port that describes the URI this service-color sends requests to for access to a namespace's routes.  That namespace's protections will be applied.  This should be an interface on the local, sidecar proxy.  The host part of the interface is usually ignored.\n", 'type': 'object', 'required': ['namespace', 'interface'], 'properties': {'namespace': {'description': 'The namespace that this interface servces.', 'type': 'string'}, 'interface': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}}
+_DEFINITION_36 = {'description': 'How the route path is matched.', 'type': 'object', 'required': ['match-type', 'value'], 'properties': {'match-type': {'oneOf': [{'description': 'the starting part of the URI path part.', 'const': 'prefix'}, {'description': 'the value is a matching regular expression.', 'const': 'regex'}, {'description': 'the value must match exactly.', 'const': 'exact'}]}, 'value': {'description': 'The URI path-part that handles the route.  This must be unique within the service-color.', 'type': 'string'}, 'case-sensitive': {'description': 'Is the path case sensitive?  Defaults to True', 'type': 'boolean'}}}
+_DEFINITION_37 = {'description': 'Weight to give the handling of this route.  A higher number means more traffic is directed to it.', 'type': 'integer', 'minimum': 1, 'maximum': 32767}
+_DEFINITION_38 = {'description': 'Optional list of request header fields that must also be fulfilled to pass network traffic to this route.\n', 'type': 'array', 'items': {'type': 'object', 'required': ['header-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': 'string'}, 'invert': {'description': 'If true, then the match is reversed.  Defaults to false.', 'type': 'boolean'}, 'case-sensitive': {'type': 'boolean'}}}}
+_DEFINITION_39 = {'description': 'query parameter filters', 'type': 'array', 'items': {'description': 'Filter for a query parameter which is part of the routing to this cluster.', 'type': 'object', 'required': ['parameter-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': ['string', 'null']}, 'case-sensitive': {'type': 'boolean'}}}}
+_DEFINITION_40 = {'description': 'Default access for any namespace not specified. Also, gateways only look at this to determine whether a route is generally public or not.\n', 'type': 'boolean'}
+_DEFINITION_41 = {'description': "Collection of each namespace's allowed access. If a namespace exists that is not given here, then the default-protection is used for that namespace.\n", 'type': 'array', 'items': {'description': 'A namespace access grant.  If a namespace is not listed, then the default-access is used instead.\n', 'type': 'object', 'required': ['namespace', 'access'], 'properties': {'namespace': {'description': 'The namespace protection to grant access.', 'type': 'string'}, 'access': {'description': 'Whether the given namespace is allowed access to this route.', 'type': 'boolean'}}}}
+_DEFINITION_42 = {'description': 'The namespace that this interface servces.', 'type': 'string'}
+_DEFINITION_43 = {'oneOf': [{'description': 'the starting part of the URI path part.', 'const': 'prefix'}, {'description': 'the value is a matching regular expression.', 'const': 'regex'}, {'description': 'the value must match exactly.', 'const': 'exact'}]}
+_DEFINITION_44 = {'description': 'The URI path-part that handles the route.  This must be unique within the service-color.', 'type': 'string'}
+_DEFINITION_45 = {'description': 'Is the path case sensitive?  Defaults to True', 'type': 'boolean'}
+_DEFINITION_46 = {'type': 'object', 'required': ['header-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': 'string'}, 'invert': {'description': 'If true, then the match is reversed.  Defaults to false.', 'type': 'boolean'}, 'case-sensitive': {'type': 'boolean'}}}
+_DEFINITION_47 = {'description': 'Filter for a query parameter which is part of the routing to this cluster.', 'type': 'object', 'required': ['parameter-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': ['string', 'null']}, 'case-sensitive': {'type': 'boolean'}}}
+_DEFINITION_48 = {'description': 'A namespace access grant.  If a namespace is not listed, then the default-access is used instead.\n', 'type': 'object', 'required': ['namespace', 'access'], 'properties': {'namespace': {'description': 'The namespace protection to grant access.', 'type': 'string'}, 'access': {'description': 'Whether the given namespace is allowed access to this route.', 'type': 'boolean'}}}
+_DEFINITION_49 = {'description': 'the starting part of the URI path part.', 'const': 'prefix'}
+_DEFINITION_50 = {'description': 'the value is a matching regular expression.', 'const': 'regex'}
+_DEFINITION_51 = {'description': 'the value must match exactly.', 'const': 'exact'}
+_DEFINITION_52 = {'type': 'string'}
+_DEFINITION_53 = {'description': 'If true, then the match is reversed.  Defaults to false.', 'type': 'boolean'}
+_DEFINITION_54 = {'type': 'boolean'}
+_DEFINITION_55 = {'type': ['string', 'null']}
+_DEFINITION_56 = {'description': 'The namespace protection to grant access.', 'type': 'string'}
+_DEFINITION_57 = {'description': 'Whether the given namespace is allowed access to this route.', 'type': 'boolean'}
+
 def validate_discovery_map_schema_yaml(data: Dict[str, Any]) -> Dict[str, Any]:
     if not isinstance(data, (dict)):
-        raise JsonSchemaException("data must be object", value=data, name="data", definition={'$schema': 'https://json-schema.org/draft-07/schema', 'description': 'Data output from the discovery-map extension point.  It describes the entire mesh.', 'type': 'object', 'required': ['schema-version', 'document-version', 'namespaces'], 'properties': {'schema-version': {'description': 'Version of this document\'s schema.  The value must be the string value "v1".', 'const': 'v1'}, 'document-version': {'description': 'An opaque value indicating the version of this document.', 'type': 'string'}, 'namespaces': {'description': 'Collection of all the namespaces and their services, colors, and routes.  This will be transformed by the entry point into the correct proxy configuration.\n', 'type': 'array', 'items': {'description': 'A single namespace and its configuration properties.', 'type': 'object', 'required': ['namespace', 'network-id', 'gateways', 'service-colors'], 'properties': {'namespace': {'description': 'The namespace name.  Each must be unique.', 'type': 'string'}, 'network-id': {'description': 'The network ID.  This can be the same as the namespace name.', 'type': 'string'}, 'gateways': {'description': 'Collection of gateway proxies that send traffic into the namespace.', 'type': 'object', 'required': ['instances', 'prefer-gateway', 'protocol'], 'properties': {'prefer-gateway': {'description': 'Whether services outside this namespace should prefer to send requests to the gateway proxy (true) or use direct access (false).  Some network topologies require inter-namespace access to go through a gateway.\n', 'type': 'boolean'}, 'instances': {'description': 'Collection of host/ports that proxy requests into the namespace.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}, 'protocol': {'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}}}, 'service-colors': {'description': 'List of all the service-colors.  Each running instance for a service-color must share the routing information.  If two instances have the same service-color information but different routing or weights, then the discovery map must distinguish the color between them.\n', 'type': 'array', 'items': {'description': 'A service-color description, which has 1 or more instances associated with it.', 'type': 'object', 'required': ['service', 'color', 'index', 'routes', 'instances', 'namespace-egress'], 'properties': {'service': {'description': 'Service name.', 'type': 'string'}, 'color': {'description': 'The service "color", which indicates different deployment characteristics of the service.\n', 'type': 'string'}, 'index': {'description': 'Some services must be split out into separate groups due to routes only serving select ports.  These are then split out by the index.\n', 'type': 'integer'}, 'protocol': {'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}, 'routes': {'description': 'Collection of URL routes that the service-color serves.', 'type': 'array', 'items': {'description': 'A service route.', 'type': 'object', 'required': ['path-match', 'weight', 'namespace-access', 'default-access'], 'properties': {'path-match': {'description': 'How the route path is matched.', 'type': 'object', 'required': ['match-type', 'value'], 'properties': {'match-type': {'oneOf': [{'description': 'the starting part of the URI path part.', 'const': 'prefix'}, {'description': 'the value is a matching regular expression.', 'const': 'regex'}, {'description': 'the value must match exactly.', 'const': 'exact'}]}, 'value': {'description': 'The URI path-part that handles the route.  This must be unique within the service-color.', 'type': 'string'}, 'case-sensitive': {'description': 'Is the path case sensitive?  Defaults to True', 'type': 'boolean'}}}, 'weight': {'description': 'Weight to give the handling of this route.  A higher number means more traffic is directed to it.', 'type': 'integer', 'minimum': 1, 'maximum': 32767}, 'headers': {'description': 'Optional list of request header fields that must also be fulfilled to pass network traffic to this route.\n', 'type': 'array', 'items': {'type': 'object', 'required': ['header-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': 'string'}, 'invert': {'description': 'If true, then the match is reversed.  Defaults to false.', 'type': 'boolean'}, 'case-sensitive': {'type': 'boolean'}}}}, 'query-parameters': {'description': 'query parameter filters', 'type': 'array', 'items': {'description': 'Filter for a query parameter which is part of the routing to this cluster.', 'type': 'object', 'required': ['parameter-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': ['string', 'null']}, 'case-sensitive': {'type': 'boolean'}}}}, 'default-access': {'description': 'Default access for any namespace not specified. Also, gateways only look at this to determine whether a route is generally public or not.\n', 'type': 'boolean'}, 'namespace-access': {'description': "Collection of each namespace's allowed access. If a namespace exists that is not given here, then the default-protection is used for that namespace.\n", 'type': 'array', 'items': {'description': 'A namespace access grant.  If a namespace is not listed, then the default-access is used instead.\n', 'type': 'object', 'required': ['namespace', 'access'], 'properties': {'namespace': {'description': 'The namespace protection to grant access.', 'type': 'string'}, 'access': {'description': 'Whether the given namespace is allowed access to this route.', 'type': 'boolean'}}}}}}}, 'instances': {'description': 'Collection of IP and listening ports for handlers of this service-color routes.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}, 'namespace-egress': {'description': 'The host and port that this service-color sends requests to access each namespace.', 'type': 'array', 'items': {'description': "A host and port that describes the URI this service-color sends requests to for access to a namespace's routes.  That namespace's protections will be applied.  This should be an interface on the local, sidecar proxy.  The host part of the interface is usually ignored.\n", 'type': 'object', 'required': ['namespace', 'interface'], 'properties': {'namespace': {'description': 'The namespace that this interface servces.', 'type': 'string'}, 'interface': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}}}}}}}}}}, 'definitions': {'host-port': {'oneOf': [{'description': 'An IPv4 and listening port.', 'type': 'object', 'required': ['ipv4', 'port'], 'properties': {'ipv4': {'description': 'IPv4 address.', 'type': 'string', 'format': 'ipv4'}, 'port': {'description': 'Listening port.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}}}, {'description': "An IPv6 and listening port for a handler of this service-color's routes.", 'type': 'object', 'required': ['ipv6', 'port'], 'properties': {'ipv6': {'description': 'IPv6 address for this service-color instance.', 'type': 'string', 'format': 'ipv6'}, 'port': {'description': 'Listening port that services the routes.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}}}, {'description': "A DNS resolvable hostname and listening port for a handler of this service-color's routes.", 'type': 'object', 'required': ['hostname', 'port'], 'properties': {'hostname': {'description': 'hostname address for this service-color instance.', 'type': 'string'}, 'port': {'description': 'Listening port that services the routes.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}}}]}, 'match-type': {'oneOf': [{'description': 'exact matching of the value.', 'const': 'exact'}, {'description': 'regular expression.', 'const': 'regex'}, {'description': 'parameter value starts with this.', 'const': 'prefix'}, {'description': 'parameter value ends with this.', 'const': 'suffix'}, {'description': 'parameter needs to just be present.  The "value" is ignored.', 'const': 'present'}]}}, '$id': 'file:/tmp/tmp93fil6rp/discovery-map-schema.yaml'}, rule='type')
+        raise JsonSchemaException("data must be object", value=data, name="data", definition=_DEFINITION_0, rule='type')
     data_is_dict = isinstance(data, dict)
     if data_is_dict:
         data_len = len(data)
-        if not all(prop in data for prop in ['schema-version', 'document-version', 'namespaces']):
-            raise JsonSchemaException("data must contain ['schema-version', 'document-version', 'namespaces'] properties", value=data, name="data", definition={'$schema': 'https://json-schema.org/draft-07/schema', 'description': 'Data output from the discovery-map extension point.  It describes the entire mesh.', 'type': 'object', 'required': ['schema-version', 'document-version', 'namespaces'], 'properties': {'schema-version': {'description': 'Version of this document\'s schema.  The value must be the string value "v1".', 'const': 'v1'}, 'document-version': {'description': 'An opaque value indicating the version of this document.', 'type': 'string'}, 'namespaces': {'description': 'Collection of all the namespaces and their services, colors, and routes.  This will be transformed by the entry point into the correct proxy configuration.\n', 'type': 'array', 'items': {'description': 'A single namespace and its configuration properties.', 'type': 'object', 'required': ['namespace', 'network-id', 'gateways', 'service-colors'], 'properties': {'namespace': {'description': 'The namespace name.  Each must be unique.', 'type': 'string'}, 'network-id': {'description': 'The network ID.  This can be the same as the namespace name.', 'type': 'string'}, 'gateways': {'description': 'Collection of gateway proxies that send traffic into the namespace.', 'type': 'object', 'required': ['instances', 'prefer-gateway', 'protocol'], 'properties': {'prefer-gateway': {'description': 'Whether services outside this namespace should prefer to send requests to the gateway proxy (true) or use direct access (false).  Some network topologies require inter-namespace access to go through a gateway.\n', 'type': 'boolean'}, 'instances': {'description': 'Collection of host/ports that proxy requests into the namespace.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}, 'protocol': {'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}}}, 'service-colors': {'description': 'List of all the service-colors.  Each running instance for a service-color must share the routing information.  If two instances have the same service-color information but different routing or weights, then the discovery map must distinguish the color between them.\n', 'type': 'array', 'items': {'description': 'A service-color description, which has 1 or more instances associated with it.', 'type': 'object', 'required': ['service', 'color', 'index', 'routes', 'instances', 'namespace-egress'], 'properties': {'service': {'description': 'Service name.', 'type': 'string'}, 'color': {'description': 'The service "color", which indicates different deployment characteristics of the service.\n', 'type': 'string'}, 'index': {'description': 'Some services must be split out into separate groups due to routes only serving select ports.  These are then split out by the index.\n', 'type': 'integer'}, 'protocol': {'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}, 'routes': {'description': 'Collection of URL routes that the service-color serves.', 'type': 'array', 'items': {'description': 'A service route.', 'type': 'object', 'required': ['path-match', 'weight', 'namespace-access', 'default-access'], 'properties': {'path-match': {'description': 'How the route path is matched.', 'type': 'object', 'required': ['match-type', 'value'], 'properties': {'match-type': {'oneOf': [{'description': 'the starting part of the URI path part.', 'const': 'prefix'}, {'description': 'the value is a matching regular expression.', 'const': 'regex'}, {'description': 'the value must match exactly.', 'const': 'exact'}]}, 'value': {'description': 'The URI path-part that handles the route.  This must be unique within the service-color.', 'type': 'string'}, 'case-sensitive': {'description': 'Is the path case sensitive?  Defaults to True', 'type': 'boolean'}}}, 'weight': {'description': 'Weight to give the handling of this route.  A higher number means more traffic is directed to it.', 'type': 'integer', 'minimum': 1, 'maximum': 32767}, 'headers': {'description': 'Optional list of request header fields that must also be fulfilled to pass network traffic to this route.\n', 'type': 'array', 'items': {'type': 'object', 'required': ['header-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': 'string'}, 'invert': {'description': 'If true, then the match is reversed.  Defaults to false.', 'type': 'boolean'}, 'case-sensitive': {'type': 'boolean'}}}}, 'query-parameters': {'description': 'query parameter filters', 'type': 'array', 'items': {'description': 'Filter for a query parameter which is part of the routing to this cluster.', 'type': 'object', 'required': ['parameter-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': ['string', 'null']}, 'case-sensitive': {'type': 'boolean'}}}}, 'default-access': {'description': 'Default access for any namespace not specified. Also, gateways only look at this to determine whether a route is generally public or not.\n', 'type': 'boolean'}, 'namespace-access': {'description': "Collection of each namespace's allowed access. If a namespace exists that is not given here, then the default-protection is used for that namespace.\n", 'type': 'array', 'items': {'description': 'A namespace access grant.  If a namespace is not listed, then the default-access is used instead.\n', 'type': 'object', 'required': ['namespace', 'access'], 'properties': {'namespace': {'description': 'The namespace protection to grant access.', 'type': 'string'}, 'access': {'description': 'Whether the given namespace is allowed access to this route.', 'type': 'boolean'}}}}}}}, 'instances': {'description': 'Collection of IP and listening ports for handlers of this service-color routes.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}, 'namespace-egress': {'description': 'The host and port that this service-color sends requests to access each namespace.', 'type': 'array', 'items': {'description': "A host and port that describes the URI this service-color sends requests to for access to a namespace's routes.  That namespace's protections will be applied.  This should be an interface on the local, sidecar proxy.  The host part of the interface is usually ignored.\n", 'type': 'object', 'required': ['namespace', 'interface'], 'properties': {'namespace': {'description': 'The namespace that this interface servces.', 'type': 'string'}, 'interface': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}}}}}}}}}}, 'definitions': {'host-port': {'oneOf': [{'description': 'An IPv4 and listening port.', 'type': 'object', 'required': ['ipv4', 'port'], 'properties': {'ipv4': {'description': 'IPv4 address.', 'type': 'string', 'format': 'ipv4'}, 'port': {'description': 'Listening port.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}}}, {'description': "An IPv6 and listening port for a handler of this service-color's routes.", 'type': 'object', 'required': ['ipv6', 'port'], 'properties': {'ipv6': {'description': 'IPv6 address for this service-color instance.', 'type': 'string', 'format': 'ipv6'}, 'port': {'description': 'Listening port that services the routes.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}}}, {'description': "A DNS resolvable hostname and listening port for a handler of this service-color's routes.", 'type': 'object', 'required': ['hostname', 'port'], 'properties': {'hostname': {'description': 'hostname address for this service-color instance.', 'type': 'string'}, 'port': {'description': 'Listening port that services the routes.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}}}]}, 'match-type': {'oneOf': [{'description': 'exact matching of the value.', 'const': 'exact'}, {'description': 'regular expression.', 'const': 'regex'}, {'description': 'parameter value starts with this.', 'const': 'prefix'}, {'description': 'parameter value ends with this.', 'const': 'suffix'}, {'description': 'parameter needs to just be present.  The "value" is ignored.', 'const': 'present'}]}}, '$id': 'file:/tmp/tmp93fil6rp/discovery-map-schema.yaml'}, rule='required')
+        if not data.keys() >= {'schema-version', 'document-version', 'namespaces'}:
+            raise JsonSchemaException("data must contain ['schema-version', 'document-version', 'namespaces'] properties", value=data, name="data", definition=_DEFINITION_0, rule='required')
         data_keys = set(data.keys())
         if "schema-version" in data_keys:
             data_keys.remove("schema-version")
             data__schemaversion = data["schema-version"]
             if data__schemaversion != "v1":
-                raise JsonSchemaException("data.schema-version must be same as const definition", value=data__schemaversion, name="data.schema-version", definition={'description': 'Version of this document\'s schema.  The value must be the string value "v1".', 'const': 'v1'}, rule='const')
+                raise JsonSchemaException("data.schema-version must be same as const definition", value=data__schemaversion, name="data.schema-version", definition=_DEFINITION_3, rule='const')
         if "document-version" in data_keys:
             data_keys.remove("document-version")
             data__documentversion = data["document-version"]
             if not isinstance(data__documentversion, (str)):
-                raise JsonSchemaException("data.document-version must be string", value=data__documentversion, name="data.document-version", definition={'description': 'An opaque value indicating the version of this document.', 'type': 'string'}, rule='type')
+                raise JsonSchemaException("data.document-version must be string", value=data__documentversion, name="data.document-version", definition=_DEFINITION_4, rule='type')
         if "namespaces" in data_keys:
             data_keys.remove("namespaces")
             data__namespaces = data["namespaces"]
             if not isinstance(data__namespaces, (list, tuple)):
-                raise JsonSchemaException("data.namespaces must be array", value=data__namespaces, name="data.namespaces", definition={'description': 'Collection of all the namespaces and their services, colors, and routes.  This will be transformed by the entry point into the correct proxy configuration.\n', 'type': 'array', 'items': {'description': 'A single namespace and its configuration properties.', 'type': 'object', 'required': ['namespace', 'network-id', 'gateways', 'service-colors'], 'properties': {'namespace': {'description': 'The namespace name.  Each must be unique.', 'type': 'string'}, 'network-id': {'description': 'The network ID.  This can be the same as the namespace name.', 'type': 'string'}, 'gateways': {'description': 'Collection of gateway proxies that send traffic into the namespace.', 'type': 'object', 'required': ['instances', 'prefer-gateway', 'protocol'], 'properties': {'prefer-gateway': {'description': 'Whether services outside this namespace should prefer to send requests to the gateway proxy (true) or use direct access (false).  Some network topologies require inter-namespace access to go through a gateway.\n', 'type': 'boolean'}, 'instances': {'description': 'Collection of host/ports that proxy requests into the namespace.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}, 'protocol': {'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}}}, 'service-colors': {'description': 'List of all the service-colors.  Each running instance for a service-color must share the routing information.  If two instances have the same service-color information but different routing or weights, then the discovery map must distinguish the color between them.\n', 'type': 'array', 'items': {'description': 'A service-color description, which has 1 or more instances associated with it.', 'type': 'object', 'required': ['service', 'color', 'index', 'routes', 'instances', 'namespace-egress'], 'properties': {'service': {'description': 'Service name.', 'type': 'string'}, 'color': {'description': 'The service "color", which indicates different deployment characteristics of the service.\n', 'type': 'string'}, 'index': {'description': 'Some services must be split out into separate groups due to routes only serving select ports.  These are then split out by the index.\n', 'type': 'integer'}, 'protocol': {'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}, 'routes': {'description': 'Collection of URL routes that the service-color serves.', 'type': 'array', 'items': {'description': 'A service route.', 'type': 'object', 'required': ['path-match', 'weight', 'namespace-access', 'default-access'], 'properties': {'path-match': {'description': 'How the route path is matched.', 'type': 'object', 'required': ['match-type', 'value'], 'properties': {'match-type': {'oneOf': [{'description': 'the starting part of the URI path part.', 'const': 'prefix'}, {'description': 'the value is a matching regular expression.', 'const': 'regex'}, {'description': 'the value must match exactly.', 'const': 'exact'}]}, 'value': {'description': 'The URI path-part that handles the route.  This must be unique within the service-color.', 'type': 'string'}, 'case-sensitive': {'description': 'Is the path case sensitive?  Defaults to True', 'type': 'boolean'}}}, 'weight': {'description': 'Weight to give the handling of this route.  A higher number means more traffic is directed to it.', 'type': 'integer', 'minimum': 1, 'maximum': 32767}, 'headers': {'description': 'Optional list of request header fields that must also be fulfilled to pass network traffic to this route.\n', 'type': 'array', 'items': {'type': 'object', 'required': ['header-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': 'string'}, 'invert': {'description': 'If true, then the match is reversed.  Defaults to false.', 'type': 'boolean'}, 'case-sensitive': {'type': 'boolean'}}}}, 'query-parameters': {'description': 'query parameter filters', 'type': 'array', 'items': {'description': 'Filter for a query parameter which is part of the routing to this cluster.', 'type': 'object', 'required': ['parameter-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': ['string', 'null']}, 'case-sensitive': {'type': 'boolean'}}}}, 'default-access': {'description': 'Default access for any namespace not specified. Also, gateways only look at this to determine whether a route is generally public or not.\n', 'type': 'boolean'}, 'namespace-access': {'description': "Collection of each namespace's allowed access. If a namespace exists that is not given here, then the default-protection is used for that namespace.\n", 'type': 'array', 'items': {'description': 'A namespace access grant.  If a namespace is not listed, then the default-access is used instead.\n', 'type': 'object', 'required': ['namespace', 'access'], 'properties': {'namespace': {'description': 'The namespace protection to grant access.', 'type': 'string'}, 'access': {'description': 'Whether the given namespace is allowed access to this route.', 'type': 'boolean'}}}}}}}, 'instances': {'description': 'Collection of IP and listening ports for handlers of this service-color routes.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}, 'namespace-egress': {'description': 'The host and port that this service-color sends requests to access each namespace.', 'type': 'array', 'items': {'description': "A host and port that describes the URI this service-color sends requests to for access to a namespace's routes.  That namespace's protections will be applied.  This should be an interface on the local, sidecar proxy.  The host part of the interface is usually ignored.\n", 'type': 'object', 'required': ['namespace', 'interface'], 'properties': {'namespace': {'description': 'The namespace that this interface servces.', 'type': 'string'}, 'interface': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}}}}}}}}}, rule='type')
+                raise JsonSchemaException("data.namespaces must be array", value=data__namespaces, name="data.namespaces", definition=_DEFINITION_5, rule='type')
             data__namespaces_is_list = isinstance(data__namespaces, (list, tuple))
             if data__namespaces_is_list:
                 data__namespaces_len = len(data__namespaces)
                 for data__namespaces_x, data__namespaces_item in enumerate(data__namespaces):
                     if not isinstance(data__namespaces_item, (dict)):
-                        raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}]".format(**locals())+" must be object", value=data__namespaces_item, name=""+"data.namespaces[{data__namespaces_x}]".format(**locals())+"", definition={'description': 'A single namespace and its configuration properties.', 'type': 'object', 'required': ['namespace', 'network-id', 'gateways', 'service-colors'], 'properties': {'namespace': {'description': 'The namespace name.  Each must be unique.', 'type': 'string'}, 'network-id': {'description': 'The network ID.  This can be the same as the namespace name.', 'type': 'string'}, 'gateways': {'description': 'Collection of gateway proxies that send traffic into the namespace.', 'type': 'object', 'required': ['instances', 'prefer-gateway', 'protocol'], 'properties': {'prefer-gateway': {'description': 'Whether services outside this namespace should prefer to send requests to the gateway proxy (true) or use direct access (false).  Some network topologies require inter-namespace access to go through a gateway.\n', 'type': 'boolean'}, 'instances': {'description': 'Collection of host/ports that proxy requests into the namespace.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}, 'protocol': {'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}}}, 'service-colors': {'description': 'List of all the service-colors.  Each running instance for a service-color must share the routing information.  If two instances have the same service-color information but different routing or weights, then the discovery map must distinguish the color between them.\n', 'type': 'array', 'items': {'description': 'A service-color description, which has 1 or more instances associated with it.', 'type': 'object', 'required': ['service', 'color', 'index', 'routes', 'instances', 'namespace-egress'], 'properties': {'service': {'description': 'Service name.', 'type': 'string'}, 'color': {'description': 'The service "color", which indicates different deployment characteristics of the service.\n', 'type': 'string'}, 'index': {'description': 'Some services must be split out into separate groups due to routes only serving select ports.  These are then split out by the index.\n', 'type': 'integer'}, 'protocol': {'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}, 'routes': {'description': 'Collection of URL routes that the service-color serves.', 'type': 'array', 'items': {'description': 'A service route.', 'type': 'object', 'required': ['path-match', 'weight', 'namespace-access', 'default-access'], 'properties': {'path-match': {'description': 'How the route path is matched.', 'type': 'object', 'required': ['match-type', 'value'], 'properties': {'match-type': {'oneOf': [{'description': 'the starting part of the URI path part.', 'const': 'prefix'}, {'description': 'the value is a matching regular expression.', 'const': 'regex'}, {'description': 'the value must match exactly.', 'const': 'exact'}]}, 'value': {'description': 'The URI path-part that handles the route.  This must be unique within the service-color.', 'type': 'string'}, 'case-sensitive': {'description': 'Is the path case sensitive?  Defaults to True', 'type': 'boolean'}}}, 'weight': {'description': 'Weight to give the handling of this route.  A higher number means more traffic is directed to it.', 'type': 'integer', 'minimum': 1, 'maximum': 32767}, 'headers': {'description': 'Optional list of request header fields that must also be fulfilled to pass network traffic to this route.\n', 'type': 'array', 'items': {'type': 'object', 'required': ['header-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': 'string'}, 'invert': {'description': 'If true, then the match is reversed.  Defaults to false.', 'type': 'boolean'}, 'case-sensitive': {'type': 'boolean'}}}}, 'query-parameters': {'description': 'query parameter filters', 'type': 'array', 'items': {'description': 'Filter for a query parameter which is part of the routing to this cluster.', 'type': 'object', 'required': ['parameter-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': ['string', 'null']}, 'case-sensitive': {'type': 'boolean'}}}}, 'default-access': {'description': 'Default access for any namespace not specified. Also, gateways only look at this to determine whether a route is generally public or not.\n', 'type': 'boolean'}, 'namespace-access': {'description': "Collection of each namespace's allowed access. If a namespace exists that is not given here, then the default-protection is used for that namespace.\n", 'type': 'array', 'items': {'description': 'A namespace access grant.  If a namespace is not listed, then the default-access is used instead.\n', 'type': 'object', 'required': ['namespace', 'access'], 'properties': {'namespace': {'description': 'The namespace protection to grant access.', 'type': 'string'}, 'access': {'description': 'Whether the given namespace is allowed access to this route.', 'type': 'boolean'}}}}}}}, 'instances': {'description': 'Collection of IP and listening ports for handlers of this service-color routes.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}, 'namespace-egress': {'description': 'The host and port that this service-color sends requests to access each namespace.', 'type': 'array', 'items': {'description': "A host and port that describes the URI this service-color sends requests to for access to a namespace's routes.  That namespace's protections will be applied.  This should be an interface on the local, sidecar proxy.  The host part of the interface is usually ignored.\n", 'type': 'object', 'required': ['namespace', 'interface'], 'properties': {'namespace': {'description': 'The namespace that this interface servces.', 'type': 'string'}, 'interface': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}}}}}}}}, rule='type')
+                        raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}]'+" must be object", value=data__namespaces_item, name=""+f'data.namespaces[{data__namespaces_x}]'+"", definition=_DEFINITION_14, rule='type')
                     data__namespaces_item_is_dict = isinstance(data__namespaces_item, dict)
                     if data__namespaces_item_is_dict:
                         data__namespaces_item_len = len(data__namespaces_item)
-                        if not all(prop in data__namespaces_item for prop in ['namespace', 'network-id', 'gateways', 'service-colors']):
-                            raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}]".format(**locals())+" must contain ['namespace', 'network-id', 'gateways', 'service-colors'] properties", value=data__namespaces_item, name=""+"data.namespaces[{data__namespaces_x}]".format(**locals())+"", definition={'description': 'A single namespace and its configuration properties.', 'type': 'object', 'required': ['namespace', 'network-id', 'gateways', 'service-colors'], 'properties': {'namespace': {'description': 'The namespace name.  Each must be unique.', 'type': 'string'}, 'network-id': {'description': 'The network ID.  This can be the same as the namespace name.', 'type': 'string'}, 'gateways': {'description': 'Collection of gateway proxies that send traffic into the namespace.', 'type': 'object', 'required': ['instances', 'prefer-gateway', 'protocol'], 'properties': {'prefer-gateway': {'description': 'Whether services outside this namespace should prefer to send requests to the gateway proxy (true) or use direct access (false).  Some network topologies require inter-namespace access to go through a gateway.\n', 'type': 'boolean'}, 'instances': {'description': 'Collection of host/ports that proxy requests into the namespace.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}, 'protocol': {'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}}}, 'service-colors': {'description': 'List of all the service-colors.  Each running instance for a service-color must share the routing information.  If two instances have the same service-color information but different routing or weights, then the discovery map must distinguish the color between them.\n', 'type': 'array', 'items': {'description': 'A service-color description, which has 1 or more instances associated with it.', 'type': 'object', 'required': ['service', 'color', 'index', 'routes', 'instances', 'namespace-egress'], 'properties': {'service': {'description': 'Service name.', 'type': 'string'}, 'color': {'description': 'The service "color", which indicates different deployment characteristics of the service.\n', 'type': 'string'}, 'index': {'description': 'Some services must be split out into separate groups due to routes only serving select ports.  These are then split out by the index.\n', 'type': 'integer'}, 'protocol': {'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}, 'routes': {'description': 'Collection of URL routes that the service-color serves.', 'type': 'array', 'items': {'description': 'A service route.', 'type': 'object', 'required': ['path-match', 'weight', 'namespace-access', 'default-access'], 'properties': {'path-match': {'description': 'How the route path is matched.', 'type': 'object', 'required': ['match-type', 'value'], 'properties': {'match-type': {'oneOf': [{'description': 'the starting part of the URI path part.', 'const': 'prefix'}, {'description': 'the value is a matching regular expression.', 'const': 'regex'}, {'description': 'the value must match exactly.', 'const': 'exact'}]}, 'value': {'description': 'The URI path-part that handles the route.  This must be unique within the service-color.', 'type': 'string'}, 'case-sensitive': {'description': 'Is the path case sensitive?  Defaults to True', 'type': 'boolean'}}}, 'weight': {'description': 'Weight to give the handling of this route.  A higher number means more traffic is directed to it.', 'type': 'integer', 'minimum': 1, 'maximum': 32767}, 'headers': {'description': 'Optional list of request header fields that must also be fulfilled to pass network traffic to this route.\n', 'type': 'array', 'items': {'type': 'object', 'required': ['header-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': 'string'}, 'invert': {'description': 'If true, then the match is reversed.  Defaults to false.', 'type': 'boolean'}, 'case-sensitive': {'type': 'boolean'}}}}, 'query-parameters': {'description': 'query parameter filters', 'type': 'array', 'items': {'description': 'Filter for a query parameter which is part of the routing to this cluster.', 'type': 'object', 'required': ['parameter-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': ['string', 'null']}, 'case-sensitive': {'type': 'boolean'}}}}, 'default-access': {'description': 'Default access for any namespace not specified. Also, gateways only look at this to determine whether a route is generally public or not.\n', 'type': 'boolean'}, 'namespace-access': {'description': "Collection of each namespace's allowed access. If a namespace exists that is not given here, then the default-protection is used for that namespace.\n", 'type': 'array', 'items': {'description': 'A namespace access grant.  If a namespace is not listed, then the default-access is used instead.\n', 'type': 'object', 'required': ['namespace', 'access'], 'properties': {'namespace': {'description': 'The namespace protection to grant access.', 'type': 'string'}, 'access': {'description': 'Whether the given namespace is allowed access to this route.', 'type': 'boolean'}}}}}}}, 'instances': {'description': 'Collection of IP and listening ports for handlers of this service-color routes.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}, 'namespace-egress': {'description': 'The host and port that this service-color sends requests to access each namespace.', 'type': 'array', 'items': {'description': "A host and port that describes the URI this service-color sends requests to for access to a namespace's routes.  That namespace's protections will be applied.  This should be an interface on the local, sidecar proxy.  The host part of the interface is usually ignored.\n", 'type': 'object', 'required': ['namespace', 'interface'], 'properties': {'namespace': {'description': 'The namespace that this interface servces.', 'type': 'string'}, 'interface': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}}}}}}}}, rule='required')
+                        if not data__namespaces_item.keys() >= {'namespace', 'network-id', 'gateways', 'service-colors'}:
+                            raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}]'+" must contain ['namespace', 'network-id', 'gateways', 'service-colors'] properties", value=data__namespaces_item, name=""+f'data.namespaces[{data__namespaces_x}]'+"", definition=_DEFINITION_14, rule='required')
                         data__namespaces_item_keys = set(data__namespaces_item.keys())
                         if "namespace" in data__namespaces_item_keys:
                             data__namespaces_item_keys.remove("namespace")
                             data__namespaces_item__namespace = data__namespaces_item["namespace"]
                             if not isinstance(data__namespaces_item__namespace, (str)):
-                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].namespace".format(**locals())+" must be string", value=data__namespaces_item__namespace, name=""+"data.namespaces[{data__namespaces_x}].namespace".format(**locals())+"", definition={'description': 'The namespace name.  Each must be unique.', 'type': 'string'}, rule='type')
+                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].namespace'+" must be string", value=data__namespaces_item__namespace, name=""+f'data.namespaces[{data__namespaces_x}].namespace'+"", definition=_DEFINITION_20, rule='type')
                         if "network-id" in data__namespaces_item_keys:
                             data__namespaces_item_keys.remove("network-id")
                             data__namespaces_item__networkid = data__namespaces_item["network-id"]
                             if not isinstance(data__namespaces_item__networkid, (str)):
-                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].network-id".format(**locals())+" must be string", value=data__namespaces_item__networkid, name=""+"data.namespaces[{data__namespaces_x}].network-id".format(**locals())+"", definition={'description': 'The network ID.  This can be the same as the namespace name.', 'type': 'string'}, rule='type')
+                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].network-id'+" must be string", value=data__namespaces_item__networkid, name=""+f'data.namespaces[{data__namespaces_x}].network-id'+"", definition=_DEFINITION_21, rule='type')
                         if "gateways" in data__namespaces_item_keys:
                             data__namespaces_item_keys.remove("gateways")
                             data__namespaces_item__gateways = data__namespaces_item["gateways"]
                             if not isinstance(data__namespaces_item__gateways, (dict)):
-                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].gateways".format(**locals())+" must be object", value=data__namespaces_item__gateways, name=""+"data.namespaces[{data__namespaces_x}].gateways".format(**locals())+"", definition={'description': 'Collection of gateway proxies that send traffic into the namespace.', 'type': 'object', 'required': ['instances', 'prefer-gateway', 'protocol'], 'properties': {'prefer-gateway': {'description': 'Whether services outside this namespace should prefer to send requests to the gateway proxy (true) or use direct access (false).  Some network topologies require inter-namespace access to go through a gateway.\n', 'type': 'boolean'}, 'instances': {'description': 'Collection of host/ports that proxy requests into the namespace.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}, 'protocol': {'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}}}, rule='type')
+                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].gateways'+" must be object", value=data__namespaces_item__gateways, name=""+f'data.namespaces[{data__namespaces_x}].gateways'+"", definition=_DEFINITION_22, rule='type')
                             data__namespaces_item__gateways_is_dict = isinstance(data__namespaces_item__gateways, dict)
                             if data__namespaces_item__gateways_is_dict:
                                 data__namespaces_item__gateways_len = len(data__namespaces_item__gateways)
-                                if not all(prop in data__namespaces_item__gateways for prop in ['instances', 'prefer-gateway', 'protocol']):
-                                    raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].gateways".format(**locals())+" must contain ['instances', 'prefer-gateway', 'protocol'] properties", value=data__namespaces_item__gateways, name=""+"data.namespaces[{data__namespaces_x}].gateways".format(**locals())+"", definition={'description': 'Collection of gateway proxies that send traffic into the namespace.', 'type': 'object', 'required': ['instances', 'prefer-gateway', 'protocol'], 'properties': {'prefer-gateway': {'description': 'Whether services outside this namespace should prefer to send requests to the gateway proxy (true) or use direct access (false).  Some network topologies require inter-namespace access to go through a gateway.\n', 'type': 'boolean'}, 'instances': {'description': 'Collection of host/ports that proxy requests into the namespace.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}, 'protocol': {'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}}}, rule='required')
+                                if not data__namespaces_item__gateways.keys() >= {'instances', 'prefer-gateway', 'protocol'}:
+                                    raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].gateways'+" must contain ['instances', 'prefer-gateway', 'protocol'] properties", value=data__namespaces_item__gateways, name=""+f'data.namespaces[{data__namespaces_x}].gateways'+"", definition=_DEFINITION_22, rule='required')
                                 data__namespaces_item__gateways_keys = set(data__namespaces_item__gateways.keys())
                                 if "prefer-gateway" in data__namespaces_item__gateways_keys:
                                     data__namespaces_item__gateways_keys.remove("prefer-gateway")
                                     data__namespaces_item__gateways__prefergateway = data__namespaces_item__gateways["prefer-gateway"]
                                     if not isinstance(data__namespaces_item__gateways__prefergateway, (bool)):
-                                        raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].gateways.prefer-gateway".format(**locals())+" must be boolean", value=data__namespaces_item__gateways__prefergateway, name=""+"data.namespaces[{data__namespaces_x}].gateways.prefer-gateway".format(**locals())+"", definition={'description': 'Whether services outside this namespace should prefer to send requests to the gateway proxy (true) or use direct access (false).  Some network topologies require inter-namespace access to go through a gateway.\n', 'type': 'boolean'}, rule='type')
+                                        raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].gateways.prefer-gateway'+" must be boolean", value=data__namespaces_item__gateways__prefergateway, name=""+f'data.namespaces[{data__namespaces_x}].gateways.prefer-gateway'+"", definition=_DEFINITION_24, rule='type')
                                 if "instances" in data__namespaces_item__gateways_keys:
                                     data__namespaces_item__gateways_keys.remove("instances")
                                     data__namespaces_item__gateways__instances = data__namespaces_item__gateways["instances"]
                                     if not isinstance(data__namespaces_item__gateways__instances, (list, tuple)):
-                                        raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].gateways.instances".format(**locals())+" must be array", value=data__namespaces_item__gateways__instances, name=""+"data.namespaces[{data__namespaces_x}].gateways.instances".format(**locals())+"", definition={'description': 'Collection of host/ports that proxy requests into the namespace.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}, rule='type')
+                                        raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].gateways.instances'+" must be array", value=data__namespaces_item__gateways__instances, name=""+f'data.namespaces[{data__namespaces_x}].gateways.instances'+"", definition=_DEFINITION_25, rule='type')
                                     data__namespaces_item__gateways__instances_is_list = isinstance(data__namespaces_item__gateways__instances, (list, tuple))
                                     if data__namespaces_item__gateways__instances_is_list:
                                         data__namespaces_item__gateways__instances_len = len(data__namespaces_item__gateways__instances)
@@ -93,71 +155,71 @@ def validate_discovery_map_schema_yaml(data: Dict[str, Any]) -> Dict[str, Any]:
                                     data__namespaces_item__gateways_keys.remove("protocol")
                                     data__namespaces_item__gateways__protocol = data__namespaces_item__gateways["protocol"]
                                     if not isinstance(data__namespaces_item__gateways__protocol, (str)):
-                                        raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].gateways.protocol".format(**locals())+" must be string", value=data__namespaces_item__gateways__protocol, name=""+"data.namespaces[{data__namespaces_x}].gateways.protocol".format(**locals())+"", definition={'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}, rule='type')
+                                        raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].gateways.protocol'+" must be string", value=data__namespaces_item__gateways__protocol, name=""+f'data.namespaces[{data__namespaces_x}].gateways.protocol'+"", definition=_DEFINITION_26, rule='type')
                         if "service-colors" in data__namespaces_item_keys:
                             data__namespaces_item_keys.remove("service-colors")
                             data__namespaces_item__servicecolors = data__namespaces_item["service-colors"]
                             if not isinstance(data__namespaces_item__servicecolors, (list, tuple)):
-                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors".format(**locals())+" must be array", value=data__namespaces_item__servicecolors, name=""+"data.namespaces[{data__namespaces_x}].service-colors".format(**locals())+"", definition={'description': 'List of all the service-colors.  Each running instance for a service-color must share the routing information.  If two instances have the same service-color information but different routing or weights, then the discovery map must distinguish the color between them.\n', 'type': 'array', 'items': {'description': 'A service-color description, which has 1 or more instances associated with it.', 'type': 'object', 'required': ['service', 'color', 'index', 'routes', 'instances', 'namespace-egress'], 'properties': {'service': {'description': 'Service name.', 'type': 'string'}, 'color': {'description': 'The service "color", which indicates different deployment characteristics of the service.\n', 'type': 'string'}, 'index': {'description': 'Some services must be split out into separate groups due to routes only serving select ports.  These are then split out by the index.\n', 'type': 'integer'}, 'protocol': {'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}, 'routes': {'description': 'Collection of URL routes that the service-color serves.', 'type': 'array', 'items': {'description': 'A service route.', 'type': 'object', 'required': ['path-match', 'weight', 'namespace-access', 'default-access'], 'properties': {'path-match': {'description': 'How the route path is matched.', 'type': 'object', 'required': ['match-type', 'value'], 'properties': {'match-type': {'oneOf': [{'description': 'the starting part of the URI path part.', 'const': 'prefix'}, {'description': 'the value is a matching regular expression.', 'const': 'regex'}, {'description': 'the value must match exactly.', 'const': 'exact'}]}, 'value': {'description': 'The URI path-part that handles the route.  This must be unique within the service-color.', 'type': 'string'}, 'case-sensitive': {'description': 'Is the path case sensitive?  Defaults to True', 'type': 'boolean'}}}, 'weight': {'description': 'Weight to give the handling of this route.  A higher number means more traffic is directed to it.', 'type': 'integer', 'minimum': 1, 'maximum': 32767}, 'headers': {'description': 'Optional list of request header fields that must also be fulfilled to pass network traffic to this route.\n', 'type': 'array', 'items': {'type': 'object', 'required': ['header-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': 'string'}, 'invert': {'description': 'If true, then the match is reversed.  Defaults to false.', 'type': 'boolean'}, 'case-sensitive': {'type': 'boolean'}}}}, 'query-parameters': {'description': 'query parameter filters', 'type': 'array', 'items': {'description': 'Filter for a query parameter which is part of the routing to this cluster.', 'type': 'object', 'required': ['parameter-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': ['string', 'null']}, 'case-sensitive': {'type': 'boolean'}}}}, 'default-access': {'description': 'Default access for any namespace not specified. Also, gateways only look at this to determine whether a route is generally public or not.\n', 'type': 'boolean'}, 'namespace-access': {'description': "Collection of each namespace's allowed access. If a namespace exists that is not given here, then the default-protection is used for that namespace.\n", 'type': 'array', 'items': {'description': 'A namespace access grant.  If a namespace is not listed, then the default-access is used instead.\n', 'type': 'object', 'required': ['namespace', 'access'], 'properties': {'namespace': {'description': 'The namespace protection to grant access.', 'type': 'string'}, 'access': {'description': 'Whether the given namespace is allowed access to this route.', 'type': 'boolean'}}}}}}}, 'instances': {'description': 'Collection of IP and listening ports for handlers of this service-color routes.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}, 'namespace-egress': {'description': 'The host and port that this service-color sends requests to access each namespace.', 'type': 'array', 'items': {'description': "A host and port that describes the URI this service-color sends requests to for access to a namespace's routes.  That namespace's protections will be applied.  This should be an interface on the local, sidecar proxy.  The host part of the interface is usually ignored.\n", 'type': 'object', 'required': ['namespace', 'interface'], 'properties': {'namespace': {'description': 'The namespace that this interface servces.', 'type': 'string'}, 'interface': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}}}}}}, rule='type')
+                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors'+" must be array", value=data__namespaces_item__servicecolors, name=""+f'data.namespaces[{data__namespaces_x}].service-colors'+"", definition=_DEFINITION_23, rule='type')
                             data__namespaces_item__servicecolors_is_list = isinstance(data__namespaces_item__servicecolors, (list, tuple))
                             if data__namespaces_item__servicecolors_is_list:
                                 data__namespaces_item__servicecolors_len = len(data__namespaces_item__servicecolors)
                                 for data__namespaces_item__servicecolors_x, data__namespaces_item__servicecolors_item in enumerate(data__namespaces_item__servicecolors):
                                     if not isinstance(data__namespaces_item__servicecolors_item, (dict)):
-                                        raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}]".format(**locals())+" must be object", value=data__namespaces_item__servicecolors_item, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}]".format(**locals())+"", definition={'description': 'A service-color description, which has 1 or more instances associated with it.', 'type': 'object', 'required': ['service', 'color', 'index', 'routes', 'instances', 'namespace-egress'], 'properties': {'service': {'description': 'Service name.', 'type': 'string'}, 'color': {'description': 'The service "color", which indicates different deployment characteristics of the service.\n', 'type': 'string'}, 'index': {'description': 'Some services must be split out into separate groups due to routes only serving select ports.  These are then split out by the index.\n', 'type': 'integer'}, 'protocol': {'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}, 'routes': {'description': 'Collection of URL routes that the service-color serves.', 'type': 'array', 'items': {'description': 'A service route.', 'type': 'object', 'required': ['path-match', 'weight', 'namespace-access', 'default-access'], 'properties': {'path-match': {'description': 'How the route path is matched.', 'type': 'object', 'required': ['match-type', 'value'], 'properties': {'match-type': {'oneOf': [{'description': 'the starting part of the URI path part.', 'const': 'prefix'}, {'description': 'the value is a matching regular expression.', 'const': 'regex'}, {'description': 'the value must match exactly.', 'const': 'exact'}]}, 'value': {'description': 'The URI path-part that handles the route.  This must be unique within the service-color.', 'type': 'string'}, 'case-sensitive': {'description': 'Is the path case sensitive?  Defaults to True', 'type': 'boolean'}}}, 'weight': {'description': 'Weight to give the handling of this route.  A higher number means more traffic is directed to it.', 'type': 'integer', 'minimum': 1, 'maximum': 32767}, 'headers': {'description': 'Optional list of request header fields that must also be fulfilled to pass network traffic to this route.\n', 'type': 'array', 'items': {'type': 'object', 'required': ['header-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': 'string'}, 'invert': {'description': 'If true, then the match is reversed.  Defaults to false.', 'type': 'boolean'}, 'case-sensitive': {'type': 'boolean'}}}}, 'query-parameters': {'description': 'query parameter filters', 'type': 'array', 'items': {'description': 'Filter for a query parameter which is part of the routing to this cluster.', 'type': 'object', 'required': ['parameter-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': ['string', 'null']}, 'case-sensitive': {'type': 'boolean'}}}}, 'default-access': {'description': 'Default access for any namespace not specified. Also, gateways only look at this to determine whether a route is generally public or not.\n', 'type': 'boolean'}, 'namespace-access': {'description': "Collection of each namespace's allowed access. If a namespace exists that is not given here, then the default-protection is used for that namespace.\n", 'type': 'array', 'items': {'description': 'A namespace access grant.  If a namespace is not listed, then the default-access is used instead.\n', 'type': 'object', 'required': ['namespace', 'access'], 'properties': {'namespace': {'description': 'The namespace protection to grant access.', 'type': 'string'}, 'access': {'description': 'Whether the given namespace is allowed access to this route.', 'type': 'boolean'}}}}}}}, 'instances': {'description': 'Collection of IP and listening ports for handlers of this service-color routes.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}, 'namespace-egress': {'description': 'The host and port that this service-color sends requests to access each namespace.', 'type': 'array', 'items': {'description': "A host and port that describes the URI this service-color sends requests to for access to a namespace's routes.  That namespace's protections will be applied.  This should be an interface on the local, sidecar proxy.  The host part of the interface is usually ignored.\n", 'type': 'object', 'required': ['namespace', 'interface'], 'properties': {'namespace': {'description': 'The namespace that this interface servces.', 'type': 'string'}, 'interface': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}}}}}, rule='type')
+                                        raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}]'+" must be object", value=data__namespaces_item__servicecolors_item, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}]'+"", definition=_DEFINITION_27, rule='type')
                                     data__namespaces_item__servicecolors_item_is_dict = isinstance(data__namespaces_item__servicecolors_item, dict)
                                     if data__namespaces_item__servicecolors_item_is_dict:
                                         data__namespaces_item__servicecolors_item_len = len(data__namespaces_item__servicecolors_item)
-                                        if not all(prop in data__namespaces_item__servicecolors_item for prop in ['service', 'color', 'index', 'routes', 'instances', 'namespace-egress']):
-                                            raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}]".format(**locals())+" must contain ['service', 'color', 'index', 'routes', 'instances', 'namespace-egress'] properties", value=data__namespaces_item__servicecolors_item, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}]".format(**locals())+"", definition={'description': 'A service-color description, which has 1 or more instances associated with it.', 'type': 'object', 'required': ['service', 'color', 'index', 'routes', 'instances', 'namespace-egress'], 'properties': {'service': {'description': 'Service name.', 'type': 'string'}, 'color': {'description': 'The service "color", which indicates different deployment characteristics of the service.\n', 'type': 'string'}, 'index': {'description': 'Some services must be split out into separate groups due to routes only serving select ports.  These are then split out by the index.\n', 'type': 'integer'}, 'protocol': {'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}, 'routes': {'description': 'Collection of URL routes that the service-color serves.', 'type': 'array', 'items': {'description': 'A service route.', 'type': 'object', 'required': ['path-match', 'weight', 'namespace-access', 'default-access'], 'properties': {'path-match': {'description': 'How the route path is matched.', 'type': 'object', 'required': ['match-type', 'value'], 'properties': {'match-type': {'oneOf': [{'description': 'the starting part of the URI path part.', 'const': 'prefix'}, {'description': 'the value is a matching regular expression.', 'const': 'regex'}, {'description': 'the value must match exactly.', 'const': 'exact'}]}, 'value': {'description': 'The URI path-part that handles the route.  This must be unique within the service-color.', 'type': 'string'}, 'case-sensitive': {'description': 'Is the path case sensitive?  Defaults to True', 'type': 'boolean'}}}, 'weight': {'description': 'Weight to give the handling of this route.  A higher number means more traffic is directed to it.', 'type': 'integer', 'minimum': 1, 'maximum': 32767}, 'headers': {'description': 'Optional list of request header fields that must also be fulfilled to pass network traffic to this route.\n', 'type': 'array', 'items': {'type': 'object', 'required': ['header-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': 'string'}, 'invert': {'description': 'If true, then the match is reversed.  Defaults to false.', 'type': 'boolean'}, 'case-sensitive': {'type': 'boolean'}}}}, 'query-parameters': {'description': 'query parameter filters', 'type': 'array', 'items': {'description': 'Filter for a query parameter which is part of the routing to this cluster.', 'type': 'object', 'required': ['parameter-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': ['string', 'null']}, 'case-sensitive': {'type': 'boolean'}}}}, 'default-access': {'description': 'Default access for any namespace not specified. Also, gateways only look at this to determine whether a route is generally public or not.\n', 'type': 'boolean'}, 'namespace-access': {'description': "Collection of each namespace's allowed access. If a namespace exists that is not given here, then the default-protection is used for that namespace.\n", 'type': 'array', 'items': {'description': 'A namespace access grant.  If a namespace is not listed, then the default-access is used instead.\n', 'type': 'object', 'required': ['namespace', 'access'], 'properties': {'namespace': {'description': 'The namespace protection to grant access.', 'type': 'string'}, 'access': {'description': 'Whether the given namespace is allowed access to this route.', 'type': 'boolean'}}}}}}}, 'instances': {'description': 'Collection of IP and listening ports for handlers of this service-color routes.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}, 'namespace-egress': {'description': 'The host and port that this service-color sends requests to access each namespace.', 'type': 'array', 'items': {'description': "A host and port that describes the URI this service-color sends requests to for access to a namespace's routes.  That namespace's protections will be applied.  This should be an interface on the local, sidecar proxy.  The host part of the interface is usually ignored.\n", 'type': 'object', 'required': ['namespace', 'interface'], 'properties': {'namespace': {'description': 'The namespace that this interface servces.', 'type': 'string'}, 'interface': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}}}}}, rule='required')
+                                        if not data__namespaces_item__servicecolors_item.keys() >= {'service', 'color', 'index', 'routes', 'instances', 'namespace-egress'}:
+                                            raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}]'+" must contain ['service', 'color', 'index', 'routes', 'instances', 'namespace-egress'] properties", value=data__namespaces_item__servicecolors_item, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}]'+"", definition=_DEFINITION_27, rule='required')
                                         data__namespaces_item__servicecolors_item_keys = set(data__namespaces_item__servicecolors_item.keys())
                                         if "service" in data__namespaces_item__servicecolors_item_keys:
                                             data__namespaces_item__servicecolors_item_keys.remove("service")
                                             data__namespaces_item__servicecolors_item__service = data__namespaces_item__servicecolors_item["service"]
                                             if not isinstance(data__namespaces_item__servicecolors_item__service, (str)):
-                                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].service".format(**locals())+" must be string", value=data__namespaces_item__servicecolors_item__service, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].service".format(**locals())+"", definition={'description': 'Service name.', 'type': 'string'}, rule='type')
+                                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].service'+" must be string", value=data__namespaces_item__servicecolors_item__service, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].service'+"", definition=_DEFINITION_28, rule='type')
                                         if "color" in data__namespaces_item__servicecolors_item_keys:
                                             data__namespaces_item__servicecolors_item_keys.remove("color")
                                             data__namespaces_item__servicecolors_item__color = data__namespaces_item__servicecolors_item["color"]
                                             if not isinstance(data__namespaces_item__servicecolors_item__color, (str)):
-                                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].color".format(**locals())+" must be string", value=data__namespaces_item__servicecolors_item__color, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].color".format(**locals())+"", definition={'description': 'The service "color", which indicates different deployment characteristics of the service.\n', 'type': 'string'}, rule='type')
+                                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].color'+" must be string", value=data__namespaces_item__servicecolors_item__color, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].color'+"", definition=_DEFINITION_29, rule='type')
                                         if "index" in data__namespaces_item__servicecolors_item_keys:
                                             data__namespaces_item__servicecolors_item_keys.remove("index")
                                             data__namespaces_item__servicecolors_item__index = data__namespaces_item__servicecolors_item["index"]
-                                            if not isinstance(data__namespaces_item__servicecolors_item__index, (int)) and not (isinstance(data__namespaces_item__servicecolors_item__index, float) and data__namespaces_item__servicecolors_item__index.is_integer()) or isinstance(data__namespaces_item__servicecolors_item__index, bool):
-                                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].index".format(**locals())+" must be integer", value=data__namespaces_item__servicecolors_item__index, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].index".format(**locals())+"", definition={'description': 'Some services must be split out into separate groups due to routes only serving select ports.  These are then split out by the index.\n', 'type': 'integer'}, rule='type')
+                                            if type(data__namespaces_item__servicecolors_item__index) is not int and (not isinstance(data__namespaces_item__servicecolors_item__index, (int)) and not (isinstance(data__namespaces_item__servicecolors_item__index, float) and data__namespaces_item__servicecolors_item__index.is_integer()) or isinstance(data__namespaces_item__servicecolors_item__index, bool)):
+                                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].index'+" must be integer", value=data__namespaces_item__servicecolors_item__index, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].index'+"", definition=_DEFINITION_30, rule='type')
                                         if "protocol" in data__namespaces_item__servicecolors_item_keys:
                                             data__namespaces_item__servicecolors_item_keys.remove("protocol")
                                             data__namespaces_item__servicecolors_item__protocol = data__namespaces_item__servicecolors_item["protocol"]
                                             if not isinstance(data__namespaces_item__servicecolors_item__protocol, (str)):
-                                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].protocol".format(**locals())+" must be string", value=data__namespaces_item__servicecolors_item__protocol, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].protocol".format(**locals())+"", definition={'description': 'The communication protocol.  If not given, this assumes HTTP 1.1.  Currently supported values are "HTTP1.1" and "HTTP2".\n', 'type': 'string'}, rule='type')
+                                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].protocol'+" must be string", value=data__namespaces_item__servicecolors_item__protocol, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].protocol'+"", definition=_DEFINITION_26, rule='type')
                                         if "routes" in data__namespaces_item__servicecolors_item_keys:
                                             data__namespaces_item__servicecolors_item_keys.remove("routes")
                                             data__namespaces_item__servicecolors_item__routes = data__namespaces_item__servicecolors_item["routes"]
                                             if not isinstance(data__namespaces_item__servicecolors_item__routes, (list, tuple)):
-                                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes".format(**locals())+" must be array", value=data__namespaces_item__servicecolors_item__routes, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes".format(**locals())+"", definition={'description': 'Collection of URL routes that the service-color serves.', 'type': 'array', 'items': {'description': 'A service route.', 'type': 'object', 'required': ['path-match', 'weight', 'namespace-access', 'default-access'], 'properties': {'path-match': {'description': 'How the route path is matched.', 'type': 'object', 'required': ['match-type', 'value'], 'properties': {'match-type': {'oneOf': [{'description': 'the starting part of the URI path part.', 'const': 'prefix'}, {'description': 'the value is a matching regular expression.', 'const': 'regex'}, {'description': 'the value must match exactly.', 'const': 'exact'}]}, 'value': {'description': 'The URI path-part that handles the route.  This must be unique within the service-color.', 'type': 'string'}, 'case-sensitive': {'description': 'Is the path case sensitive?  Defaults to True', 'type': 'boolean'}}}, 'weight': {'description': 'Weight to give the handling of this route.  A higher number means more traffic is directed to it.', 'type': 'integer', 'minimum': 1, 'maximum': 32767}, 'headers': {'description': 'Optional list of request header fields that must also be fulfilled to pass network traffic to this route.\n', 'type': 'array', 'items': {'type': 'object', 'required': ['header-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': 'string'}, 'invert': {'description': 'If true, then the match is reversed.  Defaults to false.', 'type': 'boolean'}, 'case-sensitive': {'type': 'boolean'}}}}, 'query-parameters': {'description': 'query parameter filters', 'type': 'array', 'items': {'description': 'Filter for a query parameter which is part of the routing to this cluster.', 'type': 'object', 'required': ['parameter-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': ['string', 'null']}, 'case-sensitive': {'type': 'boolean'}}}}, 'default-access': {'description': 'Default access for any namespace not specified. Also, gateways only look at this to determine whether a route is generally public or not.\n', 'type': 'boolean'}, 'namespace-access': {'description': "Collection of each namespace's allowed access. If a namespace exists that is not given here, then the default-protection is used for that namespace.\n", 'type': 'array', 'items': {'description': 'A namespace access grant.  If a namespace is not listed, then the default-access is used instead.\n', 'type': 'object', 'required': ['namespace', 'access'], 'properties': {'namespace': {'description': 'The namespace protection to grant access.', 'type': 'string'}, 'access': {'description': 'Whether the given namespace is allowed access to this route.', 'type': 'boolean'}}}}}}}, rule='type')
+                                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes'+" must be array", value=data__namespaces_item__servicecolors_item__routes, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes'+"", definition=_DEFINITION_31, rule='type')
                                             data__namespaces_item__servicecolors_item__routes_is_list = isinstance(data__namespaces_item__servicecolors_item__routes, (list, tuple))
                                             if data__namespaces_item__servicecolors_item__routes_is_list:
                                                 data__namespaces_item__servicecolors_item__routes_len = len(data__namespaces_item__servicecolors_item__routes)
                                                 for data__namespaces_item__servicecolors_item__routes_x, data__namespaces_item__servicecolors_item__routes_item in enumerate(data__namespaces_item__servicecolors_item__routes):
                                                     if not isinstance(data__namespaces_item__servicecolors_item__routes_item, (dict)):
-                                                        raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}]".format(**locals())+" must be object", value=data__namespaces_item__servicecolors_item__routes_item, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}]".format(**locals())+"", definition={'description': 'A service route.', 'type': 'object', 'required': ['path-match', 'weight', 'namespace-access', 'default-access'], 'properties': {'path-match': {'description': 'How the route path is matched.', 'type': 'object', 'required': ['match-type', 'value'], 'properties': {'match-type': {'oneOf': [{'description': 'the starting part of the URI path part.', 'const': 'prefix'}, {'description': 'the value is a matching regular expression.', 'const': 'regex'}, {'description': 'the value must match exactly.', 'const': 'exact'}]}, 'value': {'description': 'The URI path-part that handles the route.  This must be unique within the service-color.', 'type': 'string'}, 'case-sensitive': {'description': 'Is the path case sensitive?  Defaults to True', 'type': 'boolean'}}}, 'weight': {'description': 'Weight to give the handling of this route.  A higher number means more traffic is directed to it.', 'type': 'integer', 'minimum': 1, 'maximum': 32767}, 'headers': {'description': 'Optional list of request header fields that must also be fulfilled to pass network traffic to this route.\n', 'type': 'array', 'items': {'type': 'object', 'required': ['header-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': 'string'}, 'invert': {'description': 'If true, then the match is reversed.  Defaults to false.', 'type': 'boolean'}, 'case-sensitive': {'type': 'boolean'}}}}, 'query-parameters': {'description': 'query parameter filters', 'type': 'array', 'items': {'description': 'Filter for a query parameter which is part of the routing to this cluster.', 'type': 'object', 'required': ['parameter-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': ['string', 'null']}, 'case-sensitive': {'type': 'boolean'}}}}, 'default-access': {'description': 'Default access for any namespace not specified. Also, gateways only look at this to determine whether a route is generally public or not.\n', 'type': 'boolean'}, 'namespace-access': {'description': "Collection of each namespace's allowed access. If a namespace exists that is not given here, then the default-protection is used for that namespace.\n", 'type': 'array', 'items': {'description': 'A namespace access grant.  If a namespace is not listed, then the default-access is used instead.\n', 'type': 'object', 'required': ['namespace', 'access'], 'properties': {'namespace': {'description': 'The namespace protection to grant access.', 'type': 'string'}, 'access': {'description': 'Whether the given namespace is allowed access to this route.', 'type': 'boolean'}}}}}}, rule='type')
+                                                        raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}]'+" must be object", value=data__namespaces_item__servicecolors_item__routes_item, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}]'+"", definition=_DEFINITION_34, rule='type')
                                                     data__namespaces_item__servicecolors_item__routes_item_is_dict = isinstance(data__namespaces_item__servicecolors_item__routes_item, dict)
                                                     if data__namespaces_item__servicecolors_item__routes_item_is_dict:
                                                         data__namespaces_item__servicecolors_item__routes_item_len = len(data__namespaces_item__servicecolors_item__routes_item)
-                                                        if not all(prop in data__namespaces_item__servicecolors_item__routes_item for prop in ['path-match', 'weight', 'namespace-access', 'default-access']):
-                                                            raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}]".format(**locals())+" must contain ['path-match', 'weight', 'namespace-access', 'default-access'] properties", value=data__namespaces_item__servicecolors_item__routes_item, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}]".format(**locals())+"", definition={'description': 'A service route.', 'type': 'object', 'required': ['path-match', 'weight', 'namespace-access', 'default-access'], 'properties': {'path-match': {'description': 'How the route path is matched.', 'type': 'object', 'required': ['match-type', 'value'], 'properties': {'match-type': {'oneOf': [{'description': 'the starting part of the URI path part.', 'const': 'prefix'}, {'description': 'the value is a matching regular expression.', 'const': 'regex'}, {'description': 'the value must match exactly.', 'const': 'exact'}]}, 'value': {'description': 'The URI path-part that handles the route.  This must be unique within the service-color.', 'type': 'string'}, 'case-sensitive': {'description': 'Is the path case sensitive?  Defaults to True', 'type': 'boolean'}}}, 'weight': {'description': 'Weight to give the handling of this route.  A higher number means more traffic is directed to it.', 'type': 'integer', 'minimum': 1, 'maximum': 32767}, 'headers': {'description': 'Optional list of request header fields that must also be fulfilled to pass network traffic to this route.\n', 'type': 'array', 'items': {'type': 'object', 'required': ['header-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': 'string'}, 'invert': {'description': 'If true, then the match is reversed.  Defaults to false.', 'type': 'boolean'}, 'case-sensitive': {'type': 'boolean'}}}}, 'query-parameters': {'description': 'query parameter filters', 'type': 'array', 'items': {'description': 'Filter for a query parameter which is part of the routing to this cluster.', 'type': 'object', 'required': ['parameter-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': ['string', 'null']}, 'case-sensitive': {'type': 'boolean'}}}}, 'default-access': {'description': 'Default access for any namespace not specified. Also, gateways only look at this to determine whether a route is generally public or not.\n', 'type': 'boolean'}, 'namespace-access': {'description': "Collection of each namespace's allowed access. If a namespace exists that is not given here, then the default-protection is used for that namespace.\n", 'type': 'array', 'items': {'description': 'A namespace access grant.  If a namespace is not listed, then the default-access is used instead.\n', 'type': 'object', 'required': ['namespace', 'access'], 'properties': {'namespace': {'description': 'The namespace protection to grant access.', 'type': 'string'}, 'access': {'description': 'Whether the given namespace is allowed access to this route.', 'type': 'boolean'}}}}}}, rule='required')
+                                                        if not data__namespaces_item__servicecolors_item__routes_item.keys() >= {'path-match', 'weight', 'namespace-access', 'default-access'}:
+                                                            raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}]'+" must contain ['path-match', 'weight', 'namespace-access', 'default-access'] properties", value=data__namespaces_item__servicecolors_item__routes_item, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}]'+"", definition=_DEFINITION_34, rule='required')
                                                         data__namespaces_item__servicecolors_item__routes_item_keys = set(data__namespaces_item__servicecolors_item__routes_item.keys())
                                                         if "path-match" in data__namespaces_item__servicecolors_item__routes_item_keys:
                                                             data__namespaces_item__servicecolors_item__routes_item_keys.remove("path-match")
                                                             data__namespaces_item__servicecolors_item__routes_item__pathmatch = data__namespaces_item__servicecolors_item__routes_item["path-match"]
                                                             if not isinstance(data__namespaces_item__servicecolors_item__routes_item__pathmatch, (dict)):
-                                                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match".format(**locals())+" must be object", value=data__namespaces_item__servicecolors_item__routes_item__pathmatch, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match".format(**locals())+"", definition={'description': 'How the route path is matched.', 'type': 'object', 'required': ['match-type', 'value'], 'properties': {'match-type': {'oneOf': [{'description': 'the starting part of the URI path part.', 'const': 'prefix'}, {'description': 'the value is a matching regular expression.', 'const': 'regex'}, {'description': 'the value must match exactly.', 'const': 'exact'}]}, 'value': {'description': 'The URI path-part that handles the route.  This must be unique within the service-color.', 'type': 'string'}, 'case-sensitive': {'description': 'Is the path case sensitive?  Defaults to True', 'type': 'boolean'}}}, rule='type')
+                                                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match'+" must be object", value=data__namespaces_item__servicecolors_item__routes_item__pathmatch, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match'+"", definition=_DEFINITION_36, rule='type')
                                                             data__namespaces_item__servicecolors_item__routes_item__pathmatch_is_dict = isinstance(data__namespaces_item__servicecolors_item__routes_item__pathmatch, dict)
                                                             if data__namespaces_item__servicecolors_item__routes_item__pathmatch_is_dict:
                                                                 data__namespaces_item__servicecolors_item__routes_item__pathmatch_len = len(data__namespaces_item__servicecolors_item__routes_item__pathmatch)
-                                                                if not all(prop in data__namespaces_item__servicecolors_item__routes_item__pathmatch for prop in ['match-type', 'value']):
-                                                                    raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match".format(**locals())+" must contain ['match-type', 'value'] properties", value=data__namespaces_item__servicecolors_item__routes_item__pathmatch, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match".format(**locals())+"", definition={'description': 'How the route path is matched.', 'type': 'object', 'required': ['match-type', 'value'], 'properties': {'match-type': {'oneOf': [{'description': 'the starting part of the URI path part.', 'const': 'prefix'}, {'description': 'the value is a matching regular expression.', 'const': 'regex'}, {'description': 'the value must match exactly.', 'const': 'exact'}]}, 'value': {'description': 'The URI path-part that handles the route.  This must be unique within the service-color.', 'type': 'string'}, 'case-sensitive': {'description': 'Is the path case sensitive?  Defaults to True', 'type': 'boolean'}}}, rule='required')
+                                                                if not data__namespaces_item__servicecolors_item__routes_item__pathmatch.keys() >= {'match-type', 'value'}:
+                                                                    raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match'+" must contain ['match-type', 'value'] properties", value=data__namespaces_item__servicecolors_item__routes_item__pathmatch, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match'+"", definition=_DEFINITION_36, rule='required')
                                                                 data__namespaces_item__servicecolors_item__routes_item__pathmatch_keys = set(data__namespaces_item__servicecolors_item__routes_item__pathmatch.keys())
                                                                 if "match-type" in data__namespaces_item__servicecolors_item__routes_item__pathmatch_keys:
                                                                     data__namespaces_item__servicecolors_item__routes_item__pathmatch_keys.remove("match-type")
@@ -166,65 +228,65 @@ def validate_discovery_map_schema_yaml(data: Dict[str, Any]) -> Dict[str, Any]:
                                                                     if data__namespaces_item__servicecolors_item__routes_item__pathmatch__matchtype_one_of_count < 2:
                                                                         try:
                                                                             if data__namespaces_item__servicecolors_item__routes_item__pathmatch__matchtype != "prefix":
-                                                                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match.match-type".format(**locals())+" must be same as const definition", value=data__namespaces_item__servicecolors_item__routes_item__pathmatch__matchtype, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match.match-type".format(**locals())+"", definition={'description': 'the starting part of the URI path part.', 'const': 'prefix'}, rule='const')
+                                                                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match.match-type'+" must be same as const definition", value=data__namespaces_item__servicecolors_item__routes_item__pathmatch__matchtype, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match.match-type'+"", definition=_DEFINITION_49, rule='const')
                                                                             data__namespaces_item__servicecolors_item__routes_item__pathmatch__matchtype_one_of_count += 1
                                                                         except JsonSchemaException: pass
                                                                     if data__namespaces_item__servicecolors_item__routes_item__pathmatch__matchtype_one_of_count < 2:
                                                                         try:
                                                                             if data__namespaces_item__servicecolors_item__routes_item__pathmatch__matchtype != "regex":
-                                                                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match.match-type".format(**locals())+" must be same as const definition", value=data__namespaces_item__servicecolors_item__routes_item__pathmatch__matchtype, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match.match-type".format(**locals())+"", definition={'description': 'the value is a matching regular expression.', 'const': 'regex'}, rule='const')
+                                                                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match.match-type'+" must be same as const definition", value=data__namespaces_item__servicecolors_item__routes_item__pathmatch__matchtype, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match.match-type'+"", definition=_DEFINITION_50, rule='const')
                                                                             data__namespaces_item__servicecolors_item__routes_item__pathmatch__matchtype_one_of_count += 1
                                                                         except JsonSchemaException: pass
                                                                     if data__namespaces_item__servicecolors_item__routes_item__pathmatch__matchtype_one_of_count < 2:
                                                                         try:
                                                                             if data__namespaces_item__servicecolors_item__routes_item__pathmatch__matchtype != "exact":
-                                                                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match.match-type".format(**locals())+" must be same as const definition", value=data__namespaces_item__servicecolors_item__routes_item__pathmatch__matchtype, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match.match-type".format(**locals())+"", definition={'description': 'the value must match exactly.', 'const': 'exact'}, rule='const')
+                                                                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match.match-type'+" must be same as const definition", value=data__namespaces_item__servicecolors_item__routes_item__pathmatch__matchtype, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match.match-type'+"", definition=_DEFINITION_51, rule='const')
                                                                             data__namespaces_item__servicecolors_item__routes_item__pathmatch__matchtype_one_of_count += 1
                                                                         except JsonSchemaException: pass
                                                                     if data__namespaces_item__servicecolors_item__routes_item__pathmatch__matchtype_one_of_count != 1:
-                                                                        raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match.match-type".format(**locals())+" must be valid exactly by one of oneOf definition", value=data__namespaces_item__servicecolors_item__routes_item__pathmatch__matchtype, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match.match-type".format(**locals())+"", definition={'oneOf': [{'description': 'the starting part of the URI path part.', 'const': 'prefix'}, {'description': 'the value is a matching regular expression.', 'const': 'regex'}, {'description': 'the value must match exactly.', 'const': 'exact'}]}, rule='oneOf')
+                                                                        raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match.match-type'+" must be valid exactly by one of oneOf definition", value=data__namespaces_item__servicecolors_item__routes_item__pathmatch__matchtype, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match.match-type'+"", definition=_DEFINITION_43, rule='oneOf')
                                                                 if "value" in data__namespaces_item__servicecolors_item__routes_item__pathmatch_keys:
                                                                     data__namespaces_item__servicecolors_item__routes_item__pathmatch_keys.remove("value")
                                                                     data__namespaces_item__servicecolors_item__routes_item__pathmatch__value = data__namespaces_item__servicecolors_item__routes_item__pathmatch["value"]
                                                                     if not isinstance(data__namespaces_item__servicecolors_item__routes_item__pathmatch__value, (str)):
-                                                                        raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match.value".format(**locals())+" must be string", value=data__namespaces_item__servicecolors_item__routes_item__pathmatch__value, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match.value".format(**locals())+"", definition={'description': 'The URI path-part that handles the route.  This must be unique within the service-color.', 'type': 'string'}, rule='type')
+                                                                        raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match.value'+" must be string", value=data__namespaces_item__servicecolors_item__routes_item__pathmatch__value, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match.value'+"", definition=_DEFINITION_44, rule='type')
                                                                 if "case-sensitive" in data__namespaces_item__servicecolors_item__routes_item__pathmatch_keys:
                                                                     data__namespaces_item__servicecolors_item__routes_item__pathmatch_keys.remove("case-sensitive")
                                                                     data__namespaces_item__servicecolors_item__routes_item__pathmatch__casesensitive = data__namespaces_item__servicecolors_item__routes_item__pathmatch["case-sensitive"]
                                                                     if not isinstance(data__namespaces_item__servicecolors_item__routes_item__pathmatch__casesensitive, (bool)):
-                                                                        raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match.case-sensitive".format(**locals())+" must be boolean", value=data__namespaces_item__servicecolors_item__routes_item__pathmatch__casesensitive, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match.case-sensitive".format(**locals())+"", definition={'description': 'Is the path case sensitive?  Defaults to True', 'type': 'boolean'}, rule='type')
+                                                                        raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match.case-sensitive'+" must be boolean", value=data__namespaces_item__servicecolors_item__routes_item__pathmatch__casesensitive, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].path-match.case-sensitive'+"", definition=_DEFINITION_45, rule='type')
                                                         if "weight" in data__namespaces_item__servicecolors_item__routes_item_keys:
                                                             data__namespaces_item__servicecolors_item__routes_item_keys.remove("weight")
                                                             data__namespaces_item__servicecolors_item__routes_item__weight = data__namespaces_item__servicecolors_item__routes_item["weight"]
-                                                            if not isinstance(data__namespaces_item__servicecolors_item__routes_item__weight, (int)) and not (isinstance(data__namespaces_item__servicecolors_item__routes_item__weight, float) and data__namespaces_item__servicecolors_item__routes_item__weight.is_integer()) or isinstance(data__namespaces_item__servicecolors_item__routes_item__weight, bool):
-                                                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].weight".format(**locals())+" must be integer", value=data__namespaces_item__servicecolors_item__routes_item__weight, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].weight".format(**locals())+"", definition={'description': 'Weight to give the handling of this route.  A higher number means more traffic is directed to it.', 'type': 'integer', 'minimum': 1, 'maximum': 32767}, rule='type')
+                                                            if type(data__namespaces_item__servicecolors_item__routes_item__weight) is not int and (not isinstance(data__namespaces_item__servicecolors_item__routes_item__weight, (int)) and not (isinstance(data__namespaces_item__servicecolors_item__routes_item__weight, float) and data__namespaces_item__servicecolors_item__routes_item__weight.is_integer()) or isinstance(data__namespaces_item__servicecolors_item__routes_item__weight, bool)):
+                                                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].weight'+" must be integer", value=data__namespaces_item__servicecolors_item__routes_item__weight, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].weight'+"", definition=_DEFINITION_37, rule='type')
                                                             if isinstance(data__namespaces_item__servicecolors_item__routes_item__weight, (int, float)):
                                                                 if data__namespaces_item__servicecolors_item__routes_item__weight < 1:
-                                                                    raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].weight".format(**locals())+" must be bigger than or equal to 1", value=data__namespaces_item__servicecolors_item__routes_item__weight, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].weight".format(**locals())+"", definition={'description': 'Weight to give the handling of this route.  A higher number means more traffic is directed to it.', 'type': 'integer', 'minimum': 1, 'maximum': 32767}, rule='minimum')
+                                                                    raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].weight'+" must be bigger than or equal to 1", value=data__namespaces_item__servicecolors_item__routes_item__weight, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].weight'+"", definition=_DEFINITION_37, rule='minimum')
                                                                 if data__namespaces_item__servicecolors_item__routes_item__weight > 32767:
-                                                                    raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].weight".format(**locals())+" must be smaller than or equal to 32767", value=data__namespaces_item__servicecolors_item__routes_item__weight, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].weight".format(**locals())+"", definition={'description': 'Weight to give the handling of this route.  A higher number means more traffic is directed to it.', 'type': 'integer', 'minimum': 1, 'maximum': 32767}, rule='maximum')
+                                                                    raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].weight'+" must be smaller than or equal to 32767", value=data__namespaces_item__servicecolors_item__routes_item__weight, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].weight'+"", definition=_DEFINITION_37, rule='maximum')
                                                         if "headers" in data__namespaces_item__servicecolors_item__routes_item_keys:
                                                             data__namespaces_item__servicecolors_item__routes_item_keys.remove("headers")
                                                             data__namespaces_item__servicecolors_item__routes_item__headers = data__namespaces_item__servicecolors_item__routes_item["headers"]
                                                             if not isinstance(data__namespaces_item__servicecolors_item__routes_item__headers, (list, tuple)):
-                                                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers".format(**locals())+" must be array", value=data__namespaces_item__servicecolors_item__routes_item__headers, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers".format(**locals())+"", definition={'description': 'Optional list of request header fields that must also be fulfilled to pass network traffic to this route.\n', 'type': 'array', 'items': {'type': 'object', 'required': ['header-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': 'string'}, 'invert': {'description': 'If true, then the match is reversed.  Defaults to false.', 'type': 'boolean'}, 'case-sensitive': {'type': 'boolean'}}}}, rule='type')
+                                                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers'+" must be array", value=data__namespaces_item__servicecolors_item__routes_item__headers, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers'+"", definition=_DEFINITION_38, rule='type')
                                                             data__namespaces_item__servicecolors_item__routes_item__headers_is_list = isinstance(data__namespaces_item__servicecolors_item__routes_item__headers, (list, tuple))
                                                             if data__namespaces_item__servicecolors_item__routes_item__headers_is_list:
                                                                 data__namespaces_item__servicecolors_item__routes_item__headers_len = len(data__namespaces_item__servicecolors_item__routes_item__headers)
                                                                 for data__namespaces_item__servicecolors_item__routes_item__headers_x, data__namespaces_item__servicecolors_item__routes_item__headers_item in enumerate(data__namespaces_item__servicecolors_item__routes_item__headers):
                                                                     if not isinstance(data__namespaces_item__servicecolors_item__routes_item__headers_item, (dict)):
-                                                                        raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers[{data__namespaces_item__servicecolors_item__routes_item__headers_x}]".format(**locals())+" must be object", value=data__namespaces_item__servicecolors_item__routes_item__headers_item, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers[{data__namespaces_item__servicecolors_item__routes_item__headers_x}]".format(**locals())+"", definition={'type': 'object', 'required': ['header-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': 'string'}, 'invert': {'description': 'If true, then the match is reversed.  Defaults to false.', 'type': 'boolean'}, 'case-sensitive': {'type': 'boolean'}}}, rule='type')
+                                                                        raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers[{data__namespaces_item__servicecolors_item__routes_item__headers_x}]'+" must be object", value=data__namespaces_item__servicecolors_item__routes_item__headers_item, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers[{data__namespaces_item__servicecolors_item__routes_item__headers_x}]'+"", definition=_DEFINITION_46, rule='type')
                                                                     data__namespaces_item__servicecolors_item__routes_item__headers_item_is_dict = isinstance(data__namespaces_item__servicecolors_item__routes_item__headers_item, dict)
                                                                     if data__namespaces_item__servicecolors_item__routes_item__headers_item_is_dict:
                                                                         data__namespaces_item__servicecolors_item__routes_item__headers_item_len = len(data__namespaces_item__servicecolors_item__routes_item__headers_item)
-                                                                        if not all(prop in data__namespaces_item__servicecolors_item__routes_item__headers_item for prop in ['header-name', 'match-type', 'value']):
-                                                                            raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers[{data__namespaces_item__servicecolors_item__routes_item__headers_x}]".format(**locals())+" must contain ['header-name', 'match-type', 'value'] properties", value=data__namespaces_item__servicecolors_item__routes_item__headers_item, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers[{data__namespaces_item__servicecolors_item__routes_item__headers_x}]".format(**locals())+"", definition={'type': 'object', 'required': ['header-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': 'string'}, 'invert': {'description': 'If true, then the match is reversed.  Defaults to false.', 'type': 'boolean'}, 'case-sensitive': {'type': 'boolean'}}}, rule='required')
+                                                                        if not data__namespaces_item__servicecolors_item__routes_item__headers_item.keys() >= {'header-name', 'match-type', 'value'}:
+                                                                            raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers[{data__namespaces_item__servicecolors_item__routes_item__headers_x}]'+" must contain ['header-name', 'match-type', 'value'] properties", value=data__namespaces_item__servicecolors_item__routes_item__headers_item, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers[{data__namespaces_item__servicecolors_item__routes_item__headers_x}]'+"", definition=_DEFINITION_46, rule='required')
                                                                         data__namespaces_item__servicecolors_item__routes_item__headers_item_keys = set(data__namespaces_item__servicecolors_item__routes_item__headers_item.keys())
                                                                         if "header-name" in data__namespaces_item__servicecolors_item__routes_item__headers_item_keys:
                                                                             data__namespaces_item__servicecolors_item__routes_item__headers_item_keys.remove("header-name")
                                                                             data__namespaces_item__servicecolors_item__routes_item__headers_item__headername = data__namespaces_item__servicecolors_item__routes_item__headers_item["header-name"]
                                                                             if not isinstance(data__namespaces_item__servicecolors_item__routes_item__headers_item__headername, (str)):
-                                                                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers[{data__namespaces_item__servicecolors_item__routes_item__headers_x}].header-name".format(**locals())+" must be string", value=data__namespaces_item__servicecolors_item__routes_item__headers_item__headername, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers[{data__namespaces_item__servicecolors_item__routes_item__headers_x}].header-name".format(**locals())+"", definition={'type': 'string'}, rule='type')
+                                                                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers[{data__namespaces_item__servicecolors_item__routes_item__headers_x}].header-name'+" must be string", value=data__namespaces_item__servicecolors_item__routes_item__headers_item__headername, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers[{data__namespaces_item__servicecolors_item__routes_item__headers_x}].header-name'+"", definition=_DEFINITION_52, rule='type')
                                                                         if "match-type" in data__namespaces_item__servicecolors_item__routes_item__headers_item_keys:
                                                                             data__namespaces_item__servicecolors_item__routes_item__headers_item_keys.remove("match-type")
                                                                             data__namespaces_item__servicecolors_item__routes_item__headers_item__matchtype = data__namespaces_item__servicecolors_item__routes_item__headers_item["match-type"]
@@ -233,39 +295,39 @@ def validate_discovery_map_schema_yaml(data: Dict[str, Any]) -> Dict[str, Any]:
                                                                             data__namespaces_item__servicecolors_item__routes_item__headers_item_keys.remove("value")
                                                                             data__namespaces_item__servicecolors_item__routes_item__headers_item__value = data__namespaces_item__servicecolors_item__routes_item__headers_item["value"]
                                                                             if not isinstance(data__namespaces_item__servicecolors_item__routes_item__headers_item__value, (str)):
-                                                                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers[{data__namespaces_item__servicecolors_item__routes_item__headers_x}].value".format(**locals())+" must be string", value=data__namespaces_item__servicecolors_item__routes_item__headers_item__value, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers[{data__namespaces_item__servicecolors_item__routes_item__headers_x}].value".format(**locals())+"", definition={'type': 'string'}, rule='type')
+                                                                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers[{data__namespaces_item__servicecolors_item__routes_item__headers_x}].value'+" must be string", value=data__namespaces_item__servicecolors_item__routes_item__headers_item__value, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers[{data__namespaces_item__servicecolors_item__routes_item__headers_x}].value'+"", definition=_DEFINITION_52, rule='type')
                                                                         if "invert" in data__namespaces_item__servicecolors_item__routes_item__headers_item_keys:
                                                                             data__namespaces_item__servicecolors_item__routes_item__headers_item_keys.remove("invert")
                                                                             data__namespaces_item__servicecolors_item__routes_item__headers_item__invert = data__namespaces_item__servicecolors_item__routes_item__headers_item["invert"]
                                                                             if not isinstance(data__namespaces_item__servicecolors_item__routes_item__headers_item__invert, (bool)):
-                                                                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers[{data__namespaces_item__servicecolors_item__routes_item__headers_x}].invert".format(**locals())+" must be boolean", value=data__namespaces_item__servicecolors_item__routes_item__headers_item__invert, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers[{data__namespaces_item__servicecolors_item__routes_item__headers_x}].invert".format(**locals())+"", definition={'description': 'If true, then the match is reversed.  Defaults to false.', 'type': 'boolean'}, rule='type')
+                                                                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers[{data__namespaces_item__servicecolors_item__routes_item__headers_x}].invert'+" must be boolean", value=data__namespaces_item__servicecolors_item__routes_item__headers_item__invert, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers[{data__namespaces_item__servicecolors_item__routes_item__headers_x}].invert'+"", definition=_DEFINITION_53, rule='type')
                                                                         if "case-sensitive" in data__namespaces_item__servicecolors_item__routes_item__headers_item_keys:
                                                                             data__namespaces_item__servicecolors_item__routes_item__headers_item_keys.remove("case-sensitive")
                                                                             data__namespaces_item__servicecolors_item__routes_item__headers_item__casesensitive = data__namespaces_item__servicecolors_item__routes_item__headers_item["case-sensitive"]
                                                                             if not isinstance(data__namespaces_item__servicecolors_item__routes_item__headers_item__casesensitive, (bool)):
-                                                                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers[{data__namespaces_item__servicecolors_item__routes_item__headers_x}].case-sensitive".format(**locals())+" must be boolean", value=data__namespaces_item__servicecolors_item__routes_item__headers_item__casesensitive, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers[{data__namespaces_item__servicecolors_item__routes_item__headers_x}].case-sensitive".format(**locals())+"", definition={'type': 'boolean'}, rule='type')
+                                                                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers[{data__namespaces_item__servicecolors_item__routes_item__headers_x}].case-sensitive'+" must be boolean", value=data__namespaces_item__servicecolors_item__routes_item__headers_item__casesensitive, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].headers[{data__namespaces_item__servicecolors_item__routes_item__headers_x}].case-sensitive'+"", definition=_DEFINITION_54, rule='type')
                                                         if "query-parameters" in data__namespaces_item__servicecolors_item__routes_item_keys:
                                                             data__namespaces_item__servicecolors_item__routes_item_keys.remove("query-parameters")
                                                             data__namespaces_item__servicecolors_item__routes_item__queryparameters = data__namespaces_item__servicecolors_item__routes_item["query-parameters"]
                                                             if not isinstance(data__namespaces_item__servicecolors_item__routes_item__queryparameters, (list, tuple)):
-                                                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].query-parameters".format(**locals())+" must be array", value=data__namespaces_item__servicecolors_item__routes_item__queryparameters, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].query-parameters".format(**locals())+"", definition={'description': 'query parameter filters', 'type': 'array', 'items': {'description': 'Filter for a query parameter which is part of the routing to this cluster.', 'type': 'object', 'required': ['parameter-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': ['string', 'null']}, 'case-sensitive': {'type': 'boolean'}}}}, rule='type')
+                                                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].query-parameters'+" must be array", value=data__namespaces_item__servicecolors_item__routes_item__queryparameters, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].query-parameters'+"", definition=_DEFINITION_39, rule='type')
                                                             data__namespaces_item__servicecolors_item__routes_item__queryparameters_is_list = isinstance(data__namespaces_item__servicecolors_item__routes_item__queryparameters, (list, tuple))
                                                             if data__namespaces_item__servicecolors_item__routes_item__queryparameters_is_list:
                                                                 data__namespaces_item__servicecolors_item__routes_item__queryparameters_len = len(data__namespaces_item__servicecolors_item__routes_item__queryparameters)
                                                                 for data__namespaces_item__servicecolors_item__routes_item__queryparameters_x, data__namespaces_item__servicecolors_item__routes_item__queryparameters_item in enumerate(data__namespaces_item__servicecolors_item__routes_item__queryparameters):
                                                                     if not isinstance(data__namespaces_item__servicecolors_item__routes_item__queryparameters_item, (dict)):
-                                                                        raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].query-parameters[{data__namespaces_item__servicecolors_item__routes_item__queryparameters_x}]".format(**locals())+" must be object", value=data__namespaces_item__servicecolors_item__routes_item__queryparameters_item, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].query-parameters[{data__namespaces_item__servicecolors_item__routes_item__queryparameters_x}]".format(**locals())+"", definition={'description': 'Filter for a query parameter which is part of the routing to this cluster.', 'type': 'object', 'required': ['parameter-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': ['string', 'null']}, 'case-sensitive': {'type': 'boolean'}}}, rule='type')
+                                                                        raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].query-parameters[{data__namespaces_item__servicecolors_item__routes_item__queryparameters_x}]'+" must be object", value=data__namespaces_item__servicecolors_item__routes_item__queryparameters_item, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].query-parameters[{data__namespaces_item__servicecolors_item__routes_item__queryparameters_x}]'+"", definition=_DEFINITION_47, rule='type')
                                                                     data__namespaces_item__servicecolors_item__routes_item__queryparameters_item_is_dict = isinstance(data__namespaces_item__servicecolors_item__routes_item__queryparameters_item, dict)
                                                                     if data__namespaces_item__servicecolors_item__routes_item__queryparameters_item_is_dict:
                                                                         data__namespaces_item__servicecolors_item__routes_item__queryparameters_item_len = len(data__namespaces_item__servicecolors_item__routes_item__queryparameters_item)
-                                                                        if not all(prop in data__namespaces_item__servicecolors_item__routes_item__queryparameters_item for prop in ['parameter-name', 'match-type', 'value']):
-                                                                            raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].query-parameters[{data__namespaces_item__servicecolors_item__routes_item__queryparameters_x}]".format(**locals())+" must contain ['parameter-name', 'match-type', 'value'] properties", value=data__namespaces_item__servicecolors_item__routes_item__queryparameters_item, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].query-parameters[{data__namespaces_item__servicecolors_item__routes_item__queryparameters_x}]".format(**locals())+"", definition={'description': 'Filter for a query parameter which is part of the routing to this cluster.', 'type': 'object', 'required': ['parameter-name', 'match-type', 'value'], 'properties': {'header-name': {'type': 'string'}, 'match-type': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/match-type'}, 'value': {'type': ['string', 'null']}, 'case-sensitive': {'type': 'boolean'}}}, rule='required')
+                                                                        if not data__namespaces_item__servicecolors_item__routes_item__queryparameters_item.keys() >= {'parameter-name', 'match-type', 'value'}:
+                                                                            raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].query-parameters[{data__namespaces_item__servicecolors_item__routes_item__queryparameters_x}]'+" must contain ['parameter-name', 'match-type', 'value'] properties", value=data__namespaces_item__servicecolors_item__routes_item__queryparameters_item, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].query-parameters[{data__namespaces_item__servicecolors_item__routes_item__queryparameters_x}]'+"", definition=_DEFINITION_47, rule='required')
                                                                         data__namespaces_item__servicecolors_item__routes_item__queryparameters_item_keys = set(data__namespaces_item__servicecolors_item__routes_item__queryparameters_item.keys())
                                                                         if "header-name" in data__namespaces_item__servicecolors_item__routes_item__queryparameters_item_keys:
                                                                             data__namespaces_item__servicecolors_item__routes_item__queryparameters_item_keys.remove("header-name")
                                                                             data__namespaces_item__servicecolors_item__routes_item__queryparameters_item__headername = data__namespaces_item__servicecolors_item__routes_item__queryparameters_item["header-name"]
                                                                             if not isinstance(data__namespaces_item__servicecolors_item__routes_item__queryparameters_item__headername, (str)):
-                                                                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].query-parameters[{data__namespaces_item__servicecolors_item__routes_item__queryparameters_x}].header-name".format(**locals())+" must be string", value=data__namespaces_item__servicecolors_item__routes_item__queryparameters_item__headername, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].query-parameters[{data__namespaces_item__servicecolors_item__routes_item__queryparameters_x}].header-name".format(**locals())+"", definition={'type': 'string'}, rule='type')
+                                                                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].query-parameters[{data__namespaces_item__servicecolors_item__routes_item__queryparameters_x}].header-name'+" must be string", value=data__namespaces_item__servicecolors_item__routes_item__queryparameters_item__headername, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].query-parameters[{data__namespaces_item__servicecolors_item__routes_item__queryparameters_x}].header-name'+"", definition=_DEFINITION_52, rule='type')
                                                                         if "match-type" in data__namespaces_item__servicecolors_item__routes_item__queryparameters_item_keys:
                                                                             data__namespaces_item__servicecolors_item__routes_item__queryparameters_item_keys.remove("match-type")
                                                                             data__namespaces_item__servicecolors_item__routes_item__queryparameters_item__matchtype = data__namespaces_item__servicecolors_item__routes_item__queryparameters_item["match-type"]
@@ -274,49 +336,49 @@ def validate_discovery_map_schema_yaml(data: Dict[str, Any]) -> Dict[str, Any]:
                                                                             data__namespaces_item__servicecolors_item__routes_item__queryparameters_item_keys.remove("value")
                                                                             data__namespaces_item__servicecolors_item__routes_item__queryparameters_item__value = data__namespaces_item__servicecolors_item__routes_item__queryparameters_item["value"]
                                                                             if not isinstance(data__namespaces_item__servicecolors_item__routes_item__queryparameters_item__value, (str, NoneType)):
-                                                                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].query-parameters[{data__namespaces_item__servicecolors_item__routes_item__queryparameters_x}].value".format(**locals())+" must be string or null", value=data__namespaces_item__servicecolors_item__routes_item__queryparameters_item__value, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].query-parameters[{data__namespaces_item__servicecolors_item__routes_item__queryparameters_x}].value".format(**locals())+"", definition={'type': ['string', 'null']}, rule='type')
+                                                                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].query-parameters[{data__namespaces_item__servicecolors_item__routes_item__queryparameters_x}].value'+" must be string or null", value=data__namespaces_item__servicecolors_item__routes_item__queryparameters_item__value, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].query-parameters[{data__namespaces_item__servicecolors_item__routes_item__queryparameters_x}].value'+"", definition=_DEFINITION_55, rule='type')
                                                                         if "case-sensitive" in data__namespaces_item__servicecolors_item__routes_item__queryparameters_item_keys:
                                                                             data__namespaces_item__servicecolors_item__routes_item__queryparameters_item_keys.remove("case-sensitive")
                                                                             data__namespaces_item__servicecolors_item__routes_item__queryparameters_item__casesensitive = data__namespaces_item__servicecolors_item__routes_item__queryparameters_item["case-sensitive"]
                                                                             if not isinstance(data__namespaces_item__servicecolors_item__routes_item__queryparameters_item__casesensitive, (bool)):
-                                                                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].query-parameters[{data__namespaces_item__servicecolors_item__routes_item__queryparameters_x}].case-sensitive".format(**locals())+" must be boolean", value=data__namespaces_item__servicecolors_item__routes_item__queryparameters_item__casesensitive, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].query-parameters[{data__namespaces_item__servicecolors_item__routes_item__queryparameters_x}].case-sensitive".format(**locals())+"", definition={'type': 'boolean'}, rule='type')
+                                                                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].query-parameters[{data__namespaces_item__servicecolors_item__routes_item__queryparameters_x}].case-sensitive'+" must be boolean", value=data__namespaces_item__servicecolors_item__routes_item__queryparameters_item__casesensitive, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].query-parameters[{data__namespaces_item__servicecolors_item__routes_item__queryparameters_x}].case-sensitive'+"", definition=_DEFINITION_54, rule='type')
                                                         if "default-access" in data__namespaces_item__servicecolors_item__routes_item_keys:
                                                             data__namespaces_item__servicecolors_item__routes_item_keys.remove("default-access")
                                                             data__namespaces_item__servicecolors_item__routes_item__defaultaccess = data__namespaces_item__servicecolors_item__routes_item["default-access"]
                                                             if not isinstance(data__namespaces_item__servicecolors_item__routes_item__defaultaccess, (bool)):
-                                                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].default-access".format(**locals())+" must be boolean", value=data__namespaces_item__servicecolors_item__routes_item__defaultaccess, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].default-access".format(**locals())+"", definition={'description': 'Default access for any namespace not specified. Also, gateways only look at this to determine whether a route is generally public or not.\n', 'type': 'boolean'}, rule='type')
+                                                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].default-access'+" must be boolean", value=data__namespaces_item__servicecolors_item__routes_item__defaultaccess, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].default-access'+"", definition=_DEFINITION_40, rule='type')
                                                         if "namespace-access" in data__namespaces_item__servicecolors_item__routes_item_keys:
                                                             data__namespaces_item__servicecolors_item__routes_item_keys.remove("namespace-access")
                                                             data__namespaces_item__servicecolors_item__routes_item__namespaceaccess = data__namespaces_item__servicecolors_item__routes_item["namespace-access"]
                                                             if not isinstance(data__namespaces_item__servicecolors_item__routes_item__namespaceaccess, (list, tuple)):
-                                                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].namespace-access".format(**locals())+" must be array", value=data__namespaces_item__servicecolors_item__routes_item__namespaceaccess, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].namespace-access".format(**locals())+"", definition={'description': "Collection of each namespace's allowed access. If a namespace exists that is not given here, then the default-protection is used for that namespace.\n", 'type': 'array', 'items': {'description': 'A namespace access grant.  If a namespace is not listed, then the default-access is used instead.\n', 'type': 'object', 'required': ['namespace', 'access'], 'properties': {'namespace': {'description': 'The namespace protection to grant access.', 'type': 'string'}, 'access': {'description': 'Whether the given namespace is allowed access to this route.', 'type': 'boolean'}}}}, rule='type')
+                                                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].namespace-access'+" must be array", value=data__namespaces_item__servicecolors_item__routes_item__namespaceaccess, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].namespace-access'+"", definition=_DEFINITION_41, rule='type')
                                                             data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_is_list = isinstance(data__namespaces_item__servicecolors_item__routes_item__namespaceaccess, (list, tuple))
                                                             if data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_is_list:
                                                                 data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_len = len(data__namespaces_item__servicecolors_item__routes_item__namespaceaccess)
                                                                 for data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_x, data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item in enumerate(data__namespaces_item__servicecolors_item__routes_item__namespaceaccess):
                                                                     if not isinstance(data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item, (dict)):
-                                                                        raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].namespace-access[{data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_x}]".format(**locals())+" must be object", value=data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].namespace-access[{data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_x}]".format(**locals())+"", definition={'description': 'A namespace access grant.  If a namespace is not listed, then the default-access is used instead.\n', 'type': 'object', 'required': ['namespace', 'access'], 'properties': {'namespace': {'description': 'The namespace protection to grant access.', 'type': 'string'}, 'access': {'description': 'Whether the given namespace is allowed access to this route.', 'type': 'boolean'}}}, rule='type')
+                                                                        raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].namespace-access[{data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_x}]'+" must be object", value=data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].namespace-access[{data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_x}]'+"", definition=_DEFINITION_48, rule='type')
                                                                     data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item_is_dict = isinstance(data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item, dict)
                                                                     if data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item_is_dict:
                                                                         data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item_len = len(data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item)
-                                                                        if not all(prop in data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item for prop in ['namespace', 'access']):
-                                                                            raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].namespace-access[{data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_x}]".format(**locals())+" must contain ['namespace', 'access'] properties", value=data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].namespace-access[{data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_x}]".format(**locals())+"", definition={'description': 'A namespace access grant.  If a namespace is not listed, then the default-access is used instead.\n', 'type': 'object', 'required': ['namespace', 'access'], 'properties': {'namespace': {'description': 'The namespace protection to grant access.', 'type': 'string'}, 'access': {'description': 'Whether the given namespace is allowed access to this route.', 'type': 'boolean'}}}, rule='required')
+                                                                        if not data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item.keys() >= {'namespace', 'access'}:
+                                                                            raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].namespace-access[{data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_x}]'+" must contain ['namespace', 'access'] properties", value=data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].namespace-access[{data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_x}]'+"", definition=_DEFINITION_48, rule='required')
                                                                         data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item_keys = set(data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item.keys())
                                                                         if "namespace" in data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item_keys:
                                                                             data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item_keys.remove("namespace")
                                                                             data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item__namespace = data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item["namespace"]
                                                                             if not isinstance(data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item__namespace, (str)):
-                                                                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].namespace-access[{data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_x}].namespace".format(**locals())+" must be string", value=data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item__namespace, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].namespace-access[{data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_x}].namespace".format(**locals())+"", definition={'description': 'The namespace protection to grant access.', 'type': 'string'}, rule='type')
+                                                                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].namespace-access[{data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_x}].namespace'+" must be string", value=data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item__namespace, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].namespace-access[{data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_x}].namespace'+"", definition=_DEFINITION_56, rule='type')
                                                                         if "access" in data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item_keys:
                                                                             data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item_keys.remove("access")
                                                                             data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item__access = data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item["access"]
                                                                             if not isinstance(data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item__access, (bool)):
-                                                                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].namespace-access[{data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_x}].access".format(**locals())+" must be boolean", value=data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item__access, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].namespace-access[{data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_x}].access".format(**locals())+"", definition={'description': 'Whether the given namespace is allowed access to this route.', 'type': 'boolean'}, rule='type')
+                                                                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].namespace-access[{data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_x}].access'+" must be boolean", value=data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_item__access, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].routes[{data__namespaces_item__servicecolors_item__routes_x}].namespace-access[{data__namespaces_item__servicecolors_item__routes_item__namespaceaccess_x}].access'+"", definition=_DEFINITION_57, rule='type')
                                         if "instances" in data__namespaces_item__servicecolors_item_keys:
                                             data__namespaces_item__servicecolors_item_keys.remove("instances")
                                             data__namespaces_item__servicecolors_item__instances = data__namespaces_item__servicecolors_item["instances"]
                                             if not isinstance(data__namespaces_item__servicecolors_item__instances, (list, tuple)):
-                                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].instances".format(**locals())+" must be array", value=data__namespaces_item__servicecolors_item__instances, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].instances".format(**locals())+"", definition={'description': 'Collection of IP and listening ports for handlers of this service-color routes.', 'type': 'array', 'items': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}, rule='type')
+                                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].instances'+" must be array", value=data__namespaces_item__servicecolors_item__instances, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].instances'+"", definition=_DEFINITION_32, rule='type')
                                             data__namespaces_item__servicecolors_item__instances_is_list = isinstance(data__namespaces_item__servicecolors_item__instances, (list, tuple))
                                             if data__namespaces_item__servicecolors_item__instances_is_list:
                                                 data__namespaces_item__servicecolors_item__instances_len = len(data__namespaces_item__servicecolors_item__instances)
@@ -326,24 +388,24 @@ def validate_discovery_map_schema_yaml(data: Dict[str, Any]) -> Dict[str, Any]:
                                             data__namespaces_item__servicecolors_item_keys.remove("namespace-egress")
                                             data__namespaces_item__servicecolors_item__namespaceegress = data__namespaces_item__servicecolors_item["namespace-egress"]
                                             if not isinstance(data__namespaces_item__servicecolors_item__namespaceegress, (list, tuple)):
-                                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].namespace-egress".format(**locals())+" must be array", value=data__namespaces_item__servicecolors_item__namespaceegress, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].namespace-egress".format(**locals())+"", definition={'description': 'The host and port that this service-color sends requests to access each namespace.', 'type': 'array', 'items': {'description': "A host and port that describes the URI this service-color sends requests to for access to a namespace's routes.  That namespace's protections will be applied.  This should be an interface on the local, sidecar proxy.  The host part of the interface is usually ignored.\n", 'type': 'object', 'required': ['namespace', 'interface'], 'properties': {'namespace': {'description': 'The namespace that this interface servces.', 'type': 'string'}, 'interface': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}}}, rule='type')
+                                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].namespace-egress'+" must be array", value=data__namespaces_item__servicecolors_item__namespaceegress, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].namespace-egress'+"", definition=_DEFINITION_33, rule='type')
                                             data__namespaces_item__servicecolors_item__namespaceegress_is_list = isinstance(data__namespaces_item__servicecolors_item__namespaceegress, (list, tuple))
                                             if data__namespaces_item__servicecolors_item__namespaceegress_is_list:
                                                 data__namespaces_item__servicecolors_item__namespaceegress_len = len(data__namespaces_item__servicecolors_item__namespaceegress)
                                                 for data__namespaces_item__servicecolors_item__namespaceegress_x, data__namespaces_item__servicecolors_item__namespaceegress_item in enumerate(data__namespaces_item__servicecolors_item__namespaceegress):
                                                     if not isinstance(data__namespaces_item__servicecolors_item__namespaceegress_item, (dict)):
-                                                        raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].namespace-egress[{data__namespaces_item__servicecolors_item__namespaceegress_x}]".format(**locals())+" must be object", value=data__namespaces_item__servicecolors_item__namespaceegress_item, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].namespace-egress[{data__namespaces_item__servicecolors_item__namespaceegress_x}]".format(**locals())+"", definition={'description': "A host and port that describes the URI this service-color sends requests to for access to a namespace's routes.  That namespace's protections will be applied.  This should be an interface on the local, sidecar proxy.  The host part of the interface is usually ignored.\n", 'type': 'object', 'required': ['namespace', 'interface'], 'properties': {'namespace': {'description': 'The namespace that this interface servces.', 'type': 'string'}, 'interface': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}}, rule='type')
+                                                        raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].namespace-egress[{data__namespaces_item__servicecolors_item__namespaceegress_x}]'+" must be object", value=data__namespaces_item__servicecolors_item__namespaceegress_item, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].namespace-egress[{data__namespaces_item__servicecolors_item__namespaceegress_x}]'+"", definition=_DEFINITION_35, rule='type')
                                                     data__namespaces_item__servicecolors_item__namespaceegress_item_is_dict = isinstance(data__namespaces_item__servicecolors_item__namespaceegress_item, dict)
                                                     if data__namespaces_item__servicecolors_item__namespaceegress_item_is_dict:
                                                         data__namespaces_item__servicecolors_item__namespaceegress_item_len = len(data__namespaces_item__servicecolors_item__namespaceegress_item)
-                                                        if not all(prop in data__namespaces_item__servicecolors_item__namespaceegress_item for prop in ['namespace', 'interface']):
-                                                            raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].namespace-egress[{data__namespaces_item__servicecolors_item__namespaceegress_x}]".format(**locals())+" must contain ['namespace', 'interface'] properties", value=data__namespaces_item__servicecolors_item__namespaceegress_item, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].namespace-egress[{data__namespaces_item__servicecolors_item__namespaceegress_x}]".format(**locals())+"", definition={'description': "A host and port that describes the URI this service-color sends requests to for access to a namespace's routes.  That namespace's protections will be applied.  This should be an interface on the local, sidecar proxy.  The host part of the interface is usually ignored.\n", 'type': 'object', 'required': ['namespace', 'interface'], 'properties': {'namespace': {'description': 'The namespace that this interface servces.', 'type': 'string'}, 'interface': {'$ref': 'file:///tmp/tmp93fil6rp/discovery-map-schema.yaml#/definitions/host-port'}}}, rule='required')
+                                                        if not data__namespaces_item__servicecolors_item__namespaceegress_item.keys() >= {'namespace', 'interface'}:
+                                                            raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].namespace-egress[{data__namespaces_item__servicecolors_item__namespaceegress_x}]'+" must contain ['namespace', 'interface'] properties", value=data__namespaces_item__servicecolors_item__namespaceegress_item, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].namespace-egress[{data__namespaces_item__servicecolors_item__namespaceegress_x}]'+"", definition=_DEFINITION_35, rule='required')
                                                         data__namespaces_item__servicecolors_item__namespaceegress_item_keys = set(data__namespaces_item__servicecolors_item__namespaceegress_item.keys())
                                                         if "namespace" in data__namespaces_item__servicecolors_item__namespaceegress_item_keys:
                                                             data__namespaces_item__servicecolors_item__namespaceegress_item_keys.remove("namespace")
                                                             data__namespaces_item__servicecolors_item__namespaceegress_item__namespace = data__namespaces_item__servicecolors_item__namespaceegress_item["namespace"]
                                                             if not isinstance(data__namespaces_item__servicecolors_item__namespaceegress_item__namespace, (str)):
-                                                                raise JsonSchemaException(""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].namespace-egress[{data__namespaces_item__servicecolors_item__namespaceegress_x}].namespace".format(**locals())+" must be string", value=data__namespaces_item__servicecolors_item__namespaceegress_item__namespace, name=""+"data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].namespace-egress[{data__namespaces_item__servicecolors_item__namespaceegress_x}].namespace".format(**locals())+"", definition={'description': 'The namespace that this interface servces.', 'type': 'string'}, rule='type')
+                                                                raise JsonSchemaException(""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].namespace-egress[{data__namespaces_item__servicecolors_item__namespaceegress_x}].namespace'+" must be string", value=data__namespaces_item__servicecolors_item__namespaceegress_item__namespace, name=""+f'data.namespaces[{data__namespaces_x}].service-colors[{data__namespaces_item__servicecolors_x}].namespace-egress[{data__namespaces_item__servicecolors_item__namespaceegress_x}].namespace'+"", definition=_DEFINITION_42, rule='type')
                                                         if "interface" in data__namespaces_item__servicecolors_item__namespaceegress_item_keys:
                                                             data__namespaces_item__servicecolors_item__namespaceegress_item_keys.remove("interface")
                                                             data__namespaces_item__servicecolors_item__namespaceegress_item__interface = data__namespaces_item__servicecolors_item__namespaceegress_item["interface"]
@@ -355,35 +417,35 @@ def validate_discovery_map_schema_yaml__definitions_match_type(data: Dict[str, A
     if data_one_of_count < 2:
         try:
             if data != "exact":
-                raise JsonSchemaException("data must be same as const definition", value=data, name="data", definition={'description': 'exact matching of the value.', 'const': 'exact'}, rule='const')
+                raise JsonSchemaException("data must be same as const definition", value=data, name="data", definition=_DEFINITION_6, rule='const')
             data_one_of_count += 1
         except JsonSchemaException: pass
     if data_one_of_count < 2:
         try:
             if data != "regex":
-                raise JsonSchemaException("data must be same as const definition", value=data, name="data", definition={'description': 'regular expression.', 'const': 'regex'}, rule='const')
+                raise JsonSchemaException("data must be same as const definition", value=data, name="data", definition=_DEFINITION_7, rule='const')
             data_one_of_count += 1
         except JsonSchemaException: pass
     if data_one_of_count < 2:
         try:
             if data != "prefix":
-                raise JsonSchemaException("data must be same as const definition", value=data, name="data", definition={'description': 'parameter value starts with this.', 'const': 'prefix'}, rule='const')
+                raise JsonSchemaException("data must be same as const definition", value=data, name="data", definition=_DEFINITION_8, rule='const')
             data_one_of_count += 1
         except JsonSchemaException: pass
     if data_one_of_count < 2:
         try:
             if data != "suffix":
-                raise JsonSchemaException("data must be same as const definition", value=data, name="data", definition={'description': 'parameter value ends with this.', 'const': 'suffix'}, rule='const')
+                raise JsonSchemaException("data must be same as const definition", value=data, name="data", definition=_DEFINITION_9, rule='const')
             data_one_of_count += 1
         except JsonSchemaException: pass
     if data_one_of_count < 2:
         try:
             if data != "present":
-                raise JsonSchemaException("data must be same as const definition", value=data, name="data", definition={'description': 'parameter needs to just be present.  The "value" is ignored.', 'const': 'present'}, rule='const')
+                raise JsonSchemaException("data must be same as const definition", value=data, name="data", definition=_DEFINITION_10, rule='const')
             data_one_of_count += 1
         except JsonSchemaException: pass
     if data_one_of_count != 1:
-        raise JsonSchemaException("data must be valid exactly by one of oneOf definition", value=data, name="data", definition={'oneOf': [{'description': 'exact matching of the value.', 'const': 'exact'}, {'description': 'regular expression.', 'const': 'regex'}, {'description': 'parameter value starts with this.', 'const': 'prefix'}, {'description': 'parameter value ends with this.', 'const': 'suffix'}, {'description': 'parameter needs to just be present.  The "value" is ignored.', 'const': 'present'}]}, rule='oneOf')
+        raise JsonSchemaException("data must be valid exactly by one of oneOf definition", value=data, name="data", definition=_DEFINITION_1, rule='oneOf')
     return data
 
 def validate_discovery_map_schema_yaml__definitions_host_port(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -391,90 +453,90 @@ def validate_discovery_map_schema_yaml__definitions_host_port(data: Dict[str, An
     if data_one_of_count < 2:
         try:
             if not isinstance(data, (dict)):
-                raise JsonSchemaException("data must be object", value=data, name="data", definition={'description': 'An IPv4 and listening port.', 'type': 'object', 'required': ['ipv4', 'port'], 'properties': {'ipv4': {'description': 'IPv4 address.', 'type': 'string', 'format': 'ipv4'}, 'port': {'description': 'Listening port.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}}}, rule='type')
+                raise JsonSchemaException("data must be object", value=data, name="data", definition=_DEFINITION_11, rule='type')
             data_is_dict = isinstance(data, dict)
             if data_is_dict:
                 data_len = len(data)
-                if not all(prop in data for prop in ['ipv4', 'port']):
-                    raise JsonSchemaException("data must contain ['ipv4', 'port'] properties", value=data, name="data", definition={'description': 'An IPv4 and listening port.', 'type': 'object', 'required': ['ipv4', 'port'], 'properties': {'ipv4': {'description': 'IPv4 address.', 'type': 'string', 'format': 'ipv4'}, 'port': {'description': 'Listening port.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}}}, rule='required')
+                if not data.keys() >= {'ipv4', 'port'}:
+                    raise JsonSchemaException("data must contain ['ipv4', 'port'] properties", value=data, name="data", definition=_DEFINITION_11, rule='required')
                 data_keys = set(data.keys())
                 if "ipv4" in data_keys:
                     data_keys.remove("ipv4")
                     data__ipv4 = data["ipv4"]
                     if not isinstance(data__ipv4, (str)):
-                        raise JsonSchemaException("data.ipv4 must be string", value=data__ipv4, name="data.ipv4", definition={'description': 'IPv4 address.', 'type': 'string', 'format': 'ipv4'}, rule='type')
+                        raise JsonSchemaException("data.ipv4 must be string", value=data__ipv4, name="data.ipv4", definition=_DEFINITION_15, rule='type')
                     if isinstance(data__ipv4, str):
-                        if not REGEX_PATTERNS["ipv4_re_pattern"].match(data__ipv4):
-                            raise JsonSchemaException("data.ipv4 must be ipv4", value=data__ipv4, name="data.ipv4", definition={'description': 'IPv4 address.', 'type': 'string', 'format': 'ipv4'}, rule='format')
+                        if not _PATTERN_0.match(data__ipv4):
+                            raise JsonSchemaException("data.ipv4 must be ipv4", value=data__ipv4, name="data.ipv4", definition=_DEFINITION_15, rule='format')
                 if "port" in data_keys:
                     data_keys.remove("port")
                     data__port = data["port"]
-                    if not isinstance(data__port, (int)) and not (isinstance(data__port, float) and data__port.is_integer()) or isinstance(data__port, bool):
-                        raise JsonSchemaException("data.port must be integer", value=data__port, name="data.port", definition={'description': 'Listening port.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}, rule='type')
+                    if type(data__port) is not int and (not isinstance(data__port, (int)) and not (isinstance(data__port, float) and data__port.is_integer()) or isinstance(data__port, bool)):
+                        raise JsonSchemaException("data.port must be integer", value=data__port, name="data.port", definition=_DEFINITION_16, rule='type')
                     if isinstance(data__port, (int, float)):
                         if data__port < 1:
-                            raise JsonSchemaException("data.port must be bigger than or equal to 1", value=data__port, name="data.port", definition={'description': 'Listening port.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}, rule='minimum')
+                            raise JsonSchemaException("data.port must be bigger than or equal to 1", value=data__port, name="data.port", definition=_DEFINITION_16, rule='minimum')
                         if data__port > 65535:
-                            raise JsonSchemaException("data.port must be smaller than or equal to 65535", value=data__port, name="data.port", definition={'description': 'Listening port.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}, rule='maximum')
+                            raise JsonSchemaException("data.port must be smaller than or equal to 65535", value=data__port, name="data.port", definition=_DEFINITION_16, rule='maximum')
             data_one_of_count += 1
         except JsonSchemaException: pass
     if data_one_of_count < 2:
         try:
             if not isinstance(data, (dict)):
-                raise JsonSchemaException("data must be object", value=data, name="data", definition={'description': "An IPv6 and listening port for a handler of this service-color's routes.", 'type': 'object', 'required': ['ipv6', 'port'], 'properties': {'ipv6': {'description': 'IPv6 address for this service-color instance.', 'type': 'string', 'format': 'ipv6'}, 'port': {'description': 'Listening port that services the routes.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}}}, rule='type')
+                raise JsonSchemaException("data must be object", value=data, name="data", definition=_DEFINITION_12, rule='type')
             data_is_dict = isinstance(data, dict)
             if data_is_dict:
                 data_len = len(data)
-                if not all(prop in data for prop in ['ipv6', 'port']):
-                    raise JsonSchemaException("data must contain ['ipv6', 'port'] properties", value=data, name="data", definition={'description': "An IPv6 and listening port for a handler of this service-color's routes.", 'type': 'object', 'required': ['ipv6', 'port'], 'properties': {'ipv6': {'description': 'IPv6 address for this service-color instance.', 'type': 'string', 'format': 'ipv6'}, 'port': {'description': 'Listening port that services the routes.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}}}, rule='required')
+                if not data.keys() >= {'ipv6', 'port'}:
+                    raise JsonSchemaException("data must contain ['ipv6', 'port'] properties", value=data, name="data", definition=_DEFINITION_12, rule='required')
                 data_keys = set(data.keys())
                 if "ipv6" in data_keys:
                     data_keys.remove("ipv6")
                     data__ipv6 = data["ipv6"]
                     if not isinstance(data__ipv6, (str)):
-                        raise JsonSchemaException("data.ipv6 must be string", value=data__ipv6, name="data.ipv6", definition={'description': 'IPv6 address for this service-color instance.', 'type': 'string', 'format': 'ipv6'}, rule='type')
+                        raise JsonSchemaException("data.ipv6 must be string", value=data__ipv6, name="data.ipv6", definition=_DEFINITION_17, rule='type')
                     if isinstance(data__ipv6, str):
-                        if not REGEX_PATTERNS["ipv6_re_pattern"].match(data__ipv6):
-                            raise JsonSchemaException("data.ipv6 must be ipv6", value=data__ipv6, name="data.ipv6", definition={'description': 'IPv6 address for this service-color instance.', 'type': 'string', 'format': 'ipv6'}, rule='format')
+                        if not _PATTERN_1.match(data__ipv6):
+                            raise JsonSchemaException("data.ipv6 must be ipv6", value=data__ipv6, name="data.ipv6", definition=_DEFINITION_17, rule='format')
                 if "port" in data_keys:
                     data_keys.remove("port")
                     data__port = data["port"]
-                    if not isinstance(data__port, (int)) and not (isinstance(data__port, float) and data__port.is_integer()) or isinstance(data__port, bool):
-                        raise JsonSchemaException("data.port must be integer", value=data__port, name="data.port", definition={'description': 'Listening port that services the routes.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}, rule='type')
+                    if type(data__port) is not int and (not isinstance(data__port, (int)) and not (isinstance(data__port, float) and data__port.is_integer()) or isinstance(data__port, bool)):
+                        raise JsonSchemaException("data.port must be integer", value=data__port, name="data.port", definition=_DEFINITION_18, rule='type')
                     if isinstance(data__port, (int, float)):
                         if data__port < 1:
-                            raise JsonSchemaException("data.port must be bigger than or equal to 1", value=data__port, name="data.port", definition={'description': 'Listening port that services the routes.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}, rule='minimum')
+                            raise JsonSchemaException("data.port must be bigger than or equal to 1", value=data__port, name="data.port", definition=_DEFINITION_18, rule='minimum')
                         if data__port > 65535:
-                            raise JsonSchemaException("data.port must be smaller than or equal to 65535", value=data__port, name="data.port", definition={'description': 'Listening port that services the routes.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}, rule='maximum')
+                            raise JsonSchemaException("data.port must be smaller than or equal to 65535", value=data__port, name="data.port", definition=_DEFINITION_18, rule='maximum')
             data_one_of_count += 1
         except JsonSchemaException: pass
     if data_one_of_count < 2:
         try:
             if not isinstance(data, (dict)):
-                raise JsonSchemaException("data must be object", value=data, name="data", definition={'description': "A DNS resolvable hostname and listening port for a handler of this service-color's routes.", 'type': 'object', 'required': ['hostname', 'port'], 'properties': {'hostname': {'description': 'hostname address for this service-color instance.', 'type': 'string'}, 'port': {'description': 'Listening port that services the routes.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}}}, rule='type')
+                raise JsonSchemaException("data must be object", value=data, name="data", definition=_DEFINITION_13, rule='type')
             data_is_dict = isinstance(data, dict)
             if data_is_dict:
                 data_len = len(data)
-                if not all(prop in data for prop in ['hostname', 'port']):
-                    raise JsonSchemaException("data must contain ['hostname', 'port'] properties", value=data, name="data", definition={'description': "A DNS resolvable hostname and listening port for a handler of this service-color's routes.", 'type': 'object', 'required': ['hostname', 'port'], 'properties': {'hostname': {'description': 'hostname address for this service-color instance.', 'type': 'string'}, 'port': {'description': 'Listening port that services the routes.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}}}, rule='required')
+                if not data.keys() >= {'hostname', 'port'}:
+                    raise JsonSchemaException("data must contain ['hostname', 'port'] properties", value=data, name="data", definition=_DEFINITION_13, rule='required')
                 data_keys = set(data.keys())
                 if "hostname" in data_keys:
                     data_keys.remove("hostname")
                     data__hostname = data["hostname"]
                     if not isinstance(data__hostname, (str)):
-                        raise JsonSchemaException("data.hostname must be string", value=data__hostname, name="data.hostname", definition={'description': 'hostname address for this service-color instance.', 'type': 'string'}, rule='type')
+                        raise JsonSchemaException("data.hostname must be string", value=data__hostname, name="data.hostname", definition=_DEFINITION_19, rule='type')
                 if "port" in data_keys:
                     data_keys.remove("port")
                     data__port = data["port"]
-                    if not isinstance(data__port, (int)) and not (isinstance(data__port, float) and data__port.is_integer()) or isinstance(data__port, bool):
-                        raise JsonSchemaException("data.port must be integer", value=data__port, name="data.port", definition={'description': 'Listening port that services the routes.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}, rule='type')
+                    if type(data__port) is not int and (not isinstance(data__port, (int)) and not (isinstance(data__port, float) and data__port.is_integer()) or isinstance(data__port, bool)):
+                        raise JsonSchemaException("data.port must be integer", value=data__port, name="data.port", definition=_DEFINITION_18, rule='type')
                     if isinstance(data__port, (int, float)):
                         if data__port < 1:
-                            raise JsonSchemaException("data.port must be bigger than or equal to 1", value=data__port, name="data.port", definition={'description': 'Listening port that services the routes.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}, rule='minimum')
+                            raise JsonSchemaException("data.port must be bigger than or equal to 1", value=data__port, name="data.port", definition=_DEFINITION_18, rule='minimum')
                         if data__port > 65535:
-                            raise JsonSchemaException("data.port must be smaller than or equal to 65535", value=data__port, name="data.port", definition={'description': 'Listening port that services the routes.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}, rule='maximum')
+                            raise JsonSchemaException("data.port must be smaller than or equal to 65535", value=data__port, name="data.port", definition=_DEFINITION_18, rule='maximum')
             data_one_of_count += 1
         except JsonSchemaException: pass
     if data_one_of_count != 1:
-        raise JsonSchemaException("data must be valid exactly by one of oneOf definition", value=data, name="data", definition={'oneOf': [{'description': 'An IPv4 and listening port.', 'type': 'object', 'required': ['ipv4', 'port'], 'properties': {'ipv4': {'description': 'IPv4 address.', 'type': 'string', 'format': 'ipv4'}, 'port': {'description': 'Listening port.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}}}, {'description': "An IPv6 and listening port for a handler of this service-color's routes.", 'type': 'object', 'required': ['ipv6', 'port'], 'properties': {'ipv6': {'description': 'IPv6 address for this service-color instance.', 'type': 'string', 'format': 'ipv6'}, 'port': {'description': 'Listening port that services the routes.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}}}, {'description': "A DNS resolvable hostname and listening port for a handler of this service-color's routes.", 'type': 'object', 'required': ['hostname', 'port'], 'properties': {'hostname': {'description': 'hostname address for this service-color instance.', 'type': 'string'}, 'port': {'description': 'Listening port that services the routes.', 'type': 'integer', 'minimum': 1, 'maximum': 65535}}}]}, rule='oneOf')
+        raise JsonSchemaException("data must be valid exactly by one of oneOf definition", value=data, name="data", definition=_DEFINITION_2, rule='oneOf')
     return data
\ No newline at end of file
@@ -0,0 +1,129 @@
+# DO NOT MODIFY
+# AUTO-GENERATED CODE.
+
+# pylint: ignore
+
+from typing import Dict, Any
+
+VERSION = "2.14.4"
+from ..fastjsonschema_replacement import JsonSchemaException
+
+
+NoneType = type(None)
+
+_DEFINITION_0 = {'$schema': 'https://json-schema.org/draft-07/schema', 'description': 'The chain of changes to the discovery map since the last full "discovery-map" snapshot document.  A reader that holds the discovery map at one of the chain\'s versions applies the remaining changes rather than fetching the whole snapshot.  When the chain grows too long, the writer compacts it into a new snapshot and starts a new chain.\n', 'type': 'object', 'required': ['schema-version', 'document-version', 'base-version', 'map-version', 'changes'], 'properties': {'schema-version': {'description': 'Version of this document\'s schema.  The value must be the string value "v1".', 'const': 'v1'}, 'document-version': {'description': 'An opaque value indicating the version of this document.', 'type': 'string'}, 'base-version': {'description': 'The "map-version" of the discovery map snapshot that the first change applies to.\n', 'type': 'string'}, 'map-version': {'description': 'The "map-version" of the discovery map after applying all the changes.', 'type': 'string'}, 'changes': {'description': 'The ordered changes, each one moving the discovery map to a new version.', 'type': 'array', 'items': {'type': 'object', 'required': ['from-version', 'to-version', 'operations'], 'properties': {'from-version': {'description': 'The map version this change applies to.', 'type': 'string'}, 'to-version': {'description': 'The map version after applying this change.', 'type': 'string'}, 'operations': {'description': 'The ordered operations for this change.  An operation with a service and color applies to that service-color in the namespace; otherwise it applies to the whole namespace.  Added service-colors and namespaces are appended, and replaced ones keep their position.\n', 'type': 'array', 'items': {'type': 'object', 'required': ['op', 'namespace'], 'properties': {'op': {'description': 'The kind of change.  Add and replace operations require a value.', 'enum': ['add', 'replace', 'remove']}, 'namespace': {'description': 'The namespace name.', 'type': 'string'}, 'service': {'description': 'The service name, for a service-color operation.', 'type': 'string'}, 'color': {'description': 'The color name, for a service-color operation.', 'type': 'string'}, 'value': {'description': 'The new namespace or service-color object, as described in the discovery map schema.\n', 'type': 'object'}}}}}}}}, '$id': 'file:/tmp/tmp90iacrct/discovery-map-delta-schema.yaml'}
+_DEFINITION_1 = {'description': 'Version of this document\'s schema.  The value must be the string value "v1".', 'const': 'v1'}
+_DEFINITION_2 = {'description': 'An opaque value indicating the version of this document.', 'type': 'string'}
+_DEFINITION_3 = {'description': 'The "map-version" of the discovery map snapshot that the first change applies to.\n', 'type': 'string'}
+_DEFINITION_4 = {'description': 'The "map-version" of the discovery map after applying all the changes.', 'type': 'string'}
+_DEFINITION_5 = {'description': 'The ordered changes, each one moving the discovery map to a new version.', 'type': 'array', 'items': {'type': 'object', 'required': ['from-version', 'to-version', 'operations'], 'properties': {'from-version': {'description': 'The map version this change applies to.', 'type': 'string'}, 'to-version': {'description': 'The map version after applying this change.', 'type': 'string'}, 'operations': {'description': 'The ordered operations for this change.  An operation with a service and color applies to that service-color in the namespace; otherwise it applies to the whole namespace.  Added service-colors and namespaces are appended, and replaced ones keep their position.\n', 'type': 'array', 'items': {'type': 'object', 'required': ['op', 'namespace'], 'properties': {'op': {'description': 'The kind of change.  Add and replace operations require a value.', 'enum': ['add', 'replace', 'remove']}, 'namespace': {'description': 'The namespace name.', 'type': 'string'}, 'service': {'description': 'The service name, for a service-color operation.', 'type': 'string'}, 'color': {'description': 'The color name, for a service-color operation.', 'type': 'string'}, 'value': {'description': 'The new namespace or service-color object, as described in the discovery map schema.\n', 'type': 'object'}}}}}}}
+_DEFINITION_6 = {'type': 'object', 'required': ['from-version', 'to-version', 'operations'], 'properties': {'from-version': {'description': 'The map version this change applies to.', 'type': 'string'}, 'to-version': {'description': 'The map version after applying this change.', 'type': 'string'}, 'operations': {'description': 'The ordered operations for this change.  An operation with a service and color applies to that service-color in the namespace; otherwise it applies to the whole namespace.  Added service-colors and namespaces are appended, and replaced ones keep their position.\n', 'type': 'array', 'items': {'type': 'object', 'required': ['op', 'namespace'], 'properties': {'op': {'description': 'The kind of change.  Add and replace operations require a value.', 'enum': ['add', 'replace', 'remove']}, 'namespace': {'description': 'The namespace name.', 'type': 'string'}, 'service': {'description': 'The service name, for a service-color operation.', 'type': 'string'}, 'color': {'description': 'The color name, for a service-color operation.', 'type': 'string'}, 'value': {'description': 'The new namespace or service-color object, as described in the discovery map schema.\n', 'type': 'object'}}}}}}
+_DEFINITION_7 = {'description': 'The map version this change applies to.', 'type': 'string'}
+_DEFINITION_8 = {'description': 'The map version after applying this change.', 'type': 'string'}
+_DEFINITION_9 = {'description': 'The ordered operations for this change.  An operation with a service and color applies to that service-color in the namespace; otherwise it applies to the whole namespace.  Added service-colors and namespaces are appended, and replaced ones keep their position.\n', 'type': 'array', 'items': {'type': 'object', 'required': ['op', 'namespace'], 'properties': {'op': {'description': 'The kind of change.  Add and replace operations require a value.', 'enum': ['add', 'replace', 'remove']}, 'namespace': {'description': 'The namespace name.', 'type': 'string'}, 'service': {'description': 'The service name, for a service-color operation.', 'type': 'string'}, 'color': {'description': 'The color name, for a service-color operation.', 'type': 'string'}, 'value': {'description': 'The new namespace or service-color object, as described in the discovery map schema.\n', 'type': 'object'}}}}
+_DEFINITION_10 = {'type': 'object', 'required': ['op', 'namespace'], 'properties': {'op': {'description': 'The kind of change.  Add and replace operations require a value.', 'enum': ['add', 'replace', 'remove']}, 'namespace': {'description': 'The namespace name.', 'type': 'string'}, 'service': {'description': 'The service name, for a service-color operation.', 'type': 'string'}, 'color': {'description': 'The color name, for a service-color operation.', 'type': 'string'}, 'value': {'description': 'The new namespace or service-color object, as described in the discovery map schema.\n', 'type': 'object'}}}
+_DEFINITION_11 = {'description': 'The kind of change.  Add and replace operations require a value.', 'enum': ['add', 'replace', 'remove']}
+_DEFINITION_12 = {'description': 'The namespace name.', 'type': 'string'}
+_DEFINITION_13 = {'description': 'The service name, for a service-color operation.', 'type': 'string'}
+_DEFINITION_14 = {'description': 'The color name, for a service-color operation.', 'type': 'string'}
+_DEFINITION_15 = {'description': 'The new namespace or service-color object, as described in the discovery map schema.\n', 'type': 'object'}
+
+def validate_discovery_map_delta_schema_yaml(data: Dict[str, Any]) -> Dict[str, Any]:
+    if not isinstance(data, (dict)):
+        raise JsonSchemaException("data must be object", value=data, name="data", definition=_DEFINITION_0, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_len = len(data)
+        if not data.keys() >= {'schema-version', 'document-version', 'base-version', 'map-version', 'changes'}:
+            raise JsonSchemaException("data must contain ['schema-version', 'document-version', 'base-version', 'map-version', 'changes'] properties", value=data, name="data", definition=_DEFINITION_0, rule='required')
+        data_keys = set(data.keys())
+        if "schema-version" in data_keys:
+            data_keys.remove("schema-version")
+            data__schemaversion = data["schema-version"]
+            if data__schemaversion != "v1":
+                raise JsonSchemaException("data.schema-version must be same as const definition", value=data__schemaversion, name="data.schema-version", definition=_DEFINITION_1, rule='const')
+        if "document-version" in data_keys:
+            data_keys.remove("document-version")
+            data__documentversion = data["document-version"]
+            if not isinstance(data__documentversion, (str)):
+                raise JsonSchemaException("data.document-version must be string", value=data__documentversion, name="data.document-version", definition=_DEFINITION_2, rule='type')
+        if "base-version" in data_keys:
+            data_keys.remove("base-version")
+            data__baseversion = data["base-version"]
+            if not isinstance(data__baseversion, (str)):
+                raise JsonSchemaException("data.base-version must be string", value=data__baseversion, name="data.base-version", definition=_DEFINITION_3, rule='type')
+        if "map-version" in data_keys:
+            data_keys.remove("map-version")
+            data__mapversion = data["map-version"]
+            if not isinstance(data__mapversion, (str)):
+                raise JsonSchemaException("data.map-version must be string", value=data__mapversion, name="data.map-version", definition=_DEFINITION_4, rule='type')
+        if "changes" in data_keys:
+            data_keys.remove("changes")
+            data__changes = data["changes"]
+            if not isinstance(data__changes, (list, tuple)):
+                raise JsonSchemaException("data.changes must be array", value=data__changes, name="data.changes", definition=_DEFINITION_5, rule='type')
+            data__changes_is_list = isinstance(data__changes, (list, tuple))
+            if data__changes_is_list:
+                data__changes_len = len(data__changes)
+                for data__changes_x, data__changes_item in enumerate(data__changes):
+                    if not isinstance(data__changes_item, (dict)):
+                        raise JsonSchemaException(""+f'data.changes[{data__changes_x}]'+" must be object", value=data__changes_item, name=""+f'data.changes[{data__changes_x}]'+"", definition=_DEFINITION_6, rule='type')
+                    data__changes_item_is_dict = isinstance(data__changes_item, dict)
+                    if data__changes_item_is_dict:
+                        data__changes_item_len = len(data__changes_item)
+                        if not data__changes_item.keys() >= {'from-version', 'to-version', 'operations'}:
+                            raise JsonSchemaException(""+f'data.changes[{data__changes_x}]'+" must contain ['from-version', 'to-version', 'operations'] properties", value=data__changes_item, name=""+f'data.changes[{data__changes_x}]'+"", definition=_DEFINITION_6, rule='required')
+                        data__changes_item_keys = set(data__changes_item.keys())
+                        if "from-version" in data__changes_item_keys:
+                            data__changes_item_keys.remove("from-version")
+                            data__changes_item__fromversion = data__changes_item["from-version"]
+                            if not isinstance(data__changes_item__fromversion, (str)):
+                                raise JsonSchemaException(""+f'data.changes[{data__changes_x}].from-version'+" must be string", value=data__changes_item__fromversion, name=""+f'data.changes[{data__changes_x}].from-version'+"", definition=_DEFINITION_7, rule='type')
+                        if "to-version" in data__changes_item_keys:
+                            data__changes_item_keys.remove("to-version")
+                            data__changes_item__toversion = data__changes_item["to-version"]
+                            if not isinstance(data__changes_item__toversion, (str)):
+                                raise JsonSchemaException(""+f'data.changes[{data__changes_x}].to-version'+" must be string", value=data__changes_item__toversion, name=""+f'data.changes[{data__changes_x}].to-version'+"", definition=_DEFINITION_8, rule='type')
+                        if "operations" in data__changes_item_keys:
+                            data__changes_item_keys.remove("operations")
+                            data__changes_item__operations = data__changes_item["operations"]
+                            if not isinstance(data__changes_item__operations, (list, tuple)):
+                                raise JsonSchemaException(""+f'data.changes[{data__changes_x}].operations'+" must be array", value=data__changes_item__operations, name=""+f'data.changes[{data__changes_x}].operations'+"", definition=_DEFINITION_9, rule='type')
+                            data__changes_item__operations_is_list = isinstance(data__changes_item__operations, (list, tuple))
+                            if data__changes_item__operations_is_list:
+                                data__changes_item__operations_len = len(data__changes_item__operations)
+                                for data__changes_item__operations_x, data__changes_item__operations_item in enumerate(data__changes_item__operations):
+                                    if not isinstance(data__changes_item__operations_item, (dict)):
+                                        raise JsonSchemaException(""+f'data.changes[{data__changes_x}].operations[{data__changes_item__operations_x}]'+" must be object", value=data__changes_item__operations_item, name=""+f'data.changes[{data__changes_x}].operations[{data__changes_item__operations_x}]'+"", definition=_DEFINITION_10, rule='type')
+                                    data__changes_item__operations_item_is_dict = isinstance(data__changes_item__operations_item, dict)
+                                    if data__changes_item__operations_item_is_dict:
+                                        data__changes_item__operations_item_len = len(data__changes_item__operations_item)
+                                        if not data__changes_item__operations_item.keys() >= {'op', 'namespace'}:
+                                            raise JsonSchemaException(""+f'data.changes[{data__changes_x}].operations[{data__changes_item__operations_x}]'+" must contain ['op', 'namespace'] properties", value=data__changes_item__operations_item, name=""+f'data.changes[{data__changes_x}].operations[{data__changes_item__operations_x}]'+"", definition=_DEFINITION_10, rule='required')
+                                        data__changes_item__operations_item_keys = set(data__changes_item__operations_item.keys())
+                                        if "op" in data__changes_item__operations_item_keys:
+                                            data__changes_item__operations_item_keys.remove("op")
+                                            data__changes_item__operations_item__op = data__changes_item__operations_item["op"]
+                                            if data__changes_item__operations_item__op not in ['add', 'replace', 'remove']:
+                                                raise JsonSchemaException(""+f'data.changes[{data__changes_x}].operations[{data__changes_item__operations_x}].op'+" must be one of ['add', 'replace', 'remove']", value=data__changes_item__operations_item__op, name=""+f'data.changes[{data__changes_x}].operations[{data__changes_item__operations_x}].op'+"", definition=_DEFINITION_11, rule='enum')
+                                        if "namespace" in data__changes_item__operations_item_keys:
+                                            data__changes_item__operations_item_keys.remove("namespace")
+                                            data__changes_item__operations_item__namespace = data__changes_item__operations_item["namespace"]
+                                            if not isinstance(data__changes_item__operations_item__namespace, (str)):
+                                                raise JsonSchemaException(""+f'data.changes[{data__changes_x}].operations[{data__changes_item__operations_x}].namespace'+" must be string", value=data__changes_item__operations_item__namespace, name=""+f'data.changes[{data__changes_x}].operations[{data__changes_item__operations_x}].namespace'+"", definition=_DEFINITION_12, rule='type')
+                                        if "service" in data__changes_item__operations_item_keys:
+                                            data__changes_item__operations_item_keys.remove("service")
+                                            data__changes_item__operations_item__service = data__changes_item__operations_item["service"]
+                                            if not isinstance(data__changes_item__operations_item__service, (str)):
+                                                raise JsonSchemaException(""+f'data.changes[{data__changes_x}].operations[{data__changes_item__operations_x}].service'+" must be string", value=data__changes_item__operations_item__service, name=""+f'data.changes[{data__changes_x}].operations[{data__changes_item__operations_x}].service'+"", definition=_DEFINITION_13, rule='type')
+                                        if "color" in data__changes_item__operations_item_keys:
+                                            data__changes_item__operations_item_keys.remove("color")
+                                            data__changes_item__operations_item__color = data__changes_item__operations_item["color"]
+                                            if not isinstance(data__changes_item__operations_item__color, (str)):
+                                                raise JsonSchemaException(""+f'data.changes[{data__changes_x}].operations[{data__changes_item__operations_x}].color'+" must be string", value=data__changes_item__operations_item__color, name=""+f'data.changes[{data__changes_x}].operations[{data__changes_item__operations_x}].color'+"", definition=_DEFINITION_14, rule='type')
+                                        if "value" in data__changes_item__operations_item_keys:
+                                            data__changes_item__operations_item_keys.remove("value")
+                                            data__changes_item__operations_item__value = data__changes_item__operations_item["value"]
+                                            if not isinstance(data__changes_item__operations_item__value, (dict)):
+                                                raise JsonSchemaException(""+f'data.changes[{data__changes_x}].operations[{data__changes_item__operations_x}].value'+" must be object", value=data__changes_item__operations_item__value, name=""+f'data.changes[{data__changes_x}].operations[{data__changes_item__operations_x}].value'+"", definition=_DEFINITION_15, rule='type')
+    return data
\ No newline at end of file
@@ -0,0 +1,52 @@
+# DO NOT MODIFY
+# AUTO-GENERATED CODE.
+
+# pylint: ignore
+
+from typing import Dict, Any
+
+VERSION = "2.14.4"
+from ..fastjsonschema_replacement import JsonSchemaException
+
+
+NoneType = type(None)
+
+_DEFINITION_0 = {'$schema': 'https://json-schema.org/draft-07/schema', 'description': 'Index for the sharded discovery map layout in the data store.  Each namespace in the discovery map is stored as its own "discovery-map-namespace.(name)" document, which is a discovery map containing just that namespace.  This index lists the namespaces and the version of each namespace\'s contents, so that readers only fetch the namespace documents that they need and that changed.\n', 'type': 'object', 'required': ['schema-version', 'document-version', 'namespaces'], 'properties': {'schema-version': {'description': 'Version of this document\'s schema.  The value must be the string value "v1".', 'const': 'v1'}, 'document-version': {'description': 'An opaque value indicating the version of this document.', 'type': 'string'}, 'namespaces': {'description': 'Map of each namespace name to the version of the namespace contents.  This matches the "namespace-version" value in the namespace\'s document.\n', 'type': 'object', 'additionalProperties': {'type': 'string'}}}, '$id': 'file:/tmp/tmpc_hfnmld/discovery-map-index-schema.yaml'}
+_DEFINITION_1 = {'description': 'Version of this document\'s schema.  The value must be the string value "v1".', 'const': 'v1'}
+_DEFINITION_2 = {'description': 'An opaque value indicating the version of this document.', 'type': 'string'}
+_DEFINITION_3 = {'description': 'Map of each namespace name to the version of the namespace contents.  This matches the "namespace-version" value in the namespace\'s document.\n', 'type': 'object', 'additionalProperties': {'type': 'string'}}
+_DEFINITION_4 = {'type': 'string'}
+
+def validate_discovery_map_index_schema_yaml(data: Dict[str, Any]) -> Dict[str, Any]:
+    if not isinstance(data, (dict)):
+        raise JsonSchemaException("data must be object", value=data, name="data", definition=_DEFINITION_0, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_len = len(data)
+        if not data.keys() >= {'schema-version', 'document-version', 'namespaces'}:
+            raise JsonSchemaException("data must contain ['schema-version', 'document-version', 'namespaces'] properties", value=data, name="data", definition=_DEFINITION_0, rule='required')
+        data_keys = set(data.keys())
+        if "schema-version" in data_keys:
+            data_keys.remove("schema-version")
+            data__schemaversion = data["schema-version"]
+            if data__schemaversion != "v1":
+                raise JsonSchemaException("data.schema-version must be same as const definition", value=data__schemaversion, name="data.schema-version", definition=_DEFINITION_1, rule='const')
+        if "document-version" in data_keys:
+            data_keys.remove("document-version")
+            data__documentversion = data["document-version"]
+            if not isinstance(data__documentversion, (str)):
+                raise JsonSchemaException("data.document-version must be string", value=data__documentversion, name="data.document-version", definition=_DEFINITION_2, rule='type')
+        if "namespaces" in data_keys:
+            data_keys.remove("namespaces")
+            data__namespaces = data["namespaces"]
+            if not isinstance(data__namespaces, (dict)):
+                raise JsonSchemaException("data.namespaces must be object", value=data__namespaces, name="data.namespaces", definition=_DEFINITION_3, rule='type')
+            data__namespaces_is_dict = isinstance(data__namespaces, dict)
+            if data__namespaces_is_dict:
+                data__namespaces_keys = set(data__namespaces.keys())
+                for data__namespaces_key in data__namespaces_keys:
+                    if data__namespaces_key not in []:
+                        data__namespaces_value = data__namespaces.get(data__namespaces_key)
+                        if not isinstance(data__namespaces_value, (str)):
+                            raise JsonSchemaException(""+f'data.namespaces.{data__namespaces_key}'+" must be string", value=data__namespaces_value, name=""+f'data.namespaces.{data__namespaces_key}'+"", definition=_DEFINITION_4, rule='type')
+    return data
\ No newline at end of file
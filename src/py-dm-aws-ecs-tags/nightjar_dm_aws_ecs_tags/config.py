@@ -6,6 +6,7 @@ environment for the configuration.
 
 from typing import Dict, Sequence, Optional
 import os
+from nightjar_common import log
 from . import ecs
 
 ENV__AWS_CLUSTERS = 'NJ_DMECS_AWS_CLUSTERS'
@@ -41,6 +42,7 @@ class Config:
 
 def create_configuration() -> Config:
     """Setup the configuration."""
+    log.EXECUTE_MODEL = 'nightjar_dm_aws_ecs_tags'
     config = Config(dict(os.environ))
     ecs.set_aws_config(config.aws_config)
     return config
@@ -1,12 +1,16 @@
 
-"""AWS ECS Interface."""
+"""AWS ECS Interface.
 
-from typing import Dict, Tuple, List, Optional, Iterable, Set, Literal, Union, Any
+boto3 takes a large part of each run's start up time to import, so it is only imported
+once the first AWS call is made.
+"""
+
+from typing import (
+    Dict, Tuple, List, Mapping, Optional, Iterable, Set, Literal, Union, Any,
+)
 import re
 import json
-import boto3
-# from botocore.exceptions import ClientError  # type: ignore
-from botocore.config import Config  # type: ignore
+import types
 from .warn import warning, debug
 
 
@@ -36,26 +40,29 @@ TAG__ROUTE_PORT = 'NJ_ROUTE_PORT'
 TAG__ROUTE_PORT_INDEX_PREFIX = 'NJ_ROUTE_PORT_'
 TAG__ROUTE_WEIGHT_INDEX_PREFIX = 'NJ_ROUTE_WEIGHT_'
 TAG__PREFER_GATEWAY = 'NJ_PREFER_GATEWAY'
+# All the tags that contribute to the parsed routes start with this.
+TAG__ROUTE_PREFIX = 'NJ_ROUTE_'
 
 # A valid port number, but generally one that isn't listed on.
 # This is to allow the map generation to work.
 DEFAULT_ROUTE_PORT = 1
 
+# (taskdef arn, container ports, route tag values)
+RouteKey = Tuple[str, Tuple[str, ...], Tuple[Tuple[str, str], ...]]
 
-class RouteInfo:
-    """Basic route info, parsed from the NJ_ROUTE_() value."""
+
+class ParsedRoute:
+    """Basic route info, parsed from the NJ_ROUTE_() value.  This does not depend on the
+    task's host ports, so tasks of the same task definition share it."""
     __slots__ = (
         'is_public_path', 'is_private_path', 'is_route_data', 'data',
-        'index', 'container_port', 'host_port', 'weight',
+        'index', 'container_port', 'weight',
     )
     data: Union[str, Dict[str, Any]]
 
-    def __init__(
-            self, index: int, route_value: str, container_port: str, host_port: int, weight: int,
-    ) -> None:
+    def __init__(self, index: int, route_value: str, container_port: str, weight: int) -> None:
         self.index = index
         self.container_port = container_port
-        self.host_port = host_port
         self.weight = weight
 
         if route_value[0] == '!':
@@ -89,6 +96,26 @@ class RouteInfo:
             self.is_route_data = False
             self.data = route_value
 
+
+class RouteInfo(ParsedRoute):
+    """The parsed route, with the host port the task publishes it on."""
+    __slots__ = ('host_port',)
+
+    def __init__(
+            self, index: int, route_value: str, container_port: str, host_port: int, weight: int,
+    ) -> None:
+        super().__init__(index, route_value, container_port, weight)
+        self.host_port = host_port
+
+    @staticmethod
+    def from_parsed(parsed: ParsedRoute, host_port: int) -> 'RouteInfo':
+        """Create the route info from the shared parsed route, without parsing it again."""
+        ret = RouteInfo.__new__(RouteInfo)
+        for name in ParsedRoute.__slots__:
+            setattr(ret, name, getattr(parsed, name))
+        ret.host_port = host_port
+        return ret
+
     def __repr__(self) -> str:
         return (
             'RouteInfo(index={index}, weight={weight}, data={data}, '
@@ -107,6 +134,10 @@ class RouteInfo:
         )
 
 
+# Parsed routes by route key.  The ParsedRoute values must be treated as read-only.
+ROUTE_CACHE: Dict[RouteKey, List[ParsedRoute]] = {}
+
+
 class EcsTask:
     """An ECS task with 1 or more containers.
     Should to look into adding IPv6 support.
@@ -115,6 +146,7 @@ class EcsTask:
         'task_name', 'task_arn', 'taskdef_arn', 'container_instance_arn',
         'host_ipv4', 'container_host_ports',
         'task_tags', 'taskdef_tags', 'task_env', 'taskdef_env',
+        '_tags', '_all_tags', '_route_tags', '_route_key', '_egress_ports', '_routes',
     )
 
     def __init__(  # pylint: disable=R0913
@@ -140,6 +172,13 @@ class EcsTask:
         self.taskdef_tags = dict(taskdef_tags)
         self.task_env = dict(task_env)
         self.taskdef_env = dict(taskdef_env)
+        self._tags: Dict[str, str] = {}
+        self._all_tags: Mapping[str, str] = types.MappingProxyType({})
+        self._route_tags: List[Tuple[int, str]] = []
+        self._route_key: RouteKey = (taskdef_arn, (), (),)
+        self._egress_ports: List[Tuple[str, int]] = []
+        self._routes: Optional[List[RouteInfo]] = None
+        self.refresh_tags()
 
     def __repr__(self) -> str:
         # This is a bit complex, but done for consistent unit tests.
@@ -192,15 +231,67 @@ class EcsTask:
             return namespace
         return None
 
-    def get_tags(self) -> Dict[str, str]:
+    def refresh_tags(self) -> None:
+        """Build the precedence-resolved tag view, along with the route and namespace egress
+        tags pulled from it.  This must be called whenever the tag or env dictionaries
+        are changed, such as by `add_taskdef_tags`.
+        """
+        # Same ordering as get_tag; empty values fall through to the lower precedence source.
+        tags: Dict[str, str] = dict(self.taskdef_env)
+        for source in (self.task_env, self.taskdef_tags, self.task_tags):
+            for key, value in source.items():
+                if value:
+                    tags[key] = value
+
+        route_tags: List[Tuple[int, str]] = []
+        route_key_tags: List[Tuple[str, str]] = []
+        egress_ports: List[Tuple[str, int]] = []
+        for tag_name, tag_value in tags.items():
+            if tag_name.startswith(TAG__ROUTE_PREFIX):
+                route_key_tags.append((tag_name, tag_value))
+            match = TAG__ROUTE_MATCHER.match(tag_name)
+            if match:
+                if tag_value:
+                    route_tags.append((int(match.group(1)), tag_value))
+            elif TAG__NAMESPACE_PORT_MATCHER.match(tag_name):
+                parts = tag_value.split(':', 1)
+                if len(parts) != 2:
+                    continue
+                namespace, port_str = parts
+                try:
+                    port = int(port_str)
+                except ValueError:
+                    continue
+                egress_ports.append((namespace, port))
+
+        self._tags = tags
+        all_tags: Dict[str, str] = dict(self.taskdef_env)
+        all_tags.update(self.task_env)
+        all_tags.update(self.taskdef_tags)
+        all_tags.update(self.task_tags)
+        self._all_tags = types.MappingProxyType(all_tags)
+        # The routes are in their index order, not the order the tags were listed in.
+        self._route_tags = sorted(route_tags)
+        # A route without a port tag uses the first container port, so the container
+        # ports, in their order, are part of the key.
+        self._route_key = (
+            self.taskdef_arn, tuple(self.container_host_ports),
+            tuple(sorted(route_key_tags)),
+        )
+        self._egress_ports = egress_ports
+        self._routes = None
+
+    def get_route_key(self) -> RouteKey:
+        """Get the key identifying the parsed routes for this task.  Tasks with the same
+        task definition, container ports and effective route tags share their parsed
+        routes, even when they are published on different host ports."""
+        return self._route_key
+
+    def get_tags(self) -> Mapping[str, str]:
         """Fetch the current 'tags', which is a combination of tags and environment variables,
-        pulled in a specific order.
+        pulled in a specific order.  This is a read-only view built by `refresh_tags`.
         """
-        ret: Dict[str, str] = dict(self.taskdef_env)
-        ret.update(self.task_env)
-        ret.update(self.taskdef_tags)
-        ret.update(self.task_tags)
-        return ret
+        return self._all_tags
 
     def get_tag_keys(self) -> Set[str]:
         """Get all the keys in the 'tags'."""
@@ -225,15 +316,10 @@ class EcsTask:
             - task override env.  Note that each container can have its own set of overrides.
                 The order is non-determinant.
             - taskdef env
+
+        This uses the view built by `refresh_tags`.
         """
-        val = self.task_tags.get(key)
-        if not val:
-            val = self.taskdef_tags.get(key)
-            if not val:
-                val = self.task_env.get(key)
-                if not val:
-                    val = self.taskdef_env.get(key, default_value)
-        return val
+        return self._tags.get(key, default_value)
 
     def get_route_container_host_port_for(self, index: int) -> Tuple[str, int]:
         """Finds the (container) PORT value for the index, and grabs the
@@ -289,38 +375,31 @@ class EcsTask:
         return max(1, weight)
 
     def get_routes(self) -> List[RouteInfo]:
-        """Find all the route information."""
-        ret: List[RouteInfo] = []
-        for tag_name, tag_value in self.get_tags().items():
-            match = TAG__ROUTE_MATCHER.match(tag_name)
-            if match:
-                try:
-                    index = int(match.group(1))
-                except ValueError:  # pragma no cover
-                    # Because of the regular expression, this shouldn't happen...
-                    continue  # pragma no cover
-                container_port_str, host_port = self.get_route_container_host_port_for(index)
-                ret.append(RouteInfo(
-                    index, tag_value, container_port_str, host_port,
-                    self.get_route_weight(index),
-                ))
-        return ret
+        """Find all the route information.  This is parsed once and kept until the tags
+        are refreshed.  The parsed routes are shared with other tasks that have the same
+        route key; only the host ports are looked up for each task."""
+        if self._routes is None:
+            parsed_routes = ROUTE_CACHE.get(self._route_key)
+            if parsed_routes is None:
+                parsed_routes = []
+                for index, tag_value in self._route_tags:
+                    container_port_str, _ = self.get_route_container_host_port_for(index)
+                    parsed_routes.append(ParsedRoute(
+                        index, tag_value, container_port_str, self.get_route_weight(index),
+                    ))
+                ROUTE_CACHE[self._route_key] = parsed_routes
+            self._routes = [
+                RouteInfo.from_parsed(
+                    parsed,
+                    self.container_host_ports.get(parsed.container_port, DEFAULT_ROUTE_PORT),
+                )
+                for parsed in parsed_routes
+            ]
+        return self._routes
 
     def get_namespace_egress_ports(self) -> Iterable[Tuple[str, int]]:
         """Create the namespace:port list"""
-        ret: List[Tuple[str, int]] = []
-        for tag_name, tag_value in self.get_tags().items():
-            if TAG__NAMESPACE_PORT_MATCHER.match(tag_name):
-                parts = tag_value.split(':', 1)
-                if len(parts) != 2:
-                    continue
-                namespace, port_str = parts
-                try:
-                    port = int(port_str)
-                except ValueError:
-                    continue
-                ret.append((namespace, port))
-        return ret
+        return self._egress_ports
 
 
 def load_mesh_tasks(
@@ -604,6 +683,7 @@ def add_taskdef_tags(tasks: Iterable[EcsTask]) -> None:
             taskdef_envs[task.taskdef_arn] = envs
         task.taskdef_tags.update(taskdef_tags[task.taskdef_arn])
         task.taskdef_env.update(taskdef_envs[task.taskdef_arn])
+        task.refresh_tags()
 
 
 def load_taskdef_tags_env(
@@ -643,20 +723,18 @@ def set_aws_config(config: Dict[str, str]) -> None:
 
 def get_ecs_client() -> Any:
     """Get the boto3 ecs client."""
-    client_name = 'ecs'
-    if client_name not in CLIENTS:
-        session = get_session()
-        CLIENTS[client_name] = session.client(client_name, config=Config(
-            max_pool_connections=1,
-            retries=dict(max_attempts=2)
-        ))
-    return CLIENTS[client_name]
+    return get_client('ecs')
 
 
 def get_ec2_client() -> Any:
     """Get the boto3 ec2 client."""
-    client_name = 'ec2'
+    return get_client('ec2')
+
+
+def get_client(client_name: str) -> Any:
+    """Get the named boto3 client."""
     if client_name not in CLIENTS:
+        from botocore.config import Config  # type: ignore  # pylint: disable=C0415
         session = get_session()
         CLIENTS[client_name] = session.client(client_name, config=Config(
             max_pool_connections=1,
@@ -665,8 +743,9 @@ def get_ec2_client() -> Any:
     return CLIENTS[client_name]
 
 
-def get_session() -> boto3.session.Session:
+def get_session() -> Any:
     """Create the AWS session for ECS clients."""
+    import boto3.session  # pylint: disable=C0415
     region = CONFIG.get('AWS_REGION', None)
     profile = CONFIG.get('AWS_PROFILE', None)
     params: Dict[str, str] = {}
@@ -3,9 +3,23 @@
 Gets the current configuration for the full mesh.
 """
 
-from typing import Dict, List, Tuple, Set, Iterable, Any
+from typing import Dict, List, Tuple, Set, Iterable, Iterator, TextIO, Any
+import json
 from .config import Config
-from .ecs import load_mesh_tasks, EcsTask, RouteInfo
+from .ecs import load_mesh_tasks, EcsTask, RouteInfo, RouteKey, ROUTE_CACHE
+
+
+# Generated service-color routes, by the service-color's route key and the route indices
+# published on the port.  Service-colors running the same task definition revision with the
+# same container ports and route tags share these, whichever host ports their tasks are
+# published on.
+SERVICE_COLOR_ROUTES_CACHE: Dict[Tuple[RouteKey, Tuple[int, ...]], List[Dict[str, Any]]] = {}
+
+
+MESH_HEADER: Dict[str, Any] = {
+    'schema-version': 'v1',
+    'document-version': 'none',
+}
 
 
 def get_mesh(config: Config) -> Dict[str, Any]:
@@ -13,18 +27,42 @@ def get_mesh(config: Config) -> Dict[str, Any]:
     if config.test_mode:
         return {'mesh': True}
 
+    ret = dict(MESH_HEADER)
+    ret['namespaces'] = list(iter_namespace_configs(config))
+    return ret
+
+
+def write_mesh(config: Config, out: TextIO) -> None:
+    """Write the mesh JSON document to the stream.  Each namespace is written as soon as it
+    is created, so only one namespace configuration is in memory at a time."""
+    if config.test_mode:
+        json.dump(get_mesh(config), out)
+        return
+
+    out.write('{')
+    for key, value in MESH_HEADER.items():
+        out.write('{0}: {1}, '.format(json.dumps(key), json.dumps(value)))
+    out.write('"namespaces": [')
+    first = True
+    for namespace_config in iter_namespace_configs(config):
+        if not first:
+            out.write(', ')
+        first = False
+        json.dump(namespace_config, out)
+    out.write(']}')
+
+
+def iter_namespace_configs(config: Config) -> Iterator[Dict[str, Any]]:
+    """Load the mesh tasks, and create each namespace configuration in turn."""
+    # The caches only live for a single mesh load.
+    ROUTE_CACHE.clear()
+    SERVICE_COLOR_ROUTES_CACHE.clear()
+
     sorted_tasks = sort_tasks_by_namespace(load_mesh_tasks(
         config.clusters, config.required_tag_name, config.required_tag_value,
     ))
-
-    return {
-        'schema-version': 'v1',
-        'document-version': 'none',
-        'namespaces': [
-            create_namespace_config(namespace, tasks[0], tasks[1])
-            for namespace, tasks in sorted_tasks.items()
-        ],
-    }
+    for namespace, tasks in sorted_tasks.items():
+        yield create_namespace_config(namespace, tasks[0], tasks[1])
 
 
 def create_namespace_config(
@@ -70,23 +108,44 @@ def create_service_color_configs(service_color_tasks: List[EcsTask]) -> List[Dic
     and runtime modification to task tags will produce unexpected behavior.  Because of
     that, we don't need to perform tricky per-task filtering.  Instead, we'll scan the
     tasks in a service-color and use whatever we find first.
+
+    The ECS task listing order isn't stable, and the discovery map keeps the order of the
+    service-colors, so they are sorted by their service, color and port.
     """
 
     ret: List[Dict[str, Any]] = []
-    for service_color, tasks in sort_tasks_by_service_color(service_color_tasks).items():
+    for service_color, tasks in sorted(
+            sort_tasks_by_service_color(service_color_tasks).items(),
+    ):
         service, color = service_color
-        for port, routes in get_routes_by_port(tasks).items():
+        route_key = tasks[0].get_route_key()
+        namespace_egress = create_service_color_namespace_egress(tasks)
+        for port, routes in sorted(get_routes_by_port(tasks).items()):
             ret.append({
                 'service': service,
                 'color': color,
                 'index': port,
-                'routes': create_service_color_routes(routes),
+                'routes': get_service_color_routes(route_key, routes),
                 'instances': create_service_color_instances(tasks, port),
-                'namespace-egress': create_service_color_namespace_egress(tasks),
+                'namespace-egress': namespace_egress,
             })
     return ret
 
 
+def get_service_color_routes(
+        route_key: RouteKey, routes: List[RouteInfo],
+) -> List[Dict[str, Any]]:
+    """Get the routes for the service-color port, building them only if another
+    service-color with the same route key has not already done so.  The generated routes
+    don't depend on the port, only on which routes are published on it."""
+    cache_key = (route_key, tuple(route.index for route in routes),)
+    ret = SERVICE_COLOR_ROUTES_CACHE.get(cache_key)
+    if ret is None:
+        ret = create_service_color_routes(routes)
+        SERVICE_COLOR_ROUTES_CACHE[cache_key] = ret
+    return ret
+
+
 def create_service_color_routes(routes: List[RouteInfo]) -> List[Dict[str, Any]]:
     """Create the routes for the service-color"""
     ret: List[Dict[str, Any]] = []
@@ -4,7 +4,6 @@ Main program.
 """
 
 from typing import List
-import json
 from . import get_mesh
 from .config import create_configuration
 
@@ -39,9 +38,7 @@ def main(argv: List[str]) -> int:
         print('[dm-aws-ecs-tags] No --action-file given')
         return 2
 
-    data = get_mesh.get_mesh(config)
-
     with open(output_file, 'w') as f:
-        json.dump(data, f)
+        get_mesh.write_mesh(config, f)
 
     return 0
@@ -1,14 +1,16 @@
 
 """Tests for the ecs module."""
 
+# pylint: disable=C0302
+
 from typing import List, Sequence, Dict, Optional, Any
 import unittest
 import datetime
 import boto3
 import botocore.stub  # type: ignore
 import botocore.exceptions  # type: ignore
+from nightjar_common import log
 from .. import ecs
-from .. import warn
 
 
 class EcsTaskTest(unittest.TestCase):
@@ -46,6 +48,95 @@ class EcsTaskTest(unittest.TestCase):
         self.assertEqual(('0', 1), task_full.get_route_container_host_port_for(1))
         self.assertEqual(('0', 1), task_empty.get_route_container_host_port_for(1))
 
+    def test_tag_precedence_empty_values(self) -> None:
+        """Test that empty tag values fall through to the lower precedence source."""
+        task = ecs.EcsTask(
+            task_name='t1', task_arn='a1', taskdef_arn='ta', container_instance_arn='',
+            host_ipv4='', container_host_ports={},
+            task_tags={'NJ_NAMESPACE': '', 'NJ_SERVICE': ''},
+            task_env={'NJ_COLOR': 'c1'},
+            taskdef_tags={'NJ_COLOR': ''},
+            taskdef_env={'NJ_NAMESPACE': 'n2'},
+        )
+        self.assertEqual('n2', task.get_namespace_tag())
+        self.assertIsNone(task.get_service_tag())
+        self.assertEqual('x', task.get_tag_with('NJ_SERVICE', 'x'))
+        self.assertEqual('c1', task.get_color_tag())
+
+    def test_refresh_tags(self) -> None:
+        """Test that the tag view, routes, and egress ports update after refresh_tags."""
+        task = ecs.EcsTask(
+            task_name='t1', task_arn='a1', taskdef_arn='ta', container_instance_arn='',
+            host_ipv4='', container_host_ports={'8080': 2021},
+            task_tags={'NJ_ROUTE_1': '/a'}, task_env={}, taskdef_tags={}, taskdef_env={},
+        )
+        routes = task.get_routes()
+        self.assertEqual(['/a'], [route.data for route in routes])
+        # The parsed routes are kept between calls.
+        self.assertIs(routes, task.get_routes())
+        self.assertEqual([], list(task.get_namespace_egress_ports()))
+
+        task.taskdef_tags.update({
+            'NJ_ROUTE_2': '/b',
+            'NJ_NAMESPACE': 'n1',
+            'NJ_NAMESPACE_PORT_1': 'n2:9000',
+            'NJ_NAMESPACE_PORT_2': 'n3',
+            'NJ_NAMESPACE_PORT_3': 'n4:x',
+        })
+        # Not seen until the tags are refreshed.
+        self.assertIsNone(task.get_namespace_tag())
+        task.refresh_tags()
+        self.assertEqual('n1', task.get_namespace_tag())
+        # The routes are in their index order.
+        self.assertEqual(
+            ['/a', '/b'],
+            [route.data for route in task.get_routes()],
+        )
+        self.assertEqual([('n2', 9000)], list(task.get_namespace_egress_ports()))
+
+    def test_route_key(self) -> None:
+        """Test that routes are only shared between tasks with the same route key."""
+        tasks = [
+            ecs.EcsTask(
+                task_name='t1', task_arn='a1', taskdef_arn='ta', container_instance_arn='',
+                host_ipv4='', container_host_ports={'8080': host_port},
+                task_tags=task_tags, task_env={}, taskdef_tags={},
+                taskdef_env={'NJ_ROUTE_1': '{"x": 1}', 'NJ_NAMESPACE': 'n1'},
+            )
+            for task_tags, host_port in (
+                ({'NJ_SERVICE': 's1'}, 2021),
+                ({'NJ_SERVICE': 's2'}, 2022),
+                ({'NJ_ROUTE_WEIGHT_1': '2'}, 2021),
+            )
+        ]
+        self.assertEqual(tasks[0].get_route_key(), tasks[1].get_route_key())
+        self.assertNotEqual(tasks[0].get_route_key(), tasks[2].get_route_key())
+        self.assertEqual([2021, 2022], [task.get_routes()[0].host_port for task in tasks[:2]])
+        self.assertIs(tasks[0].get_routes()[0].data, tasks[1].get_routes()[0].data)
+        self.assertEqual(1, tasks[0].get_routes()[0].weight)
+        self.assertEqual(2, tasks[2].get_routes()[0].weight)
+
+    def test_route_key__container_ports(self) -> None:
+        """Test that a route without a port tag, which uses the first container port,
+        isn't shared with tasks that have other container ports."""
+        tasks = [
+            ecs.EcsTask(
+                task_name='t1', task_arn='a1', taskdef_arn='ta', container_instance_arn='',
+                host_ipv4='', container_host_ports=container_host_ports,
+                task_tags={}, task_env={}, taskdef_tags={},
+                taskdef_env={'NJ_ROUTE_1': '/a', 'NJ_NAMESPACE': 'n1'},
+            )
+            for container_host_ports in ({}, {'8080': 2021})
+        ]
+        self.assertNotEqual(tasks[0].get_route_key(), tasks[1].get_route_key())
+        self.assertEqual(
+            [('0', 1), ('8080', 2021)],
+            [
+                (task.get_routes()[0].container_port, task.get_routes()[0].host_port)
+                for task in tasks
+            ],
+        )
+
     def test_bad_data_format(self) -> None:
         """Test the route data with incorrect json data"""
         info = ecs.RouteInfo(1, '{[', '12', 21, 2)
@@ -147,9 +238,15 @@ class EcsTest(unittest.TestCase):
 
     def setUp(self) -> None:
         self._orig_config = ecs.CONFIG
-        warn.DEBUG = True
+        self._orig_debug = log.DEBUG_ON
+        log.DEBUG_ON = True
+        # The debug messages go to a buffer of their own, which is dropped after the test.
+        self._orig_buffer = log.BUFFER
+        log.BUFFER = log.LogBuffer(log.BUFFER_SIZE)
 
     def tearDown(self) -> None:
+        log.DEBUG_ON = self._orig_debug
+        log.BUFFER = self._orig_buffer
         ecs.CONFIG.clear()
         ecs.CONFIG.update(self._orig_config)
 
@@ -453,6 +550,9 @@ class EcsTest(unittest.TestCase):
         self.assertEqual(tasks[0].get_tags(), {'k': 'v', 'k1': 'v1'})
         self.assertEqual(tasks[1].get_tags(), {'k': 'v', 'k1': 'other'})
         self.assertEqual(tasks[2].get_tags(), {'k2': 'v2', 'k3': 'v3'})
+        self.assertEqual('v1', tasks[0].get_tag('k1'))
+        self.assertEqual('other', tasks[1].get_tag('k1'))
+        self.assertEqual('v3', tasks[2].get_tag('k3'))
 
     def test_load_taskdef_tags(self) -> None:
         """Test the load_taskdef_tags method"""
@@ -1,11 +1,15 @@
 
 """Test the get_mesh module"""
 
+from typing import Iterable, List, Optional
 import unittest
+import io
+import json
+from nightjar_common.extension_point.discovery_map_fingerprint import get_fingerprint
 from .. import get_mesh
-# from ..config import Config
+from ..config import Config
 from ..ecs import (
-    EcsTask, RouteInfo,
+    EcsTask, RouteInfo, ROUTE_CACHE,
     TAG__NAMESPACE,
     TAG__MODE,
     TAG__SERVICE,
@@ -18,6 +22,59 @@ from ..ecs import (
 class GetMeshTest(unittest.TestCase):  # pylint: disable=R0904
     """Test functions in get_mesh."""
 
+    def setUp(self) -> None:
+        self._orig_load_mesh_tasks = get_mesh.load_mesh_tasks
+
+    def tearDown(self) -> None:
+        get_mesh.load_mesh_tasks = self._orig_load_mesh_tasks  # type: ignore
+
+    def test_write_mesh__test_mode(self) -> None:
+        """Test write_mesh in test mode."""
+        config = Config({})
+        config.test_mode = True
+        out = io.StringIO()
+        get_mesh.write_mesh(config, out)
+        self.assertEqual({'mesh': True}, json.loads(out.getvalue()))
+
+    def test_write_mesh__no_namespaces(self) -> None:
+        """Test write_mesh with no tasks."""
+        self._set_mesh_tasks([])
+        out = io.StringIO()
+        get_mesh.write_mesh(Config({}), out)
+        self.assertEqual({
+            'schema-version': 'v1',
+            'document-version': 'none',
+            'namespaces': [],
+        }, json.loads(out.getvalue()))
+
+    def test_write_mesh__many_namespaces(self) -> None:
+        """Test write_mesh with several namespaces matches get_mesh."""
+        self._set_mesh_tasks([
+            EcsTask(
+                't1', 'ta1', 'td1', 'cia1', '1.2.3.4',
+                {'20': 21}, {}, {}, {'NJ_ROUTE_1': '/p1'},
+                {TAG__NAMESPACE: 'n1', TAG__MODE: 'SERVICE', TAG__SERVICE: 's', TAG__COLOR: 'c'},
+            ),
+            EcsTask(
+                't2', 'ta2', 'td2', 'cia1', '1.2.3.5',
+                {'20': 22}, {}, {}, {},
+                {TAG__NAMESPACE: 'n2', TAG__MODE: 'GATEWAY'},
+            ),
+        ])
+        out = io.StringIO()
+        get_mesh.write_mesh(Config({}), out)
+        res = json.loads(out.getvalue())
+        self.assertEqual(get_mesh.get_mesh(Config({})), res)
+        self.assertEqual(['n1', 'n2'], [ns['namespace'] for ns in res['namespaces']])
+
+    def _set_mesh_tasks(self, tasks: Iterable[EcsTask]) -> None:
+        def load_mesh_tasks(
+                _clusters: Iterable[str], _tag_name: Optional[str], _tag_value: Optional[str],
+        ) -> Iterable[EcsTask]:
+            return tasks
+
+        get_mesh.load_mesh_tasks = load_mesh_tasks  # type: ignore
+
     def test_create_namespace_config__none(self) -> None:
         """Test create_namespace_config with no values"""
         res = get_mesh.create_namespace_config('n1', [], [])
@@ -89,6 +146,78 @@ class GetMeshTest(unittest.TestCase):  # pylint: disable=R0904
             }],
         }], res)
 
+    def test_create_service_color_configs__shared_routes(self) -> None:
+        """Test create_service_color_configs with two service-colors from the same
+        task definition on different host ports, which share their generated routes."""
+        get_mesh.SERVICE_COLOR_ROUTES_CACHE.clear()
+        task_1 = EcsTask(
+            't1', 'ta1', 'td-shared', 'cia1', '1.2.3.4',
+            {'20': 21}, {}, {},
+            {TAG__NAMESPACE: 'n1', TAG__MODE: 'SERVICE', TAG__SERVICE: 's', TAG__COLOR: 'c1'},
+            {'NJ_ROUTE_1': '{"path-match": {"match-type": "exact", "value": "/p1"}}'},
+        )
+        task_2 = EcsTask(
+            't2', 'ta2', 'td-shared', 'cia1', '1.2.3.5',
+            {'20': 31}, {}, {},
+            {TAG__NAMESPACE: 'n1', TAG__MODE: 'SERVICE', TAG__SERVICE: 's', TAG__COLOR: 'c2'},
+            {'NJ_ROUTE_1': '{"path-match": {"match-type": "exact", "value": "/p1"}}'},
+        )
+        self.assertEqual(task_1.get_route_key(), task_2.get_route_key())
+        res = get_mesh.create_service_color_configs([task_1, task_2])
+        self.assertEqual(2, len(res))
+        self.assertEqual(
+            [{'path-match': {'match-type': 'exact', 'value': '/p1'}}],
+            res[0]['routes'],
+        )
+        self.assertIs(res[0]['routes'], res[1]['routes'])
+        self.assertEqual(1, len(get_mesh.SERVICE_COLOR_ROUTES_CACHE))
+        self.assertEqual([21, 31], [sc['index'] for sc in res])
+        self.assertEqual([{'ipv4': '1.2.3.5', 'port': 31}], res[1]['instances'])
+
+    def test_create_service_color_configs__task_order(self) -> None:
+        """Test create_service_color_configs with the tasks and their route tags listed in
+        different orders, which generate the same service-colors in the same order."""
+
+        def mk_tasks(reverse: bool) -> List[EcsTask]:
+            ret: List[EcsTask] = []
+            for service in ('s2', 's1'):
+                for host_ip in ('1.2.3.4', '1.2.3.5'):
+                    routes = [
+                        ('NJ_ROUTE_1', '/a'),
+                        (TAG__ROUTE_PORT_INDEX_PREFIX + '1', '20'),
+                        ('NJ_ROUTE_2', '/b/'),
+                        (TAG__ROUTE_PORT_INDEX_PREFIX + '2', '30'),
+                        ('NJ_ROUTE_3', '/c/'),
+                    ]
+                    ret.append(EcsTask(
+                        't-' + service + host_ip, 'ta1', 'td-' + service, 'cia1', host_ip,
+                        {'20': 21, '30': 31}, {}, {},
+                        dict(reversed(routes) if reverse else routes),
+                        {
+                            TAG__NAMESPACE: 'n1', TAG__MODE: 'SERVICE',
+                            TAG__SERVICE: service, TAG__COLOR: 'c',
+                        },
+                    ))
+            return list(reversed(ret)) if reverse else ret
+
+        configs = []
+        for reverse in (False, True):
+            ROUTE_CACHE.clear()
+            get_mesh.SERVICE_COLOR_ROUTES_CACHE.clear()
+            configs.append(get_mesh.create_service_color_configs(mk_tasks(reverse)))
+        self.assertEqual(
+            [('s1', 21), ('s1', 31), ('s2', 21), ('s2', 31)],
+            [(sc['service'], sc['index']) for sc in configs[0]],
+        )
+        self.assertEqual(
+            ['/a', '/a/', '/c/'],
+            [route['path-match']['value'] for route in configs[0][0]['routes']],
+        )
+        self.assertEqual(
+            get_fingerprint({'namespaces': [{'service-colors': configs[0]}]}),
+            get_fingerprint({'namespaces': [{'service-colors': configs[1]}]}),
+        )
+
     def test_create_service_color_routes__none(self) -> None:
         """Test create_service_color_routes with no values"""
         res = get_mesh.create_service_color_routes([])
@@ -3,6 +3,8 @@
 
 import unittest
 import os
+import subprocess
+import sys
 import tempfile
 import shutil
 import json
@@ -47,3 +49,17 @@ class MainTest(unittest.TestCase):
         self.assertTrue(os.path.isfile(os.path.join(self._temp_dir, 'mesh.json')))
         with open(os.path.join(self._temp_dir, 'mesh.json'), 'r') as f:
             self.assertEqual({'mesh': True}, json.load(f))
+
+    def test_main_import__no_boto3(self) -> None:
+        """Importing the main module must not import boto3, which is only imported on the
+        first AWS call, to keep the start up time of each run short."""
+        res = subprocess.run(
+            [
+                sys.executable, '-c',
+                'import sys, nightjar_dm_aws_ecs_tags.main; '
+                'print(\'boto3\' in sys.modules, \'botocore\' in sys.modules)',
+            ],
+            env={'PYTHONPATH': os.pathsep.join(sys.path)},
+            stdout=subprocess.PIPE, check=True,
+        )
+        self.assertEqual('False False', res.stdout.decode('utf-8').strip())
@@ -1,11 +1,7 @@
-
 """Produce warning and error messages."""
 
 from typing import Any
-import os
-import sys
-
-DEBUG = os.environ.get('DEBUG', 'false') == 'true'
+from nightjar_common import log as common_log
 
 
 def warning(source: str, message: str, **kwargs: Any) -> None:
@@ -15,14 +11,10 @@ def warning(source: str, message: str, **kwargs: Any) -> None:
 
 def log(level: str, source: str, message: str, **kwargs: Any) -> None:
     """Produce a log message."""
-    sys.stderr.write(
-        '[nightjar_dm_aws_ecs_tags: {0}] {1}: {2}\n'.format(
-            level, source, message.format(**kwargs),
-        )
-    )
+    common_log.log(level, '{source}: ' + message, source=source, **kwargs)
 
 
 def debug(source: str, message: str, **kwargs: Any) -> None:
     """Print a debug message"""
-    if DEBUG:
+    if common_log.DEBUG_ON:
         log('DEBUG', source, message, **kwargs)
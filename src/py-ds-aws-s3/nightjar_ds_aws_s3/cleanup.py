@@ -0,0 +1,94 @@
+"""Removes the old document versions from the S3 backend."""
+
+from typing import Dict, Tuple, Iterable, List, Optional
+import datetime
+from .config import Config
+from .commit import get_latest_pointer_version
+from .util import is_data_file, is_meta_file, get_version_from_data_key_name, log
+from . import s3
+
+
+OLD_FILE_TIME_DAYS = 1
+OLD_FILE_TIME = datetime.timedelta(days=OLD_FILE_TIME_DAYS)
+
+# The most keys removed in one run; a single S3 delete request.  A larger backlog is
+# spread across several runs.
+MAX_DELETE_KEY_COUNT = 1000
+
+
+def collect_garbage(config: Config, document: str) -> int:
+    """Remove the old versions of the document.
+
+    This is a maintenance action, separate from the commit, so that committing only
+    needs to write the new files.  It keeps the newest `historical_preserve_count`
+    versions, any version younger than `historical_preserve_seconds`, and the version
+    named by the latest pointer.
+    """
+    if config.is_test_mode:
+        return 15
+
+    keep_version = get_latest_pointer_version(config, document)
+    old_keys = filter_old_document_entries(
+        s3.list_entries(config, s3.get_document_s3_path(config, document)),
+        config.historical_preserve_count,
+        config.historical_preserve_seconds,
+        keep_version,
+    )
+    if len(old_keys) > MAX_DELETE_KEY_COUNT:
+        log(
+            'INFO',
+            "Removing {count} of {total} old keys for {doc}; the rest wait for the next run.",
+            count=MAX_DELETE_KEY_COUNT, total=len(old_keys), doc=document,
+        )
+        old_keys = old_keys[:MAX_DELETE_KEY_COUNT]
+    s3.delete(config, old_keys)
+    return 0
+
+
+def filter_old_document_entries(
+        entries: Iterable[Tuple[str, datetime.datetime]],
+        preserve_count: int,
+        preserve_seconds: float,
+        keep_version: Optional[str],
+) -> List[str]:
+    """Select the old S3 keys that can be removed, oldest first."""
+    # Note that we're comparing S3 files against the UTC time, because we need the timezone
+    # component for correct comparison.
+    now = datetime.datetime.now(datetime.timezone.utc)
+    preserve_time = datetime.timedelta(seconds=preserve_seconds)
+
+    groups: Dict[str, List[str]] = {}
+    by_time: Dict[str, datetime.datetime] = {}
+    for key, when in entries:
+        if not is_data_file(key) and not is_meta_file(key):
+            # Not a file we're interested in.  Skip it.
+            continue
+        version = get_version_from_data_key_name(key)
+        if version not in groups:
+            groups[version] = []
+        groups[version].append(key)
+        by_time[key] = when
+
+    # Now that we have the data split up, we'll analyze it.
+    ret: List[Tuple[datetime.datetime, str]] = []
+    pairs: List[Tuple[datetime.datetime, List[str]]] = []
+    for version, paths in groups.items():
+        when = max(by_time[key] for key in paths)
+        if version == keep_version:
+            continue
+        if len(paths) >= 2:
+            pairs.append((when, paths))
+        elif is_meta_file(paths[0]) or now - when > OLD_FILE_TIME:
+            # We have a dangler.  A meta file is written after its data file, so it is
+            # outright removed.  A data file may still have its meta file on the way,
+            # unless it is "old".
+            ret.append((when, paths[0]))
+
+    # The newest pairs are preserved.
+    pairs.sort(key=lambda pair: pair[0], reverse=True)
+    for when, paths in pairs[preserve_count:]:
+        if now - when > preserve_time:
+            ret.extend((when, key) for key in sorted(paths))
+
+    ret.sort(key=lambda item: item[0])
+    return [key for _, key in ret]
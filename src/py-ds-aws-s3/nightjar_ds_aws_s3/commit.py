@@ -1,19 +1,19 @@
 
 """Commits files to the S3 backend."""
 
-from typing import Dict, Tuple, Sequence, List, Union, Any
+from typing import Dict, Tuple, Union, Optional, Any
 import json
+import gzip
 import hashlib
 import uuid
 import datetime
-from .config import Config
-from .util import is_data_file, is_meta_file, get_version_from_data_key_name
+from .config import Config, GZIP_CONTENT_ENCODING
+from .fetch import find_latest_data_version, get_data_meta_entries
+from .util import log
 from . import s3
 
 
 DOCUMENT_VERSION_KEY = 'document-version'
-OLD_FILE_TIME_DAYS = 1
-OLD_FILE_TIME = datetime.timedelta(days=OLD_FILE_TIME_DAYS)
 
 
 def commit(config: Config, document: str, src_file: str) -> int:
@@ -22,42 +22,131 @@ def commit(config: Config, document: str, src_file: str) -> int:
     Committing files is a multi-step process.
 
     1. The document source is prepared for commit.
-    2. An inventory is taken of all existing versions of the document and their metadata files.
-      Only files that are pairs are considered.
-    3. The new files are written to S3 (document, then metadata).
-    4. The old file pairs are removed, singleton metadata files are removed
-        outright (there should be a document then metadata).  Document files that have an "old"
-        date are removed.
+    2. If the latest version has the same contents, as recorded in its metadata, then
+        there is nothing to commit.  The latest version is found with the latest
+        pointer file, or by listing the entries if there isn't one.
+    3. The new files are written to S3 (document, then metadata), followed by the
+        latest pointer file, which names the new version.
+
+    The old versions are left in place; the "gc" action removes them.
     """
     if config.is_test_mode:
         return 12
 
     # Prepare for commit
-    info = load_document_information(document, src_file)
+    info = prepare_document(config, document, src_file)
     if isinstance(info, int):
         return info
-    version, metadata, data = info
-    metadata_bytes = json_binary_dump(metadata)
-    data_bytes = json_binary_dump(data)
+    version, metadata, data_bytes = info
 
-    # Get original keys
-    original_entries = list(s3.list_entries(config, s3.get_document_s3_path(config, document)))
+    if is_unchanged(config, document, metadata):
+        log('INFO', "Contents of {doc} did not change; not committing.", doc=document)
+        return 0
 
     # Upload document then metadata
-    res = s3.upload(config, s3.get_version_file_s3_key(config, document, version), data_bytes)
+    data_key = s3.get_version_file_s3_key(config, document, version)
+    res = upload_version(config, document, version, data_bytes, metadata)
     if res != 0:
         return res
-    res = s3.upload(config, s3.get_meta_file_s3_key(config, document, version), metadata_bytes)
+
+    # Then point readers to the new version.
+    pointer_key = s3.get_latest_pointer_s3_key(config, document)
+    res = s3.upload(config, pointer_key, json_binary_dump(
+        create_latest_pointer(version, data_key),
+    ))
     if res != 0:
-        # This isn't a good state.  It will hopefully be cleaned up later.
+        # The old pointer must not outlive its version, so remove it; readers fall back
+        # to listing the entries.
+        s3.delete(config, [pointer_key])
         return res
 
-    # Remove old keys
-    s3.delete(config, filter_old_document_entries(original_entries))
-
     return 0
 
 
+def upload_version(
+        config: Config, document: str, version: str,
+        data_bytes: bytes, metadata: Dict[str, Any],
+) -> int:
+    """Upload the document version's data, then its metadata."""
+    res = s3.upload(
+        config, s3.get_version_file_s3_key(config, document, version), data_bytes,
+        metadata.get('content-encoding', ''),
+    )
+    if res != 0:
+        return res
+    # If this fails, then it isn't a good state.  It will hopefully be cleaned up later.
+    return s3.upload(
+        config, s3.get_meta_file_s3_key(config, document, version), json_binary_dump(metadata),
+    )
+
+
+def is_unchanged(config: Config, document: str, metadata: Dict[str, Any]) -> bool:
+    """Does the latest version already have the same contents as the new metadata?  The
+    entries are only listed if there is no latest pointer."""
+    latest_version = get_latest_pointer_version(config, document)
+    if latest_version is None:
+        _, latest_version = find_latest_data_version(*get_data_meta_entries(
+            s3.list_entries(config, s3.get_document_s3_path(config, document)),
+        ))
+    return bool(latest_version) and is_same_contents(
+        config, document, latest_version, metadata,
+    )
+
+
+def get_latest_pointer_version(config: Config, document: str) -> Optional[str]:
+    """Get the version named by the document's latest pointer file, if there is one."""
+    res = s3.download_if_changed(config, s3.get_latest_pointer_s3_key(config, document), '')
+    if not isinstance(res, tuple):
+        return None
+    pointer = load_json_bytes(res[0])
+    version = pointer.get('document-version') if pointer else None
+    return version if isinstance(version, str) else None
+
+
+def is_same_contents(
+        config: Config, document: str, version: str, metadata: Dict[str, Any],
+) -> bool:
+    """Does the metadata of the existing version describe the same contents, stored with
+    the same content encoding, as the new metadata?"""
+    res = s3.download_if_changed(config, s3.get_meta_file_s3_key(config, document, version), '')
+    if not isinstance(res, tuple):
+        return False
+    existing = load_json_bytes(res[0])
+    return existing is not None and all(
+        existing.get(key) == metadata[key]
+        for key in ('bare-contents-md5', 'bare-contents-size')
+    ) and existing.get('content-encoding', '') == metadata.get('content-encoding', '')
+
+
+def load_json_bytes(contents: bytes) -> Optional[Dict[str, Any]]:
+    """Load the JSON dictionary from the downloaded contents, or None if it isn't one."""
+    try:
+        ret = json.loads(contents.decode('utf-8'))
+    except ValueError:
+        return None
+    return ret if isinstance(ret, dict) else None
+
+
+def prepare_document(
+        config: Config, document: str, src_file: str,
+) -> Union[int, Tuple[str, Dict[str, Any], bytes]]:
+    """Load the document and its metadata, and encode the document contents for upload."""
+    info = load_document_information(document, src_file)
+    if isinstance(info, int):
+        return info
+    version, metadata, data = info
+    data_bytes = json_binary_dump(data)
+    if config.content_encoding == GZIP_CONTENT_ENCODING:
+        data_bytes = gzip.compress(data_bytes)
+        metadata['content-encoding'] = config.content_encoding
+    if len(data_bytes) > config.max_document_bytes:
+        print("[nightjar-ds-aws-s3] Document too large to store: {0} bytes".format(
+            len(data_bytes),
+        ))
+        return 1
+    return version, metadata, data_bytes
+
+
 def load_document_information(
         document: str, src_file: str,
 ) -> Union[int, Tuple[str, Dict[str, Any], Dict[str, Any]]]:
@@ -71,6 +160,14 @@ def load_document_information(
         return 1
 
 
+def create_latest_pointer(version: str, data_key: str) -> Dict[str, Any]:
+    """Create the contents of the latest pointer file."""
+    return {
+        'document-version': version,
+        'data-key': data_key,
+    }
+
+
 def create_document_metadata(
         document_name: str, data: Dict[str, Any],
 ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
@@ -104,44 +201,6 @@ def create_document_metadata(
     }, data
 
 
-def filter_old_document_entries(entries: Sequence[Tuple[str, datetime.datetime]]) -> List[str]:
-    """Select the old S3 keys that will need to be removed after the commit completes."""
-    # Note that we're comparing S3 files against the UTC time, because we need the timezone
-    # component for correct comparison.
-    now = datetime.datetime.now(datetime.timezone.utc)
-
-    groups: Dict[str, List[str]] = {}
-    by_time: Dict[str, datetime.datetime] = {}
-    for key, when in entries:
-        if not is_data_file(key) and not is_meta_file(key):
-            # Not a file we're interested in.  Skip it.
-            continue
-        version = get_version_from_data_key_name(key)
-        if version not in groups:
-            groups[version] = []
-        groups[version].append(key)
-        by_time[key] = when
-
-    # Now that we have the data split up, we'll analyze it.
-    ret: List[str] = []
-    for paths in groups.values():
-        if len(paths) >= 2:
-            # There's enough here to remove them.
-            ret.extend(paths)
-        elif paths:
-            # We have a dangler.
-            key = paths[0]
-            # If it's a meta file, then outright remove it.
-            if is_meta_file(key):
-                ret.append(key)
-            else:
-                # If the file is "old", then remove it.
-                when = by_time[key]
-                if now - when > OLD_FILE_TIME:
-                    ret.append(key)
-    return ret
-
-
 def json_binary_dump(doc: Dict[str, Any]) -> bytes:
     """Dump the document as a JSON format, encoded in UTF-8."""
     return json.dumps(doc).encode('utf-8', 'replace')
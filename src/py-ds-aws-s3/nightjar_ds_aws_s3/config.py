@@ -6,8 +6,9 @@ S3 Configuration Parameters
 # This file must be clean of any boto3 or boto imports.  Likewise, it
 # can't import anything that in turn imports those.
 
-from typing import List, Dict
+from typing import List, Dict, Any
 import os
+from nightjar_common import log
 
 
 ENV__BUCKET = 'NJ_DSS3_BUCKET'
@@ -22,6 +23,24 @@ MIN_HISTORICAL_PRESERVE_HOURS = 2
 ENV__MAX_DOCUMENT_SIZE_MB = 'NJ_DSS3_MAX_DOCUMENT_SIZE_MB'
 DEFAULT_MAX_DOCUMENT_SIZE_MB = 4
 MIN_DOCUMENT_SIZE_MB = 2
+ENV__CONTENT_ENCODING = 'NJ_DSS3_CONTENT_ENCODING'
+IDENTITY_CONTENT_ENCODING = 'identity'
+GZIP_CONTENT_ENCODING = 'gzip'
+SUPPORTED_CONTENT_ENCODINGS = (IDENTITY_CONTENT_ENCODING, GZIP_CONTENT_ENCODING,)
+DEFAULT_CONTENT_ENCODING = IDENTITY_CONTENT_ENCODING
+ENV__MAX_POOL_CONNECTIONS = 'NJ_DSS3_MAX_POOL_CONNECTIONS'
+DEFAULT_MAX_POOL_CONNECTIONS = 4
+ENV__MAX_ATTEMPTS = 'NJ_DSS3_MAX_ATTEMPTS'
+DEFAULT_MAX_ATTEMPTS = 2
+ENV__RETRY_MODE = 'NJ_DSS3_RETRY_MODE'
+SUPPORTED_RETRY_MODES = ('legacy', 'standard', 'adaptive',)
+DEFAULT_RETRY_MODE = 'adaptive'
+ENV__MULTIPART_THRESHOLD_MB = 'NJ_DSS3_MULTIPART_THRESHOLD_MB'
+DEFAULT_MULTIPART_THRESHOLD_MB = 8
+# S3 does not allow multipart upload parts smaller than this.
+MIN_MULTIPART_THRESHOLD_MB = 5
+ENV__MAX_CONCURRENCY = 'NJ_DSS3_MAX_CONCURRENCY'
+DEFAULT_MAX_CONCURRENCY = 1
 
 _HOURS_TO_SECONDS = 60.0 * 60.0
 _MB_TO_BYTES = 1024 * 1024
@@ -30,8 +49,8 @@ _MB_TO_BYTES = 1024 * 1024
 class Config:
     """Configuration for the S3 backend"""
     __slots__ = (
-        'bucket', 'base_path', 'aws_config',
-        'max_document_bytes',
+        'bucket', 'base_path', 'aws_config', 'client_settings',
+        'max_document_bytes', 'content_encoding',
         'historical_preserve_count', 'historical_preserve_seconds',
         'is_test_mode',
     )
@@ -40,7 +59,9 @@ class Config:
         self.bucket = get_s3_bucket(env)
         self.base_path = get_base_path(env)
         self.aws_config = get_aws_config(env)
+        self.client_settings = get_client_settings(env)
         self.max_document_bytes = get_max_document_bytes(env)
+        self.content_encoding = get_content_encoding(env)
         self.historical_preserve_count = get_historical_preserve_count(env)
         self.historical_preserve_seconds = get_historical_preserve_seconds(env)
         self.is_test_mode = get_test_mode_enabled(env)
@@ -81,13 +102,8 @@ class Config:
 
 def create_configuration() -> Config:
     """Create and populate the configuration object."""
-    ret = Config(dict(os.environ))
-
-    # This avoids a circular import, and note that this should only be called once.
-    from .s3 import set_aws_config  # pylint: disable=C0415
-
-    set_aws_config(ret.aws_config)
-    return ret
+    log.EXECUTE_MODEL = 'nightjar-ds_aws_s3'
+    return Config(dict(os.environ))
 
 
 def get_s3_bucket(env: Dict[str, str]) -> str:
@@ -111,6 +127,14 @@ def get_max_document_bytes(env: Dict[str, str]) -> int:
     return max(mb_count, MIN_DOCUMENT_SIZE_MB) * _MB_TO_BYTES
 
 
+def get_content_encoding(env: Dict[str, str]) -> str:
+    """Get the encoding used to compress committed documents."""
+    ret = env.get(ENV__CONTENT_ENCODING, DEFAULT_CONTENT_ENCODING).strip().lower()
+    if ret not in SUPPORTED_CONTENT_ENCODINGS:
+        return DEFAULT_CONTENT_ENCODING
+    return ret
+
+
 def get_historical_preserve_count(env: Dict[str, str]) -> int:
     """Get the number of old versions to keep around."""
     try:
@@ -134,6 +158,35 @@ def get_historical_preserve_seconds(env: Dict[str, str]) -> float:
     return max(MIN_HISTORICAL_PRESERVE_HOURS, preserve_hours) * _HOURS_TO_SECONDS
 
 
+def get_client_settings(env: Dict[str, str]) -> Dict[str, Any]:
+    """Get the S3 client connection and transfer settings."""
+    retry_mode = env.get(ENV__RETRY_MODE, DEFAULT_RETRY_MODE).strip().lower()
+    if retry_mode not in SUPPORTED_RETRY_MODES:
+        retry_mode = DEFAULT_RETRY_MODE
+    return {
+        'max_pool_connections': get_env_int(
+            env, ENV__MAX_POOL_CONNECTIONS, DEFAULT_MAX_POOL_CONNECTIONS, 1,
+        ),
+        # As with botocore, this is the number of retries after the first attempt.
+        'max_attempts': get_env_int(env, ENV__MAX_ATTEMPTS, DEFAULT_MAX_ATTEMPTS, 0),
+        'retry_mode': retry_mode,
+        'multipart_threshold': get_env_int(
+            env, ENV__MULTIPART_THRESHOLD_MB, DEFAULT_MULTIPART_THRESHOLD_MB,
+            MIN_MULTIPART_THRESHOLD_MB,
+        ) * _MB_TO_BYTES,
+        'max_concurrency': get_env_int(env, ENV__MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY, 1),
+    }
+
+
+def get_env_int(env: Dict[str, str], key: str, default: int, minimum: int) -> int:
+    """Get an integer environment value, no smaller than the minimum."""
+    try:
+        value = int(env.get(key, str(default)))
+    except ValueError:
+        value = default
+    return max(minimum, value)
+
+
 def get_aws_config(env: Dict[str, str]) -> Dict[str, str]:
     """Create the AWS config."""
     ret: Dict[str, str] = {}
@@ -1,11 +1,15 @@
 
 """Fetch files from the S3 backend."""
 
-from typing import Dict, Set, Tuple, Iterable, Union, Optional
+from typing import Dict, Set, Tuple, Iterable, Union, Optional, Any
 import datetime
+import json
+import os
 from . import s3
 from .config import Config
-from .util import get_version_from_data_key_name, is_data_file, is_meta_file
+from .util import get_version_from_data_key_name, is_data_file, is_meta_file, log
+
+FETCH_STATE_FILE_SUFFIX = '.s3-state'
 
 
 def fetch(config: Config, document: str, output_file: str, previous_version: str) -> int:
@@ -14,31 +18,105 @@ def fetch(config: Config, document: str, output_file: str, previous_version: str
     Because of the multi-stage method for getting the file, the fetch may
     require a retry.
 
-    1. Pull a list of the entries from S3.
-    2. From the pulled list, find the .data entry that has the most recent
+    1. Download the latest pointer file, if it changed since the last fetch into
+        the same output file.  If it names a .data entry, then use that.
+    2. Otherwise, pull a list of the entries from S3.
+    3. From the pulled list, find the .data entry that has the most recent
         commit date.  If there isn't one, need a retry.
-    3. From the pulled list, find the .meta entry that matches the .data
+    4. From the pulled list, find the .meta entry that matches the .data
         entry.  If there isn't one, need a retry.
-    4. Download the .data file.  If it doesn't exist, need a retry.
+    5. Download the .data file.  If it doesn't exist, need a retry.  If the
+        .data entry came from a stale pointer, then list the entries instead.
     """
     if config.is_test_mode:
         return 13
 
-    res = find_top_data_entry(config, document)
+    res = find_pointer_data_entry(config, document, output_file)
+    if res is None:
+        return fetch_listed_data_entry(config, document, output_file, previous_version)
     if isinstance(res, int):
         return res
 
     key, version = res
     if version.strip() == previous_version.strip():
         return 30
-    data = s3.download(config, key)
-    if isinstance(data, int):
-        return data
+    if s3.download_to_file(config, key, output_file) != 0:
+        log('INFO', "Latest pointer for {doc} is stale; listing the entries.", doc=document)
+        return fetch_listed_data_entry(config, document, output_file, previous_version)
+    return 0
 
-    with open(output_file, 'wb') as f:
-        f.write(data)
 
-    return 0
+def fetch_listed_data_entry(
+        config: Config, document: str, output_file: str, previous_version: str,
+) -> int:
+    """Fetch the document into the output file, only using the listed entries."""
+    res = find_top_data_entry(config, document)
+    if isinstance(res, int):
+        return res
+    key, version = res
+    if version.strip() == previous_version.strip():
+        return 30
+    return s3.download_to_file(config, key, output_file)
+
+
+def find_pointer_data_entry(
+        config: Config, document: str, output_file: str,
+) -> Union[None, int, Tuple[str, str]]:
+    """Find the data entry named by the latest pointer file.  The pointer is only
+    downloaded if its ETag changed since the last fetch into the same output file.
+    Returns None if there is no usable pointer, so the entries must be listed instead."""
+    state_file = output_file + FETCH_STATE_FILE_SUFFIX
+    state = read_fetch_state(state_file)
+    pointer = state.get('latest')
+    res = s3.download_if_changed(
+        config, s3.get_latest_pointer_s3_key(config, document),
+        pointer['etag'] if isinstance(pointer, dict) else '',
+    )
+    if res is None:
+        return None
+    if isinstance(res, int):
+        if res != 30:
+            return res
+    else:
+        contents, etag = res
+        try:
+            pointer = json.loads(contents.decode('utf-8'))
+        except ValueError:
+            pointer = None
+        if isinstance(pointer, dict):
+            pointer['etag'] = etag
+        state['latest'] = pointer
+        write_fetch_state(state_file, state)
+    if not isinstance(pointer, dict):
+        return None
+    key = pointer.get('data-key')
+    version = pointer.get('document-version')
+    if (
+            not isinstance(key, str) or not isinstance(version, str)
+            or not key.startswith(s3.get_document_s3_path(config, document))
+            or not is_data_file(key)
+    ):
+        return None
+    return key, version
+
+
+def read_fetch_state(state_file: str) -> Dict[str, Any]:
+    """Read the state stored by the last fetch into the same output file."""
+    if os.path.isfile(state_file):
+        try:
+            with open(state_file, 'r') as f:
+                ret = json.load(f)
+            if isinstance(ret, dict):
+                return ret
+        except ValueError:
+            pass
+    return {}
+
+
+def write_fetch_state(state_file: str, state: Dict[str, Any]) -> None:
+    """Store the state for the next fetch into the same output file."""
+    with open(state_file, 'w') as f:
+        json.dump(state, f)
 
 
 def find_top_data_entry(config: Config, document: str) -> Union[int, Tuple[str, str]]:
@@ -0,0 +1,51 @@
+"""Leases, for electing a leader between several processes sharing the data store."""
+
+from typing import Optional
+import json
+import time
+from .config import Config
+from .commit import load_json_bytes
+from .util import log
+from . import s3
+
+
+LEASE_FILE_NAME = 'lease.json'
+
+
+def acquire_lease(config: Config, lease_name: str, owner: str, lease_seconds: float) -> int:
+    """Acquire or renew the named lease for the owner, for the lease seconds.
+
+    The lease is a small S3 object naming its owner and when it expires.  It is only
+    replaced with a conditional upload against the ETag that was read, so when several
+    processes try at once, only one of them wins.  Returns 0 if the owner holds the lease,
+    or 30 if another owner holds it.  A lease time of 0 releases the owner's lease.
+    """
+    if config.is_test_mode:
+        return 16
+    if not lease_name or not owner:
+        print("[nightjar-ds-aws-s3] The lease action requires a document and an owner.")
+        return 5
+    key = config.get_path([lease_name, LEASE_FILE_NAME])
+    res = s3.download_if_changed(config, key, '')
+    if isinstance(res, int):
+        return res
+    etag: Optional[str] = None
+    now = time.time()
+    if res is not None:
+        contents, etag = res
+        current = load_json_bytes(contents)
+        if (
+                current is not None
+                and current.get('owner') != owner
+                and isinstance(current.get('expires'), (int, float))
+                and current['expires'] > now
+        ):
+            return 30
+    if not s3.supports_conditional_upload():
+        log('WARN', "The installed botocore can't perform conditional uploads for leases.")
+        return 6
+    return s3.upload_if_match(
+        config, key,
+        json.dumps({'owner': owner, 'expires': now + lease_seconds}).encode('utf-8'),
+        etag,
+    )
@@ -7,6 +7,9 @@ from typing import List
 from .config import create_configuration
 from .fetch import fetch
 from .commit import commit
+from .cleanup import collect_garbage
+from .lease import acquire_lease
+from . import s3
 
 
 ARG__DOCUMENT = '--document='
@@ -14,16 +17,22 @@ ARG__PREVIOUS_VERSION = '--previous-document-version='
 ARG__ACTION = '--action='
 ARG__FILE = '--action-file='
 ARG__API_VERSION = '--api-version='
+ARG__LEASE_OWNER = '--lease-owner='
+ARG__LEASE_SECONDS = '--lease-seconds='
 
 
 def main(argv: List[str]) -> int:
     """Main execution."""
     config = create_configuration()
+    # The s3 module uses the configuration, so the configuration module can't set it.
+    s3.set_aws_config(config.aws_config, config.client_settings)
     document = ''
     previous_version = ''
     action = ''
     action_file = ''
     api_version = ''
+    lease_owner = ''
+    lease_seconds = 0.0
 
     for arg in argv[1:]:
         if arg.startswith(ARG__DOCUMENT):
@@ -36,6 +45,13 @@ def main(argv: List[str]) -> int:
             action_file = arg[len(ARG__FILE):].strip()
         elif arg.startswith(ARG__API_VERSION):
             api_version = arg[len(ARG__API_VERSION):].strip()
+        elif arg.startswith(ARG__LEASE_OWNER):
+            lease_owner = arg[len(ARG__LEASE_OWNER):].strip()
+        elif arg.startswith(ARG__LEASE_SECONDS):
+            try:
+                lease_seconds = float(arg[len(ARG__LEASE_SECONDS):].strip())
+            except ValueError:
+                print('[nightjar-ds-aws-s3] Invalid lease seconds: ' + arg)
 
     if api_version != '1':
         print('[nightjar-ds-aws-s3] Unknown API version: ' + api_version)
@@ -47,5 +63,11 @@ def main(argv: List[str]) -> int:
     if action == 'fetch':
         return fetch(config, document, action_file, previous_version)
 
+    if action == 'gc':
+        return collect_garbage(config, document)
+
+    if action == 'lease':
+        return acquire_lease(config, document, lease_owner, lease_seconds)
+
     print("[nightjar-ds-aws-s3] Invalid action `{0}`.".format(action))
     return 6
@@ -3,18 +3,24 @@
 
 This is very simple.  This just stores the file with no history or anything.  Extremely simple
 to make it easy to inspect and debug.
+
+boto3 and botocore take a large part of each run's start up time to import, so they are
+only imported once the first AWS call is made.  Test mode runs never import them.
 """
 
 
-from typing import Iterable, Dict, Tuple, List, Union, Any
+from typing import Iterable, Dict, Tuple, List, Union, Optional, Any
 import datetime
+import gzip
 import io
-import boto3
-from botocore.config import Config as BotoConfig  # type: ignore
-from botocore.exceptions import ClientError  # type: ignore
+import os
+import shutil
+import sys
+import zlib
+from .config import Config, GZIP_CONTENT_ENCODING, get_client_settings
+from .util import debug, log, LATEST_POINTER_NAME
 
-from .config import Config
-from .util import debug, log
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
 
 
 def get_version_file_s3_key(config: Config, document_name: str, version: str) -> str:
@@ -27,9 +33,16 @@ def get_meta_file_s3_key(config: Config, document_name: str, version: str) -> st
     return config.get_path([document_name, version + '.meta'])
 
 
+def get_latest_pointer_s3_key(config: Config, document_name: str) -> str:
+    """Get the s3 entry key to the pointer file, which names the latest version of
+    the document."""
+    return config.get_path([document_name, LATEST_POINTER_NAME])
+
+
 def get_document_s3_path(config: Config, document_name: str) -> str:
-    """Get the s3 entry key to the version file for the document."""
-    return config.get_path([document_name])
+    """Get the s3 key prefix for all the files of the document.  It ends with a '/', so
+    that documents whose name starts with this document's name are not included."""
+    return config.get_path([document_name]) + '/'
 
 
 def list_entries(config: Config, path: str) -> Iterable[Tuple[str, datetime.datetime]]:
@@ -56,18 +69,29 @@ def list_entries(config: Config, path: str) -> Iterable[Tuple[str, datetime.date
                 yield key, modified
 
 
-def upload(config: Config, path: str, contents: bytes) -> int:
+def upload(config: Config, path: str, contents: bytes, content_encoding: str = '') -> int:
     """Upload the contents to the path S3 key, in the bucket defined by the
-    config.  The path should already have the prefix added to it."""
+    config.  The path should already have the prefix added to it.  If the contents
+    are compressed, then the content encoding names the compression."""
     assert len(contents) <= config.max_document_bytes
     # Note that the path argument musn't start with a '/', but the path construction
     # should handle this.
     log('INFO', "Uploading s3://{bucket}/{path}", bucket=config.bucket, path=path)
     inp = io.BytesIO(contents)
+    extra_args: Dict[str, str] = {}
+    if content_encoding:
+        extra_args['ContentEncoding'] = content_encoding
     try:
-        get_s3_client().upload_fileobj(inp, config.bucket, path)
+        if len(contents) < get_client_setting('multipart_threshold'):
+            # Small documents are sent in a single request, which avoids the transfer
+            # manager's extra overhead.
+            get_s3_client().put_object(Body=inp, Bucket=config.bucket, Key=path, **extra_args)
+        else:
+            get_s3_client().upload_fileobj(
+                inp, config.bucket, path, ExtraArgs=extra_args, Config=get_transfer_config(),
+            )
         return 0
-    except ClientError as err:
+    except get_botocore_exceptions().ClientError as err:
         # 404 errors may happen if the bucket doesn't exist,
         # and if that happens, it's not recoverable.
         if request_requires_retry(err):
@@ -76,17 +100,46 @@ def upload(config: Config, path: str, contents: bytes) -> int:
         raise err
 
 
-def download(config: Config, path: str) -> Union[bytes, int]:
-    """Download the contents of the s3 key.  The path should already have
-    the prefix added to it.  This returns a number on error, and a string
-    on success."""
+def upload_if_match(config: Config, path: str, contents: bytes, etag: Optional[str]) -> int:
+    """Upload the small contents to the path S3 key, only if the key still has the given
+    ETag, or, if the ETag is None, only if the key does not exist.  This returns 0 on
+    success, 30 if the key changed since, and 31 if a retry is needed."""
+    log('INFO', "Conditionally uploading s3://{bucket}/{path}", bucket=config.bucket, path=path)
+    params: Dict[str, Any] = {'Body': io.BytesIO(contents), 'Bucket': config.bucket, 'Key': path}
+    if etag is None:
+        params['IfNoneMatch'] = '*'
+    else:
+        params['IfMatch'] = etag
+    try:
+        get_s3_client().put_object(**params)
+        return 0
+    except get_botocore_exceptions().ClientError as err:
+        if is_precondition_failed_error(err):
+            return 30
+        if request_requires_retry(err):
+            log('WARN', "Upload generated a retry request from S3: {err}", err=repr(err))
+            return 31
+        raise err
+
+
+def supports_conditional_upload() -> bool:
+    """Does the installed botocore know about conditional uploads?  Older versions reject
+    the conditional parameters."""
+    put_object = get_s3_client().meta.service_model.operation_model('PutObject')
+    return 'IfMatch' in put_object.input_shape.members
+
+
+def download_to_file(config: Config, path: str, output_file: str) -> int:
+    """Download the contents of the s3 key into the output file.  The path should
+    already have the prefix added to it.  The contents are streamed into the file
+    rather than held in memory, and gzip encoded contents are decompressed on the way.
+    This returns 0 on success, or 31 if a retry is needed."""
     # Note that the path argument musn't start with a '/', but the path construction
     # should handle this.
     debug('Downloading s3://{bucket}/{path}', bucket=config.bucket, path=path)
-    out = io.BytesIO()
     try:
-        get_s3_client().download_fileobj(config.bucket, path, out)
-    except ClientError as err:
+        response = get_s3_client().get_object(Bucket=config.bucket, Key=path)
+    except get_botocore_exceptions().ClientError as err:
         if is_404_error(err):
             # File disappeared underneath us.
             log('WARN', "Download generated a not-found response from S3: {err}", err=repr(err))
@@ -95,7 +148,59 @@ def download(config: Config, path: str) -> Union[bytes, int]:
             log('WARN', "Download generated a retry request from S3: {err}", err=repr(err))
             return 31
         raise err
-    return out.getvalue()
+    if response.get('ContentLength', 0) > config.max_document_bytes:
+        log('WARN', "Refusing too large s3://{bucket}/{path}", bucket=config.bucket, path=path)
+        response['Body'].close()
+        return 31
+    body = response['Body']
+    if response.get('ContentEncoding') == GZIP_CONTENT_ENCODING:
+        body = gzip.GzipFile(fileobj=body, mode='rb')
+    try:
+        with open(output_file, 'wb') as f:
+            shutil.copyfileobj(body, f, DOWNLOAD_CHUNK_SIZE)
+    except (
+            get_botocore_exceptions().IncompleteReadError,
+            get_botocore_exceptions().ReadTimeoutError,
+            EOFError, gzip.BadGzipFile, zlib.error,
+    ) as err:
+        log(
+            'WARN',
+            "Download of s3://{bucket}/{path} was interrupted: {err}",
+            bucket=config.bucket, path=path, err=repr(err),
+        )
+        os.unlink(output_file)
+        return 31
+    return 0
+
+
+def download_if_changed(
+        config: Config, path: str, etag: str,
+) -> Optional[Union[int, Tuple[bytes, str]]]:
+    """Download the contents of the s3 key, unless its ETag matches the given ETag.  This
+    returns the contents and the new ETag on success, None if the key does not exist,
+    30 if the contents did not change, and 31 if a retry is needed."""
+    debug(
+        'Downloading s3://{bucket}/{path} if not {etag}',
+        bucket=config.bucket, path=path, etag=etag,
+    )
+    params = {'Bucket': config.bucket, 'Key': path}
+    if etag:
+        params['IfNoneMatch'] = etag
+    try:
+        response = get_s3_client().get_object(**params)
+    except get_botocore_exceptions().ClientError as err:
+        if is_not_modified_error(err):
+            return 30
+        if is_404_error(err):
+            return None
+        if request_requires_retry(err):
+            log('WARN', "Download generated a retry request from S3: {err}", err=repr(err))
+            return 31
+        raise err
+    if response.get('ContentLength', 0) > config.max_document_bytes:
+        log('WARN', "Ignoring too large s3://{bucket}/{path}", bucket=config.bucket, path=path)
+        return None
+    return response['Body'].read(), str(response.get('ETag', ''))
 
 
 def delete(config: Config, keys: List[str]) -> None:
@@ -112,7 +217,7 @@ def delete(config: Config, keys: List[str]) -> None:
                     'Objects': [{'Key': p} for p in sub_keys],
                 }
             )
-        except ClientError as err:
+        except get_botocore_exceptions().ClientError as err:
             if is_404_error(err):
                 log(
                     'INFO',
@@ -135,21 +240,62 @@ def delete(config: Config, keys: List[str]) -> None:
 
 def is_404_error(err: Exception) -> bool:
     """Is this a not-found error?"""
-    if isinstance(err, ClientError):
+    response = get_error_response(err)
+    if response is not None:
         # Generally this is just "NoSuchKey" we're looking for.
         # Note that when deleting, the "Message" part is "Not Found",
         # because the message is the human-readable English text.
-        code = str(err.response.get('Error', {}).get('Code', 'x'))
+        code = str(response.get('Error', {}).get('Code', 'x'))
         return code == '404' or code.lower() == 'nosuchkey'
     return False
 
 
+def is_not_modified_error(err: Exception) -> bool:
+    """Is this a response to a conditional request that the contents did not change?"""
+    response = get_error_response(err)
+    if response is not None:
+        code = str(response.get('Error', {}).get('Code', 'x'))
+        return code == '304' or code.lower() == 'notmodified'
+    return False
+
+
+def is_precondition_failed_error(err: Exception) -> bool:
+    """Is this a response to a conditional upload that the key changed?  Concurrent
+    conditional uploads to the same key may also report a conflict."""
+    response = get_error_response(err)
+    if response is not None:
+        code = str(response.get('Error', {}).get('Code', 'x'))
+        return code in ('409', '412') or code.lower() in (
+            'preconditionfailed', 'conditionalrequestconflict',
+        )
+    return False
+
+
+def get_error_response(err: Exception) -> Optional[Dict[str, Any]]:
+    """Get the response of an error from AWS, or None if it's another kind of error.  An
+    error from AWS can only be raised after botocore was imported for the client."""
+    if (
+            'botocore.exceptions' in sys.modules
+            and isinstance(err, get_botocore_exceptions().ClientError)
+    ):
+        response: Dict[str, Any] = err.response
+        return response
+    return None
+
+
+def get_botocore_exceptions() -> Any:
+    """Get the botocore exceptions module."""
+    from botocore import exceptions  # type: ignore  # pylint: disable=C0415
+    return exceptions
+
+
 def request_requires_retry(err: Exception) -> bool:
     """Does the error mean that a retry should be performed?"""
-    if not isinstance(err, ClientError):
+    response = get_error_response(err)
+    if response is None:
         return False
-    code = err.response.get('Error', {}).get('Code', '').lower()
-    message = err.response.get('Error', {}).get('Message', '')
+    code = response.get('Error', {}).get('Code', '').lower()
+    message = response.get('Error', {}).get('Message', '')
     # This covers:
     #   ExpiredToken
     #   OperationAborted
@@ -174,31 +320,62 @@ def request_requires_retry(err: Exception) -> bool:
 
 
 # ---------------------------------------------------------------------------
+# The client is created once per process, and reused for every call, so that its
+# connection pool keeps the connections (and their TLS sessions) alive between calls.
 CLIENTS: Dict[str, object] = {}
 CONFIG: Dict[str, str] = {}
+CLIENT_SETTINGS: Dict[str, Any] = {}
 
 
-def set_aws_config(config: Dict[str, str]) -> None:
-    """Set the global AWS configuration."""
+def set_aws_config(
+        config: Dict[str, str], client_settings: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Set the global AWS configuration, and the S3 client settings."""
     CONFIG.clear()
     CLIENTS.clear()
+    CLIENT_SETTINGS.clear()
     CONFIG.update(config)
+    CLIENT_SETTINGS.update(client_settings or get_client_settings({}))
+
+
+def get_client_setting(key: str) -> Any:
+    """Get the S3 client setting, using the default if the settings were never set."""
+    if key not in CLIENT_SETTINGS:
+        CLIENT_SETTINGS.update(get_client_settings({}))
+    return CLIENT_SETTINGS[key]
 
 
 def get_s3_client() -> Any:
     """Get the boto3 s3 client."""
     client_name = 's3'
     if client_name not in CLIENTS:
+        from botocore.config import Config as BotoConfig  # type: ignore  # pylint: disable=C0415
         session = get_session()
         CLIENTS[client_name] = session.client(client_name, config=BotoConfig(
-            max_pool_connections=1,
-            retries=dict(max_attempts=2)
+            max_pool_connections=get_client_setting('max_pool_connections'),
+            retries=dict(
+                max_attempts=get_client_setting('max_attempts'),
+                mode=get_client_setting('retry_mode'),
+            ),
         ))
     return CLIENTS[client_name]
 
 
-def get_session() -> boto3.session.Session:
-    """Create the AWS session for ECS clients."""
+def get_transfer_config() -> Any:
+    """Get the transfer configuration for uploads too large for a single request."""
+    from boto3.s3.transfer import TransferConfig  # pylint: disable=C0415
+    max_concurrency = get_client_setting('max_concurrency')
+    return TransferConfig(
+        multipart_threshold=get_client_setting('multipart_threshold'),
+        max_concurrency=max_concurrency,
+        # Without concurrency, there's no need for the thread pool.
+        use_threads=max_concurrency > 1,
+    )
+
+
+def get_session() -> Any:
+    """Create the AWS session for S3 clients."""
+    import boto3.session  # pylint: disable=C0415
     region = CONFIG.get('AWS_REGION', None)
     profile = CONFIG.get('AWS_PROFILE', None)
     params: Dict[str, str] = {}
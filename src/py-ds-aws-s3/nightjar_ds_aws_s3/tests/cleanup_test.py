@@ -0,0 +1,156 @@
+"""Test the cleanup module."""
+
+from typing import List, Tuple, Optional
+import unittest
+import datetime
+import json
+from .s3_mock import MockS3
+from .. import cleanup
+from ..config import Config, ENV__BUCKET, ENV__BASE_PATH
+
+
+class CleanupTest(unittest.TestCase):
+    """Test the cleanup functions."""
+
+    def setUp(self) -> None:
+        self.config = Config({
+            ENV__BUCKET: 'some-bucket',
+            ENV__BASE_PATH: 'this/test',
+            'AWS_REGION': 'us-east-1111',
+        })
+        self.pointer_key = self.config.base_path + '/doco-2/latest.pointer'
+
+    def test_filter_old_document_entries__no_entries(self) -> None:
+        """Test filter_old_document_entries with no entries."""
+        res = cleanup.filter_old_document_entries([], 0, 0, None)
+        self.assertEqual([], res)
+
+    def test_filter_old_document_entries__invalid_entries(self) -> None:
+        """Test filter_old_document_entries with only non-expected data."""
+        res = cleanup.filter_old_document_entries([
+            ('a/b/c/foo.txt', _mk_time(0)),
+            ('a/b/c/bar.md', _mk_time(0)),
+        ], 0, 0, None)
+        self.assertEqual([], res)
+
+    def test_filter_old_document_entries__pairs(self) -> None:
+        """Test filter_old_document_entries with pairs of valid data, oldest first."""
+        res = cleanup.filter_old_document_entries([
+            ('a/b/c/foo.txt', _mk_time(0)),
+            ('a/b/c/foo.meta', _mk_time(1)),
+            ('a/b/c/foo.data', _mk_time(1)),
+            ('a/b/c/bar.data', _mk_time(2)),
+            ('a/b/c/bar.meta', _mk_time(2)),
+        ], 0, 0, None)
+        self.assertEqual(
+            ['a/b/c/bar.data', 'a/b/c/bar.meta', 'a/b/c/foo.data', 'a/b/c/foo.meta'],
+            res,
+        )
+
+    def test_filter_old_document_entries__preserve_count(self) -> None:
+        """Test filter_old_document_entries keeps the newest pairs."""
+        res = cleanup.filter_old_document_entries([
+            ('v1.data', _mk_time(3)),
+            ('v1.meta', _mk_time(3)),
+            ('v2.data', _mk_time(2)),
+            ('v2.meta', _mk_time(2)),
+            ('v3.data', _mk_time(1)),
+            ('v3.meta', _mk_time(1)),
+        ], 2, 0, None)
+        self.assertEqual(['v1.data', 'v1.meta'], res)
+
+    def test_filter_old_document_entries__preserve_seconds(self) -> None:
+        """Test filter_old_document_entries keeps the young pairs."""
+        res = cleanup.filter_old_document_entries([
+            ('v1.data', _mk_time(3)),
+            ('v1.meta', _mk_time(3)),
+            ('v2.data', _mk_time(2)),
+            ('v2.meta', _mk_time(2)),
+        ], 0, 150 * 60, None)
+        self.assertEqual(['v1.data', 'v1.meta'], res)
+
+    def test_filter_old_document_entries__keep_version(self) -> None:
+        """Test filter_old_document_entries keeps the pointer's version."""
+        res = cleanup.filter_old_document_entries([
+            ('v1.data', _mk_time(3)),
+            ('v1.meta', _mk_time(3)),
+            ('v2.data', _mk_time(2)),
+            ('v2.meta', _mk_time(2)),
+        ], 0, 0, 'v1')
+        self.assertEqual(['v2.data', 'v2.meta'], res)
+
+    def test_filter_old_document_entries__dangling_meta(self) -> None:
+        """Test filter_old_document_entries with a meta file without its data."""
+        res = cleanup.filter_old_document_entries([
+            ('a/b/c/foo.txt', _mk_time(0)),
+            ('bar.meta', _mk_time(0)),
+        ], 10, 1000, None)
+        self.assertEqual(['bar.meta'], res)
+
+    def test_filter_old_document_entries__dangling_data_old(self) -> None:
+        """Test filter_old_document_entries with an old data file without its meta."""
+        res = cleanup.filter_old_document_entries([
+            ('a/b/c/foo.txt', _mk_time(0)),
+            ('bar.data', _mk_time(cleanup.OLD_FILE_TIME_DAYS * 24 + 1)),
+        ], 10, 1000, None)
+        self.assertEqual(['bar.data'], res)
+
+    def test_filter_old_document_entries__dangling_data_young(self) -> None:
+        """Test filter_old_document_entries with a young data file without its meta."""
+        res = cleanup.filter_old_document_entries([
+            ('a/b/c/foo.txt', _mk_time(0)),
+            ('bar.data', _mk_time(cleanup.OLD_FILE_TIME_DAYS * 24 - 1)),
+        ], 0, 0, None)
+        self.assertEqual([], res)
+
+    def test_collect_garbage__test_mode(self) -> None:
+        """Test collect_garbage in test mode."""
+        self.config.is_test_mode = True
+        self.assertEqual(15, cleanup.collect_garbage(self.config, 'doco-2'))
+
+    def test_collect_garbage__valid(self) -> None:
+        """Test collect_garbage, which keeps the pointer's version."""
+        self.config.historical_preserve_count = 1
+        self.config.historical_preserve_seconds = 0
+        mock_s3 = MockS3()
+        mock_s3.mk_get_object(self.config.bucket, self.pointer_key, json.dumps({
+            'document-version': 'v1',
+            'data-key': self.config.base_path + '/doco-2/v1.data',
+        }).encode('utf-8'), '"e1"')
+        mock_s3.mk_list_entries(self.config.bucket, self.config.base_path + '/doco-2/', [
+            ('v1.data', 3),
+            ('v1.meta', 3),
+            ('v2.data', 2),
+            ('v2.meta', 2),
+            ('v3.data', 1),
+            ('v3.meta', 1),
+        ])
+        mock_s3.mk_delete(self.config.bucket, [
+            self.config.base_path + '/doco-2/v2.data',
+            self.config.base_path + '/doco-2/v2.meta',
+        ])
+        with mock_s3:
+            res = cleanup.collect_garbage(self.config, 'doco-2')
+            self.assertEqual(0, res)
+            mock_s3.stubber.assert_no_pending_responses()
+
+    def test_collect_garbage__limited(self) -> None:
+        """Test collect_garbage with more keys to remove than one run allows."""
+        self.config.historical_preserve_count = 0
+        self.config.historical_preserve_seconds = 0
+        mock_s3 = MockS3()
+        mock_s3.mk_get_object_error(self.config.bucket, self.pointer_key, 'NoSuchKey')
+        keys: List[Tuple[str, Optional[int]]] = []
+        for index in range(cleanup.MAX_DELETE_KEY_COUNT + 1):
+            keys.append(('v{0}.data'.format(index), 1))
+            keys.append(('v{0}.meta'.format(index), 1))
+        mock_s3.mk_list_entries(self.config.bucket, self.config.base_path + '/doco-2/', keys)
+        with mock_s3:
+            mock_s3.stubber.add_response('delete_objects', {}, None)
+            res = cleanup.collect_garbage(self.config, 'doco-2')
+            self.assertEqual(0, res)
+            mock_s3.stubber.assert_no_pending_responses()
+
+
+def _mk_time(delta: int) -> datetime.datetime:
+    return datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(hours=delta)
@@ -2,7 +2,6 @@
 """Test the commit module."""
 
 import unittest
-import datetime
 import tempfile
 import os
 import json
@@ -12,7 +11,7 @@ from .. import commit, util
 from ..config import Config, ENV__BUCKET, ENV__BASE_PATH
 
 
-class CommitTest(unittest.TestCase):
+class CommitTest(unittest.TestCase):  # pylint: disable=R0904
     """Test the commit functions."""
 
     def setUp(self) -> None:
@@ -22,6 +21,7 @@ class CommitTest(unittest.TestCase):
             'AWS_REGION': 'us-east-1111',
         })
         self.src_file = tempfile.mktemp()
+        self.pointer_key = self.config.base_path + '/doco-2/latest.pointer'
 
     def tearDown(self) -> None:
         if os.path.isfile(self.src_file):
@@ -32,65 +32,6 @@ class CommitTest(unittest.TestCase):
         res = commit.json_binary_dump({'x': 'y'})
         self.assertEqual(b'{"x": "y"}', res)
 
-    def test_filter_old_document_entries__no_entries(self) -> None:
-        """Test filter_old_document_entries with no entries."""
-        res = commit.filter_old_document_entries([])
-        self.assertEqual([], res)
-
-    def test_filter_old_document_entries__invalid_entries(self) -> None:
-        """Test filter_old_document_entries with only non-expected data."""
-        res = commit.filter_old_document_entries([
-            ('a/b/c/foo.txt', _mk_time(0)),
-            ('a/b/c/bar.md', _mk_time(0)),
-        ])
-        self.assertEqual([], res)
-
-    def test_filter_old_document_entries__pairs(self) -> None:
-        """Test filter_old_document_entries with pairs of valid data."""
-        res = commit.filter_old_document_entries([
-            ('a/b/c/foo.txt', _mk_time(0)),
-            ('a/b/c/bar.md', _mk_time(0)),
-            ('a/b/c/foo.data', _mk_time(0)),
-            ('a/b/c/foo.meta', _mk_time(0)),
-        ])
-        self.assertEqual(
-            sorted(['a/b/c/foo.data', 'a/b/c/foo.meta']),
-            sorted(res),
-        )
-
-    def test_filter_old_document_entries__dangling_meta(self) -> None:
-        """Test filter_old_document_entries with pairs of valid data."""
-        res = commit.filter_old_document_entries([
-            ('a/b/c/foo.txt', _mk_time(0)),
-            ('a/b/c/bar.md', _mk_time(0)),
-            ('bar.meta', _mk_time(0)),
-        ])
-        self.assertEqual(
-            sorted(['bar.meta']),
-            sorted(res),
-        )
-
-    def test_filter_old_document_entries__dangling_data_old(self) -> None:
-        """Test filter_old_document_entries with pairs of valid data."""
-        res = commit.filter_old_document_entries([
-            ('a/b/c/foo.txt', _mk_time(0)),
-            ('a/b/c/bar.md', _mk_time(0)),
-            ('bar.data', _mk_time(commit.OLD_FILE_TIME_DAYS * 24 + 1)),
-        ])
-        self.assertEqual(
-            sorted(['bar.data']),
-            sorted(res),
-        )
-
-    def test_filter_old_document_entries__dangling_data_young(self) -> None:
-        """Test filter_old_document_entries with pairs of valid data."""
-        res = commit.filter_old_document_entries([
-            ('a/b/c/foo.txt', _mk_time(0)),
-            ('a/b/c/bar.md', _mk_time(0)),
-            ('bar.data', _mk_time(commit.OLD_FILE_TIME_DAYS * 24 - 1)),
-        ])
-        self.assertEqual([], res)
-
     def test_create_document_metadata(self) -> None:
         """Test create_document_metadata"""
         meta, data = commit.create_document_metadata('doc-1', {"x": "y"})
@@ -142,16 +83,19 @@ class CommitTest(unittest.TestCase):
         with open(self.src_file, 'w') as f:
             json.dump({'brownie': 'fudge'}, f)
         mock_s3 = MockS3()
+        mock_s3.mk_get_object_error(self.config.bucket, self.pointer_key, 'NoSuchKey')
         mock_s3.mk_list_entries(
-            self.config.bucket, self.config.base_path + '/doco-2',
+            self.config.bucket, self.config.base_path + '/doco-2/',
             [
                 ('to-ignore.txt', 0),
-                ('to-remove.data', commit.OLD_FILE_TIME_DAYS * 24 + 1),
-                ('to-keep.data', commit.OLD_FILE_TIME_DAYS * 24 - 1),
-                ('foo-to-remove.data', 4),
-                ('foo-to-remove.meta', 5),
+                ('to-keep.data', 25),
+                ('foo-to-keep.data', 4),
+                ('foo-to-keep.meta', 5),
             ],
         )
+        mock_s3.mk_get_object_error(
+            self.config.bucket, self.config.base_path + '/doco-2/foo-to-keep.meta', 'NoSuchKey',
+        )
         # We can't predict the version ahead of time...
         mock_s3.mk_upload(self.config.bucket, re.compile(
             '^' + re.escape(self.config.base_path + '/doco-2/') + '.*?' +
@@ -161,13 +105,8 @@ class CommitTest(unittest.TestCase):
             '^' + re.escape(self.config.base_path + '/doco-2/') + '.*?' +
             re.escape(util.META_FILE_EXTENSION) + '$'
         ), None)
-        mock_s3.mk_delete(
-            self.config.bucket,
-            [
-                self.config.base_path + '/doco-2/to-remove.data',
-                self.config.base_path + '/doco-2/foo-to-remove.data',
-                self.config.base_path + '/doco-2/foo-to-remove.meta',
-            ]
+        mock_s3.mk_upload(
+            self.config.bucket, self.config.base_path + '/doco-2/latest.pointer', None,
         )
         with mock_s3:
             res = commit.commit(self.config, 'doco-2', self.src_file)
@@ -185,7 +124,8 @@ class CommitTest(unittest.TestCase):
         with open(self.src_file, 'w') as f:
             json.dump({'brownie': 'fudge'}, f)
         mock_s3 = MockS3()
-        mock_s3.mk_list_entries(self.config.bucket, self.config.base_path + '/doco-2', [])
+        mock_s3.mk_get_object_error(self.config.bucket, self.pointer_key, 'NoSuchKey')
+        mock_s3.mk_list_entries(self.config.bucket, self.config.base_path + '/doco-2/', [])
         # We can't predict the version ahead of time...
         mock_s3.mk_upload_throttled(self.config.bucket, re.compile(
             '^' + re.escape(self.config.base_path + '/doco-2/') + '.*?' +
@@ -200,7 +140,8 @@ class CommitTest(unittest.TestCase):
         with open(self.src_file, 'w') as f:
             json.dump({'brownie': 'fudge'}, f)
         mock_s3 = MockS3()
-        mock_s3.mk_list_entries(self.config.bucket, self.config.base_path + '/doco-2', [])
+        mock_s3.mk_get_object_error(self.config.bucket, self.pointer_key, 'NoSuchKey')
+        mock_s3.mk_list_entries(self.config.bucket, self.config.base_path + '/doco-2/', [])
         # We can't predict the version ahead of time...
         mock_s3.mk_upload(self.config.bucket, re.compile(
             '^' + re.escape(self.config.base_path + '/doco-2/') + '.*?' +
@@ -214,6 +155,154 @@ class CommitTest(unittest.TestCase):
             res = commit.commit(self.config, 'doco-2', self.src_file)
             self.assertEqual(31, res)
 
+    def test_commit__failed_pointer_upload(self) -> None:
+        """Test commit where the pointer upload is a retry, which removes the pointer."""
+        with open(self.src_file, 'w') as f:
+            json.dump({'brownie': 'fudge'}, f)
+        mock_s3 = MockS3()
+        mock_s3.mk_get_object_error(self.config.bucket, self.pointer_key, 'NoSuchKey')
+        mock_s3.mk_list_entries(self.config.bucket, self.config.base_path + '/doco-2/', [])
+        mock_s3.mk_upload(self.config.bucket, re.compile(
+            '^' + re.escape(self.config.base_path + '/doco-2/') + '.*?' +
+            re.escape(util.DATA_FILE_EXTENSION) + '$'
+        ), None)
+        mock_s3.mk_upload(self.config.bucket, re.compile(
+            '^' + re.escape(self.config.base_path + '/doco-2/') + '.*?' +
+            re.escape(util.META_FILE_EXTENSION) + '$'
+        ), None)
+        mock_s3.mk_upload_throttled(
+            self.config.bucket, self.config.base_path + '/doco-2/latest.pointer',
+        )
+        mock_s3.mk_delete(self.config.bucket, [self.config.base_path + '/doco-2/latest.pointer'])
+        with mock_s3:
+            res = commit.commit(self.config, 'doco-2', self.src_file)
+            self.assertEqual(31, res)
+
+    def test_commit__gzip(self) -> None:
+        """Test commit with gzip encoded documents."""
+        self.config.content_encoding = 'gzip'
+        with open(self.src_file, 'w') as f:
+            json.dump({'brownie': 'fudge'}, f)
+        mock_s3 = MockS3()
+        mock_s3.mk_get_object_error(self.config.bucket, self.pointer_key, 'NoSuchKey')
+        mock_s3.mk_list_entries(self.config.bucket, self.config.base_path + '/doco-2/', [])
+        mock_s3.mk_upload(self.config.bucket, re.compile(
+            '^' + re.escape(self.config.base_path + '/doco-2/') + '.*?' +
+            re.escape(util.DATA_FILE_EXTENSION) + '$'
+        ), None, 'gzip')
+        mock_s3.mk_upload(self.config.bucket, re.compile(
+            '^' + re.escape(self.config.base_path + '/doco-2/') + '.*?' +
+            re.escape(util.META_FILE_EXTENSION) + '$'
+        ), None)
+        mock_s3.mk_upload(
+            self.config.bucket, self.config.base_path + '/doco-2/latest.pointer', None,
+        )
+        with mock_s3:
+            res = commit.commit(self.config, 'doco-2', self.src_file)
+            self.assertEqual(0, res)
+
+    def test_commit__too_large(self) -> None:
+        """Test commit with a document larger than the maximum size."""
+        self.config.max_document_bytes = 10
+        with open(self.src_file, 'w') as f:
+            json.dump({'brownie': 'fudge'}, f)
+        mock_s3 = MockS3()
+        with mock_s3:
+            res = commit.commit(self.config, 'doco-2', self.src_file)
+            self.assertEqual(1, res)
+
+    def test_commit__unchanged_pointer(self) -> None:
+        """Test commit where the pointer's version has the same contents."""
+        with open(self.src_file, 'w') as f:
+            json.dump({'brownie': 'fudge'}, f)
+        metadata, _ = commit.create_document_metadata('doco-2', {'brownie': 'fudge'})
+        mock_s3 = MockS3()
+        mock_s3.mk_get_object(self.config.bucket, self.pointer_key, json.dumps({
+            'document-version': 'v1',
+            'data-key': self.config.base_path + '/doco-2/v1.data',
+        }).encode('utf-8'), '"e1"')
+        mock_s3.mk_get_object(
+            self.config.bucket, self.config.base_path + '/doco-2/v1.meta',
+            json.dumps(metadata).encode('utf-8'), '"e2"',
+        )
+        with mock_s3:
+            res = commit.commit(self.config, 'doco-2', self.src_file)
+            self.assertEqual(0, res)
+
+    def test_commit__unchanged_listed(self) -> None:
+        """Test commit without a pointer, where the latest listed version has the same
+        contents."""
+        with open(self.src_file, 'w') as f:
+            json.dump({'brownie': 'fudge'}, f)
+        metadata, _ = commit.create_document_metadata('doco-2', {'brownie': 'fudge'})
+        mock_s3 = MockS3()
+        mock_s3.mk_get_object(self.config.bucket, self.pointer_key, b'{[', '"e1"')
+        mock_s3.mk_list_entries(self.config.bucket, self.config.base_path + '/doco-2/', [
+            ('v1.data', 2),
+            ('v1.meta', 2),
+        ])
+        mock_s3.mk_get_object(
+            self.config.bucket, self.config.base_path + '/doco-2/v1.meta',
+            json.dumps(metadata).encode('utf-8'), '"e2"',
+        )
+        with mock_s3:
+            res = commit.commit(self.config, 'doco-2', self.src_file)
+            self.assertEqual(0, res)
+
+    def test_commit__changed_pointer(self) -> None:
+        """Test commit where the pointer's version has different contents."""
+        with open(self.src_file, 'w') as f:
+            json.dump({'brownie': 'fudge'}, f)
+        mock_s3 = MockS3()
+        mock_s3.mk_get_object(self.config.bucket, self.pointer_key, json.dumps({
+            'document-version': 'v1',
+            'data-key': self.config.base_path + '/doco-2/v1.data',
+        }).encode('utf-8'), '"e1"')
+        mock_s3.mk_get_object(
+            self.config.bucket, self.config.base_path + '/doco-2/v1.meta', b'[]', '"e2"',
+        )
+        mock_s3.mk_upload_throttled(self.config.bucket, re.compile(
+            '^' + re.escape(self.config.base_path + '/doco-2/') + '.*?' +
+            re.escape(util.DATA_FILE_EXTENSION) + '$'
+        ))
+        with mock_s3:
+            res = commit.commit(self.config, 'doco-2', self.src_file)
+            self.assertEqual(31, res)
+
+    def test_commit__changed_encoding(self) -> None:
+        """Test commit where the pointer's version has the same contents, but without the
+        gzip content encoding."""
+        self.config.content_encoding = 'gzip'
+        with open(self.src_file, 'w') as f:
+            json.dump({'brownie': 'fudge'}, f)
+        metadata, _ = commit.create_document_metadata('doco-2', {'brownie': 'fudge'})
+        mock_s3 = MockS3()
+        mock_s3.mk_get_object(self.config.bucket, self.pointer_key, json.dumps({
+            'document-version': 'v1',
+            'data-key': self.config.base_path + '/doco-2/v1.data',
+        }).encode('utf-8'), '"e1"')
+        mock_s3.mk_get_object(
+            self.config.bucket, self.config.base_path + '/doco-2/v1.meta',
+            json.dumps(metadata).encode('utf-8'), '"e2"',
+        )
+        mock_s3.mk_upload(self.config.bucket, re.compile(
+            '^' + re.escape(self.config.base_path + '/doco-2/') + '.*?' +
+            re.escape(util.DATA_FILE_EXTENSION) + '$'
+        ), None, 'gzip')
+        mock_s3.mk_upload(self.config.bucket, re.compile(
+            '^' + re.escape(self.config.base_path + '/doco-2/') + '.*?' +
+            re.escape(util.META_FILE_EXTENSION) + '$'
+        ), None)
+        mock_s3.mk_upload(self.config.bucket, self.pointer_key, None)
+        with mock_s3:
+            res = commit.commit(self.config, 'doco-2', self.src_file)
+            self.assertEqual(0, res)
+            # The gzip encoded version was uploaded.
+            mock_s3.stubber.assert_no_pending_responses()
 
-def _mk_time(delta: int) -> datetime.datetime:
-    return datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(hours=delta)
+    def test_create_latest_pointer(self) -> None:
+        """Test create_latest_pointer"""
+        self.assertEqual(
+            {'document-version': 'v1', 'data-key': 'a/v1.data'},
+            commit.create_latest_pointer('v1', 'a/v1.data'),
+        )
@@ -5,7 +5,7 @@ import unittest
 from .. import config
 
 
-class ConfigTest(unittest.TestCase):
+class ConfigTest(unittest.TestCase):  # pylint: disable=R0904
     """Tests for the S3 configuration class."""
 
     def test_get_historical_preserve_count__non_int(self) -> None:
@@ -73,6 +73,48 @@ class ConfigTest(unittest.TestCase):
         res = config.get_max_document_bytes({})
         self.assertEqual(res, config.DEFAULT_MAX_DOCUMENT_SIZE_MB * 1024 * 1024)
 
+    def test_get_content_encoding(self) -> None:
+        """Test get_content_encoding with valid, invalid, and missing values"""
+        self.assertEqual(config.DEFAULT_CONTENT_ENCODING, config.get_content_encoding({}))
+        self.assertEqual(
+            config.GZIP_CONTENT_ENCODING,
+            config.get_content_encoding({config.ENV__CONTENT_ENCODING: ' GZip '}),
+        )
+        self.assertEqual(
+            config.DEFAULT_CONTENT_ENCODING,
+            config.get_content_encoding({config.ENV__CONTENT_ENCODING: 'rot13'}),
+        )
+
+    def test_get_client_settings__default(self) -> None:
+        """Test get_client_settings with no values set"""
+        self.assertEqual({
+            'max_pool_connections': config.DEFAULT_MAX_POOL_CONNECTIONS,
+            'max_attempts': config.DEFAULT_MAX_ATTEMPTS,
+            'retry_mode': config.DEFAULT_RETRY_MODE,
+            'multipart_threshold': config.DEFAULT_MULTIPART_THRESHOLD_MB * 1024 * 1024,
+            'max_concurrency': config.DEFAULT_MAX_CONCURRENCY,
+        }, config.get_client_settings({}))
+
+    def test_get_client_settings__values(self) -> None:
+        """Test get_client_settings with valid and invalid values"""
+        self.assertEqual({
+            'max_pool_connections': 20,
+            'max_attempts': 0,
+            'retry_mode': 'standard',
+            'multipart_threshold': config.MIN_MULTIPART_THRESHOLD_MB * 1024 * 1024,
+            'max_concurrency': config.DEFAULT_MAX_CONCURRENCY,
+        }, config.get_client_settings({
+            config.ENV__MAX_POOL_CONNECTIONS: '20',
+            config.ENV__MAX_ATTEMPTS: '-4',
+            config.ENV__RETRY_MODE: 'Standard',
+            config.ENV__MULTIPART_THRESHOLD_MB: '1',
+            config.ENV__MAX_CONCURRENCY: 'x',
+        }))
+        self.assertEqual(
+            config.DEFAULT_RETRY_MODE,
+            config.get_client_settings({config.ENV__RETRY_MODE: 'x'})['retry_mode'],
+        )
+
     def test_is_valid__yes(self) -> None:
         """Test a minimally valid config"""
         cfg = config.Config({config.ENV__BUCKET: 'abc'})
@@ -5,12 +5,14 @@ import unittest
 import datetime
 import tempfile
 import os
+import json
+import gzip
 from .s3_mock import MockS3
 from .. import fetch
 from ..config import Config, ENV__BUCKET, ENV__BASE_PATH
 
 
-class FetchTest(unittest.TestCase):
+class FetchTest(unittest.TestCase):  # pylint: disable=R0904
     """Test the fetch functions."""
 
     def setUp(self) -> None:
@@ -22,12 +24,15 @@ class FetchTest(unittest.TestCase):
             'AWS_REGION': 'us-east-1111',
         })
         self.outfile = tempfile.mktemp()
+        self.state_file = self.outfile + fetch.FETCH_STATE_FILE_SUFFIX
+        self.pointer_key = self.config.base_path + '/doc/latest.pointer'
 
     def tearDown(self) -> None:
         os.environ.clear()
         os.environ.update(self._orig_env)
-        if os.path.isfile(self.outfile):
-            os.unlink(self.outfile)
+        for filename in (self.outfile, self.state_file):
+            if os.path.isfile(filename):
+                os.unlink(filename)
 
     def test_get_data_meta_entries__empty(self) -> None:
         """Test get_data_meta_entries with no entries."""
@@ -107,7 +112,7 @@ class FetchTest(unittest.TestCase):
         """Test find_top_data_entry with simple data set."""
         mock_s3 = MockS3()
         mock_s3.mk_list_entries(
-            self.config.bucket, self.config.base_path + '/doc',
+            self.config.bucket, self.config.base_path + '/doc/',
             [
                 ('abc.data', 2),
                 ('abc.meta', 3),
@@ -122,7 +127,7 @@ class FetchTest(unittest.TestCase):
     def test_find_top_data_entry__with_no_results(self) -> None:
         """Test find_top_data_entry with simple data set."""
         mock_s3 = MockS3()
-        mock_s3.mk_list_entries(self.config.bucket, self.config.base_path + '/doc', [])
+        mock_s3.mk_list_entries(self.config.bucket, self.config.base_path + '/doc/', [])
         with mock_s3:
             res = fetch.find_top_data_entry(self.config, 'doc')
             self.assertEqual(31, res)
@@ -130,7 +135,8 @@ class FetchTest(unittest.TestCase):
     def test_fetch__no_data(self) -> None:
         """Test fetch with no existing document."""
         mock_s3 = MockS3()
-        mock_s3.mk_list_entries(self.config.bucket, self.config.base_path + '/doc', [])
+        mock_s3.mk_get_object_error(self.config.bucket, self.pointer_key, 'NoSuchKey')
+        mock_s3.mk_list_entries(self.config.bucket, self.config.base_path + '/doc/', [])
         with mock_s3:
             res = fetch.fetch(self.config, 'doc', self.outfile, '')
             self.assertEqual(31, res)
@@ -139,7 +145,8 @@ class FetchTest(unittest.TestCase):
     def test_fetch__same_version(self) -> None:
         """Test fetch with latest version is the same as requested."""
         mock_s3 = MockS3()
-        mock_s3.mk_list_entries(self.config.bucket, self.config.base_path + '/doc', [
+        mock_s3.mk_get_object_error(self.config.bucket, self.pointer_key, 'NoSuchKey')
+        mock_s3.mk_list_entries(self.config.bucket, self.config.base_path + '/doc/', [
             ('abc.data', 2),
             ('abc.meta', 3),
         ])
@@ -151,12 +158,13 @@ class FetchTest(unittest.TestCase):
     def test_fetch__failed_download(self) -> None:
         """Test fetch but the download fails."""
         mock_s3 = MockS3()
-        mock_s3.mk_list_entries(self.config.bucket, self.config.base_path + '/doc', [
+        mock_s3.mk_get_object_error(self.config.bucket, self.pointer_key, 'NoSuchKey')
+        mock_s3.mk_list_entries(self.config.bucket, self.config.base_path + '/doc/', [
             ('abc.data', 2),
             ('abc.meta', 3),
         ])
-        mock_s3.mk_download_key_not_found(
-            self.config.bucket, self.config.base_path + '/doc/abc.data',
+        mock_s3.mk_get_object_error(
+            self.config.bucket, self.config.base_path + '/doc/abc.data', 'NoSuchKey',
         )
         with mock_s3:
             res = fetch.fetch(self.config, 'doc', self.outfile, '')
@@ -166,7 +174,8 @@ class FetchTest(unittest.TestCase):
     def test_fetch__ok(self) -> None:
         """Test fetch with everything fine."""
         mock_s3 = MockS3()
-        mock_s3.mk_list_entries(self.config.bucket, self.config.base_path + '/doc', [
+        mock_s3.mk_get_object_error(self.config.bucket, self.pointer_key, 'NoSuchKey')
+        mock_s3.mk_list_entries(self.config.bucket, self.config.base_path + '/doc/', [
             ('abc.data', 2),
             ('abc.meta', 3),
         ])
@@ -182,6 +191,97 @@ class FetchTest(unittest.TestCase):
         with open(self.outfile, 'rb') as f:
             self.assertEqual(b'my-contents', f.read())
 
+    def test_fetch__gzip(self) -> None:
+        """Test fetch with a gzip encoded document, which is decompressed."""
+        mock_s3 = MockS3()
+        mock_s3.mk_get_object_error(self.config.bucket, self.pointer_key, 'NoSuchKey')
+        mock_s3.mk_list_entries(self.config.bucket, self.config.base_path + '/doc/', [
+            ('abc.data', 2),
+            ('abc.meta', 3),
+        ])
+        mock_s3.mk_download(
+            self.config.bucket, self.config.base_path + '/doc/abc.data',
+            gzip.compress(b'my-contents'), 'gzip',
+        )
+        with mock_s3:
+            res = fetch.fetch(self.config, 'doc', self.outfile, '')
+            self.assertEqual(0, res)
+        with open(self.outfile, 'rb') as f:
+            self.assertEqual(b'my-contents', f.read())
+
+    def test_fetch__pointer(self) -> None:
+        """Test fetch using the latest pointer, then with the pointer unchanged."""
+        mock_s3 = MockS3()
+        mock_s3.mk_get_object(self.config.bucket, self.pointer_key, json.dumps({
+            'document-version': 'abc',
+            'data-key': self.config.base_path + '/doc/abc.data',
+        }).encode('utf-8'), '"e1"')
+        mock_s3.mk_download(
+            self.config.bucket, self.config.base_path + '/doc/abc.data',
+            b'my-contents',
+        )
+        mock_s3.mk_get_object_error(self.config.bucket, self.pointer_key, '304', '"e1"')
+        with mock_s3:
+            res = fetch.fetch(self.config, 'doc', self.outfile, '')
+            self.assertEqual(0, res)
+            with open(self.outfile, 'rb') as f:
+                self.assertEqual(b'my-contents', f.read())
+            res = fetch.fetch(self.config, 'doc', self.outfile, 'abc')
+            self.assertEqual(30, res)
+
+    def test_fetch__pointer_stale(self) -> None:
+        """Test fetch with a pointer to a removed version, which lists the entries."""
+        with open(self.state_file, 'w') as f:
+            json.dump({'latest': {
+                'etag': '"e1"',
+                'document-version': 'abc',
+                'data-key': self.config.base_path + '/doc/abc.data',
+            }}, f)
+        mock_s3 = MockS3()
+        mock_s3.mk_get_object_error(self.config.bucket, self.pointer_key, '304', '"e1"')
+        mock_s3.mk_get_object_error(
+            self.config.bucket, self.config.base_path + '/doc/abc.data', '404',
+        )
+        mock_s3.mk_list_entries(self.config.bucket, self.config.base_path + '/doc/', [
+            ('def.data', 2),
+            ('def.meta', 3),
+        ])
+        mock_s3.mk_download(
+            self.config.bucket, self.config.base_path + '/doc/def.data',
+            b'new-contents',
+        )
+        with mock_s3:
+            res = fetch.fetch(self.config, 'doc', self.outfile, 'xyz')
+            self.assertEqual(0, res)
+        with open(self.outfile, 'rb') as f:
+            self.assertEqual(b'new-contents', f.read())
+
+    def test_fetch__pointer_invalid(self) -> None:
+        """Test fetch with invalid pointer contents, which lists the entries."""
+        with open(self.state_file, 'w') as f:
+            f.write('{[')
+        mock_s3 = MockS3()
+        mock_s3.mk_get_object(self.config.bucket, self.pointer_key, b'{[', '"e2"')
+        mock_s3.mk_list_entries(self.config.bucket, self.config.base_path + '/doc/', [])
+        mock_s3.mk_get_object(self.config.bucket, self.pointer_key, json.dumps({
+            'document-version': 'abc',
+            'data-key': 'other-doc/abc.data',
+        }).encode('utf-8'), '"e3"')
+        mock_s3.mk_list_entries(self.config.bucket, self.config.base_path + '/doc/', [])
+        with mock_s3:
+            res = fetch.fetch(self.config, 'doc', self.outfile, '')
+            self.assertEqual(31, res)
+            res = fetch.fetch(self.config, 'doc', self.outfile, '')
+            self.assertEqual(31, res)
+
+    def test_fetch__pointer_throttled(self) -> None:
+        """Test fetch with a pointer download that must be retried."""
+        mock_s3 = MockS3()
+        mock_s3.mk_get_object_error(self.config.bucket, self.pointer_key, 'SlowDown')
+        with mock_s3:
+            res = fetch.fetch(self.config, 'doc', self.outfile, '')
+            self.assertEqual(31, res)
+
 
 def _mk_time(delta: int) -> datetime.datetime:
     return datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(delta)
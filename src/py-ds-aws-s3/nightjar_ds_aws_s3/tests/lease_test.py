@@ -0,0 +1,99 @@
+"""Test the lease module."""
+
+import unittest
+import json
+import time
+from .s3_mock import MockS3
+from .. import lease, s3
+from ..config import Config, ENV__BUCKET, ENV__BASE_PATH
+
+
+class LeaseTest(unittest.TestCase):
+    """Test the lease functions."""
+
+    def setUp(self) -> None:
+        self.config = Config({
+            ENV__BUCKET: 'some-bucket',
+            ENV__BASE_PATH: 'this/test',
+            'AWS_REGION': 'us-east-1111',
+        })
+        self.lease_key = self.config.base_path + '/leader/' + lease.LEASE_FILE_NAME
+        # The mock answers the conditional uploads, whatever botocore is installed.
+        self._orig_supports = s3.supports_conditional_upload
+        setattr(s3, 'supports_conditional_upload', lambda: True)
+
+    def tearDown(self) -> None:
+        setattr(s3, 'supports_conditional_upload', self._orig_supports)
+
+    def test_acquire_lease__test_mode(self) -> None:
+        """Test acquire_lease in test mode."""
+        self.config.is_test_mode = True
+        self.assertEqual(16, lease.acquire_lease(self.config, 'leader', 'me', 10))
+
+    def test_acquire_lease__no_owner(self) -> None:
+        """Test acquire_lease without an owner."""
+        self.assertEqual(5, lease.acquire_lease(self.config, 'leader', '', 10))
+
+    def test_acquire_lease__held_by_other(self) -> None:
+        """Test acquire_lease with the lease held by another owner."""
+        mock_s3 = MockS3()
+        mock_s3.mk_get_object(self.config.bucket, self.lease_key, json.dumps({
+            'owner': 'other', 'expires': time.time() + 60,
+        }).encode('utf-8'), '"e1"')
+        with mock_s3:
+            res = lease.acquire_lease(self.config, 'leader', 'me', 10)
+            self.assertEqual(30, res)
+            mock_s3.stubber.assert_no_pending_responses()
+
+    def test_acquire_lease__retry(self) -> None:
+        """Test acquire_lease when reading the lease needs a retry."""
+        mock_s3 = MockS3()
+        mock_s3.mk_get_object_error(self.config.bucket, self.lease_key, 'SlowDown')
+        with mock_s3:
+            res = lease.acquire_lease(self.config, 'leader', 'me', 10)
+            self.assertEqual(31, res)
+
+    def test_acquire_lease__new(self) -> None:
+        """Test acquire_lease with no lease yet."""
+        mock_s3 = MockS3()
+        mock_s3.mk_get_object_error(self.config.bucket, self.lease_key, 'NoSuchKey')
+        mock_s3.mk_upload_if_match(self.config.bucket, self.lease_key, None)
+        with mock_s3:
+            res = lease.acquire_lease(self.config, 'leader', 'me', 10)
+            self.assertEqual(0, res)
+            mock_s3.assert_no_pending_responses()
+
+    def test_acquire_lease__unsupported(self) -> None:
+        """Test acquire_lease with a botocore that can't perform conditional uploads."""
+        setattr(s3, 'supports_conditional_upload', lambda: False)
+        mock_s3 = MockS3()
+        mock_s3.mk_get_object_error(self.config.bucket, self.lease_key, 'NoSuchKey')
+        with mock_s3:
+            self.assertEqual(6, lease.acquire_lease(self.config, 'leader', 'me', 10))
+
+    def test_acquire_lease__expired(self) -> None:
+        """Test acquire_lease with another owner's expired lease, which another process
+        replaced first."""
+        mock_s3 = MockS3()
+        mock_s3.mk_get_object(self.config.bucket, self.lease_key, json.dumps({
+            'owner': 'other', 'expires': time.time() - 1,
+        }).encode('utf-8'), '"e1"')
+        mock_s3.mk_upload_if_match(
+            self.config.bucket, self.lease_key, '"e1"', 'PreconditionFailed',
+        )
+        with mock_s3:
+            res = lease.acquire_lease(self.config, 'leader', 'me', 10)
+            self.assertEqual(30, res)
+            mock_s3.assert_no_pending_responses()
+
+    def test_acquire_lease__renew(self) -> None:
+        """Test acquire_lease renewing the owner's own lease."""
+        mock_s3 = MockS3()
+        mock_s3.mk_get_object(self.config.bucket, self.lease_key, json.dumps({
+            'owner': 'me', 'expires': time.time() + 5,
+        }).encode('utf-8'), '"e1"')
+        mock_s3.mk_upload_if_match(self.config.bucket, self.lease_key, '"e1"')
+        with mock_s3:
+            res = lease.acquire_lease(self.config, 'leader', 'me', 10)
+            self.assertEqual(0, res)
+            mock_s3.assert_no_pending_responses()
@@ -5,6 +5,8 @@ Test the main module.
 
 import unittest
 import os
+import subprocess
+import sys
 from .. import main
 
 
@@ -63,3 +65,37 @@ class MainTest(unittest.TestCase):
             '--action=fetch',
             '--action-file=/blah',
         ]))
+
+    def test_main_gc(self) -> None:
+        """Run main with the gc action."""
+        os.environ['TEST.MODE'] = 'unit-test'
+        self.assertEqual(15, main.main([
+            'main.py', '--api-version=1',
+            '--document=discovery-map',
+            '--action=gc',
+        ]))
+
+    def test_main_lease(self) -> None:
+        """Run main with the lease action."""
+        os.environ['TEST.MODE'] = 'unit-test'
+        self.assertEqual(16, main.main([
+            'main.py', '--api-version=1',
+            '--document=central-leader',
+            '--action=lease',
+            '--lease-owner=me',
+            '--lease-seconds=x',
+        ]))
+
+    def test_main_import__no_boto3(self) -> None:
+        """Importing the main module must not import boto3, which is only imported on the
+        first AWS call, to keep the start up time of each run short."""
+        res = subprocess.run(
+            [
+                sys.executable, '-c',
+                'import sys, nightjar_ds_aws_s3.main; '
+                'print(\'boto3\' in sys.modules, \'botocore\' in sys.modules)',
+            ],
+            env={'PYTHONPATH': os.pathsep.join(sys.path)},
+            stdout=subprocess.PIPE, check=True,
+        )
+        self.assertEqual('False False', res.stdout.decode('utf-8').strip())
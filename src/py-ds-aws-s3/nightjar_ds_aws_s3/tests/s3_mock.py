@@ -3,23 +3,36 @@
 Mock the S3 callouts
 """
 
-from typing import List, Tuple, Optional, Union, Any
+from typing import List, Dict, Tuple, Optional, Union, Any
 import io
 import re
 import datetime
 import boto3
 import botocore.stub  # type: ignore
+import botocore.exceptions  # type: ignore
 from .. import s3
 
 
 class MockS3:
     """Mock S3 client."""
-    __slots__ = ('client', '_stub_client', 'stubber')
+    __slots__ = ('client', '_stub_client', 'stubber', '_conditional_uploads',)
 
     def __init__(self) -> None:
         self.client: Any = None
         self._stub_client = boto3.client('s3')
         self.stubber = botocore.stub.Stubber(self._stub_client)
+        # The stubber validates the parameters against the installed botocore's model,
+        # which may not know the conditional upload parameters, so those uploads are
+        # answered here.
+        self._conditional_uploads: List[Tuple[Dict[str, Any], str]] = []
+        stub_put_object = self._stub_client.put_object
+
+        def put_object(**params: Any) -> Dict[str, Any]:
+            if 'IfMatch' in params or 'IfNoneMatch' in params:
+                return self._put_object_if_match(params)
+            return stub_put_object(**params)  # type: ignore
+
+        setattr(self._stub_client, 'put_object', put_object)
 
     def __enter__(self) -> None:
         self.client = self._stub_client
@@ -31,6 +44,23 @@ class MockS3:
         del s3.CLIENTS['s3']
         self.stubber.__exit__(exc_type, exc_val, exc_tb)
 
+    def assert_no_pending_responses(self) -> None:
+        """Assert that all the added responses were used."""
+        self.stubber.assert_no_pending_responses()
+        assert not self._conditional_uploads, 'unused conditional uploads'
+
+    def _put_object_if_match(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        assert self._conditional_uploads, 'unexpected conditional upload'
+        expected, error_code = self._conditional_uploads.pop(0)
+        actual = dict(params)
+        del actual['Body']
+        assert expected == actual, 'expected {0}, found {1}'.format(expected, actual)
+        if error_code:
+            raise botocore.exceptions.ClientError(
+                {'Error': {'Code': error_code, 'Message': error_code}}, 'PutObject',
+            )
+        return {'ETag': '"new"'}
+
     def mk_list_entries(
             self, bucket: str, prefix: str, keys: List[Tuple[str, Optional[int]]],
     ) -> None:
@@ -39,7 +69,7 @@ class MockS3:
         # "Contents" is only given if there are > 0 keys.
         if keys:
             resp['Contents'] = [{
-                'Key': prefix + '/' + key,
+                'Key': prefix.rstrip('/') + '/' + key,
                 # S3 always returns time with tz
                 'LastModified': (
                     datetime.datetime.now(datetime.timezone.utc)
@@ -57,25 +87,50 @@ class MockS3:
             ),
         )
 
-    def mk_download(self, bucket: str, key: str, bin_content: bytes) -> None:
+    def mk_download(
+            self, bucket: str, key: str, bin_content: bytes, content_encoding: str = '',
+    ) -> None:
         """Add downloadable content to the mock."""
-        # Note: this only works for small content sizes.  Bigger than that has other
-        # paging and so on mechanisms.
+        response: Dict[str, Any] = {
+            'Body': io.BytesIO(bin_content),
+            'ContentLength': len(bin_content),
+        }
+        if content_encoding:
+            response['ContentEncoding'] = content_encoding
         self.stubber.add_response(
-            'head_object', {
-                'ContentLength': len(bin_content),
-            }, dict(
+            'get_object', response, dict(
                 Bucket=bucket,
                 Key=key,
             ),
         )
+
+    def mk_get_object(
+            self, bucket: str, key: str, bin_content: bytes, etag: str,
+            if_none_match: str = '',
+    ) -> None:
+        """Add a get_object response, with an optional conditional request."""
+        params = dict(Bucket=bucket, Key=key)
+        if if_none_match:
+            params['IfNoneMatch'] = if_none_match
         self.stubber.add_response(
             'get_object', {
                 'Body': io.BytesIO(bin_content),
-            }, dict(
-                Bucket=bucket,
-                Key=key,
-            ),
+                'ContentLength': len(bin_content),
+                'ETag': etag,
+            }, params,
+        )
+
+    def mk_get_object_error(
+            self, bucket: str, key: str, code: str, if_none_match: str = '',
+    ) -> None:
+        """Add a get_object error response, such as '304' or 'NoSuchKey'."""
+        params = dict(Bucket=bucket, Key=key)
+        if if_none_match:
+            params['IfNoneMatch'] = if_none_match
+        self.stubber.add_client_error(
+            'get_object',
+            expected_params=params,
+            service_error_meta={'Code': code, 'Message': code},
         )
 
     def mk_delete(self, bucket: str, keys: List[str]) -> None:
@@ -89,17 +144,28 @@ class MockS3:
 
     def mk_upload(
             self, bucket: str, key: Union[re.Pattern, str], contents: Optional[bytes],
+            content_encoding: str = '',
     ) -> None:
         """Upload a value."""
-        self.stubber.add_response(
-            'put_object',
-            {},
-            dict(
-                Body=botocore.stub.ANY if contents is None else ExpectedBinStream(contents),
-                Bucket=bucket,
-                Key=ExpectedMatcher(key) if isinstance(key, re.Pattern) else key,
-            ),
+        params: Dict[str, Any] = dict(
+            Body=botocore.stub.ANY if contents is None else ExpectedBinStream(contents),
+            Bucket=bucket,
+            Key=ExpectedMatcher(key) if isinstance(key, re.Pattern) else key,
         )
+        if content_encoding:
+            params['ContentEncoding'] = content_encoding
+        self.stubber.add_response('put_object', {}, params)
+
+    def mk_upload_if_match(
+            self, bucket: str, key: str, etag: Optional[str], error_code: str = '',
+    ) -> None:
+        """Add a conditional upload response, or an error response."""
+        params: Dict[str, Any] = dict(Bucket=bucket, Key=key)
+        if etag is None:
+            params['IfNoneMatch'] = '*'
+        else:
+            params['IfMatch'] = etag
+        self._conditional_uploads.append((params, error_code))
 
     def mk_download_key_not_found(self, bucket: str, key: str) -> None:
         """Add a key-not-found response"""
@@ -125,14 +191,6 @@ class MockS3:
             service_error_code='RequestTimeout',
         )
 
-    def mk_download_head_access_denied(self, bucket: str, key: str) -> None:
-        """Add a access error response"""
-        self.stubber.add_client_error(
-            'head_object',
-            expected_params=dict(Bucket=bucket, Key=key),
-            service_error_code='AccessDenied',
-        )
-
     # Not used... Should it ever be used?
     # def mk_list_entries_throttled(self, bucket: str, prefix: str) -> None:
     #     """Add a throttle error response."""
@@ -1,12 +1,18 @@
 
 """Test the s3 module."""
 
+from typing import Any
 import unittest
 import io
-from botocore.exceptions import ClientError, ProfileNotFound  # type: ignore
+import os
+import gzip
+import tempfile
+from botocore.exceptions import (  # type: ignore
+    ClientError, ProfileNotFound, IncompleteReadError,
+)
 from .s3_mock import MockS3
 from .. import s3
-from ..config import Config, ENV__BUCKET, DEFAULT_BASE_PATH
+from ..config import Config, ENV__BUCKET, DEFAULT_BASE_PATH, DEFAULT_MAX_POOL_CONNECTIONS
 
 
 class S3Test(unittest.TestCase):  # pylint: disable=R0904
@@ -14,6 +20,12 @@ class S3Test(unittest.TestCase):  # pylint: disable=R0904
 
     def setUp(self) -> None:
         self.config = Config({'AWS_REGION': 'eu-north-99', ENV__BUCKET: 'my-bucket'})
+        s3.set_aws_config({})
+        self.outfile = tempfile.mktemp()
+
+    def tearDown(self) -> None:
+        if os.path.isfile(self.outfile):
+            os.unlink(self.outfile)
 
     def test_get_client(self) -> None:
         """get client test"""
@@ -28,6 +40,31 @@ class S3Test(unittest.TestCase):  # pylint: disable=R0904
         self.assertIsNotNone(client)
         self.assertEqual('eu-north-9999', client.meta.region_name)
 
+    def test_get_client_with_settings(self) -> None:
+        """Test getting a client with the client settings."""
+        s3.set_aws_config({'AWS_REGION': 'eu-north-9999'}, {
+            'max_pool_connections': 7,
+            'max_attempts': 3,
+            'retry_mode': 'standard',
+            'multipart_threshold': 100,
+            'max_concurrency': 4,
+        })
+        client = s3.get_s3_client()
+        self.assertEqual(7, client.meta.config.max_pool_connections)
+        self.assertEqual(
+            {'total_max_attempts': 4, 'mode': 'standard'}, client.meta.config.retries,
+        )
+        transfer_config = s3.get_transfer_config()
+        self.assertEqual(100, transfer_config.multipart_threshold)
+        self.assertTrue(transfer_config.use_threads)
+
+    def test_get_client_setting__not_set(self) -> None:
+        """Test get_client_setting before any settings are given."""
+        s3.CLIENT_SETTINGS.clear()
+        self.assertEqual(
+            DEFAULT_MAX_POOL_CONNECTIONS, s3.get_client_setting('max_pool_connections'),
+        )
+
     def test_get_client_with_bad_profile(self) -> None:
         """Test getting a client with a profile set.  This ensures that
         the profile property is used."""
@@ -169,44 +206,126 @@ class S3Test(unittest.TestCase):  # pylint: disable=R0904
         with mock_s3:
             s3.delete(self.config, list('a' * 1001))
 
-    def test_download_404(self) -> None:
-        """Test download when the key doesn't exist."""
+    def test_download_to_file__404(self) -> None:
+        """Test download_to_file when the key doesn't exist."""
         mock_s3 = MockS3()
-        mock_s3.mk_download_key_not_found(self.config.bucket, 'x/y/z')
+        mock_s3.mk_get_object_error(self.config.bucket, 'x/y/z', 'NoSuchKey')
         with mock_s3:
-            res = s3.download(self.config, 'x/y/z')
+            res = s3.download_to_file(self.config, 'x/y/z', self.outfile)
             self.assertEqual(31, res)
+        self.assertFalse(os.path.isfile(self.outfile))
 
-    def test_download_retry(self) -> None:
-        """Test download when a retry is returned."""
+    def test_download_to_file__retry(self) -> None:
+        """Test download_to_file when a retry is returned."""
         mock_s3 = MockS3()
-        mock_s3.mk_download_head_throttled(self.config.bucket, 'x/y/z')
+        mock_s3.mk_get_object_error(self.config.bucket, 'x/y/z', 'SlowDown')
         with mock_s3:
-            res = s3.download(self.config, 'x/y/z')
+            res = s3.download_to_file(self.config, 'x/y/z', self.outfile)
             self.assertEqual(31, res)
 
-    def test_download_other(self) -> None:
-        """Test download when some other error is returned."""
+    def test_download_to_file__other(self) -> None:
+        """Test download_to_file when some other error is returned."""
         mock_s3 = MockS3()
-        mock_s3.mk_download_head_access_denied(self.config.bucket, 'x/y/z')
+        mock_s3.mk_get_object_error(self.config.bucket, 'x/y/z', 'AccessDenied')
         with mock_s3:
             try:
-                s3.download(self.config, 'x/y/z')
+                s3.download_to_file(self.config, 'x/y/z', self.outfile)
                 self.fail("Did not raise an exception")  # pragma no cover
             except ClientError as err:
                 self.assertEqual(
                     "ClientError('An error occurred (AccessDenied) when "
-                    "calling the HeadObject operation: ')",
+                    "calling the GetObject operation: AccessDenied')",
                     repr(err),
                 )
 
-    def test_download_ok(self) -> None:
-        """Test download when the key exists and the contents are ok."""
+    def test_download_to_file__too_large(self) -> None:
+        """Test download_to_file when the contents are too large."""
+        self.config.max_document_bytes = 2
         mock_s3 = MockS3()
         mock_s3.mk_download(self.config.bucket, 'x/y/z', b'a-b-c')
         with mock_s3:
-            res = s3.download(self.config, 'x/y/z')
-            self.assertEqual(b'a-b-c', res)
+            res = s3.download_to_file(self.config, 'x/y/z', self.outfile)
+            self.assertEqual(31, res)
+        self.assertFalse(os.path.isfile(self.outfile))
+
+    def test_download_to_file__interrupted(self) -> None:
+        """Test download_to_file when the stream is cut short."""
+        mock_s3 = MockS3()
+        mock_s3.stubber.add_response('get_object', {
+            'Body': _InterruptedBody(io.BytesIO(b'a-b-c')),
+            'ContentLength': 5,
+        }, dict(Bucket=self.config.bucket, Key='x/y/z'))
+        with mock_s3:
+            res = s3.download_to_file(self.config, 'x/y/z', self.outfile)
+            self.assertEqual(31, res)
+        self.assertFalse(os.path.isfile(self.outfile))
+
+    def test_download_to_file__bad_gzip(self) -> None:
+        """Test download_to_file when the gzip encoded contents are cut short or
+        corrupt."""
+        data = gzip.compress(b'a-b-c' * 100)
+        for contents in (data[:len(data) // 2], data[:10] + b'\xff' * 20 + data[30:]):
+            mock_s3 = MockS3()
+            mock_s3.mk_download(self.config.bucket, 'x/y/z', contents, 'gzip')
+            with mock_s3:
+                res = s3.download_to_file(self.config, 'x/y/z', self.outfile)
+                self.assertEqual(31, res)
+            self.assertFalse(os.path.isfile(self.outfile))
+
+    def test_download_to_file__ok(self) -> None:
+        """Test download_to_file when the key exists and the contents are ok."""
+        mock_s3 = MockS3()
+        mock_s3.mk_download(self.config.bucket, 'x/y/z', b'a-b-c')
+        with mock_s3:
+            res = s3.download_to_file(self.config, 'x/y/z', self.outfile)
+            self.assertEqual(0, res)
+        with open(self.outfile, 'rb') as f:
+            self.assertEqual(b'a-b-c', f.read())
+
+    def test_download_if_changed__ok(self) -> None:
+        """Test download_if_changed when the contents changed."""
+        mock_s3 = MockS3()
+        mock_s3.mk_get_object(self.config.bucket, 'x/y/z', b'a-b-c', '"e2"', '"e1"')
+        with mock_s3:
+            res = s3.download_if_changed(self.config, 'x/y/z', '"e1"')
+            self.assertEqual((b'a-b-c', '"e2"'), res)
+
+    def test_download_if_changed__not_modified(self) -> None:
+        """Test download_if_changed when the contents did not change."""
+        mock_s3 = MockS3()
+        mock_s3.mk_get_object_error(self.config.bucket, 'x/y/z', '304', '"e1"')
+        with mock_s3:
+            res = s3.download_if_changed(self.config, 'x/y/z', '"e1"')
+            self.assertEqual(30, res)
+
+    def test_download_if_changed__not_found(self) -> None:
+        """Test download_if_changed when the key doesn't exist."""
+        mock_s3 = MockS3()
+        mock_s3.mk_get_object_error(self.config.bucket, 'x/y/z', 'NoSuchKey')
+        with mock_s3:
+            res = s3.download_if_changed(self.config, 'x/y/z', '')
+            self.assertIsNone(res)
+
+    def test_download_if_changed__too_large(self) -> None:
+        """Test download_if_changed when the contents are too large."""
+        self.config.max_document_bytes = 2
+        mock_s3 = MockS3()
+        mock_s3.mk_get_object(self.config.bucket, 'x/y/z', b'a-b-c', '"e1"')
+        with mock_s3:
+            res = s3.download_if_changed(self.config, 'x/y/z', '')
+            self.assertIsNone(res)
+
+    def test_download_if_changed__other(self) -> None:
+        """Test download_if_changed when some other error is returned."""
+        mock_s3 = MockS3()
+        mock_s3.mk_get_object_error(self.config.bucket, 'x/y/z', 'AccessDenied')
+        with mock_s3:
+            with self.assertRaises(ClientError):
+                s3.download_if_changed(self.config, 'x/y/z', '')
+
+    def test_is_not_modified_error__not_client_error(self) -> None:
+        """Test is_not_modified_error with a non-client error."""
+        self.assertFalse(s3.is_not_modified_error(Exception('foo')))
 
     def test_upload_retry(self) -> None:
         """Test upload with a retry response."""
@@ -239,6 +358,74 @@ class S3Test(unittest.TestCase):  # pylint: disable=R0904
             res = s3.upload(self.config, 'x/y/z', b'data')
             self.assertEqual(0, res)
 
+    def test_upload__multipart(self) -> None:
+        """Test upload with contents beyond the multipart threshold."""
+        s3.set_aws_config({}, {**s3.CLIENT_SETTINGS, 'multipart_threshold': 4})
+        mock_s3 = MockS3()
+        mock_s3.stubber.add_response(
+            'create_multipart_upload', {'UploadId': 'u1'},
+            dict(Bucket=self.config.bucket, Key='x/y/z', ContentEncoding='gzip'),
+        )
+        mock_s3.stubber.add_response('upload_part', {'ETag': '"e1"'}, None)
+        mock_s3.stubber.add_response('complete_multipart_upload', {}, None)
+        with mock_s3:
+            res = s3.upload(self.config, 'x/y/z', b'data-data', 'gzip')
+            self.assertEqual(0, res)
+
+    def test_upload_if_match__created(self) -> None:
+        """Test upload_if_match for a key that must not exist."""
+        mock_s3 = MockS3()
+        mock_s3.mk_upload_if_match(self.config.bucket, 'x/y/z', None)
+        with mock_s3:
+            res = s3.upload_if_match(self.config, 'x/y/z', b'data', None)
+            self.assertEqual(0, res)
+
+    def test_upload_if_match__changed(self) -> None:
+        """Test upload_if_match for a key that changed."""
+        mock_s3 = MockS3()
+        mock_s3.mk_upload_if_match(self.config.bucket, 'x/y/z', '"e1"', 'PreconditionFailed')
+        with mock_s3:
+            res = s3.upload_if_match(self.config, 'x/y/z', b'data', '"e1"')
+            self.assertEqual(30, res)
+
+    def test_upload_if_match__retry(self) -> None:
+        """Test upload_if_match with a retry response."""
+        mock_s3 = MockS3()
+        mock_s3.mk_upload_if_match(self.config.bucket, 'x/y/z', '"e1"', 'SlowDown')
+        with mock_s3:
+            res = s3.upload_if_match(self.config, 'x/y/z', b'data', '"e1"')
+            self.assertEqual(31, res)
+
+    def test_upload_if_match__other(self) -> None:
+        """Test upload_if_match with another error."""
+        mock_s3 = MockS3()
+        mock_s3.mk_upload_if_match(self.config.bucket, 'x/y/z', '"e1"', 'AccessDenied')
+        with mock_s3:
+            with self.assertRaises(ClientError):
+                s3.upload_if_match(self.config, 'x/y/z', b'data', '"e1"')
+
+    def test_supports_conditional_upload(self) -> None:
+        """Test supports_conditional_upload against the installed botocore's model."""
+        mock_s3 = MockS3()
+        with mock_s3:
+            self.assertEqual(
+                'IfMatch' in mock_s3.client.meta.service_model.operation_model(
+                    'PutObject',
+                ).input_shape.members,
+                s3.supports_conditional_upload(),
+            )
+
+    def test_is_precondition_failed_error(self) -> None:
+        """Test is_precondition_failed_error with the different errors."""
+        for code, expected in (
+                ('PreconditionFailed', True), ('ConditionalRequestConflict', True),
+                ('412', True), ('AccessDenied', False),
+        ):
+            self.assertEqual(expected, s3.is_precondition_failed_error(ClientError(
+                {'Error': {'Code': code, 'Message': code}}, 'PutObject',
+            )))
+        self.assertFalse(s3.is_precondition_failed_error(Exception('foo')))
+
     def test_list_entries__empty(self) -> None:
         """Test list_entries with no keys."""
         mock_s3 = MockS3()
@@ -259,7 +446,12 @@ class S3Test(unittest.TestCase):  # pylint: disable=R0904
     def test_get_document_s3_path(self) -> None:
         """Test get_document_s3_path"""
         res = s3.get_document_s3_path(self.config, 'tuna')
-        self.assertEqual('nightjar-datastore/tuna', res)
+        self.assertEqual('nightjar-datastore/tuna/', res)
+
+    def test_get_latest_pointer_s3_key(self) -> None:
+        """Test get_latest_pointer_s3_key"""
+        res = s3.get_latest_pointer_s3_key(self.config, 'tuna')
+        self.assertEqual('nightjar-datastore/tuna/latest.pointer', res)
 
     def test_get_meta_file_s3_key(self) -> None:
         """Test get_meta_file_s3_key"""
@@ -271,3 +463,15 @@ class S3Test(unittest.TestCase):  # pylint: disable=R0904
         """Test get_version_file_s3_key"""
         res = s3.get_version_file_s3_key(self.config, 'tuna', 'ahi')
         self.assertEqual(DEFAULT_BASE_PATH + '/tuna/ahi.data', res)
+
+
+class _InterruptedBody:
+    """A response body whose stream ends early."""
+    def __init__(self, body: Any) -> None:
+        self._body = body
+
+    def read(self, size: int = -1) -> bytes:
+        """Read part of the contents, then fail."""
+        if self._body.read(size):
+            raise IncompleteReadError(actual_bytes=1, expected_bytes=5)
+        return b''  # pragma no cover
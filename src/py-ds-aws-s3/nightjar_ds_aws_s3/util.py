@@ -2,15 +2,13 @@
 """Constant values... and other things."""
 
 from typing import Any
-import os
-import sys
+from nightjar_common import log as common_log
 
 
 DATA_FILE_EXTENSION = '.data'
 META_FILE_EXTENSION = '.meta'
 FILE_EXTENSION_LENGTH = 5
-
-DEBUG = os.environ.get('DEBUG') == 'true'
+LATEST_POINTER_NAME = 'latest.pointer'
 
 
 def get_version_from_data_key_name(key: str) -> str:
@@ -31,14 +29,11 @@ def is_meta_file(key: str) -> bool:
     return key.endswith(META_FILE_EXTENSION)
 
 
-def debug(message: str, **kwargs: Any) -> None:
+def debug(message: str, /, **kwargs: Any) -> None:
     """Debug logging."""
-    if DEBUG:
-        log('DEBUG', message, **kwargs)
+    common_log.debug(message, **kwargs)
 
 
-def log(level: str, message: str, **kwargs: Any) -> None:
+def log(level: str, message: str, /, **kwargs: Any) -> None:
     """Log information to stderr."""
-    sys.stderr.write('[nightjar-ds_aws_s3 :: {0}] {1}\n'.format(
-        level, message.format(**kwargs)
-    ))
+    common_log.log(level, message, **kwargs)
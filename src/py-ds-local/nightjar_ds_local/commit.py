@@ -5,13 +5,21 @@ Commit the data.
 
 import os
 import json
+import shutil
+import tempfile
 import datetime
 from .config import Config
 
+HISTORY_FILE_EXTENSION = '.json'
+
 
 def commit(config: Config, document: str, source_file: str) -> int:
     """
     Commit the source file to the local store.
+
+    The document is written to a temporary file in the same directory, flushed to disk,
+    then renamed over the document file, so readers never see a partially written
+    document.
     """
     if not os.path.isfile(source_file):
         print(
@@ -22,16 +30,76 @@ def commit(config: Config, document: str, source_file: str) -> int:
     with open(source_file, 'r') as f:
         data = json.load(f)
     assert isinstance(data, dict)
-    version = datetime.datetime.utcnow().isoformat()
-    data['commit-version'] = version
+    now = datetime.datetime.utcnow()
+    data['commit-version'] = now.isoformat()
 
     dst_file = config.get_file(document)
     if not dst_file:
         print("[nightjar-ds-local] Invalid document: `{0}`".format(document))
         return 5
 
-    os.makedirs(os.path.dirname(dst_file), exist_ok=True)
-    with open(dst_file, 'w') as f:
-        json.dump(data, f)
+    write_atomic(dst_file, json.dumps(data).encode('utf-8'))
+    if config.history_dir:
+        add_history(config, document, dst_file, now.strftime('%Y%m%dT%H%M%S%f'))
     print("[nightjar-ds-local] Committed {0}".format(document))
     return 0
+
+
+def write_atomic(dst_file: str, contents: bytes) -> None:
+    """Replace the file with the contents, so that it either has the old or the new
+    contents, even if the system crashes."""
+    dst_dir = os.path.dirname(os.path.abspath(dst_file))
+    os.makedirs(dst_dir, exist_ok=True)
+    gen_fd, gen_filename = tempfile.mkstemp(
+        prefix=os.path.basename(dst_file), suffix='.tmp', dir=dst_dir,
+    )
+    try:
+        os.write(gen_fd, contents)
+        os.fsync(gen_fd)
+    finally:
+        os.close(gen_fd)
+    try:
+        # mkstemp creates the file readable only by the owner.
+        os.chmod(gen_filename, 0o644)
+        os.replace(gen_filename, dst_file)
+    except OSError:
+        os.unlink(gen_filename)
+        raise
+    fsync_dir(dst_dir)
+
+
+def fsync_dir(dir_name: str) -> None:
+    """Flush the directory entries to disk, so a rename survives a crash.  Not all
+    platforms allow opening a directory."""
+    try:
+        dir_fd = os.open(dir_name, os.O_RDONLY)
+    except OSError:  # pragma no cover
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:  # pragma no cover
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+def add_history(config: Config, document: str, dst_file: str, version: str) -> None:
+    """Keep the committed document in the history directory, so it can be copied back
+    to roll back the commit.  The committed file is never changed in place, so it can be
+    hard linked.  Only the newest `history_count` versions are kept."""
+    history_dir = os.path.join(config.history_dir, document)
+    os.makedirs(history_dir, exist_ok=True)
+    history_file = os.path.join(history_dir, version + HISTORY_FILE_EXTENSION)
+    try:
+        os.link(dst_file, history_file)
+    except OSError:  # pragma no cover
+        # Different file system, or links are not supported.
+        shutil.copyfile(dst_file, history_file)
+
+    versions = sorted(
+        name
+        for name in os.listdir(history_dir)
+        if name.endswith(HISTORY_FILE_EXTENSION)
+    )
+    for name in versions[:-config.history_count]:
+        os.unlink(os.path.join(history_dir, name))
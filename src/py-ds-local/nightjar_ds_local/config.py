@@ -13,21 +13,36 @@ ENV_NAME__LOCAL_FILE_TEMPLATES = ENV_FORMAT__LOCAL_FILE.format('TEMPLATES')
 DEFAULT__LOCAL_FILE_TEMPLATE = DEFAULT_FORMAT__LOCAL_FILE.format('templates')
 ENV_NAME__LOCAL_FILE_DISCOVERY_MAP = ENV_FORMAT__LOCAL_FILE.format('DISCOVERY_MAP')
 DEFAULT__LOCAL_FILE_DISCOVERY_MAP = DEFAULT_FORMAT__LOCAL_FILE.format('discovery-map')
+ENV_NAME__HISTORY_DIR = 'NJ_DSLOCAL_HISTORY_DIR'
+ENV_NAME__HISTORY_COUNT = 'NJ_DSLOCAL_HISTORY_COUNT'
+DEFAULT__HISTORY_COUNT = 10
+
+# The sharded and delta discovery map documents are stored next to the discovery map file.
+DISCOVERY_MAP_INDEX_DOCUMENT = 'discovery-map-index'
+DISCOVERY_MAP_DELTA_DOCUMENT = 'discovery-map-delta'
+DISCOVERY_MAP_NAMESPACE_DOCUMENT_PREFIX = 'discovery-map-namespace.'
 
 
 class Config:
     """The configuration."""
-    __slots__ = ('local_files',)
+    __slots__ = ('local_files', 'history_dir', 'history_count',)
 
     def __init__(self, env: Dict[str, str]) -> None:
         self.local_files = {
             'templates': get_templates_file(env),
             'discovery-map': get_discovery_map_file(env),
         }
+        self.history_dir = env.get(ENV_NAME__HISTORY_DIR, '')
+        self.history_count = get_history_count(env)
 
     def get_file(self, document: str) -> Optional[str]:
         """Get the local file for the document.  Returns None if it isn't valid."""
-        return self.local_files.get(document)
+        ret = self.local_files.get(document)
+        if ret is None and is_extra_discovery_map_document(document):
+            ret = os.path.join(
+                os.path.dirname(self.local_files['discovery-map']), document + '.json',
+            )
+        return ret
 
 
 def create_configuration() -> Config:
@@ -35,6 +50,19 @@ def create_configuration() -> Config:
     return Config(dict(os.environ))
 
 
+def is_extra_discovery_map_document(document: str) -> bool:
+    """Is the document name one of the sharded or delta discovery map documents?  The
+    namespace part of the name is already encoded, but must not be a path."""
+    if document in (DISCOVERY_MAP_INDEX_DOCUMENT, DISCOVERY_MAP_DELTA_DOCUMENT):
+        return True
+    return (
+        document.startswith(DISCOVERY_MAP_NAMESPACE_DOCUMENT_PREFIX)
+        and len(document) > len(DISCOVERY_MAP_NAMESPACE_DOCUMENT_PREFIX)
+        and '/' not in document
+        and '\\' not in document
+    )
+
+
 def get_discovery_map_file(env: Dict[str, str]) -> str:
     """Get the discovery map file defined in the environment."""
     return env.get(
@@ -47,3 +75,11 @@ def get_templates_file(env: Dict[str, str]) -> str:
     return env.get(
         ENV_NAME__LOCAL_FILE_TEMPLATES, DEFAULT__LOCAL_FILE_TEMPLATE,
     )
+
+
+def get_history_count(env: Dict[str, str]) -> int:
+    """Get the number of committed versions to keep in the history directory."""
+    try:
+        return max(1, int(env.get(ENV_NAME__HISTORY_COUNT, str(DEFAULT__HISTORY_COUNT))))
+    except ValueError:
+        return DEFAULT__HISTORY_COUNT
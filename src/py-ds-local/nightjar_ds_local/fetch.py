@@ -3,30 +3,82 @@
 Fetch the data.
 """
 
+from typing import Dict, List, Any
 import os
 import json
+import shutil
 from .config import Config
 
+FETCH_STATE_FILE_SUFFIX = '.local-state'
+
 
 def fetch(config: Config, document: str, dst_file: str, previous_version: str) -> int:
-    """Fetch the data from the store."""
-    if document not in config.local_files:
+    """Fetch the data from the store.
+
+    The source file's modification time, size and inode from the last fetch are kept
+    next to the destination file, so that an unchanged source file isn't read again.
+    A changed source file is copied as-is, and only parsed to find its version.
+    """
+    src_file = config.get_file(document)
+    if not src_file:
         print("[nightjar-ds-local] Invalid activity `{0}`".format(document))
         return 5
-    src_file = config.local_files[document]
 
     if not os.path.isfile(src_file):
         print("[nightjar-ds-local] No data for document {0}.".format(document))
         # It might appear later...
         return 31
 
-    with open(src_file, 'r') as f:
-        data = json.load(f)
-    assert isinstance(data, dict)
-    if previous_version and data['document-version'] == previous_version:
+    state_file = dst_file + FETCH_STATE_FILE_SUFFIX
+    file_stat = get_file_stat(src_file)
+    state = read_fetch_state(state_file)
+    if (
+            previous_version
+            and state.get('file') == file_stat
+            and state.get('document-version') == previous_version
+    ):
         return 30
 
     os.makedirs(os.path.dirname(dst_file), exist_ok=True)
-    with open(dst_file, 'w') as f:
-        json.dump(data, f)
+    shutil.copyfile(src_file, dst_file)
+    try:
+        with open(dst_file, 'r') as f:
+            data = json.load(f)
+    except ValueError:
+        print("[nightjar-ds-local] Document {0} is not valid JSON.".format(document))
+        os.unlink(dst_file)
+        # It might be in the middle of a write...
+        return 31
+    assert isinstance(data, dict)
+    version = data['document-version']
+    write_fetch_state(state_file, {'file': file_stat, 'document-version': version})
+    if previous_version and version == previous_version:
+        os.unlink(dst_file)
+        return 30
     return 0
+
+
+def get_file_stat(filename: str) -> List[int]:
+    """Get the file's modification time, size and inode, which change when it is
+    written."""
+    stat = os.stat(filename)
+    return [stat.st_mtime_ns, stat.st_size, stat.st_ino]
+
+
+def read_fetch_state(state_file: str) -> Dict[str, Any]:
+    """Read the state stored by the last fetch into the same output file."""
+    if os.path.isfile(state_file):
+        try:
+            with open(state_file, 'r') as f:
+                ret = json.load(f)
+            if isinstance(ret, dict):
+                return ret
+        except ValueError:
+            pass
+    return {}
+
+
+def write_fetch_state(state_file: str, state: Dict[str, Any]) -> None:
+    """Store the state for the next fetch into the same output file."""
+    with open(state_file, 'w') as f:
+        json.dump(state, f)
@@ -3,10 +3,11 @@
 Single local file implementation of the data store extension point executable.
 """
 
-from typing import List
+from typing import List, Optional
 from .config import create_configuration
 from .commit import commit
 from .fetch import fetch
+from .watch import watch
 
 
 ARG__DOCUMENT = '--document='
@@ -14,6 +15,9 @@ ARG__PREVIOUS_VERSION = '--previous-document-version='
 ARG__ACTION = '--action='
 ARG__FILE = '--action-file='
 ARG__API_VERSION = '--api-version='
+ARG__WATCH_TIMEOUT = '--watch-timeout='
+ARG__WATCH_SINCE = '--watch-since='
+DEFAULT_WATCH_TIMEOUT = 30.0
 
 
 def main(argv: List[str]) -> int:
@@ -24,6 +28,8 @@ def main(argv: List[str]) -> int:
     action = ''
     action_file = ''
     api_version = ''
+    watch_timeout = DEFAULT_WATCH_TIMEOUT
+    watch_since: Optional[float] = None
 
     for arg in argv[1:]:
         if arg.startswith(ARG__DOCUMENT):
@@ -36,6 +42,16 @@ def main(argv: List[str]) -> int:
             action_file = arg[len(ARG__FILE):].strip()
         elif arg.startswith(ARG__API_VERSION):
             api_version = arg[len(ARG__API_VERSION):].strip()
+        elif arg.startswith(ARG__WATCH_TIMEOUT):
+            try:
+                watch_timeout = float(arg[len(ARG__WATCH_TIMEOUT):].strip())
+            except ValueError:
+                print('[nightjar-ds-local] Invalid watch timeout: ' + arg)
+        elif arg.startswith(ARG__WATCH_SINCE):
+            try:
+                watch_since = float(arg[len(ARG__WATCH_SINCE):].strip())
+            except ValueError:
+                print('[nightjar-ds-local] Invalid watch since time: ' + arg)
 
     if api_version != '1':
         print('[nightjar-ds-local] Unknown API version: ' + api_version)
@@ -47,5 +63,12 @@ def main(argv: List[str]) -> int:
     if action == 'fetch':
         return fetch(config, document, action_file, previous_version)
 
+    if action == 'watch':
+        return watch(config, watch_timeout, watch_since)
+
+    if action == 'gc':
+        # Each document is a single file, so there are no old versions to remove.
+        return 0
+
     print("[nightjar-ds-local] Invalid action `{0}`.".format(action))
     return 6
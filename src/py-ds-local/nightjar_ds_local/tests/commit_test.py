@@ -5,6 +5,8 @@ Test the commit module.
 
 from typing import cast
 import unittest
+import os
+import json
 import re
 from .util import Local
 from .. import commit
@@ -73,3 +75,50 @@ class CommitTest(unittest.TestCase):
         self.assertIsNotNone(ISO_DATETIME_FORMAT_RE.match(
             cast(str, data.get('commit-version'))
         ))
+
+    def test_commit_replaces_file(self) -> None:
+        """Test that the commit replaces the document file, rather than writing into it,
+        and leaves no temporary files."""
+        self._local.write_template({'document-version': 'old'})
+        old_inode = os.stat(self._local.template_file).st_ino
+        with open(self._local.template_file, 'r') as reader:
+            self._local.write_action_file({'expected-template': True})
+            res = commit.commit(self._local.config, 'templates', self._local.action_file)
+            self.assertEqual(0, res)
+            # An open reader still sees the whole old document.
+            self.assertEqual({'document-version': 'old'}, json.load(reader))
+        self.assertNotEqual(old_inode, os.stat(self._local.template_file).st_ino)
+        self.assertIs(True, self._local.read_template().get('expected-template'))
+        self.assertEqual(
+            sorted(['template.json', 'action.json']),
+            sorted(os.listdir(self._local.temp_dir)),
+        )
+
+    def test_commit_replace_failure(self) -> None:
+        """Test that a failed replace removes the temporary file."""
+        os.makedirs(os.path.join(self._local.template_file, 'x'))
+        self._local.write_action_file({'expected-template': True})
+        with self.assertRaises(OSError):
+            commit.commit(self._local.config, 'templates', self._local.action_file)
+        self.assertEqual(['x'], os.listdir(self._local.template_file))
+        self.assertEqual(
+            sorted(['template.json', 'action.json']),
+            sorted(os.listdir(self._local.temp_dir)),
+        )
+
+    def test_commit_history(self) -> None:
+        """Test that the history directory keeps the newest committed versions."""
+        history_dir = os.path.join(self._local.temp_dir, 'history')
+        self._local.config.history_dir = history_dir
+        self._local.config.history_count = 2
+        for index in range(3):
+            self._local.write_action_file({'index': index})
+            res = commit.commit(self._local.config, 'templates', self._local.action_file)
+            self.assertEqual(0, res)
+        versions = sorted(os.listdir(os.path.join(history_dir, 'templates')))
+        self.assertEqual(2, len(versions))
+        contents = []
+        for name in versions:
+            with open(os.path.join(history_dir, 'templates', name), 'r') as f:
+                contents.append(json.load(f)['index'])
+        self.assertEqual([1, 2], contents)
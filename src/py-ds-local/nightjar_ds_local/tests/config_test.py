@@ -0,0 +1,21 @@
+
+"""
+Test the config module.
+"""
+
+import unittest
+from .. import config
+
+
+class ConfigTest(unittest.TestCase):
+    """Test the configuration functions."""
+
+    def test_get_history_count(self) -> None:
+        """Test get_history_count"""
+        self.assertEqual(config.DEFAULT__HISTORY_COUNT, config.get_history_count({}))
+        self.assertEqual(3, config.get_history_count({config.ENV_NAME__HISTORY_COUNT: '3'}))
+        self.assertEqual(1, config.get_history_count({config.ENV_NAME__HISTORY_COUNT: '0'}))
+        self.assertEqual(
+            config.DEFAULT__HISTORY_COUNT,
+            config.get_history_count({config.ENV_NAME__HISTORY_COUNT: 'x'}),
+        )
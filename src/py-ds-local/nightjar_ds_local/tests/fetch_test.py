@@ -4,6 +4,8 @@ Test the fetch module.
 """
 
 import unittest
+import os
+import json
 from .util import Local
 from .. import fetch
 
@@ -64,3 +66,78 @@ class FetchTest(unittest.TestCase):
             {'document-version': 'prev-1', 'expected-config': True},
             self._local.read_action_file(),
         )
+
+    def test_extra_discovery_map_documents(self) -> None:
+        """Test that the sharded and delta discovery map documents are stored next to the
+        discovery-map file."""
+        for document in (
+                'discovery-map-index', 'discovery-map-delta', 'discovery-map-namespace.n%2F1',
+        ):
+            with open(os.path.join(self._local.temp_dir, document + '.json'), 'w') as f:
+                json.dump({'document-version': 'v1', 'document': document}, f)
+            res = fetch.fetch(self._local.config, document, self._local.action_file, '')
+            self.assertEqual(0, res)
+            self.assertEqual(
+                {'document-version': 'v1', 'document': document},
+                self._local.read_action_file(),
+            )
+
+    def test_invalid_documents(self) -> None:
+        """Test that invalid document names are not fetched."""
+        for document in (
+                'discovery-map-namespace.', 'discovery-map-namespace.a/b',
+                'discovery-map-namespace.a\\b', 'discovery-map-other',
+        ):
+            res = fetch.fetch(self._local.config, document, self._local.action_file, '')
+            self.assertEqual(5, res)
+
+    def test_unchanged_file_not_read(self) -> None:
+        """Ensure that, when the source file has not changed since the last fetch, the
+        previous version is trusted without reading the file."""
+        self._local.write_template({'document-version': 'prev-1'})
+        fetch.write_fetch_state(self._local.action_file + fetch.FETCH_STATE_FILE_SUFFIX, {
+            'file': fetch.get_file_stat(self._local.template_file),
+            'document-version': 'prev-0',
+        })
+        res = fetch.fetch(self._local.config, 'templates', self._local.action_file, 'prev-0')
+        self.assertEqual(30, res)
+        self.assertFalse(self._local.does_action_file_exist())
+
+    def test_changed_file(self) -> None:
+        """Ensure that, when the source file changed since the last fetch, it is read
+        again."""
+        self._local.write_template({'document-version': 'prev-1'})
+        res = fetch.fetch(self._local.config, 'templates', self._local.action_file, '')
+        self.assertEqual(0, res)
+        os.unlink(self._local.action_file)
+        res = fetch.fetch(self._local.config, 'templates', self._local.action_file, 'prev-1')
+        self.assertEqual(30, res)
+        self.assertFalse(self._local.does_action_file_exist())
+
+        os.unlink(self._local.template_file)
+        self._local.write_template({'document-version': 'prev-2', 'changed': True})
+        res = fetch.fetch(self._local.config, 'templates', self._local.action_file, 'prev-1')
+        self.assertEqual(0, res)
+        self.assertEqual(
+            {'document-version': 'prev-2', 'changed': True},
+            self._local.read_action_file(),
+        )
+
+    def test_invalid_json(self) -> None:
+        """Ensure that a partially written source file is retried."""
+        with open(self._local.template_file, 'w') as f:
+            f.write('{"document-version": ')
+        res = fetch.fetch(self._local.config, 'templates', self._local.action_file, '')
+        self.assertEqual(31, res)
+        self.assertFalse(self._local.does_action_file_exist())
+
+    def test_read_fetch_state__invalid(self) -> None:
+        """Test read_fetch_state with missing and invalid state files."""
+        state_file = self._local.action_file + fetch.FETCH_STATE_FILE_SUFFIX
+        self.assertEqual({}, fetch.read_fetch_state(state_file))
+        with open(state_file, 'w') as f:
+            f.write('{[')
+        self.assertEqual({}, fetch.read_fetch_state(state_file))
+        with open(state_file, 'w') as f:
+            f.write('[]')
+        self.assertEqual({}, fetch.read_fetch_state(state_file))
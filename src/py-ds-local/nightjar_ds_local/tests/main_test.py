@@ -3,6 +3,7 @@
 
 import unittest
 import os
+import threading
 from .util import Local
 from .. import main
 from ..config import ENV_NAME__LOCAL_FILE_TEMPLATES, ENV_NAME__LOCAL_FILE_DISCOVERY_MAP
@@ -41,6 +42,16 @@ class MainTest(unittest.TestCase):
         ])
         self.assertEqual(6, res)
 
+    def test_gc(self) -> None:
+        """Ensure the gc action does nothing."""
+        res = main.main([
+            'main.py',
+            "--api-version=1",
+            "--action=gc",
+            "--document=discovery-map",
+        ])
+        self.assertEqual(0, res)
+
     def test_invalid_document(self) -> None:
         """Ensure the right exit code."""
         self._create_action_file()
@@ -83,6 +94,54 @@ class MainTest(unittest.TestCase):
         ])
         self.assertEqual(5, res)
 
+    def test_watch(self) -> None:
+        """Ensure the watch action times out with no changes."""
+        self._create_basic_files()
+        res = main.main([
+            'main.py',
+            "--api-version=1",
+            "--action=watch",
+            "--watch-timeout=0.01",
+        ])
+        self.assertEqual(30, res)
+
+    def test_watch_since(self) -> None:
+        """Ensure the watch action returns right away for files changed since the time,
+        and ignores an invalid time."""
+        self._create_basic_files()
+        res = main.main([
+            'main.py',
+            "--api-version=1",
+            "--action=watch",
+            "--watch-timeout=10",
+            "--watch-since=0",
+        ])
+        self.assertEqual(0, res)
+        res = main.main([
+            'main.py',
+            "--api-version=1",
+            "--action=watch",
+            "--watch-timeout=0.01",
+            "--watch-since=x",
+        ])
+        self.assertEqual(30, res)
+
+    def test_watch_invalid_timeout(self) -> None:
+        """Ensure an invalid watch timeout uses the default timeout."""
+        self._create_basic_files()
+        timer = threading.Timer(0.1, self._create_basic_files)
+        timer.start()
+        try:
+            res = main.main([
+                'main.py',
+                "--api-version=1",
+                "--action=watch",
+                "--watch-timeout=x",
+            ])
+        finally:
+            timer.cancel()
+        self.assertEqual(0, res)
+
     def _create_action_file(self) -> None:
         self._local.write_action_file({"type": "action"})
 
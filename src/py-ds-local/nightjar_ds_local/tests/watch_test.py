@@ -0,0 +1,86 @@
+
+"""
+Test the watch module.
+"""
+
+from typing import Callable
+import unittest
+import os
+import json
+import time
+import threading
+from .util import Local
+from .. import watch
+
+
+class WatchTest(unittest.TestCase):
+    """Test the watch functions."""
+
+    def setUp(self) -> None:
+        self._local = Local()
+        self._local.write_template({'document-version': 'v1'})
+        self._local.write_config({'document-version': 'v1'})
+        self._timer: threading.Timer = threading.Timer(0, lambda: None)
+
+    def tearDown(self) -> None:
+        self._timer.cancel()
+        self._local.tear_down()
+
+    def test_watch__timeout(self) -> None:
+        """Test watch with no change."""
+        self.assertEqual(30, watch.watch(self._local.config, 0.05))
+
+    def test_watch__template_changed(self) -> None:
+        """Test watch with a change to the templates."""
+        self._later(lambda: self._local.write_template({'document-version': 'v2'}))
+        self.assertEqual(0, watch.watch(self._local.config, 10))
+
+    def test_watch__extra_document_changed(self) -> None:
+        """Test watch with a new delta discovery map document."""
+        self._later(lambda: self._write('discovery-map-delta.json'))
+        self.assertEqual(0, watch.watch(self._local.config, 10))
+
+    def test_watch__changed_since(self) -> None:
+        """Test watch with files that changed since the given time, such as after the
+        caller's last fetch."""
+        self.assertEqual(0, watch.watch(self._local.config, 10, time.time() - 60))
+        self.assertEqual(30, watch.watch(self._local.config, 0.05, time.time() + 60))
+
+    def test_watch_inotify__other_file_changed(self) -> None:
+        """Test watch_inotify with a change to an unrelated file."""
+        self._later(lambda: self._write('other.json'))
+        self.assertEqual(30, watch.watch_inotify(self._local.config, 0.3))
+
+    def test_watch_inotify__missing_dir(self) -> None:
+        """Test watch_inotify with a document directory that doesn't exist."""
+        self._local.config.local_files['templates'] = os.path.join(
+            self._local.temp_dir, 'missing', 'templates.json',
+        )
+        self.assertIsNone(watch.watch_inotify(self._local.config, 0.05))
+
+    def test_watch_poll(self) -> None:
+        """Test watch_poll with and without changes."""
+        self._local.config.local_files['templates'] = os.path.join(
+            self._local.temp_dir, 'missing', 'templates.json',
+        )
+        self.assertEqual(30, watch.watch(self._local.config, 0.05))
+        self.assertEqual(30, watch.watch(self._local.config, 0.05, time.time() + 60))
+        self._later(lambda: self._local.write_config({'document-version': 'v2, longer'}))
+        self.assertEqual(0, watch.watch_poll(self._local.config, 10))
+        self.assertEqual(0, watch.watch_poll(self._local.config, 10, time.time() - 60))
+
+    def test_parse_events(self) -> None:
+        """Test parse_events"""
+        data = (
+            watch.EVENT_HEADER.pack(1, watch.IN_CLOSE_WRITE, 0, 8) + b'a.json\0\0'
+            + watch.EVENT_HEADER.pack(2, watch.IN_DELETE, 0, 0)
+        )
+        self.assertEqual([(1, 'a.json'), (2, '')], list(watch.parse_events(data)))
+
+    def _later(self, callback: Callable[[], None]) -> None:
+        self._timer = threading.Timer(0.1, callback)
+        self._timer.start()
+
+    def _write(self, name: str) -> None:
+        with open(os.path.join(self._local.temp_dir, name), 'w') as f:
+            json.dump({'document-version': 'v1'}, f)
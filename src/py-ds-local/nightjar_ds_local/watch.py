@@ -0,0 +1,168 @@
+
+"""
+Watch the local files for changes.
+"""
+
+from typing import Dict, List, Tuple, Iterable, Optional, Any
+import os
+import time
+import select
+import struct
+import ctypes
+from .config import Config, is_extra_discovery_map_document
+
+POLL_INTERVAL_SECONDS = 1.0
+
+# inotify(7) values.
+IN_CLOEXEC = 0o2000000
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_DELETE = 0x00000200
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE
+EVENT_HEADER = struct.Struct('iIII')
+EVENT_BUFFER_SIZE = 64 * 1024
+
+
+def watch(config: Config, timeout: float, since: Optional[float] = None) -> int:
+    """Wait for one of the document files to change.  Returns 0 when a file changed, or
+    30 if nothing changed before the timeout.  If the files changed at or after the
+    `since` time, such as between the caller's fetch and this call, then this returns
+    right away.  This uses inotify where it's available, and otherwise polls the files'
+    stats."""
+    ret = watch_inotify(config, timeout, since)
+    if ret is None:
+        ret = watch_poll(config, timeout, since)
+    return ret
+
+
+def watch_inotify(
+        config: Config, timeout: float, since: Optional[float] = None,
+) -> Optional[int]:
+    """Wait for a change with inotify.  Returns None if inotify can't be used."""
+    libc = load_libc()
+    if libc is None:
+        return None  # pragma no cover
+    inotify_fd = libc.inotify_init1(IN_CLOEXEC)
+    if inotify_fd < 0:
+        return None  # pragma no cover
+    try:
+        dirs: Dict[int, str] = {}
+        for dir_name in get_watched_dirs(config):
+            watch_fd = libc.inotify_add_watch(inotify_fd, dir_name.encode('utf-8'), WATCH_MASK)
+            if watch_fd < 0:
+                return None
+            dirs[watch_fd] = dir_name
+        # Checked once the watches are in place, so no change is missed in between.
+        if has_changed_since(config, since):
+            return 0
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = max(0.0, deadline - time.monotonic())
+            readable, _, _ = select.select([inotify_fd], [], [], remaining)
+            if not readable:
+                return 30
+            for watch_fd, name in parse_events(os.read(inotify_fd, EVENT_BUFFER_SIZE)):
+                if watch_fd in dirs and is_watched_file(
+                        config, os.path.join(dirs[watch_fd], name),
+                ):
+                    return 0
+    finally:
+        os.close(inotify_fd)
+
+
+def load_libc() -> Optional[Any]:
+    """Load the C library with the inotify functions, if this platform has them.  The
+    library is looked up in the running process, because `find_library` finds nothing
+    on some platforms, such as musl based ones."""
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+    except OSError:  # pragma no cover
+        return None
+    if not hasattr(libc, 'inotify_init1') or not hasattr(libc, 'inotify_add_watch'):
+        return None  # pragma no cover
+    return libc
+
+
+def parse_events(data: bytes) -> Iterable[Tuple[int, str]]:
+    """Parse the inotify events into the watch descriptor and file name."""
+    offset = 0
+    while offset + EVENT_HEADER.size <= len(data):
+        watch_fd, _, _, name_len = EVENT_HEADER.unpack_from(data, offset)
+        offset += EVENT_HEADER.size
+        name = data[offset:offset + name_len].rstrip(b'\0').decode('utf-8', errors='replace')
+        offset += name_len
+        yield watch_fd, name
+
+
+def watch_poll(config: Config, timeout: float, since: Optional[float] = None) -> int:
+    """Wait for a change by comparing the files' stats."""
+    deadline = time.monotonic() + timeout
+    original = get_file_stats(config)
+    if has_changed_since(config, since):
+        return 0
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return 30
+        time.sleep(min(remaining, POLL_INTERVAL_SECONDS))
+        if get_file_stats(config) != original:
+            return 0
+
+
+def get_file_stats(config: Config) -> Dict[str, List[int]]:
+    """Get the modification time, size and inode of each document file."""
+    ret: Dict[str, List[int]] = {}
+    for dir_name in get_watched_dirs(config):
+        if not os.path.isdir(dir_name):
+            continue
+        for name in os.listdir(dir_name):
+            filename = os.path.join(dir_name, name)
+            if is_watched_file(config, filename):
+                try:
+                    stat = os.stat(filename)
+                except OSError:  # pragma no cover
+                    # Removed since the listing.
+                    continue
+                ret[filename] = [stat.st_mtime_ns, stat.st_size, stat.st_ino]
+    return ret
+
+
+def has_changed_since(config: Config, since: Optional[float]) -> bool:
+    """Did a document file, or a document directory's listing, change at or after the
+    time?  A removed file only changes its directory."""
+    if since is None:
+        return False
+    since_ns = int(since * 1e9)
+    for dir_name in get_watched_dirs(config):
+        try:
+            if os.stat(dir_name).st_mtime_ns >= since_ns:
+                return True
+        except OSError:
+            continue
+    return any(stats[0] >= since_ns for stats in get_file_stats(config).values())
+
+
+def get_watched_dirs(config: Config) -> List[str]:
+    """Get the directories containing the document files."""
+    return sorted({
+        os.path.dirname(os.path.abspath(filename))
+        for filename in config.local_files.values()
+    })
+
+
+def is_watched_file(config: Config, filename: str) -> bool:
+    """Is the file one of the document files?  The sharded and delta discovery map
+    documents are next to the discovery map file."""
+    filename = os.path.abspath(filename)
+    if filename in (os.path.abspath(name) for name in config.local_files.values()):
+        return True
+    name = os.path.basename(filename)
+    return (
+        os.path.dirname(filename) == os.path.dirname(
+            os.path.abspath(config.local_files['discovery-map']),
+        )
+        and name.endswith('.json')
+        and is_extra_discovery_map_document(name[:-5])
+    )
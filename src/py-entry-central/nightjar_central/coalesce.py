@@ -0,0 +1,92 @@
+"""
+Coalesce rapid discovery map changes into fewer commits.
+
+Each commit makes every proxy fetch the new discovery map, so while the mesh changes
+quickly, such as during a deployment, the changes are held and committed together.
+Removed endpoints are committed right away, because traffic sent to them fails.
+"""
+
+from typing import Dict, FrozenSet, Set, Tuple, Optional, Any
+import json
+
+EndpointKey = Tuple[str, ...]
+
+
+class CommitCoalescer:
+    """Decides when a changed discovery map is committed.
+
+    A change is committed once the map stopped changing between two passes, and the
+    minimum interval since the last commit passed.  A change held for the max staleness
+    time is committed even if the map keeps changing.
+    """
+    __slots__ = (
+        'min_interval', 'max_staleness', '_last_commit', '_pending_since',
+        '_pending_fingerprint', '_endpoints',
+    )
+
+    def __init__(self, min_interval: float, max_staleness: float) -> None:
+        self.min_interval = min_interval
+        self.max_staleness = max_staleness
+        self._last_commit: Optional[float] = None
+        self._pending_since: Optional[float] = None
+        self._pending_fingerprint: Optional[str] = None
+        self._endpoints: Optional[FrozenSet[EndpointKey]] = None
+
+    def should_commit(self, data: Dict[str, Any], fingerprint: str, now: float) -> bool:
+        """Should the changed discovery map be committed now?"""
+        if self.min_interval <= 0:
+            return True
+        if self._endpoints is not None and not self._endpoints <= get_endpoints(data):
+            # Some endpoints were removed.
+            return True
+        settled = fingerprint == self._pending_fingerprint
+        self._pending_fingerprint = fingerprint
+        if self._pending_since is None:
+            self._pending_since = now
+        if now - self._pending_since >= self.max_staleness:
+            return True
+        return settled and (
+            self._last_commit is None or now - self._last_commit >= self.min_interval
+        )
+
+    def committed(self, data: Dict[str, Any], now: Optional[float]) -> None:
+        """The discovery map was committed at the given time, or loaded from an earlier run
+        if the time is None."""
+        if now is not None:
+            self._last_commit = now
+        self._pending_since = None
+        self._pending_fingerprint = None
+        if self.min_interval > 0:
+            self._endpoints = get_endpoints(data)
+
+    def unchanged(self) -> None:
+        """The discovery map is the same as the committed one, so nothing is pending."""
+        self._pending_since = None
+        self._pending_fingerprint = None
+
+    def reset(self) -> None:
+        """Forget the committed and pending discovery maps, such as when another process
+        may have committed since then."""
+        self._last_commit = None
+        self._pending_since = None
+        self._pending_fingerprint = None
+        self._endpoints = None
+
+
+def get_endpoints(data: Dict[str, Any]) -> FrozenSet[EndpointKey]:
+    """Get the gateway and service-color instances of the discovery map."""
+    ret: Set[EndpointKey] = set()
+    for namespace in data.get('namespaces', []):
+        name = str(namespace.get('namespace'))
+        for instance in namespace.get('gateways', {}).get('instances', []):
+            ret.add((name, json.dumps(instance, sort_keys=True)))
+        for service_color in namespace.get('service-colors', []):
+            for instance in service_color.get('instances', []):
+                ret.add((
+                    name,
+                    str(service_color.get('service')),
+                    str(service_color.get('color')),
+                    str(service_color.get('index')),
+                    json.dumps(instance, sort_keys=True),
+                ))
+    return frozenset(ret)
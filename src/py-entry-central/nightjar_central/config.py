@@ -5,9 +5,11 @@ Configuration settings for the standalone.
 
 from typing import Dict
 import os
+import socket
 import tempfile
 from nightjar_common import log
 from nightjar_common import parse_env
+from nightjar_common.extension_point.errors import ConfigurationError
 from nightjar_common.extension_point.run_cmd import get_env_executable_cmd
 
 
@@ -23,15 +25,48 @@ ENV__TEMP_DIR = 'NJ_TEMP_DIR'
 
 ENV__DATA_STORE_EXEC = 'DATA_STORE_EXEC'
 ENV__DISCOVERY_MAP_EXEC = 'DISCOVERY_MAP_EXEC'
+ENV__SHARDED_DISCOVERY_MAP = 'SHARDED_DISCOVERY_MAP'
+DEFAULT_SHARDED_DISCOVERY_MAP = False
+ENV__DELTA_DISCOVERY_MAP = 'DELTA_DISCOVERY_MAP'
+DEFAULT_DELTA_DISCOVERY_MAP = False
+ENV__DELTA_MAX_CHANGES = 'DELTA_MAX_CHANGES'
+DEFAULT_DELTA_MAX_CHANGES = 20
+ENV__GC_INTERVAL = 'GC_INTERVAL'
+DEFAULT_GC_INTERVAL = 3600
+ENV__COMMIT_MIN_INTERVAL = 'COMMIT_MIN_INTERVAL'
+DEFAULT_COMMIT_MIN_INTERVAL = 0
+ENV__COMMIT_MAX_STALENESS = 'COMMIT_MAX_STALENESS'
+DEFAULT_COMMIT_MAX_STALENESS = 300
+ENV__LEADER_ELECTION = 'LEADER_ELECTION'
+LEADER_ELECTION_NONE = 'none'
+LEADER_ELECTION_FILE = 'file'
+LEADER_ELECTION_DATA_STORE = 'data-store'
+LEADER_ELECTION_TYPES = (LEADER_ELECTION_NONE, LEADER_ELECTION_FILE, LEADER_ELECTION_DATA_STORE,)
+ENV__LEADER_LOCK_FILE = 'LEADER_LOCK_FILE'
+DEFAULT_LEADER_LOCK_FILE = '/tmp/nightjar-central-leader.lock'
+ENV__LEADER_LEASE_NAME = 'LEADER_LEASE_NAME'
+DEFAULT_LEADER_LEASE_NAME = 'central-leader'
+ENV__LEADER_LEASE_TIME = 'LEADER_LEASE_TIME'
+DEFAULT_LEADER_LEASE_TIME = 120
+ENV__LEADER_ID = 'LEADER_ID'
+ENV__METRICS_PORT = 'METRICS_PORT'
+DEFAULT_METRICS_PORT = 0
+ENV__METRICS_FILE = 'METRICS_FILE'
+ENV__TRACE_FILE = 'TRACE_FILE'
 
 
 class Config:  # pylint: disable=R0902
     """Configuration settings"""
     __slots__ = (
-        'data_store_exec', 'discovery_map_exec', 'temp_dir',
+        'data_store_exec', 'discovery_map_exec', 'temp_dir', 'sharded_discovery_map',
+        'delta_discovery_map', 'delta_max_changes', 'gc_interval',
+        'commit_min_interval', 'commit_max_staleness',
+        'leader_election', 'leader_lock_file', 'leader_lease_name', 'leader_lease_time',
+        'leader_id',
 
         'trigger_stop_file',
         'refresh_time', 'failure_sleep', 'exit_on_generation_failure',
+        'metrics_port', 'metrics_file', 'trace_file',
 
         'test_mode',
     )
@@ -49,6 +84,62 @@ class Config:  # pylint: disable=R0902
         self.exit_on_generation_failure = parse_env.env_as_bool(
             env, ENV__EXIT_ON_GENERATION_FAILURE, DEFAULT_EXIT_ON_GENERATION_FAILURE,
         )
+        self.sharded_discovery_map = parse_env.env_as_bool(
+            env, ENV__SHARDED_DISCOVERY_MAP, DEFAULT_SHARDED_DISCOVERY_MAP,
+        )
+        self.delta_discovery_map = parse_env.env_as_bool(
+            env, ENV__DELTA_DISCOVERY_MAP, DEFAULT_DELTA_DISCOVERY_MAP,
+        )
+        self.delta_max_changes = parse_env.env_as_int(
+            env, ENV__DELTA_MAX_CHANGES, DEFAULT_DELTA_MAX_CHANGES,
+        )
+        self.gc_interval = parse_env.env_as_float(
+            env, ENV__GC_INTERVAL, DEFAULT_GC_INTERVAL,
+        )
+
+        self.commit_min_interval = parse_env.env_as_float(
+            env, ENV__COMMIT_MIN_INTERVAL, DEFAULT_COMMIT_MIN_INTERVAL,
+        )
+        self.commit_max_staleness = parse_env.env_as_float(
+            env, ENV__COMMIT_MAX_STALENESS, DEFAULT_COMMIT_MAX_STALENESS,
+        )
+        self.leader_election = env.get(ENV__LEADER_ELECTION, LEADER_ELECTION_NONE).lower()
+        if self.leader_election not in LEADER_ELECTION_TYPES:
+            raise ConfigurationError(
+                ENV__LEADER_ELECTION,
+                'must be one of {0}'.format(', '.join(LEADER_ELECTION_TYPES)),
+            )
+        self.leader_lock_file = env.get(ENV__LEADER_LOCK_FILE, DEFAULT_LEADER_LOCK_FILE)
+        self.leader_lease_name = env.get(ENV__LEADER_LEASE_NAME, DEFAULT_LEADER_LEASE_NAME)
+        self.leader_lease_time = parse_env.env_as_float(
+            env, ENV__LEADER_LEASE_TIME, DEFAULT_LEADER_LEASE_TIME,
+        )
+        if self.leader_election == LEADER_ELECTION_DATA_STORE:
+            # The leader only renews its lease between sleeps, so the lease must outlast
+            # them, or a standby takes over while the leader sleeps.
+            if ENV__FAILURE_SLEEP not in env:
+                self.failure_sleep = min(self.failure_sleep, self.leader_lease_time / 2)
+            for name, value in (
+                    (ENV__REFRESH_TIME, self.refresh_time),
+                    (ENV__FAILURE_SLEEP, self.failure_sleep),
+            ):
+                if value >= self.leader_lease_time:
+                    raise ConfigurationError(
+                        name,
+                        'must be less than {0} ({1}) with the data-store leader election'.format(
+                            ENV__LEADER_LEASE_TIME, self.leader_lease_time,
+                        ),
+                    )
+        self.leader_id = (
+            env.get(ENV__LEADER_ID)
+            or '{0}-{1}'.format(socket.gethostname(), os.getpid())
+        )
+        # The metrics are only served over HTTP when the port is set, and only written
+        # to a file (for the node exporter's textfile collector) when the file is set.
+        self.metrics_port = parse_env.env_as_int(env, ENV__METRICS_PORT, DEFAULT_METRICS_PORT)
+        self.metrics_file = env.get(ENV__METRICS_FILE, '')
+        # The trace spans of each pass are only written when the file is set.
+        self.trace_file = env.get(ENV__TRACE_FILE, '')
 
         env_temp_dir = env.get(ENV__TEMP_DIR)
         if env_temp_dir:
@@ -3,16 +3,29 @@
 Generate the current configuration.
 """
 
-from typing import cast
+from typing import Dict, Optional, Callable, Any
 import os
-import json
+import time
+import tempfile
+from nightjar_common.log import debug, warning
+from nightjar_common import metrics
+from nightjar_common import tracing
 from nightjar_common.extension_point.data_store import DataStoreRunner
 from nightjar_common.extension_point.discovery_map import DiscoveryMapRunner
+from nightjar_common.extension_point.discovery_map_fingerprint import get_fingerprint
 from nightjar_common.extension_point.errors import (
     ExtensionPointRuntimeError, ExtensionPointTooManyRetries,
 )
+from .coalesce import CommitCoalescer
 from .config import Config
 
+DISCOVERY_MAP_UPDATES = metrics.counter(
+    'nightjar_discovery_map_updates_total',
+    'Generated discovery maps, by whether they were committed, unchanged, held to '
+    'commit with later changes, or dropped because the leadership was lost.',
+    ('result',),
+)
+
 
 class GenerateData:
     """Generates and commits the discovery-map."""
@@ -21,69 +34,181 @@ class GenerateData:
         """Generate the new discovery map, and, if it is different than the old one, commit it."""
         raise NotImplementedError()  # pragma no cover
 
+    def became_leader(self) -> None:
+        """This process became the leader.  Another leader may have committed a different
+        discovery map since this process last committed one."""
+
+    def get_data_store(self) -> Optional[DataStoreRunner]:
+        """The data store runner used to commit, if any, to share with the leader election."""
+        return None
+
+    def set_leader_check(self, check: Callable[[], bool]) -> None:
+        """Set the check, called right before each commit, that this process is still the
+        leader.  A pass may outlast the leadership, so the commit is dropped if it isn't."""
+
 
 class GenerateDataImpl(GenerateData):
     """Manages the gateway configuration generation."""
-    __slots__ = ('_config', '_data_store', '_discovery_map', '_gen_file', '_old_file',)
+    __slots__ = (
+        '_config', '_data_store', '_discovery_map', '_old_file', '_last_gc',
+        '_generated', '_generated_fingerprint', '_last_fingerprint', '_coalescer',
+        '_leader_check',
+    )
 
     def __init__(self, config: Config) -> None:
         self._config = config
         self._data_store = DataStoreRunner(config.data_store_exec, config.temp_dir)
+        self._data_store.max_delta_changes = config.delta_max_changes
         self._discovery_map = DiscoveryMapRunner(config.discovery_map_exec, config.temp_dir)
-        self._gen_file = os.path.join(self._config.temp_dir, 'generated-discovery-map.json')
-        self._old_file = os.path.join(self._config.temp_dir, 'last-discovery-map.json')
+        self._old_file = os.path.join(self._config.temp_dir, 'last-discovery-map.fingerprint')
+        self._last_gc = time.monotonic()
+        # The generated discovery map that has not been committed yet.
+        self._generated: Optional[Dict[str, Any]] = None
+        self._generated_fingerprint: Optional[str] = None
+        # The fingerprint of the last committed discovery map, so that maps which only
+        # differ in the order of their unordered arrays are not committed.  The fingerprint
+        # is also written to a file, so that a restart doesn't commit the same map again.
+        self._last_fingerprint: Optional[str] = None
+        self._coalescer = CommitCoalescer(
+            config.commit_min_interval, config.commit_max_staleness,
+        )
+        self._leader_check: Callable[[], bool] = lambda: True
+        if os.path.isfile(self._old_file):
+            # The coalescer doesn't know the endpoints of that map, so after a restart it
+            # holds the first change until the map settles, even if endpoints were removed.
+            with open(self._old_file, 'r') as f:
+                self._last_fingerprint = f.read().strip() or None
 
     def update_discovery_map(self) -> int:
         """Generate the new discovery map, and, if it is different than the old one, commit it."""
-        ret = self.generate_discovery_map()
+        with tracing.span('discovery-map.fetch'):
+            ret = self.generate_discovery_map()
         if ret != 0:
             return ret
-        if self.is_generated_map_different():
-            ret = self.commit_discovery_map()
+        with tracing.span('discovery-map.diff') as diff_span:
+            commit = self.should_commit()
+            diff_span.set_attribute('commit', commit)
+        if commit:
+            with tracing.span('discovery-map.commit'):
+                ret = self.commit_discovery_map()
+        if ret == 0:
+            self.collect_garbage()
         return ret
 
+    def became_leader(self) -> None:
+        """Forget the committed state of the earlier leadership term, so the next commit
+        stores the whole discovery map, even if it matches the map committed back then."""
+        debug('Forgetting the discovery map committed in the earlier leadership term.')
+        self._last_fingerprint = None
+        self._coalescer.reset()
+        self._data_store.forget_commits()
+
+    def get_data_store(self) -> Optional[DataStoreRunner]:
+        return self._data_store
+
+    def set_leader_check(self, check: Callable[[], bool]) -> None:
+        self._leader_check = check
+
     def generate_discovery_map(self) -> int:
         """Runs the generation process."""
         try:
-            discovery_map = self._discovery_map.get_mesh()
+            self._generated = self._discovery_map.get_mesh()
+            self._generated_fingerprint = None
         except ExtensionPointRuntimeError as err:
             print("[nightjar-central] Failed to create the discovery map: " + repr(err))
             return 1
-        with open(self._gen_file, 'w') as f:
-            json.dump(discovery_map, f)
         return 0
 
     def is_generated_map_different(self) -> bool:
         """Check if the generated discovery map is different than the last committed one."""
-        if not os.path.isfile(self._gen_file):
-            # No generated file, so there's nothing to commit
+        if self._generated is None:
+            # Nothing generated, so there's nothing to commit
+            return False
+        return self.get_generated_fingerprint() != self._last_fingerprint
+
+    def should_commit(self) -> bool:
+        """Check if the generated discovery map is different than the last committed one,
+        and should be committed now rather than with later changes."""
+        if not self.is_generated_map_different():
+            self._coalescer.unchanged()
+            DISCOVERY_MAP_UPDATES.inc('unchanged')
             return False
-        if not os.path.isfile(self._old_file):
-            # No old version, so it's definitely new.
+        data = self._generated
+        fingerprint = self._generated_fingerprint
+        assert data is not None and fingerprint is not None
+        if self._coalescer.should_commit(data, fingerprint, time.monotonic()):
             return True
-        # Simple comparison.  This requires loading both files into memory.  It
-        # shouldn't be a problem for this container.
-        with open(self._gen_file, 'r') as f:
-            new_contents = json.load(f)
-        with open(self._old_file, 'r') as f:
-            old_contents = json.load(f)
-        return cast(bool, new_contents != old_contents)
+        debug('Holding the changed discovery map to commit it with later changes.')
+        DISCOVERY_MAP_UPDATES.inc('held')
+        return False
+
+    def get_generated_fingerprint(self) -> Optional[str]:
+        """Get the fingerprint of the generated discovery map, computed only once."""
+        if self._generated is not None and self._generated_fingerprint is None:
+            self._generated_fingerprint = get_fingerprint(self._generated)
+        return self._generated_fingerprint
 
     def commit_discovery_map(self) -> int:
         """Push the just-generated discovery map to the data store."""
-        if os.path.isfile(self._gen_file):
-            with open(self._gen_file, 'r') as f:
-                data = json.load(f)
-
+        data = self._generated
+        if data is not None:
             try:
-                self._data_store.commit_document('discovery-map', data)
+                if not self.is_still_leader():
+                    return 0
+                if self._config.delta_discovery_map:
+                    self._data_store.commit_delta_discovery_map(data)
+                else:
+                    self._data_store.commit_document('discovery-map', data)
+                if self._config.sharded_discovery_map:
+                    if not self.is_still_leader():
+                        return 0
+                    self._data_store.commit_sharded_discovery_map(data)
             except (ExtensionPointRuntimeError, ExtensionPointTooManyRetries) as err:
                 print("[nightjar_central] " + str(err))
                 return 1
 
-            os.replace(self._gen_file, self._old_file)
+            DISCOVERY_MAP_UPDATES.inc('committed')
+            self._last_fingerprint = self.get_generated_fingerprint()
+            self._coalescer.committed(data, time.monotonic())
+            self._generated = None
+            self._generated_fingerprint = None
+            self.write_last_fingerprint()
         return 0
 
+    def is_still_leader(self) -> bool:
+        """Check, or renew, the leadership right before a commit.  If it was lost, the
+        generated map is dropped, and the new leader commits its own."""
+        if self._leader_check():
+            return True
+        warning('Lost the leadership during the pass; dropping the discovery map commit.')
+        DISCOVERY_MAP_UPDATES.inc('dropped')
+        self._generated = None
+        self._generated_fingerprint = None
+        return False
+
+    def write_last_fingerprint(self) -> None:
+        """Write the fingerprint of the committed map, for a restart.  It's synced before
+        it replaces the old file, so a crash leaves either the old or the new one."""
+        gen_fd, gen_filename = tempfile.mkstemp(
+            prefix='last-discovery-map', dir=self._config.temp_dir,
+        )
+        os.write(gen_fd, (self._last_fingerprint or '').encode('utf-8'))
+        os.fsync(gen_fd)
+        os.close(gen_fd)
+        os.replace(gen_filename, self._old_file)
+
+    def collect_garbage(self) -> None:
+        """Remove the old versions of the committed documents from the data store, at
+        most once per garbage collection interval.  This keeps the clean up out of the
+        commits."""
+        if self._config.gc_interval <= 0:
+            return
+        now = time.monotonic()
+        if now - self._last_gc < self._config.gc_interval:
+            return
+        self._last_gc = now
+        self._data_store.collect_garbage()
+
 
 class MockGenerateData(GenerateData):
     """GenerateData for testing only."""
@@ -0,0 +1,126 @@
+"""
+Leader election between several central replicas.
+
+Only the leader generates and commits the discovery map; the other replicas wait as
+standbys, ready to take over when the leader stops.
+"""
+
+from typing import Optional, IO
+import os
+from nightjar_common.log import warning
+from nightjar_common.extension_point.data_store import DataStoreRunner
+from .config import (
+    Config, LEADER_ELECTION_FILE, LEADER_ELECTION_DATA_STORE,
+)
+
+try:
+    import fcntl
+except ImportError:  # pragma no cover
+    fcntl = None  # type: ignore
+
+
+class LeaderElection:
+    """Decides whether this replica is the leader."""
+
+    def is_leader(self) -> bool:
+        """Become or stay the leader, if possible.  Called before each generation pass."""
+        raise NotImplementedError()  # pragma no cover
+
+    def release(self) -> None:
+        """Stop being the leader, so a standby can take over right away."""
+        raise NotImplementedError()  # pragma no cover
+
+
+class NoLeaderElection(LeaderElection):
+    """Without leader election, the replica is always the leader."""
+
+    def is_leader(self) -> bool:
+        return True
+
+    def release(self) -> None:
+        pass
+
+
+class FileLockLeaderElection(LeaderElection):
+    """The leader holds an exclusive lock on a file.  This only works for replicas sharing
+    the file system, such as in tests; the lock is released when the process stops."""
+    __slots__ = ('lock_file', '_lock',)
+
+    def __init__(self, lock_file: str) -> None:
+        self.lock_file = lock_file
+        self._lock: Optional[IO[str]] = None
+
+    def is_leader(self) -> bool:
+        if self._lock is not None:
+            return True
+        if fcntl is None:  # pragma no cover
+            warning('File locks are not supported on this platform; acting as the leader')
+            return True
+        # The file stays open while this replica is the leader, as closing it releases the lock.
+        lock = open(self.lock_file, 'a')  # pylint: disable=R1732
+        try:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock.close()
+            return False
+        self._lock = lock
+        return True
+
+    def release(self) -> None:
+        if self._lock is not None:
+            fcntl.flock(self._lock.fileno(), fcntl.LOCK_UN)
+            self._lock.close()
+            self._lock = None
+
+
+class DataStoreLeaderElection(LeaderElection):
+    """The leader holds a lease in the data store, which it renews on each pass.  If the
+    leader stops renewing it, then a standby takes it over once it expires, so the lease
+    time must be longer than the time between passes."""
+    __slots__ = ('_data_store', 'lease_name', 'owner', 'lease_time', '_held', '_supported',)
+
+    def __init__(
+            self, data_store: DataStoreRunner, lease_name: str, owner: str, lease_time: float,
+    ) -> None:
+        self._data_store = data_store
+        self.lease_name = lease_name
+        self.owner = owner
+        self.lease_time = lease_time
+        self._held = False
+        self._supported = True
+
+    def is_leader(self) -> bool:
+        res = self._data_store.acquire_lease(self.lease_name, self.owner, self.lease_time)
+        if res is None:
+            # Without leases, no replica can know it is the only leader, so all of them
+            # stay standbys rather than all committing.
+            if self._supported:
+                warning('The data store does not support leases; staying a standby')
+                self._supported = False
+            self._held = False
+            return False
+        self._supported = True
+        self._held = res
+        return res
+
+    def release(self) -> None:
+        if self._held:
+            self._data_store.acquire_lease(self.lease_name, self.owner, 0)
+            self._held = False
+
+
+def create_leader_election(
+        config: Config, data_store: Optional[DataStoreRunner] = None,
+) -> LeaderElection:
+    """Create the configured leader election.  The data store lease uses the given data
+    store runner, if any, so that it shares the generator's temporary files."""
+    if config.leader_election == LEADER_ELECTION_FILE:
+        lock_dir = os.path.dirname(os.path.abspath(config.leader_lock_file))
+        os.makedirs(lock_dir, exist_ok=True)
+        return FileLockLeaderElection(config.leader_lock_file)
+    if config.leader_election == LEADER_ELECTION_DATA_STORE:
+        return DataStoreLeaderElection(
+            data_store or DataStoreRunner(config.data_store_exec, config.temp_dir),
+            config.leader_lease_name, config.leader_id, config.leader_lease_time,
+        )
+    return NoLeaderElection()
@@ -3,25 +3,80 @@
 Main program.
 """
 
-from typing import Sequence
+from typing import Sequence, Optional
 import os
 import time
-from nightjar_common.log import warning, debug
-from .config import create_configuration
-from .generate import create_generator
+from nightjar_common.log import warning, debug, log, flush
+from nightjar_common import metrics
+from nightjar_common import tracing
+from .config import Config, LEADER_ELECTION_NONE, create_configuration
+from .generate import GenerateData, create_generator
+from .leader import LeaderElection, create_leader_election
+
+CYCLE_SECONDS = metrics.histogram(
+    'nightjar_cycle_duration_seconds',
+    'Time taken by each pass of generating and committing the discovery map.',
+)
+CYCLES = metrics.counter(
+    'nightjar_cycles_total',
+    'Passes of generating and committing the discovery map, by whether they succeeded.',
+    ('result',),
+)
+LAST_CYCLE = metrics.gauge(
+    'nightjar_last_cycle_timestamp_seconds',
+    'Time when the last pass of generating the discovery map ended.',
+)
+IS_LEADER = metrics.gauge(
+    'nightjar_central_is_leader',
+    'Whether this replica is the leader (1) or a standby (0).',
+)
 
 
 def main(_args: Sequence[str]) -> int:
     """Main program."""
     config = create_configuration()
     generator = create_generator(config)
+    leader = create_leader_election(config, generator.get_data_store())
+    generator.set_leader_check(leader.is_leader)
+    if config.metrics_port > 0:
+        metrics.start_http_server(config.metrics_port)
+    if config.trace_file:
+        tracing.enable(config.trace_file)
+    try:
+        return run_loop(config, generator, leader)
+    finally:
+        leader.release()
+
 
+def run_loop(config: Config, generator: GenerateData, leader: LeaderElection) -> int:
+    """Generate and commit the discovery map until stopped.  Standby replicas only wait
+    to become the leader."""
+    was_leader: Optional[bool] = None
     while True:
         if os.path.exists(config.trigger_stop_file):
             warning("Stopping due to existence of stop trigger file.")
             return 0
+        is_leader = leader.is_leader()
+        if is_leader != was_leader:
+            log('INFO', 'Became the leader.' if is_leader else 'Waiting as a standby.')
+            if is_leader and config.leader_election != LEADER_ELECTION_NONE:
+                # Another replica may have led since this one last committed.
+                generator.became_leader()
+            was_leader = is_leader
+        IS_LEADER.set(1.0 if is_leader else 0.0)
+        if not is_leader:
+            metrics.export_textfile(config.metrics_file)
+            time.sleep(config.refresh_time)
+            continue
         debug('Generating new discovery map.')
-        res = generator.update_discovery_map()
+        with CYCLE_SECONDS.time(), tracing.span('central.pass') as pass_span:
+            res = generator.update_discovery_map()
+            pass_span.set_attribute('result', res)
+        CYCLES.inc('ok' if res == 0 else 'failed')
+        LAST_CYCLE.set(time.time())
+        metrics.export_textfile(config.metrics_file)
+        # Write out this pass' debug messages before sleeping.
+        flush()
         if res != 0:
             warning("Envoy configuration generator returned {code}", code=res)
             if config.exit_on_generation_failure:
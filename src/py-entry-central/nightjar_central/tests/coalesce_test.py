@@ -0,0 +1,95 @@
+"""
+Test the coalesce module.
+"""
+
+from typing import List, Dict, Any
+import unittest
+from .. import coalesce
+
+
+class CommitCoalescerTest(unittest.TestCase):
+    """Test the commit coalescer."""
+
+    def test_should_commit__disabled(self) -> None:
+        """Test should_commit without a minimum interval."""
+        coalescer = coalesce.CommitCoalescer(0, 300)
+        coalescer.committed(_mk_map(['1.1.1.1']), 10)
+        self.assertTrue(coalescer.should_commit(_mk_map(['1.1.1.1', '2.2.2.2']), 'f1', 11))
+
+    def test_should_commit__settled(self) -> None:
+        """Test should_commit, which waits for the map to stop changing and for the
+        minimum interval."""
+        coalescer = coalesce.CommitCoalescer(60, 300)
+        coalescer.committed(_mk_map(['1.1.1.1']), 100)
+        self.assertFalse(coalescer.should_commit(_mk_map(['1.1.1.1', '2.2.2.2']), 'f1', 110))
+        # Settled, but too soon.
+        self.assertFalse(coalescer.should_commit(_mk_map(['1.1.1.1', '2.2.2.2']), 'f1', 150))
+        self.assertFalse(
+            coalescer.should_commit(_mk_map(['1.1.1.1', '2.2.2.2', '3.3.3.3']), 'f2', 160),
+        )
+        self.assertTrue(
+            coalescer.should_commit(_mk_map(['1.1.1.1', '2.2.2.2', '3.3.3.3']), 'f2', 170),
+        )
+
+    def test_should_commit__first(self) -> None:
+        """Test should_commit with nothing committed by this process."""
+        coalescer = coalesce.CommitCoalescer(60, 300)
+        self.assertFalse(coalescer.should_commit(_mk_map(['1.1.1.1']), 'f1', 10))
+        self.assertTrue(coalescer.should_commit(_mk_map(['1.1.1.1']), 'f1', 20))
+
+    def test_should_commit__stale(self) -> None:
+        """Test should_commit with a map that keeps changing."""
+        coalescer = coalesce.CommitCoalescer(60, 100)
+        coalescer.committed(_mk_map([]), 0)
+        for index in range(10):
+            self.assertFalse(coalescer.should_commit(
+                _mk_map(['1.1.1.{0}'.format(i) for i in range(index + 1)]),
+                'f{0}'.format(index), 100 + index * 10,
+            ))
+        self.assertTrue(coalescer.should_commit(_mk_map(['1.1.1.1']), 'x', 200))
+
+    def test_should_commit__removed(self) -> None:
+        """Test should_commit with a removed endpoint, which is committed right away."""
+        coalescer = coalesce.CommitCoalescer(60, 300)
+        coalescer.committed(_mk_map(['1.1.1.1', '2.2.2.2']), None)
+        self.assertTrue(coalescer.should_commit(_mk_map(['1.1.1.1']), 'f1', 10))
+
+    def test_unchanged(self) -> None:
+        """Test unchanged, which forgets the pending change."""
+        coalescer = coalesce.CommitCoalescer(60, 100)
+        coalescer.committed(_mk_map([]), 0)
+        self.assertFalse(coalescer.should_commit(_mk_map(['1.1.1.1']), 'f1', 90))
+        coalescer.unchanged()
+        self.assertFalse(coalescer.should_commit(_mk_map(['1.1.1.1']), 'f1', 150))
+
+    def test_get_endpoints(self) -> None:
+        """Test get_endpoints with gateway and service-color instances."""
+        data = _mk_map(['1.1.1.1'])
+        data['namespaces'][0]['gateways']['instances'].append({'hostname': 'gw', 'port': 1})
+        self.assertEqual(
+            frozenset([
+                ('n1', '{"hostname": "gw", "port": 1}'),
+                ('n1', 's1', 'c1', '1', '{"ipv4": "1.1.1.1", "port": 90}'),
+            ]),
+            coalesce.get_endpoints(data),
+        )
+
+
+def _mk_map(addresses: List[str]) -> Dict[str, Any]:
+    return {
+        'schema-version': 'v1',
+        'document-version': 'x',
+        'namespaces': [{
+            'namespace': 'n1',
+            'network-id': 'n1',
+            'gateways': {'instances': [], 'prefer-gateway': False, 'protocol': 'HTTP1.1'},
+            'service-colors': [{
+                'service': 's1',
+                'color': 'c1',
+                'index': 1,
+                'routes': [],
+                'namespace-egress': [],
+                'instances': [{'ipv4': address, 'port': 90} for address in addresses],
+            }],
+        }],
+    }
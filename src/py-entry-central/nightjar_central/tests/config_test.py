@@ -45,3 +45,47 @@ class ConfigTest(unittest.TestCase):
             config.ENV__TEMP_DIR: self._temp_dir,
         })
         self.assertEqual(self._temp_dir, cfg.temp_dir)
+
+    def test_init_leader_election(self) -> None:
+        """Run the configuration with the leader election settings."""
+        cfg = config.Config({
+            config.ENV__DATA_STORE_EXEC: self._valid_cmd,
+            config.ENV__DISCOVERY_MAP_EXEC: self._valid_cmd,
+            config.ENV__TEMP_DIR: self._temp_dir,
+            config.ENV__LEADER_ELECTION: 'Data-Store',
+            config.ENV__LEADER_ID: 'me',
+        })
+        self.assertEqual(config.LEADER_ELECTION_DATA_STORE, cfg.leader_election)
+        self.assertEqual('me', cfg.leader_id)
+        self.assertEqual(config.DEFAULT_LEADER_LEASE_TIME, cfg.leader_lease_time)
+        # The default failure sleep is shortened to keep the lease.
+        self.assertEqual(config.DEFAULT_LEADER_LEASE_TIME / 2, cfg.failure_sleep)
+
+    def test_init_leader_election__sleep_over_lease(self) -> None:
+        """Run the configuration with the leader sleeping past its lease."""
+        for name in (config.ENV__REFRESH_TIME, config.ENV__FAILURE_SLEEP):
+            try:
+                config.Config({
+                    config.ENV__DATA_STORE_EXEC: self._valid_cmd,
+                    config.ENV__DISCOVERY_MAP_EXEC: self._valid_cmd,
+                    config.ENV__TEMP_DIR: self._temp_dir,
+                    config.ENV__LEADER_ELECTION: 'data-store',
+                    config.ENV__LEADER_LEASE_TIME: '60',
+                    name: '60',
+                })
+                self.fail("Did not raise a configuration error.")  # pragma no cover
+            except ConfigurationError as err:
+                self.assertEqual(name, err.source)
+
+    def test_init_bad_leader_election(self) -> None:
+        """Run the configuration with an unknown leader election."""
+        try:
+            config.Config({
+                config.ENV__DATA_STORE_EXEC: self._valid_cmd,
+                config.ENV__DISCOVERY_MAP_EXEC: self._valid_cmd,
+                config.ENV__TEMP_DIR: self._temp_dir,
+                config.ENV__LEADER_ELECTION: 'zookeeper',
+            })
+            self.fail("Did not raise a configuration error.")  # pragma no cover
+        except ConfigurationError as err:
+            self.assertEqual(config.ENV__LEADER_ELECTION, err.source)
@@ -3,12 +3,16 @@
 Test the generate module.
 """
 
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Any
 import unittest
 import os
 import platform
 import shutil
 import json
+import time
+from nightjar_common import tracing
+from nightjar_common.extension_point.data_store import DataStoreRunner
+from nightjar_common.extension_point.discovery_map_fingerprint import get_fingerprint
 from .. import generate
 from ..config import (
     Config,
@@ -16,7 +20,7 @@ from ..config import (
 )
 
 
-class GenerateDataImplTest(unittest.TestCase):
+class GenerateDataImplTest(unittest.TestCase):  # pylint: disable=R0904
     """Test the generator functions and classes."""
     # These are all smashed together, because they share the same setup and teardown logic.
     # Yeah, it's a lousy reason to jam them together, but it makes less duplication.
@@ -32,8 +36,7 @@ class GenerateDataImplTest(unittest.TestCase):
             ENV__DISCOVERY_MAP_EXEC: noop_cmd,
             ENV__DATA_STORE_EXEC: noop_cmd,
         })
-        self._gen_file = os.path.join(self._config.temp_dir, 'generated-discovery-map.json')
-        self._old_file = os.path.join(self._config.temp_dir, 'last-discovery-map.json')
+        self._old_file = os.path.join(self._config.temp_dir, 'last-discovery-map.fingerprint')
         self._file_index = 0
 
     def tearDown(self) -> None:
@@ -44,67 +47,79 @@ class GenerateDataImplTest(unittest.TestCase):
         res = generate.create_generator(self._config)
         self.assertIsInstance(res, generate.GenerateDataImpl)
 
-    def test_is_generated_map_different__no_files(self) -> None:
-        """Test is_generated_map_different with no files"""
-        self.assertFalse(os.path.isfile(self._gen_file))
+    def test_init__old_file(self) -> None:
+        """Test the constructor, which reads the fingerprint of the last committed map."""
+        self._write_old_file({'x': True})
+        gen = generate.GenerateDataImpl(self._config)
+        self.assertEqual(
+            get_fingerprint({'x': True}),
+            gen._last_fingerprint,  # pylint: disable=protected-access
+        )
+
+    def test_is_generated_map_different__nothing(self) -> None:
+        """Test is_generated_map_different with nothing generated or committed"""
         self.assertFalse(os.path.isfile(self._old_file))
         gen = generate.GenerateDataImpl(self._config)
         res = gen.is_generated_map_different()
         self.assertFalse(res)
 
     def test_is_generated_map_different__just_new(self) -> None:
-        """Test is_generated_map_different with no files"""
-        with open(self._gen_file, 'w') as f:
-            json.dump({}, f)
+        """Test is_generated_map_different with nothing committed"""
         self.assertFalse(os.path.isfile(self._old_file))
         gen = generate.GenerateDataImpl(self._config)
+        gen._generated = {}  # pylint: disable=protected-access
         res = gen.is_generated_map_different()
         self.assertTrue(res)
 
     def test_is_generated_map_different__just_old(self) -> None:
-        """Test is_generated_map_different with no files"""
-        with open(self._old_file, 'w') as f:
-            json.dump({}, f)
-        self.assertFalse(os.path.isfile(self._gen_file))
+        """Test is_generated_map_different with nothing generated"""
+        self._write_old_file({})
         gen = generate.GenerateDataImpl(self._config)
         res = gen.is_generated_map_different()
         self.assertFalse(res)
 
     def test_is_generated_map_different__same(self) -> None:
-        """Test is_generated_map_different with no files"""
-        with open(self._gen_file, 'w') as f:
-            json.dump({'x': True}, f)
-        with open(self._old_file, 'w') as f:
-            json.dump({'x': True}, f)
+        """Test is_generated_map_different with the same map"""
+        self._write_old_file({'x': True})
         gen = generate.GenerateDataImpl(self._config)
+        gen._generated = {'x': True}  # pylint: disable=protected-access
+        res = gen.is_generated_map_different()
+        self.assertFalse(res)
+
+    def test_is_generated_map_different__reordered(self) -> None:
+        """Test is_generated_map_different with the same map in a different order"""
+        self._write_old_file({'document-version': 'a', 'namespaces': [{'x': 1}, {'x': 2}]})
+        gen = generate.GenerateDataImpl(self._config)
+        gen._generated = {  # pylint: disable=protected-access
+            'document-version': 'b', 'namespaces': [{'x': 2}, {'x': 1}],
+        }
         res = gen.is_generated_map_different()
         self.assertFalse(res)
 
     def test_is_generated_map_different__different(self) -> None:
-        """Test is_generated_map_different with no files"""
-        with open(self._gen_file, 'w') as f:
-            json.dump({'x': True}, f)
-        with open(self._old_file, 'w') as f:
-            json.dump({'y': True}, f)
+        """Test is_generated_map_different with a different map"""
+        self._write_old_file({'y': True})
         gen = generate.GenerateDataImpl(self._config)
+        gen._generated = {'x': True}  # pylint: disable=protected-access
         res = gen.is_generated_map_different()
         self.assertTrue(res)
 
     def test_commit_discovery_map__with_error(self) -> None:
         """Test commit_discovery_map with an error"""
-        self._config.data_store_exec = self._get_runnable_cmd(1, self._gen_file, {
+        self._config.data_store_exec = self._get_runnable_cmd(1, {})
+        gen = generate.GenerateDataImpl(self._config)
+        gen._generated = {  # pylint: disable=protected-access
             'schema-version': 'v1',
             'document-version': 'x',
             'namespaces': [],
-        })
-        gen = generate.GenerateDataImpl(self._config)
+        }
         res = gen.commit_discovery_map()
         self.assertEqual(1, res)
         self.assertFalse(os.path.isfile(self._old_file))
+        self.assertTrue(gen.is_generated_map_different())
 
-    def test_commit_discovery_map__no_gen_file(self) -> None:
-        """Test commit_discovery_map with no gen file"""
-        self.assertFalse(os.path.isfile(self._gen_file))
+    def test_commit_discovery_map__nothing_generated(self) -> None:
+        """Test commit_discovery_map with nothing generated"""
         gen = generate.GenerateDataImpl(self._config)
         res = gen.commit_discovery_map()
         self.assertEqual(0, res)
@@ -118,34 +133,91 @@ class GenerateDataImplTest(unittest.TestCase):
             'document-version': 'a',
             'namespaces': [],
         }
-        self._config.data_store_exec = self._get_runnable_cmd(0, self._gen_file, expected)
+        self._config.data_store_exec = self._get_runnable_cmd(0, {})
         gen = generate.GenerateDataImpl(self._config)
+        gen._generated = expected  # pylint: disable=protected-access
         res = gen.commit_discovery_map()
         self.assertEqual(0, res)
         self.assertTrue(os.path.isfile(self._old_file))
         with open(self._old_file, 'r') as f:
-            self.assertEqual(expected, json.load(f))
+            self.assertEqual(get_fingerprint(expected), f.read())
+        self.assertFalse(gen.is_generated_map_different())
+
+    def test_commit_discovery_map__sharded(self) -> None:
+        """Test commit_discovery_map with the sharded discovery map enabled."""
+        self._config.sharded_discovery_map = True
+        self._config.data_store_exec = self._get_runnable_cmd(0, {})
+        gen = generate.GenerateDataImpl(self._config)
+        gen._generated = {  # pylint: disable=protected-access
+            'schema-version': 'v1',
+            'document-version': 'a',
+            'namespaces': [],
+        }
+        res = gen.commit_discovery_map()
+        self.assertEqual(0, res)
+        self.assertTrue(os.path.isfile(self._old_file))
+
+    def test_commit_discovery_map__delta(self) -> None:
+        """Test commit_discovery_map with the delta discovery map enabled."""
+        self._config.delta_discovery_map = True
+        self._config.data_store_exec = self._get_runnable_cmd(0, {})
+        gen = generate.GenerateDataImpl(self._config)
+        gen._generated = {  # pylint: disable=protected-access
+            'schema-version': 'v1',
+            'document-version': 'a',
+            'namespaces': [],
+        }
+        res = gen.commit_discovery_map()
+        self.assertEqual(0, res)
+        self.assertTrue(os.path.isfile(self._old_file))
+
+    def test_commit_discovery_map__lost_leadership(self) -> None:
+        """Test commit_discovery_map, which drops the commit once the leadership is lost."""
+        self._config.sharded_discovery_map = True
+        commits_file = os.path.join(self._config.temp_dir, 'commit-args.txt')
+        self._config.data_store_exec = ['sh', '-c', 'echo "$@" >> ' + commits_file, 'sh']
+        gen = generate.GenerateDataImpl(self._config)
+        self.assertIs(
+            gen._data_store, gen.get_data_store(),  # pylint: disable=protected-access
+        )
+        checks = [False, True, False]
+        gen.set_leader_check(lambda: checks.pop(0))
+        dropped = generate.DISCOVERY_MAP_UPDATES.get('dropped')
+        for _ in range(2):
+            gen._generated = {  # pylint: disable=protected-access
+                'schema-version': 'v1',
+                'document-version': 'a',
+                'namespaces': [],
+            }
+            self.assertEqual(0, gen.commit_discovery_map())
+            self.assertIsNone(gen._generated)  # pylint: disable=protected-access
+        self.assertEqual([], checks)
+        self.assertEqual(dropped + 2, generate.DISCOVERY_MAP_UPDATES.get('dropped'))
+        self.assertFalse(os.path.isfile(self._old_file))
+        # Only the whole discovery map of the second pass was committed.
+        with open(commits_file, 'r') as f:
+            self.assertEqual(1, len(f.read().splitlines()))
 
     def test_generate_discovery_map__failure(self) -> None:
         """Test generate_discovery_map which fails to execute."""
-        self._config.discovery_map_exec = self._get_runnable_cmd(6, None, {})
+        self._config.discovery_map_exec = self._get_runnable_cmd(6, {})
         gen = generate.GenerateDataImpl(self._config)
         res = gen.generate_discovery_map()
         self.assertEqual(1, res)
-        self.assertFalse(os.path.isfile(self._gen_file))
+        self.assertFalse(gen.is_generated_map_different())
 
     def test_update_discovery_map__failure_gen(self) -> None:
         """Test update_discovery_map with failure form discovery map."""
-        self._config.discovery_map_exec = self._get_runnable_cmd(6, None, {})
-        self._config.data_store_exec = self._get_runnable_cmd(12, None, {})
+        self._config.discovery_map_exec = self._get_runnable_cmd(6, {})
+        self._config.data_store_exec = self._get_runnable_cmd(12, {})
         gen = generate.GenerateDataImpl(self._config)
         res = gen.update_discovery_map()
         self.assertEqual(1, res)
 
     def test_update_discovery_map__failure_commit(self) -> None:
         """Test update_discovery_map with failure form discovery map."""
-        self._config.discovery_map_exec = self._get_runnable_cmd(0, None, {})
-        self._config.data_store_exec = self._get_runnable_cmd(6, None, {})
+        self._config.discovery_map_exec = self._get_runnable_cmd(0, {})
+        self._config.data_store_exec = self._get_runnable_cmd(6, {})
         gen = generate.GenerateDataImpl(self._config)
         res = gen.update_discovery_map()
         self.assertEqual(1, res)
@@ -157,47 +229,149 @@ class GenerateDataImplTest(unittest.TestCase):
             'document-version': 'z',
             'namespaces': [],
         }
-        with open(self._old_file, 'w') as f:
-            json.dump(expected, f)
-        self._config.discovery_map_exec = self._get_runnable_cmd(0, None, expected)
+        self._write_old_file(expected)
+        self._config.discovery_map_exec = self._get_runnable_cmd(0, expected)
         # data-store should not run, so have it generate an error if it does.
-        self._config.data_store_exec = self._get_runnable_cmd(1, None, {})
+        self._config.data_store_exec = self._get_runnable_cmd(1, {})
         gen = generate.GenerateDataImpl(self._config)
+        unchanged = generate.DISCOVERY_MAP_UPDATES.get('unchanged')
         res = gen.update_discovery_map()
         self.assertEqual(0, res)
+        self.assertEqual(unchanged + 1, generate.DISCOVERY_MAP_UPDATES.get('unchanged'))
 
     def test_update_discovery_map__changed(self) -> None:
         """Test update_discovery_map with changed contents."""
-        with open(self._old_file, 'w') as f:
-            json.dump({
-                'schema-version': 'v1',
-                'document-version': 'old',
-                'namespaces': [],
-            }, f)
+        self._write_old_file({
+            'schema-version': 'v1',
+            'document-version': 'old',
+            'namespaces': [{'namespace': 'n1'}],
+        })
         expected = {
             'schema-version': 'v1',
             'document-version': 'new',
             'namespaces': [],
         }
-        self._config.discovery_map_exec = self._get_runnable_cmd(0, None, expected)
-        self._config.data_store_exec = self._get_runnable_cmd(0, None, {})
+        self._config.discovery_map_exec = self._get_runnable_cmd(0, expected)
+        self._config.data_store_exec = self._get_runnable_cmd(0, {})
         gen = generate.GenerateDataImpl(self._config)
-        res = gen.update_discovery_map()
+        trace_file = os.path.join(self._config.temp_dir, 'trace.jsonl')
+        tracing.enable(trace_file)
+        try:
+            res = gen.update_discovery_map()
+        finally:
+            tracing.disable()
         self.assertEqual(0, res)
         self.assertTrue(os.path.isfile(self._old_file))
+        with open(trace_file, 'r') as f:
+            spans = {
+                span['name']: span for span in (json.loads(line) for line in f)
+            }
+        self.assertEqual({'commit': True}, spans['discovery-map.diff']['attributes'])
+        self.assertIn('discovery-map.fetch', spans)
+        self.assertIn('discovery-map.commit', spans)
+        with open(self._old_file, 'r') as f:
+            self.assertEqual(get_fingerprint(expected), f.read())
+
+        # The second run finds the same map, so it must not run the data store.
+        self._config.data_store_exec = self._get_runnable_cmd(1, {})
+        gen = generate.GenerateDataImpl(self._config)
+        res = gen.update_discovery_map()
+        self.assertEqual(0, res)
+
+    def test_update_discovery_map__coalesced(self) -> None:
+        """Test update_discovery_map holding a change until the map settles."""
+        self._config.commit_min_interval = 60
+        self._write_old_file({
+            'schema-version': 'v1',
+            'document-version': 'old',
+            'namespaces': [{'namespace': 'n1'}],
+        })
+        expected = {
+            'schema-version': 'v1',
+            'document-version': 'new',
+            'namespaces': [],
+        }
+        self._config.discovery_map_exec = self._get_runnable_cmd(0, expected)
+        # data-store should not run, so have it generate an error if it does.
+        self._config.data_store_exec = self._get_runnable_cmd(1, {})
+        gen = generate.GenerateDataImpl(self._config)
+        held = generate.DISCOVERY_MAP_UPDATES.get('held')
+        committed = generate.DISCOVERY_MAP_UPDATES.get('committed')
+        res = gen.update_discovery_map()
+        self.assertEqual(0, res)
+        self.assertEqual(held + 1, generate.DISCOVERY_MAP_UPDATES.get('held'))
+
+        # The same change again is committed.
+        self._config.data_store_exec = self._get_runnable_cmd(0, {})
+        gen._data_store = DataStoreRunner(  # pylint: disable=protected-access
+            self._config.data_store_exec, self._config.temp_dir,
+        )
+        res = gen.update_discovery_map()
+        self.assertEqual(0, res)
+        self.assertEqual(committed + 1, generate.DISCOVERY_MAP_UPDATES.get('committed'))
         with open(self._old_file, 'r') as f:
-            self.assertEqual(expected, json.load(f))
+            self.assertEqual(get_fingerprint(expected), f.read())
+
+        # An unchanged map leaves nothing pending.
+        res = gen.update_discovery_map()
+        self.assertEqual(0, res)
+
+    def test_became_leader(self) -> None:
+        """Test became_leader, which commits the same map again after a failback."""
+        self._config.sharded_discovery_map = True
+        self._config.delta_discovery_map = True
+        expected = {
+            'schema-version': 'v1',
+            'document-version': 'a',
+            'namespaces': [],
+        }
+        self._config.discovery_map_exec = self._get_runnable_cmd(0, expected)
+        self._config.data_store_exec = self._get_runnable_cmd(0, {})
+        gen = generate.GenerateDataImpl(self._config)
+        committed = generate.DISCOVERY_MAP_UPDATES.get('committed')
+        self.assertEqual(0, gen.update_discovery_map())
+        self.assertEqual(committed + 1, generate.DISCOVERY_MAP_UPDATES.get('committed'))
+        self.assertEqual(0, gen.update_discovery_map())
+        self.assertEqual(committed + 1, generate.DISCOVERY_MAP_UPDATES.get('committed'))
+
+        # Another leader may have committed a different map in the meantime.
+        gen.became_leader()
+        self.assertEqual(0, gen.update_discovery_map())
+        self.assertEqual(committed + 2, generate.DISCOVERY_MAP_UPDATES.get('committed'))
+
+    def test_collect_garbage(self) -> None:
+        """Test collect_garbage, which waits for the interval."""
+        gc_file = os.path.join(self._config.temp_dir, 'gc-args.txt')
+        self._config.data_store_exec = ['sh', '-c', 'echo "$@" >> ' + gc_file, 'sh']
+        gen = generate.GenerateDataImpl(self._config)
+        gen._data_store.commit_document(  # pylint: disable=protected-access
+            'discovery-map', {'schema-version': 'v1', 'document-version': 'a', 'namespaces': []},
+        )
+        os.unlink(gc_file)
+        gen.collect_garbage()
+        self.assertFalse(os.path.isfile(gc_file))
+
+        self._config.gc_interval = 0
+        gen.collect_garbage()
+        self.assertFalse(os.path.isfile(gc_file))
+
+        self._config.gc_interval = 0.01
+        time.sleep(0.02)
+        gen.collect_garbage()
+        with open(gc_file, 'r') as f:
+            self.assertIn('--action=gc', f.read())
+
+    def _write_old_file(self, data: Dict[str, Any]) -> None:
+        with open(self._old_file, 'w') as f:
+            f.write(get_fingerprint(data))
 
     def _get_runnable_cmd(
-            self, exit_code: int, filename: Optional[str], src_contents: Dict[str, Any],
+            self, exit_code: int, src_contents: Dict[str, Any],
     ) -> List[str]:
         ret = list(self._runnable)
         ret.append(str(exit_code))
         self._file_index += 1
-        if filename:
-            out = filename
-        else:
-            out = os.path.join(self._config.temp_dir, '{0}-src.json'.format(self._file_index))
+        out = os.path.join(self._config.temp_dir, '{0}-src.json'.format(self._file_index))
         with open(out, 'w') as f:
             json.dump(src_contents, f)
         ret.append(out)
@@ -0,0 +1,106 @@
+"""
+Test the leader module.
+"""
+
+import unittest
+import os
+import platform
+import shutil
+import tempfile
+from nightjar_common.extension_point.data_store import DataStoreRunner
+from .. import leader
+from ..config import (
+    Config,
+    ENV__DATA_STORE_EXEC, ENV__DISCOVERY_MAP_EXEC, ENV__TEMP_DIR, ENV__LEADER_ELECTION,
+    ENV__LEADER_LOCK_FILE,
+)
+
+
+class LeaderTest(unittest.TestCase):
+    """Test the leader election classes."""
+
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.mkdtemp()
+        self._lock_file = os.path.join(self._temp_dir, 'lock', 'leader.lock')
+        noop_cmd = 'where' if platform.system() == 'Windows' else 'echo'
+        self._env = {
+            ENV__DATA_STORE_EXEC: noop_cmd,
+            ENV__DISCOVERY_MAP_EXEC: noop_cmd,
+            ENV__TEMP_DIR: self._temp_dir,
+            ENV__LEADER_LOCK_FILE: self._lock_file,
+        }
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self._temp_dir)
+
+    def test_create_leader_election__none(self) -> None:
+        """Test create_leader_election without leader election."""
+        res = leader.create_leader_election(Config(self._env))
+        self.assertIsInstance(res, leader.NoLeaderElection)
+        self.assertTrue(res.is_leader())
+        res.release()
+
+    def test_create_leader_election__data_store(self) -> None:
+        """Test create_leader_election with a data store lease."""
+        self._env[ENV__LEADER_ELECTION] = 'data-store'
+        res = leader.create_leader_election(Config(self._env))
+        self.assertIsInstance(res, leader.DataStoreLeaderElection)
+
+        # It shares the generator's data store runner.
+        data_store = DataStoreRunner(['sh', '-c', 'exit 0', 'sh'], self._temp_dir)
+        res = leader.create_leader_election(Config(self._env), data_store)
+        assert isinstance(res, leader.DataStoreLeaderElection)
+        self.assertIs(data_store, res._data_store)  # pylint: disable=protected-access
+
+    def test_file_lock(self) -> None:
+        """Test the file lock, which only one holder can have at a time."""
+        self._env[ENV__LEADER_ELECTION] = 'file'
+        first = leader.create_leader_election(Config(self._env))
+        second = leader.create_leader_election(Config(self._env))
+        self.assertIsInstance(first, leader.FileLockLeaderElection)
+        self.assertTrue(first.is_leader())
+        self.assertTrue(first.is_leader())
+        self.assertFalse(second.is_leader())
+        first.release()
+        first.release()
+        self.assertTrue(second.is_leader())
+        self.assertFalse(first.is_leader())
+        second.release()
+
+    def test_data_store_lease(self) -> None:
+        """Test the data store lease with the data store exit codes."""
+        lease_file = os.path.join(self._temp_dir, 'lease-args.txt')
+        script = (
+            'echo "$@" >> {0}; '
+            'case "$*" in *lease-seconds=0*) exit 0;; esac; '
+            'test -f {0}.held && exit 30; touch {0}.held'
+        ).format(lease_file)
+        election = leader.DataStoreLeaderElection(
+            DataStoreRunner(['sh', '-c', script, 'sh'], self._temp_dir), 'l1', 'me', 60,
+        )
+        self.assertTrue(election.is_leader())
+        self.assertFalse(election.is_leader())
+        # Not held, so not released.
+        election.release()
+        os.unlink(lease_file + '.held')
+        self.assertTrue(election.is_leader())
+        election.release()
+        with open(lease_file, 'r') as f:
+            lines = f.read().splitlines()
+        self.assertEqual(4, len(lines))
+        self.assertIn('--lease-owner=me --lease-seconds=60', lines[0])
+        self.assertIn('--lease-seconds=0', lines[3])
+
+    def test_data_store_lease__not_supported(self) -> None:
+        """Test the data store lease with a data store that doesn't support it."""
+        election = leader.DataStoreLeaderElection(
+            DataStoreRunner(['sh', '-c', 'exit 6', 'sh'], self._temp_dir), 'l1', 'me', 60,
+        )
+        self.assertFalse(election.is_leader())
+        self.assertFalse(election.is_leader())
+        election.release()
+        # It tries again, in case the data store gains lease support.
+        election._data_store = DataStoreRunner(  # pylint: disable=protected-access
+            ['sh', '-c', 'exit 0', 'sh'], self._temp_dir,
+        )
+        self.assertTrue(election.is_leader())
@@ -3,12 +3,17 @@
 Test the main module.
 """
 
+from typing import List, Optional
 import unittest
+import json
 import os
 import tempfile
 import shutil
 import platform
-from .. import main, config, generate
+import threading
+import time
+from nightjar_common import metrics, tracing
+from .. import main, config, generate, leader
 
 
 class MainTest(unittest.TestCase):
@@ -43,6 +48,41 @@ class MainTest(unittest.TestCase):
 
         self.assertTrue(os.path.exists(self._stop_file))
 
+    def test_main__metrics(self) -> None:
+        """Run one loop of the main program, exporting the metrics."""
+        generate.MockGenerateData.PASSES_BEFORE_EXIT_CREATION = 1
+        generate.MockGenerateData.RETURN_CODE = 0
+        metrics_file = os.path.join(self._temp_dir, 'nightjar.prom')
+        os.environ[config.ENV__METRICS_FILE] = metrics_file
+        os.environ[config.ENV__METRICS_PORT] = '9901'
+        started: List[int] = []
+        orig_start = metrics.start_http_server
+        setattr(metrics, 'start_http_server', started.append)
+        try:
+            self.assertEqual(0, main.main(['main.py']))
+        finally:
+            setattr(metrics, 'start_http_server', orig_start)
+        self.assertEqual([9901], started)
+        with open(metrics_file, 'r') as f:
+            contents = f.read()
+        self.assertIn('\nnightjar_cycles_total{result="ok"} ', contents)
+        self.assertIn('\nnightjar_central_is_leader 1\n', contents)
+
+    def test_main__trace(self) -> None:
+        """Run one loop of the main program, writing the trace."""
+        generate.MockGenerateData.PASSES_BEFORE_EXIT_CREATION = 1
+        generate.MockGenerateData.RETURN_CODE = 0
+        trace_file = os.path.join(self._temp_dir, 'trace.jsonl')
+        os.environ[config.ENV__TRACE_FILE] = trace_file
+        try:
+            self.assertEqual(0, main.main(['main.py']))
+        finally:
+            tracing.disable()
+        with open(trace_file, 'r') as f:
+            spans = [json.loads(line) for line in f]
+        self.assertEqual(['central.pass'], [s['name'] for s in spans])
+        self.assertEqual({'result': 0}, spans[0]['attributes'])
+
     def test_main__stop_on_error(self) -> None:
         """Run one loop of the main program."""
         generate.MockGenerateData.PASSES_BEFORE_EXIT_CREATION = 2
@@ -66,3 +106,87 @@ class MainTest(unittest.TestCase):
         self.assertEqual(0, main.main(['main.py']))
 
         self.assertTrue(os.path.exists(self._stop_file))
+
+    def test_main__standby(self) -> None:
+        """Run the main program as a standby, which does not generate anything."""
+        generate.MockGenerateData.PASSES_BEFORE_EXIT_CREATION = 1
+        generate.MockGenerateData.RETURN_CODE = 0
+        lock_file = os.path.join(self._temp_dir, 'leader.lock')
+        os.environ[config.ENV__LEADER_ELECTION] = 'file'
+        os.environ[config.ENV__LEADER_LOCK_FILE] = lock_file
+        metrics_file = os.path.join(self._temp_dir, 'nightjar.prom')
+        os.environ[config.ENV__METRICS_FILE] = metrics_file
+        other = leader.FileLockLeaderElection(lock_file)
+        self.assertTrue(other.is_leader())
+
+        # The other leader stops this one after a few passes.
+        def stop() -> None:
+            time.sleep(0.05)
+            with open(self._stop_file, 'w') as f:
+                f.write('stop')
+
+        thread = threading.Thread(target=stop)
+        thread.start()
+        self.assertEqual(0, main.main(['main.py']))
+        thread.join()
+        other.release()
+        # Still needs its single pass.
+        self.assertEqual(1, generate.MockGenerateData.PASSES_BEFORE_EXIT_CREATION)
+        # The standby still exports its metrics.
+        with open(metrics_file, 'r') as f:
+            self.assertIn('\nnightjar_central_is_leader 0\n', f.read())
+
+    def test_run_loop__failover(self) -> None:
+        """Run the loop through a failover and failback, which forgets the earlier commits
+        each time this replica becomes the leader."""
+        os.environ[config.ENV__LEADER_ELECTION] = 'file'
+        loop_config = config.create_configuration()
+        generator = RecordingGenerateData()
+        election = ScriptedLeaderElection(
+            [True, False, False, True, None], self._stop_file,
+        )
+        self.assertEqual(0, main.run_loop(loop_config, generator, election))
+        self.assertEqual(
+            ['became-leader', 'update', 'became-leader', 'update'], generator.calls,
+        )
+
+    def test_run_loop__no_election(self) -> None:
+        """Without leader election, the state from the last run is kept."""
+        loop_config = config.create_configuration()
+        generator = RecordingGenerateData()
+        election = ScriptedLeaderElection([True, True, None], self._stop_file)
+        self.assertEqual(0, main.run_loop(loop_config, generator, election))
+        self.assertEqual(['update', 'update'], generator.calls)
+
+
+class RecordingGenerateData(generate.GenerateData):
+    """Records the calls made by the loop."""
+
+    def __init__(self) -> None:
+        self.calls: List[str] = []
+
+    def update_discovery_map(self) -> int:
+        self.calls.append('update')
+        return 0
+
+    def became_leader(self) -> None:
+        self.calls.append('became-leader')
+
+
+class ScriptedLeaderElection(leader.LeaderElection):
+    """Returns the scripted leadership on each pass; None writes the stop file."""
+
+    def __init__(self, script: List[Optional[bool]], stop_file: str) -> None:
+        self.script = list(script)
+        self.stop_file = stop_file
+
+    def is_leader(self) -> bool:
+        ret = self.script.pop(0)
+        if ret is None:
+            with open(self.stop_file, 'w') as f:
+                f.write('stop')
+            return False
+        return ret
+
+    def release(self) -> None:
+        pass  # pragma no cover
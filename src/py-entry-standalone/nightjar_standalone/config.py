@@ -45,6 +45,15 @@ ENV__TEMP_DIR = 'NJ_TEMP_DIR'
 
 ENV__DATA_STORE_EXEC = 'DATA_STORE_EXEC'
 ENV__DISCOVERY_MAP_EXEC = 'DISCOVERY_MAP_EXEC'
+ENV__SHARDED_DISCOVERY_MAP = 'SHARDED_DISCOVERY_MAP'
+DEFAULT_SHARDED_DISCOVERY_MAP = False
+ENV__DELTA_DISCOVERY_MAP = 'DELTA_DISCOVERY_MAP'
+DEFAULT_DELTA_DISCOVERY_MAP = False
+ENV__WATCH_DATA_STORE = 'WATCH_DATA_STORE'
+DEFAULT_WATCH_DATA_STORE = False
+ENV__SHARED_CACHE_DIR = 'NJ_SHARED_CACHE_DIR'
+ENV__SHARED_CACHE_MAX_AGE = 'SHARED_CACHE_MAX_AGE'
+DEFAULT_SHARED_CACHE_MAX_AGE = 15
 ENV__NAMESPACE = 'NJ_NAMESPACE'
 DEFAULT_NAMESPACE = 'default'
 ENV__SERVICE = 'NJ_SERVICE'
@@ -52,6 +61,11 @@ DEFAULT_SERVICE = 'default'
 ENV__COLOR = 'NJ_COLOR'
 DEFAULT_COLOR = 'default'
 
+ENV__METRICS_PORT = 'METRICS_PORT'
+DEFAULT_METRICS_PORT = 0
+ENV__METRICS_FILE = 'METRICS_FILE'
+ENV__TRACE_FILE = 'TRACE_FILE'
+
 ENV__LISTEN_PORT = 'NJ_LISTEN_PORT'
 ENV__ADMIN_PORT = 'NJ_ADMIN_PORT'
 
@@ -59,7 +73,9 @@ ENV__ADMIN_PORT = 'NJ_ADMIN_PORT'
 class Config:  # pylint: disable=R0902
     """Configuration settings"""
     __slots__ = (
-        'proxy_mode', 'data_store_exec', 'discovery_map_exec', 'temp_dir',
+        'proxy_mode', 'data_store_exec', 'discovery_map_exec', 'sharded_discovery_map',
+        'delta_discovery_map', 'watch_data_store', 'temp_dir',
+        'shared_cache_dir', 'shared_cache_max_age',
         'namespace', 'service', 'color',
 
         'envoy_cmd', 'envoy_log_level', 'envoy_base_id', 'envoy_config_template',
@@ -68,6 +84,7 @@ class Config:  # pylint: disable=R0902
 
         'trigger_stop_file',
         'refresh_time', 'failure_sleep', 'exit_on_generation_failure',
+        'metrics_port', 'metrics_file', 'trace_file',
     )
 
     def __init__(self, env: Dict[str, str]) -> None:
@@ -84,6 +101,19 @@ class Config:  # pylint: disable=R0902
             self.proxy_mode = DEFAULT_PROXY_MODE
         self.data_store_exec = get_env_executable_cmd(env, ENV__DATA_STORE_EXEC)
         self.discovery_map_exec = get_env_executable_cmd(env, ENV__DISCOVERY_MAP_EXEC)
+        self.sharded_discovery_map = parse_env.env_as_bool(
+            env, ENV__SHARDED_DISCOVERY_MAP, DEFAULT_SHARDED_DISCOVERY_MAP,
+        )
+        self.delta_discovery_map = parse_env.env_as_bool(
+            env, ENV__DELTA_DISCOVERY_MAP, DEFAULT_DELTA_DISCOVERY_MAP,
+        )
+        self.watch_data_store = parse_env.env_as_bool(
+            env, ENV__WATCH_DATA_STORE, DEFAULT_WATCH_DATA_STORE,
+        )
+        self.shared_cache_dir = env.get(ENV__SHARED_CACHE_DIR, '')
+        self.shared_cache_max_age = parse_env.env_as_float(
+            env, ENV__SHARED_CACHE_MAX_AGE, DEFAULT_SHARED_CACHE_MAX_AGE,
+        )
         self.namespace = env.get(ENV__NAMESPACE, DEFAULT_NAMESPACE)
         self.service = env.get(ENV__SERVICE, DEFAULT_SERVICE)
         self.color = env.get(ENV__COLOR, DEFAULT_COLOR)
@@ -108,6 +138,12 @@ class Config:  # pylint: disable=R0902
         self.exit_on_generation_failure = parse_env.env_as_bool(
             env, ENV__EXIT_ON_GENERATION_FAILURE, DEFAULT_EXIT_ON_GENERATION_FAILURE,
         )
+        # The metrics are only served over HTTP when the port is set, and only written
+        # to a file (for the node exporter's textfile collector) when the file is set.
+        self.metrics_port = parse_env.env_as_int(env, ENV__METRICS_PORT, DEFAULT_METRICS_PORT)
+        self.metrics_file = env.get(ENV__METRICS_FILE, '')
+        # The trace spans of each pass are only written when the file is set.
+        self.trace_file = env.get(ENV__TRACE_FILE, '')
 
         env_temp_dir = env.get(ENV__TEMP_DIR)
         if env_temp_dir:
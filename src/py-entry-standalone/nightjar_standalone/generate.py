@@ -3,15 +3,21 @@
 Generate the current configuration.
 """
 
-from typing import Dict, Tuple, Iterable, Optional
+from typing import Dict, Tuple, Iterable, Optional, Any
 import os
+import time
 import tempfile
 import pystache  # type: ignore
 from nightjar_common import log
+from nightjar_common import metrics
+from nightjar_common import tracing
 from nightjar_common.extension_point.data_store import DataStoreRunner
-from nightjar_common.extension_point.discovery_map import DiscoveryMapRunner
+from nightjar_common.extension_point.shared_cache import SharedDocumentCache
+from nightjar_common.extension_point.discovery_map import DiscoveryMapRunner, namespace_filter
 from nightjar_common.envoy_transform.gateway import create_gateway_proxy_input
-from nightjar_common.envoy_transform.service import create_service_color_proxy_input
+from nightjar_common.envoy_transform.service import (
+    create_service_color_proxy_input, find_required_namespaces,
+)
 from nightjar_common.extension_point.errors import (
     ExtensionPointRuntimeError, ExtensionPointTooManyRetries,
 )
@@ -19,6 +25,20 @@ from .config import Config
 
 TEMPLATE_DEFAULT = None
 
+RENDER_SECONDS = metrics.histogram(
+    'nightjar_template_render_duration_seconds',
+    'Time taken to render each envoy template.',
+)
+ENVOY_FILES = metrics.counter(
+    'nightjar_envoy_files_total',
+    'Envoy files generated, by whether they were written or unchanged.',
+    ('result',),
+)
+ENVOY_FILE_BYTES = metrics.counter(
+    'nightjar_envoy_file_written_bytes_total',
+    'Bytes written to the changed envoy files.',
+)
+
 
 class Generator:
     """The generic generator class."""
@@ -26,6 +46,10 @@ class Generator:
         """Runs the generation process.  Returns 0 on no error."""
         raise NotImplementedError()  # pragma no cover
 
+    def wait_for_change(self, timeout: float) -> None:
+        """Wait until it's time to generate the files again."""
+        time.sleep(timeout)
+
 
 def create_generator(config: Config) -> Generator:
     """Create the appropriate generator."""
@@ -42,7 +66,7 @@ class GenerateGatewayConfiguration(Generator):
 
     def __init__(self, config: Config) -> None:
         self._config = config
-        self._data_store = DataStoreRunner(config.data_store_exec, config.temp_dir)
+        self._data_store = create_data_store(config)
         self._discovery_map = DiscoveryMapRunner(config.discovery_map_exec, config.temp_dir)
         os.makedirs(config.envoy_config_dir, exist_ok=True)
 
@@ -50,7 +74,12 @@ class GenerateGatewayConfiguration(Generator):
         """Runs the generation process."""
         try:
             log.debug("Fetching discovery map")
-            discovery_map = self._discovery_map.get_mesh()
+            # Only this gateway's namespace is needed.
+            with tracing.span('discovery-map.fetch'):
+                discovery_map = get_namespace_discovery_map(
+                    self._config, self._data_store, self._discovery_map,
+                    (self._config.namespace,),
+                )
             mapping = create_gateway_proxy_input(
                 discovery_map, self._config.namespace,
                 listen_port, admin_port,
@@ -60,17 +89,22 @@ class GenerateGatewayConfiguration(Generator):
                 return mapping
             for purpose, template in self.get_templates().items():
                 log.debug("Rendering template {purpose}", purpose=purpose)
-                rendered = pystache.render(template, mapping)
+                rendered = render_template(purpose, template, mapping)
                 generate_envoy_file(self._config, purpose, rendered)
             return 0
         except (ExtensionPointRuntimeError, ExtensionPointTooManyRetries) as err:
             print("[nightjar-standalone] File construction generated error: " + repr(err))
             return 1
 
+    def wait_for_change(self, timeout: float) -> None:
+        """Wait for the timeout, or until the data store reports a change."""
+        wait_for_data_store_change(self._config, self._data_store, timeout)
+
     def get_templates(self) -> Dict[str, str]:
         """Get the right templates for this mode (purpose -> template)."""
         log.debug("Fetching templates")
-        all_templates = self._data_store.fetch_document('templates')
+        with tracing.span('templates.fetch'):
+            all_templates = self._data_store.fetch_document('templates')
         default_templates: Dict[str, str] = {}
         namespace_templates: Dict[str, str] = {}
         for gateway_template in all_templates['gateway-templates']:
@@ -89,13 +123,14 @@ class GenerateServiceConfiguration(Generator):
 
     def __init__(self, config: Config) -> None:
         self._config = config
-        self._data_store = DataStoreRunner(config.data_store_exec, config.temp_dir)
+        self._data_store = create_data_store(config)
         self._discovery_map = DiscoveryMapRunner(config.discovery_map_exec, config.temp_dir)
         os.makedirs(config.envoy_config_dir, exist_ok=True)
 
     def generate_file(self, listen_port: int, admin_port: int) -> int:
         """Runs the generation process."""
-        discovery_map = self._discovery_map.get_mesh()
+        with tracing.span('discovery-map.fetch'):
+            discovery_map = self.get_discovery_map()
         mapping = create_service_color_proxy_input(
             discovery_map, self._config.namespace, self._config.service, self._config.color,
             listen_port, admin_port,
@@ -104,13 +139,35 @@ class GenerateServiceConfiguration(Generator):
             log.warning("Could not generate mapping.")
             return mapping
         for purpose, template in self.get_templates().items():
-            rendered = pystache.render(template, mapping)
+            rendered = render_template(purpose, template, mapping)
             generate_envoy_file(self._config, purpose, rendered)
         return 0
 
+    def get_discovery_map(self) -> Dict[str, Any]:
+        """Load just the parts of the discovery map needed by this service-color: the local
+        namespace, then a second pass over the cached map for the namespaces it egresses
+        to."""
+        local_namespace = self._config.namespace
+        discovery_map = get_namespace_discovery_map(
+            self._config, self._data_store, self._discovery_map, (local_namespace,),
+        )
+        namespaces = find_required_namespaces(
+            discovery_map, local_namespace, self._config.service, self._config.color,
+        )
+        if len(namespaces) > 1:
+            discovery_map = get_namespace_discovery_map(
+                self._config, self._data_store, self._discovery_map, namespaces, True,
+            )
+        return discovery_map
+
+    def wait_for_change(self, timeout: float) -> None:
+        """Wait for the timeout, or until the data store reports a change."""
+        wait_for_data_store_change(self._config, self._data_store, timeout)
+
     def get_templates(self) -> Dict[str, str]:
         """Get the right templates for this mode (purpose -> template)."""
-        all_templates = self._data_store.fetch_document('templates')
+        with tracing.span('templates.fetch'):
+            all_templates = self._data_store.fetch_document('templates')
         possible_templates: Dict[
             Tuple[Optional[str], Optional[str], Optional[str]], Dict[str, str],
         ] = {
@@ -183,6 +240,64 @@ class MockGenerator(Generator):
         return MockGenerator.RETURN_CODE
 
 
+def create_data_store(config: Config) -> DataStoreRunner:
+    """Create the data store runner, which uses the shared cache if there is one."""
+    ret = DataStoreRunner(config.data_store_exec, config.temp_dir)
+    if config.shared_cache_dir:
+        ret.shared_cache = SharedDocumentCache(
+            config.shared_cache_dir, config.shared_cache_max_age,
+        )
+    return ret
+
+
+def wait_for_data_store_change(
+        config: Config, data_store: DataStoreRunner, timeout: float,
+) -> None:
+    """Wait for the timeout, or, if enabled, until the data store reports a change."""
+    if config.watch_data_store:
+        if data_store.wait_for_change(timeout):
+            log.debug("Data store reported a change")
+    else:
+        time.sleep(timeout)
+
+
+def get_namespace_discovery_map(
+        config: Config,
+        data_store: DataStoreRunner,
+        discovery_map: DiscoveryMapRunner,
+        namespaces: Iterable[str],
+        reuse_last: bool = False,
+) -> Dict[str, Any]:
+    """Load just the given namespaces from the discovery map.  With the sharded discovery
+    map, this only fetches the namespaces' documents from the data store, and with the
+    delta discovery map, this only fetches the changes since the last call.  If `reuse_last`
+    is set, then the discovery map from the last call is used rather than fetching a new
+    one."""
+    if config.sharded_discovery_map:
+        return data_store.fetch_sharded_discovery_map(namespaces, reuse_last)
+    if config.delta_discovery_map:
+        # The data store runner holds onto the returned map, so don't change it.
+        full_map = data_store.fetch_delta_discovery_map(reuse_last)
+        matches = namespace_filter(namespaces)
+        ret = dict(full_map)
+        ret['namespaces'] = [
+            namespace_obj
+            for namespace_obj in full_map['namespaces']
+            if matches(namespace_obj)
+        ]
+        return ret
+    if reuse_last:
+        return discovery_map.get_cached_mesh(namespace_filter(namespaces))
+    return discovery_map.get_mesh(namespace_filter(namespaces))
+
+
+def render_template(purpose: str, template: str, mapping: Dict[str, Any]) -> str:
+    """Render the envoy template with the proxy input."""
+    with RENDER_SECONDS.time(), tracing.span('template.render', purpose=purpose):
+        ret: str = pystache.render(template, mapping)
+    return ret
+
+
 def generate_envoy_file(config: Config, file_name: str, contents: str) -> None:
     """Performs the correct construction of the envoy file.  To properly support
     envoy dynamic configurations, the file must be created in a temporary file, then
@@ -196,6 +311,15 @@ def generate_envoy_file(config: Config, file_name: str, contents: str) -> None:
     out_dir = config.envoy_config_dir
     target_file = os.path.join(out_dir, file_name)
 
+    with tracing.span('envoy-file.write', file=file_name) as write_span:
+        write_span.set_attribute('result', write_envoy_file(
+            out_dir, target_file, file_name, contents,
+        ))
+
+
+def write_envoy_file(out_dir: str, target_file: str, file_name: str, contents: str) -> str:
+    """Write the contents to the envoy file, unless it already has them.  Returns whether
+    the file was 'written' or 'unchanged'."""
     # First, check if the file needs to be updated.  That means the contents are different.
     if os.path.isfile(target_file):
         with open(target_file, 'r') as f:
@@ -204,13 +328,18 @@ def generate_envoy_file(config: Config, file_name: str, contents: str) -> None:
                 log.debug(
                     "Contents of {file_name} are the same; not updating.", file_name=file_name
                 )
-                return
+                ENVOY_FILES.inc('unchanged')
+                return 'unchanged'
 
     gen_fd, gen_filename = tempfile.mkstemp(prefix=file_name, dir=out_dir, text=False)
-    os.write(gen_fd, contents.encode('utf-8', errors='replace'))
+    data = contents.encode('utf-8', errors='replace')
+    os.write(gen_fd, data)
     os.close(gen_fd)
     os.replace(gen_filename, target_file)
+    ENVOY_FILES.inc('written')
+    ENVOY_FILE_BYTES.inc(amount=len(data))
     log.log('INFO', "Generated configuration file {file_name}", file_name=file_name)
     log.debug('. . . . . . . . . . . . . . . . . .')
     log.debug_raw(contents)
     log.debug('. . . . . . . . . . . . . . . . . .')
+    return 'written'
@@ -6,11 +6,27 @@ Main program.
 from typing import Sequence
 import os
 import time
-from nightjar_common.log import warning, debug
+from nightjar_common.log import warning, debug, flush
+from nightjar_common import metrics
+from nightjar_common import tracing
 from .config import create_configuration
 from .generate import create_generator
 from .envoy import create_envoy_handler
 
+CYCLE_SECONDS = metrics.histogram(
+    'nightjar_cycle_duration_seconds',
+    'Time taken by each pass of generating the envoy files.',
+)
+CYCLES = metrics.counter(
+    'nightjar_cycles_total',
+    'Passes of generating the envoy files, by whether they succeeded.',
+    ('result',),
+)
+LAST_CYCLE = metrics.gauge(
+    'nightjar_last_cycle_timestamp_seconds',
+    'Time when the last pass of generating the envoy files ended.',
+)
+
 
 def main(_args: Sequence[str]) -> int:
     """Main program."""
@@ -20,6 +36,10 @@ def main(_args: Sequence[str]) -> int:
         return 1
     generator = create_generator(config)
     envoy = create_envoy_handler(config)
+    if config.metrics_port > 0:
+        metrics.start_http_server(config.metrics_port)
+    if config.trace_file:
+        tracing.enable(config.trace_file)
 
     while True:
         if os.path.exists(config.trigger_stop_file):
@@ -27,10 +47,17 @@ def main(_args: Sequence[str]) -> int:
             envoy.stop_envoy()
             return 0
         debug('Generating envoy files.')
-        res = generator.generate_file(config.envoy_listen_port, config.envoy_admin_port)
+        with CYCLE_SECONDS.time(), tracing.span('standalone.pass') as pass_span:
+            res = generator.generate_file(config.envoy_listen_port, config.envoy_admin_port)
+            pass_span.set_attribute('result', res)
+        CYCLES.inc('ok' if res == 0 else 'failed')
+        LAST_CYCLE.set(time.time())
+        metrics.export_textfile(config.metrics_file)
         if os.path.isfile(config.envoy_config_file):
             debug('Starting envoy.')
             envoy.start_if_not_running()
+        # Write out this pass' debug messages before waiting.
+        flush()
         if res != 0:
             warning("Envoy configuration generator returned {code}", code=res)
             if config.exit_on_generation_failure:
@@ -39,4 +66,4 @@ def main(_args: Sequence[str]) -> int:
                 return res
             time.sleep(config.failure_sleep)
         else:
-            time.sleep(config.refresh_time)
+            generator.wait_for_change(config.refresh_time)
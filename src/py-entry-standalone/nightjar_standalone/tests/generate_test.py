@@ -9,7 +9,10 @@ import os
 import platform
 import shutil
 import json
+from nightjar_common import tracing
 from nightjar_common.validation import validate_discovery_map, validate_templates
+from nightjar_common.extension_point.data_store import DataStoreRunner
+from nightjar_common.extension_point.sharded_discovery_map import create_namespace_document
 from .. import generate
 from ..config import (
     Config,
@@ -18,7 +21,7 @@ from ..config import (
 )
 
 
-class GeneratorTest(unittest.TestCase):
+class GeneratorTest(unittest.TestCase):  # pylint: disable=R0904
     """Test the generator functions and classes."""
     # These are all smashed together, because they share the same setup and teardown logic.
     # Yeah, it's a lousy reason to jam them together, but it makes less duplication.
@@ -178,7 +181,12 @@ class GeneratorTest(unittest.TestCase):
         }))
 
         gateway = generate.GenerateGatewayConfiguration(self._config)
-        res = gateway.generate_file(1, 2)
+        trace_file = os.path.join(self._config.temp_dir, 'trace.jsonl')
+        tracing.enable(trace_file)
+        try:
+            res = gateway.generate_file(1, 2)
+        finally:
+            tracing.disable()
         self.assertEqual(0, res)
 
         out_file_1 = os.path.join(self._config.envoy_config_dir, 'out-1.txt')
@@ -192,6 +200,16 @@ class GeneratorTest(unittest.TestCase):
         with open(out_file_2, 'r') as f:
             self.assertEqual('z v1 y', f.read())
 
+        # Each stage is traced.
+        with open(trace_file, 'r') as f:
+            names = [json.loads(line)['name'] for line in f]
+        self.assertEqual({
+            'discovery-map.fetch', 'extension-point.run', 'document.read', 'document.validate',
+            'proxy-input.create', 'proxy-input.validate', 'templates.fetch',
+            'template.render', 'envoy-file.write',
+        }, set(names))
+        self.assertEqual(2, names.count('envoy-file.write'))
+
     def test_gateway_generate_file__no_match(self) -> None:
         """Test the gateway generate_file function when the proxy input is None."""
         self._config.namespace = 'n1'
@@ -473,27 +491,183 @@ class GeneratorTest(unittest.TestCase):
         res = gateway.generate_file(3, 4)
         self.assertEqual(1, res)
 
+    def test_service_get_discovery_map__egress(self) -> None:
+        """Test that the service discovery map only loads the local and egress namespaces."""
+        self._config.namespace = 'n1'
+        self._config.service = 's1'
+        self._config.color = 'c1'
+        namespaces: List[Dict[str, Any]] = [{
+            'namespace': name,
+            'network-id': 'nk1',
+            'gateways': {'instances': [], 'prefer-gateway': True, 'protocol': 'http2'},
+            'service-colors': [],
+        } for name in ('n1', 'n2', 'n3')]
+        namespaces[0]['service-colors'] = [{
+            'service': 's1',
+            'color': 'c1',
+            'index': 199,
+            'routes': [],
+            'instances': [],
+            'namespace-egress': [{
+                'namespace': 'n3',
+                'interface': {'ipv4': '127.0.0.1', 'port': 100},
+            }],
+        }]
+        self._config.discovery_map_exec = self._get_runnable_cmd(0, validate_discovery_map({
+            'schema-version': 'v1',
+            'document-version': 'd12',
+            'namespaces': namespaces,
+        }))
+
+        service = generate.GenerateServiceConfiguration(self._config)
+        res = service.get_discovery_map()
+        self.assertEqual([namespaces[0], namespaces[2]], res['namespaces'])
+
+    def test_service_get_discovery_map__sharded(self) -> None:
+        """Test that the service discovery map, with the sharded discovery map, only fetches
+        the local and egress namespaces."""
+        self._config.namespace = 'n1'
+        self._config.service = 's1'
+        self._config.color = 'c1'
+        self._config.sharded_discovery_map = True
+        namespaces: List[Dict[str, Any]] = [{
+            'namespace': name,
+            'network-id': 'nk1',
+            'gateways': {'instances': [], 'prefer-gateway': True, 'protocol': 'http2'},
+            'service-colors': [],
+        } for name in ('n1', 'n2', 'n3')]
+        namespaces[0]['service-colors'] = [{
+            'service': 's1',
+            'color': 'c1',
+            'index': 199,
+            'routes': [],
+            'instances': [],
+            'namespace-egress': [{
+                'namespace': 'n3',
+                'interface': {'ipv4': '127.0.0.1', 'port': 100},
+            }],
+        }]
+        src_dir = os.path.join(self._config.temp_dir, 'data-store')
+        os.makedirs(src_dir)
+        with open(os.path.join(src_dir, 'discovery-map-index.json'), 'w') as f:
+            json.dump({
+                'schema-version': 'v1',
+                'document-version': 'd12',
+                'namespaces': {'n1': 'v1', 'n2': 'v1', 'n3': 'v1'},
+            }, f)
+        for namespace_obj in namespaces:
+            with open(os.path.join(
+                    src_dir, 'discovery-map-namespace.{0}.json'.format(namespace_obj['namespace']),
+            ), 'w') as f:
+                json.dump(create_namespace_document(namespace_obj, 'v1'), f)
+        self._config.data_store_exec = [*self._runnable, '0', src_dir]
+
+        service = generate.GenerateServiceConfiguration(self._config)
+        res = service.get_discovery_map()
+        self.assertEqual([namespaces[0], namespaces[2]], res['namespaces'])
+        self.assertFalse(os.path.isfile(os.path.join(
+            self._config.temp_dir, 'discovery-map-namespace.n2-cached.json',
+        )))
+
+    def test_service_get_discovery_map__delta(self) -> None:
+        """Test that the service discovery map, with the delta discovery map, applies the
+        delta to the snapshot and only keeps the local and egress namespaces."""
+        self._config.namespace = 'n1'
+        self._config.service = 's1'
+        self._config.color = 'c1'
+        self._config.delta_discovery_map = True
+        namespaces: List[Dict[str, Any]] = [{
+            'namespace': name,
+            'network-id': 'nk1',
+            'gateways': {'instances': [], 'prefer-gateway': True, 'protocol': 'http2'},
+            'service-colors': [],
+        } for name in ('n1', 'n2', 'n3')]
+        namespaces[0]['service-colors'] = [{
+            'service': 's1',
+            'color': 'c1',
+            'index': 199,
+            'routes': [],
+            'instances': [],
+            'namespace-egress': [{
+                'namespace': 'n3',
+                'interface': {'ipv4': '127.0.0.1', 'port': 100},
+            }],
+        }]
+        src_dir = os.path.join(self._config.temp_dir, 'data-store')
+        os.makedirs(src_dir)
+        with open(os.path.join(src_dir, 'discovery-map.json'), 'w') as f:
+            json.dump({
+                'schema-version': 'v1',
+                'document-version': 'd12',
+                'map-version': 'm1',
+                'namespaces': namespaces[:2],
+            }, f)
+        with open(os.path.join(src_dir, 'discovery-map-delta.json'), 'w') as f:
+            json.dump({
+                'schema-version': 'v1',
+                'document-version': 'd13',
+                'base-version': 'm1',
+                'map-version': 'm2',
+                'changes': [{
+                    'from-version': 'm1',
+                    'to-version': 'm2',
+                    'operations': [{'op': 'add', 'namespace': 'n3', 'value': namespaces[2]}],
+                }],
+            }, f)
+        self._config.data_store_exec = [*self._runnable, '0', src_dir]
+
+        service = generate.GenerateServiceConfiguration(self._config)
+        res = service.get_discovery_map()
+        self.assertEqual([namespaces[0], namespaces[2]], res['namespaces'])
+
     def test_generate_envoy_file__no_change(self) -> None:
         """Run generate_envoy_file with no changes to the files."""
         requested_out_file = os.path.join(self._config.envoy_config_dir, 'x.txt')
         with open(requested_out_file, 'w') as f:
             f.write('x')
+        unchanged = generate.ENVOY_FILES.get('unchanged')
         generate.generate_envoy_file(self._config, 'x.txt', 'x')
         self.assertTrue(os.path.isfile(requested_out_file))
         with open(requested_out_file, 'r') as f:
             self.assertEqual('x', f.read())
+        self.assertEqual(unchanged + 1, generate.ENVOY_FILES.get('unchanged'))
 
     def test_generate_envoy_file__replaced(self) -> None:
         """Run generate_envoy_file with no changes to the files."""
         requested_out_file = os.path.join(self._config.envoy_config_dir, 'x.txt')
         with open(requested_out_file, 'w') as f:
             f.write('y')
+        written = generate.ENVOY_FILES.get('written')
+        written_bytes = generate.ENVOY_FILE_BYTES.get()
         generate.generate_envoy_file(self._config, 'x.txt', 'x')
         self.assertTrue(os.path.isfile(requested_out_file))
         with open(requested_out_file, 'r') as f:
             self.assertEqual('x', f.read())
+        self.assertEqual(written + 1, generate.ENVOY_FILES.get('written'))
+        self.assertEqual(written_bytes + 1, generate.ENVOY_FILE_BYTES.get())
 
     # -----------------------------------------------------------------------
+    def test_create_data_store(self) -> None:
+        """Test create_data_store with and without the shared cache."""
+        self.assertIsNone(generate.create_data_store(self._config).shared_cache)
+        self._config.shared_cache_dir = os.path.join(self._config.temp_dir, 'shared')
+        self.assertIsNotNone(generate.create_data_store(self._config).shared_cache)
+
+    def test_wait_for_change(self) -> None:
+        """Test wait_for_change with and without watching the data store."""
+        self._config.data_store_exec = self._get_runnable_cmd(0, {})
+        gateway = generate.GenerateGatewayConfiguration(self._config)
+        service = generate.GenerateServiceConfiguration(self._config)
+        self._config.watch_data_store = False
+        gateway.wait_for_change(0.01)
+        self._config.watch_data_store = True
+        gateway.wait_for_change(0.01)
+        service.wait_for_change(0.01)
+        generate.wait_for_data_store_change(
+            self._config, DataStoreRunner(self._get_runnable_cmd(30, {}), self._config.temp_dir),
+            0.01,
+        )
+
     def _get_runnable_cmd(
             self, exit_code: int, src_contents: Dict[str, Any],
     ) -> List[str]:
@@ -3,11 +3,14 @@
 Test the main module.
 """
 
+from typing import List
 import unittest
+import json
 import os
 import tempfile
 import shutil
 import platform
+from nightjar_common import metrics, tracing
 from .. import main, config, generate
 
 
@@ -76,3 +79,39 @@ class MainTest(unittest.TestCase):
         self.assertEqual(0, main.main(['main.py']))
 
         self.assertTrue(os.path.exists(self._stop_file))
+
+    def test_main__metrics(self) -> None:
+        """Run one loop of the main program, exporting the metrics."""
+        metrics_file = os.path.join(self._temp_dir, 'nightjar.prom')
+        os.environ[config.ENV__METRICS_FILE] = metrics_file
+        os.environ[config.ENV__METRICS_PORT] = '0'
+        generate.MockGenerator.PASSES_BEFORE_EXIT_CREATION = 1
+        started: List[int] = []
+        orig_start = metrics.start_http_server
+        setattr(metrics, 'start_http_server', started.append)
+        try:
+            self.assertEqual(0, main.main(['main.py']))
+            self.assertEqual([], started)
+            os.environ[config.ENV__METRICS_PORT] = '9901'
+            os.remove(self._stop_file)
+            generate.MockGenerator.PASSES_BEFORE_EXIT_CREATION = 1
+            self.assertEqual(0, main.main(['main.py']))
+            self.assertEqual([9901], started)
+        finally:
+            setattr(metrics, 'start_http_server', orig_start)
+        with open(metrics_file, 'r') as f:
+            self.assertIn('\nnightjar_cycles_total{result="ok"} ', f.read())
+
+    def test_main__trace(self) -> None:
+        """Run one loop of the main program, writing the trace."""
+        trace_file = os.path.join(self._temp_dir, 'trace.jsonl')
+        os.environ[config.ENV__TRACE_FILE] = trace_file
+        generate.MockGenerator.PASSES_BEFORE_EXIT_CREATION = 1
+        try:
+            self.assertEqual(0, main.main(['main.py']))
+        finally:
+            tracing.disable()
+        with open(trace_file, 'r') as f:
+            spans = [json.loads(line) for line in f]
+        self.assertEqual(['standalone.pass'], [s['name'] for s in spans])
+        self.assertEqual({'result': 0}, spans[0]['attributes'])
@@ -4,6 +4,7 @@
 Simulates an execution end point.
 """
 
+import os
 import shutil
 import sys
 
@@ -11,11 +12,17 @@ print("Running with " + repr(sys.argv))
 exit_code = int(sys.argv[1])
 src_file = sys.argv[2]
 tgt_file: str = ''
+document: str = ''
 for arg in sys.argv[3:]:
     if arg.startswith('--output-file='):
         tgt_file = arg[14:]
     elif arg.startswith('--action-file='):
         tgt_file = arg[14:]
+    elif arg.startswith('--document='):
+        document = arg[11:]
+# A source directory contains one file per document.
+if os.path.isdir(src_file):
+    src_file = os.path.join(src_file, document + '.json')
 if src_file and src_file != 'none' and tgt_file:
     print("Copying {0} to {1}".format(src_file, tgt_file))
     shutil.copy(src_file, tgt_file)
@@ -204,11 +204,13 @@ def extract_service_template(
 
 
 def push_document(config: Config, document_type: str, data: Dict[str, Any]) -> int:
-    """Push the document contents to the data store"""
+    """Push the document contents to the data store, then remove its old versions."""
     temp_dir = tempfile.mkdtemp()
     try:
         runner = DataStoreRunner(config.data_store_exec, temp_dir, config.config_env)
         runner.commit_document(cast(DocumentName, document_type), data)
+        # Central only cleans up the documents it commits itself.
+        runner.collect_garbage()
         return 0
     finally:
         shutil.rmtree(temp_dir)
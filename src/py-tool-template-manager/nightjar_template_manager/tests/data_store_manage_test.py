@@ -188,6 +188,23 @@ class DataStoreManageTest(unittest.TestCase):  # pylint: disable=R0904
             'template': 'foo',
         }], []), data)
 
+    def test_push_document__gc(self) -> None:
+        """Test push_document, which removes the old versions after the commit."""
+        args_file = os.path.join(self._temp_dir, 'args.txt')
+        script = os.path.join(self._temp_dir, 'data-store.sh')
+        with open(script, 'w') as f:
+            f.write('echo "$@" >> {0}\n'.format(args_file))
+        config = self._setup_config({})
+        config.data_store_exec = ['sh', script]
+        res = data_store_manage.push_document(config, 'templates', _mk_templates([], []))
+        self.assertEqual(0, res)
+        with open(args_file, 'r') as f:
+            lines = f.read().splitlines()
+        self.assertEqual(2, len(lines))
+        self.assertIn('--action=commit', lines[0])
+        self.assertIn('--action=gc', lines[1])
+        self.assertIn('--document=templates', lines[1])
+
     def test_push_template__gateway_first_time_and_push_retry_error(self) -> None:
         """Test push_template with a gateway, when the data store reports no existing template."""
         config = self._setup_config({}, 31)